@@ -19,6 +19,7 @@ import { DesktopMode } from '@interface/types/desktop-modes';
 import { isDuplicateEvent } from '@interface/lib/event-dedup';
 
 import { initAppMessageBridge } from '../events/appMessageBridge';
+import { createAppMessageUnwrapper, isFramedAppMessage } from '../events/appMessageFraming';
 import { routeNiaEvent } from '../events/niaEventRouter';
 import {
   getParticipantsSnapshot,
@@ -295,6 +296,7 @@ const Call: React.FC<CallProps> = ({
   const [niaEvents, setNiaEvents] = useState<NiaEventEnvelope[]>([]);
   const niaLastSeqRef = useRef<number>(0);
   const niaGapsRef = useRef<Array<{ expected: number; got: number }>>([]);
+  const appMessageUnwrapRef = useRef(createAppMessageUnwrapper());
 
   // Setup global error handling once
   useEffect(() => {
@@ -1556,11 +1558,17 @@ const Call: React.FC<CallProps> = ({
   });
 
   // Inbound nia.event stream handler (from app-message) — canonical ingestion path
-  useDailyEvent('app-message', (ev: any) => {
+  useDailyEvent('app-message', function handleAppMessage(ev: any) {
     try {
       const data = ev?.data;
       if (!data || typeof data !== 'object') return;
 
+      // Coalesced or chunked bot envelopes: replay each complete item through this handler
+      if (isFramedAppMessage(data)) {
+        appMessageUnwrapRef.current(data).forEach(item => handleAppMessage({ ...ev, data: item }));
+        return;
+      }
+
       // Handle admin-kick message - force leave the call
       if (data.type === 'admin-kick') {
         log.warn('[Call] Received admin-kick message', {
@@ -0,0 +1,69 @@
+/* @jest-environment jsdom */
+
+import { TextDecoder as NodeTextDecoder } from 'util';
+
+import { BATCH_KIND, CHUNK_KIND, createAppMessageUnwrapper } from '../appMessageFraming';
+
+function chunksFor(envelope: object, id: string, parts: number) {
+  const b64 = Buffer.from(JSON.stringify(envelope), 'utf-8').toString('base64');
+  // Split on 4-char boundaries so each slice is valid base64 on its own
+  const size = Math.ceil(b64.length / 4 / parts) * 4;
+  const chunks = [];
+  for (let index = 0; index < parts; index++) {
+    chunks.push({
+      v: 1,
+      kind: CHUNK_KIND,
+      id,
+      index,
+      total: parts,
+      data: b64.slice(index * size, (index + 1) * size),
+    });
+  }
+  return chunks;
+}
+
+describe('createAppMessageUnwrapper', () => {
+  beforeAll(() => {
+    if (typeof (globalThis as any).TextDecoder === 'undefined') {
+      (globalThis as any).TextDecoder = NodeTextDecoder;
+    }
+  });
+
+  const envelope = {
+    v: 1,
+    kind: 'nia.event',
+    seq: 7,
+    ts: 1,
+    event: 'html.created',
+    payload: { html: '<p>héllo</p>'.repeat(50) },
+  };
+
+  it('passes plain envelopes through', () => {
+    const unwrap = createAppMessageUnwrapper();
+    expect(unwrap(envelope)).toEqual([envelope]);
+  });
+
+  it('flattens coalesced batches', () => {
+    const unwrap = createAppMessageUnwrapper();
+    const items = [{ ...envelope, seq: 1 }, { ...envelope, seq: 2 }];
+    expect(unwrap({ v: 1, kind: BATCH_KIND, items })).toEqual(items);
+  });
+
+  it('reassembles out-of-order chunks once complete', () => {
+    const unwrap = createAppMessageUnwrapper();
+    const [a, b, c] = chunksFor(envelope, 'r1', 3);
+    expect(unwrap(c)).toEqual([]);
+    expect(unwrap(a)).toEqual([]);
+    expect(unwrap(a)).toEqual([]); // duplicate fragment ignored
+    expect(unwrap(b)).toEqual([envelope]);
+  });
+
+  it('drops stale partial reassemblies', () => {
+    let now = 0;
+    const unwrap = createAppMessageUnwrapper(() => now);
+    const [a, b] = chunksFor(envelope, 'r2', 2);
+    unwrap(a);
+    now = 60_000;
+    expect(unwrap(b)).toEqual([]);
+  });
+});
@@ -3,6 +3,8 @@ import { EventEnum } from '@nia/events';
 
 import { getClientLogger } from '@interface/lib/client-logger';
 
+import { createAppMessageUnwrapper, isFramedAppMessage } from './appMessageFraming';
+
 // Envelope for app-message forwarded events
 export interface AppMessageEnvelope<T = any> {
   v: 1;
@@ -30,6 +32,7 @@ let _seq = 0;
 const _listeners: Set<Listener> = new Set();
 let _opts: BridgeOptions = {};
 let _inited = false;
+let _unwrapAppMessage = createAppMessageUnwrapper();
 
 const log = getClientLogger('[daily_call]');
 
@@ -69,9 +72,13 @@ export function initAppMessageBridge(daily: any, options: BridgeOptions = {}) {
   _opts = options;
   _inited = true;
   try {
-    daily.on('app-message', (ev: any) => {
+    daily.on('app-message', function handleAppMessage(ev: any) {
       const data = ev?.data;
       if (!data) return;
+      if (isFramedAppMessage(data)) {
+        _unwrapAppMessage(data).forEach(item => handleAppMessage({ ...ev, data: item }));
+        return;
+      }
       // Handle sync request
       if (data.kind === SYNC_REQUEST) {
         if (_opts.getSnapshot) {
@@ -159,4 +166,4 @@ export function addAppMessageListener(listener: Listener) {
 }
 
 // For tests / diagnostics
-export function __resetBridge() { _daily = null; _seq = 0; _listeners.clear(); _opts = {}; _inited = false; }
+export function __resetBridge() { _daily = null; _seq = 0; _listeners.clear(); _opts = {}; _inited = false; _unwrapAppMessage = createAppMessageUnwrapper(); }
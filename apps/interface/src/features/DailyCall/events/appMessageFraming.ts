@@ -0,0 +1,82 @@
+/* eslint-disable @typescript-eslint/no-explicit-any */
+
+/**
+ * Wire-level framing for bot app-messages.
+ *
+ * The bot's forwarder transport (services/app_message_transport.py) may:
+ *  - coalesce several small envelopes into one `nia.batch` message, and
+ *  - split envelopes above Daily's ~50KB limit into base64 `nia.chunk`
+ *    fragments sharing a reassembly id.
+ *
+ * `createAppMessageUnwrapper` returns a stateful function that flattens both
+ * back into plain messages so every `app-message` consumer keeps seeing
+ * ordinary `nia.event` envelopes. Each consumer owns its own unwrapper because
+ * every Daily listener receives every fragment.
+ */
+
+export const BATCH_KIND = 'nia.batch';
+export const CHUNK_KIND = 'nia.chunk';
+
+// Drop partial reassemblies whose remaining fragments never arrived
+const CHUNK_TTL_MS = 30_000;
+
+interface PendingChunks {
+  total: number;
+  received: number;
+  parts: string[];
+  startedAt: number;
+}
+
+function decodeBase64Json(data: string): any {
+  const binary = atob(data);
+  const bytes = new Uint8Array(binary.length);
+  for (let i = 0; i < binary.length; i++) bytes[i] = binary.charCodeAt(i);
+  return JSON.parse(new TextDecoder().decode(bytes));
+}
+
+export function createAppMessageUnwrapper(now: () => number = Date.now) {
+  const pending = new Map<string, PendingChunks>();
+
+  const expire = (ts: number) => {
+    pending.forEach((entry, id) => {
+      if (ts - entry.startedAt > CHUNK_TTL_MS) pending.delete(id);
+    });
+  };
+
+  const acceptChunk = (msg: any): any[] => {
+    const { id, index, total, data } = msg;
+    if (typeof id !== 'string' || typeof index !== 'number' || typeof total !== 'number') return [];
+    if (typeof data !== 'string' || index < 0 || index >= total) return [];
+    const ts = now();
+    expire(ts);
+    let entry = pending.get(id);
+    if (!entry) {
+      entry = { total, received: 0, parts: new Array(total), startedAt: ts };
+      pending.set(id, entry);
+    }
+    if (entry.parts[index] === undefined) {
+      entry.parts[index] = data;
+      entry.received += 1;
+    }
+    if (entry.received < entry.total) return [];
+    pending.delete(id);
+    try {
+      return [decodeBase64Json(entry.parts.join(''))];
+    } catch {
+      return [];
+    }
+  };
+
+  return function unwrapAppMessage(data: any): any[] {
+    if (!data || typeof data !== 'object') return [];
+    if (data.kind === BATCH_KIND && Array.isArray(data.items)) {
+      return data.items.filter((item: any) => !!item && typeof item === 'object');
+    }
+    if (data.kind === CHUNK_KIND) return acceptChunk(data);
+    return [data];
+  };
+}
+
+export function isFramedAppMessage(data: any): boolean {
+  return !!data && (data.kind === BATCH_KIND || data.kind === CHUNK_KIND);
+}
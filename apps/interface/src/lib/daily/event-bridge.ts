@@ -5,6 +5,10 @@
 
 import type { DailyCall, DailyEventObject } from '@daily-co/daily-js';
 
+import {
+  createAppMessageUnwrapper,
+  isFramedAppMessage,
+} from '@interface/features/DailyCall/events/appMessageFraming';
 import { routeNiaEvent } from '@interface/features/DailyCall/events/niaEventRouter';
 import { isAssistantSelfCloseNiaEvent } from '@interface/lib/assistant-feature-sync';
 
@@ -35,6 +39,7 @@ export function setupVoiceSessionEventBridge(
   });
 
   const cleanupFunctions: Array<() => void> = [];
+  const unwrapAppMessage = createAppMessageUnwrapper();
 
   // Helper to register event with cleanup
   const on = (event: string, handler: (e?: DailyEventObject) => void) => {
@@ -80,12 +85,19 @@ export function setupVoiceSessionEventBridge(
   });
 
   // App messages (from pipecat bot via AppMessageForwarder)
-  on('app-message', (e) => {
+  on('app-message', function handleAppMessage(e) {
     log.info('App message received', { data: e?.data });
     
     const data = e?.data;
     if (!data) return;
 
+    // Coalesced or chunked bot envelopes: replay each complete item through this handler
+    if (isFramedAppMessage(data)) {
+      // eslint-disable-next-line @typescript-eslint/no-explicit-any
+      unwrapAppMessage(data).forEach((item) => handleAppMessage({ ...e, data: item } as any));
+      return;
+    }
+
     // Dedup: events arrive via both Daily app-message AND WebSocket
     if (data.kind === 'nia.event' && data.seq != null && data.ts != null && data.event) {
       const { isDuplicateEvent } = require('@interface/lib/event-dedup');
@@ -388,4 +388,77 @@ describe('Content API', () => {
         expect(invalidDataModelRes.status).toBe(400);
         expect(invalidDataModelBody.error.code).toBe('INVALID_BLOCK');
     });
+
+    it('should apply text edits with an If-Match version check', async () => {
+        const crypto = require('crypto');
+        const version = (text: string) => crypto.createHash('sha256').update(text, 'utf8').digest('hex').slice(0, 16);
+        const jsonHeaders = { 'Content-Type': 'application/json', 'x-mesh-secret': secret, ...authHeaders };
+
+        const defRes = await contentApiDoFetch(`${base}/definition`, {
+            method: 'POST',
+            headers: jsonHeaders,
+            body: JSON.stringify({
+                definition: {
+                    name: 'ApiEditType',
+                    description: 'API text edit test type',
+                    dataModel: {
+                        block: 'ApiEditType',
+                        jsonSchema: { type: 'object', properties: { title: { type: 'string' }, content: { type: 'string' } }, required: ['title'] },
+                        indexer: ['title']
+                    },
+                    uiConfig: { labels: {}, listView: { displayFields: [] }, detailView: { displayFields: [] } },
+                    access: { allowAnonymous: true }
+                },
+                tenant: tenantId
+            })
+        });
+        expect(defRes.status).toBe(200);
+
+        const createRes = await contentApiDoFetch(`${base}/content/ApiEditType?tenant=${tenantId}`, {
+            method: 'POST',
+            headers: jsonHeaders,
+            body: JSON.stringify({ content: { title: 'Groceries', content: '- milk' } })
+        });
+        const createBody = await parseJson(createRes);
+        expect(createRes.status).toBe(200);
+        const id = createBody.data._id;
+        const editsUrl = `${base}/content/ApiEditType/${id}/edits?tenant=${tenantId}`;
+
+        const editRes = await contentApiDoFetch(editsUrl, {
+            method: 'PATCH',
+            headers: { ...jsonHeaders, 'If-Match': `"${version('- milk')}"` },
+            body: JSON.stringify({ edits: [{ op: 'insert', text: '- eggs' }] })
+        });
+        const editBody = await parseJson(editRes);
+        expect(editRes.status).toBe(200);
+        expect(editBody.data.content).toBe('- milk\n- eggs');
+        expect(editBody.data.title).toBe('Groceries');
+        expect(editBody.version).toBe(version('- milk\n- eggs'));
+
+        // A write based on the old version is refused and changes nothing
+        const staleRes = await contentApiDoFetch(editsUrl, {
+            method: 'PATCH',
+            headers: jsonHeaders,
+            body: JSON.stringify({ expectedVersion: version('- milk'), edits: [{ op: 'remove', anchor: '- milk' }] })
+        });
+        const staleBody = await parseJson(staleRes);
+        expect(staleRes.status).toBe(412);
+        expect(staleBody.error.code).toBe('VERSION_MISMATCH');
+        expect(staleBody.error.details.version).toBe(version('- milk\n- eggs'));
+
+        const missingRes = await contentApiDoFetch(editsUrl, {
+            method: 'PATCH',
+            headers: jsonHeaders,
+            body: JSON.stringify({ edits: [{ op: 'replace', anchor: '- bread', text: '- rye' }] })
+        });
+        const missingBody = await parseJson(missingRes);
+        expect(missingRes.status).toBe(422);
+        expect(missingBody.error.code).toBe('EDIT_NOT_APPLICABLE');
+
+        const getRes = await contentApiDoFetch(`${base}/content/ApiEditType/${id}?tenant=${tenantId}`, {
+            headers: { 'x-mesh-secret': secret, ...authHeaders }
+        });
+        const getBody = await parseJson(getRes);
+        expect(getBody.data.content).toBe('- milk\n- eggs');
+    });
 });
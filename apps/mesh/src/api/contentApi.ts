@@ -1,5 +1,7 @@
 /* eslint-disable @typescript-eslint/no-explicit-any */
 
+import { createHash } from 'crypto';
+
 import { Prism } from '@nia/prism';
 import express from 'express';
 
@@ -116,6 +118,7 @@ function ok(res: express.Response, data: any, meta: any = {}) {
   const payload: any = { success: true, data };
   if (typeof meta.total === 'number') payload.total = meta.total;
   if (typeof meta.hasMore === 'boolean') payload.hasMore = meta.hasMore;
+  if (typeof meta.version === 'string') payload.version = meta.version;
   return res.json(payload);
 }
 
@@ -124,6 +127,105 @@ function fail(res: express.Response, status: number, message: string, code?: str
   return res.status(status).json({ success: false, error: { message, code, details } });
 }
 
+// Writes to one content item run one at a time (per Mesh instance), so the
+// read-check-write of PUT, PATCH and text edits cannot interleave.
+const contentWriteQueues = new Map<string, Promise<unknown>>();
+
+function withContentLock<T>(type: string, tenant: string, id: string, task: () => Promise<T>): Promise<T> {
+  const key = `${type}:${tenant}:${id}`;
+  const previous = contentWriteQueues.get(key) ?? Promise.resolve();
+  const run = previous.then(task);
+  const tail = run.catch(() => undefined);
+  contentWriteQueues.set(key, tail);
+  void tail.then(() => {
+    if (contentWriteQueues.get(key) === tail) contentWriteQueues.delete(key);
+  });
+  return run;
+}
+
+// Text fields may be stored as a plain string or as { type, content }
+function textOf(value: any): string {
+  if (value && typeof value === 'object' && !Array.isArray(value)) return typeof value.content === 'string' ? value.content : '';
+  return typeof value === 'string' ? value : '';
+}
+
+function withText(value: any, text: string): any {
+  if (value && typeof value === 'object' && !Array.isArray(value)) return { ...value, content: text };
+  return text;
+}
+
+// Same fingerprint as the bot's notes_actions.note_version()
+function textVersion(text: string): string {
+  return createHash('sha256').update(text, 'utf8').digest('hex').slice(0, 16);
+}
+
+class TextEditError extends Error {}
+
+interface TextEdit {
+  op: 'insert' | 'remove' | 'replace';
+  text?: string;
+  anchor?: string;
+  position?: 'start' | 'end' | 'before' | 'after';
+  separator?: string;
+  count?: number;
+}
+
+function replaceOccurrences(text: string, anchor: string, replacement: string, count: number): string {
+  if (count < 0) return text.split(anchor).join(replacement);
+  let result = '';
+  let from = 0;
+  for (let n = 0; n < count; n++) {
+    const index = text.indexOf(anchor, from);
+    if (index < 0) break;
+    result += text.slice(from, index) + replacement;
+    from = index + anchor.length;
+  }
+  return result + text.slice(from);
+}
+
+// Position/anchor edits, applied in order (mirrors the bot's apply_note_edits)
+function applyTextEdits(text: string, edits: TextEdit[]): string {
+  for (const edit of edits) {
+    const insert = edit.text ?? '';
+    const separator = edit.separator ?? '\n';
+    const position = edit.position ?? 'end';
+    if (edit.op === 'insert' && (position === 'start' || position === 'end')) {
+      if (!text) text = insert;
+      else text = position === 'start' ? `${insert}${separator}${text}` : `${text}${separator}${insert}`;
+      continue;
+    }
+
+    if (!edit.anchor) throw new TextEditError(`'${edit.op}' at '${position}' needs anchor text`);
+    const index = text.indexOf(edit.anchor);
+    if (index < 0) throw new TextEditError(`'${edit.anchor.slice(0, 80)}' not found`);
+
+    if (edit.op === 'insert') {
+      if (position === 'before') {
+        text = `${text.slice(0, index)}${insert}${separator}${text.slice(index)}`;
+      } else if (position === 'after') {
+        const end = index + edit.anchor.length;
+        text = `${text.slice(0, end)}${separator}${insert}${text.slice(end)}`;
+      } else {
+        throw new TextEditError(`Unknown insert position: ${position}`);
+      }
+    } else if (edit.op === 'remove') {
+      text = replaceOccurrences(text, edit.anchor, '', edit.count ?? -1);
+    } else if (edit.op === 'replace') {
+      text = replaceOccurrences(text, edit.anchor, insert, edit.count ?? -1);
+    } else {
+      throw new TextEditError(`Unknown edit op: ${(edit as any).op}`);
+    }
+  }
+  return text;
+}
+
+function expectedVersionOf(req: express.Request): string | undefined {
+  const header = req.get('If-Match');
+  if (header && header !== '*') return header.replace(/^W\//, '').replace(/"/g, '').trim();
+  const fromBody = req.body?.expectedVersion;
+  return typeof fromBody === 'string' && fromBody ? fromBody : undefined;
+}
+
 export const contentApiRouter: express.Router = express.Router();
 
 contentApiRouter.use(express.json());
@@ -284,6 +386,10 @@ contentApiRouter.get('/content/:type', async (req: express.Request, res: express
     const offset = req.query.offset ? parseInt(req.query.offset as string, 10) : 0;
     const pageId = req.query.page_id as string | undefined;
     const rawWhere = req.query.where as string | undefined;
+    // Optional projection: comma-separated top-level fields (e.g. fields=title,createdBy)
+    const select = typeof req.query.fields === 'string'
+      ? req.query.fields.split(',').map((f) => f.trim()).filter(Boolean)
+      : undefined;
     if (!type) return fail(res, 400, 'Missing type');
     const prism = await Prism.getInstance();
     let where: any = {};
@@ -298,7 +404,7 @@ contentApiRouter.get('/content/:type', async (req: express.Request, res: express
     }
     let result;
     try {
-      result = await prism.query({ contentType: type, tenantId: tenant, where, limit, offset });
+      result = await prism.query({ contentType: type, tenantId: tenant, where, limit, offset, select });
     } catch (e: any) {
       if (e.message && e.message.includes('no definition found')) {
         console.error(`GET [/content/:type] Definition not found for type=${type}, tenant=${tenant}`);
@@ -400,14 +506,16 @@ contentApiRouter.put('/content/:type/:id', async (req: express.Request, res: exp
       return fail(res, 400, 'Missing type, id or content');
     }
     const prism = await Prism.getInstance();
-    const existing = await prism.query({ contentType: type, tenantId: tenant, where: { page_id: { eq: id } }, limit: 1 });
-    if (existing.total === 0) {
-      console.error(`PUT [/content/:type/:id] Content not found: type=${type}, id=${id}, tenant=${tenant}`);
-      return fail(res, 404, 'Content not found');
-    }
-    const updated = await prism.replace(type, id, content, tenant);
-    if (!updated || updated.total === 0) return fail(res, 500, 'Replace failed', 'CONTENT_REPLACE_FAIL');
-    return ok(res, updated.items[0]);
+    return await withContentLock(type, tenant, id, async () => {
+      const existing = await prism.query({ contentType: type, tenantId: tenant, where: { page_id: { eq: id } }, limit: 1 });
+      if (existing.total === 0) {
+        console.error(`PUT [/content/:type/:id] Content not found: type=${type}, id=${id}, tenant=${tenant}`);
+        return fail(res, 404, 'Content not found');
+      }
+      const updated = await prism.replace(type, id, content, tenant);
+      if (!updated || updated.total === 0) return fail(res, 500, 'Replace failed', 'CONTENT_REPLACE_FAIL');
+      return ok(res, updated.items[0]);
+    });
   } catch (e: any) {
     console.error(`PUT [/content/:type/:id] Content replace error:`, e);
     return fail(res, 500, 'Internal error', 'CONTENT_REPLACE_ERR');
@@ -437,21 +545,77 @@ contentApiRouter.patch('/content/:type/:id', async (req: express.Request, res: e
     // PATCH performs partial update - merge with existing content
     // This uses the atomic JSONB merge optimization when ENABLE_PARTIAL_UPDATES=true
     const prism = await Prism.getInstance();
-    const existing = await prism.query({ contentType: type, tenantId: tenant, where: { page_id: { eq: id } }, limit: 1 });
-    if (existing.total === 0) {
-      console.error(`PATCH [/content/:type/:id] Content not found: type=${type}, id=${id}, tenant=${tenant}`);
-      return fail(res, 404, 'Content not found');
-    }
-    
-    const updated = await prism.update(type, id, content, tenant);
-    if (!updated || updated.total === 0) return fail(res, 500, 'Update failed', 'CONTENT_UPDATE_FAIL');
-    return ok(res, updated.items[0]);
+    return await withContentLock(type, tenant, id, async () => {
+      const existing = await prism.query({ contentType: type, tenantId: tenant, where: { page_id: { eq: id } }, limit: 1 });
+      if (existing.total === 0) {
+        console.error(`PATCH [/content/:type/:id] Content not found: type=${type}, id=${id}, tenant=${tenant}`);
+        return fail(res, 404, 'Content not found');
+      }
+
+      const updated = await prism.update(type, id, content, tenant);
+      if (!updated || updated.total === 0) return fail(res, 500, 'Update failed', 'CONTENT_UPDATE_FAIL');
+      return ok(res, updated.items[0]);
+    });
   } catch (e: any) {
     console.error(`PATCH [/content/:type/:id] Content update error:`, e);
     return fail(res, 500, 'Internal error', 'CONTENT_UPDATE_ERR');
   }
 });
 
+contentApiRouter.patch('/content/:type/:id/edits', async (req: express.Request, res: express.Response) => {
+  try {
+    const { type, id } = req.params;
+    const tenant = req.auth?.user?.tenant || (req.query.tenant as string) || 'any';
+
+    debug('PATCH [/content/:type/:id/edits] request:', { type, id, tenant, body: req.body });
+
+    // Applies position/anchor edits to one text field on the server, so callers
+    // send only the edits. With If-Match (or expectedVersion) the write is
+    // conditional on the field still having that version.
+    const field = req.body?.field ?? 'content';
+    const edits = req.body?.edits;
+    if (!type || !id || typeof field !== 'string' || !field || !Array.isArray(edits) || edits.length === 0) {
+      console.error('PATCH [/content/:type/:id/edits] Missing type, id, field or edits');
+      return fail(res, 400, 'Missing type, id, field or edits', 'BAD_EDITS');
+    }
+    const expectedVersion = expectedVersionOf(req);
+
+    const prism = await Prism.getInstance();
+    return await withContentLock(type, tenant, id, async () => {
+      const existing = await prism.query({ contentType: type, tenantId: tenant, where: { page_id: { eq: id } }, limit: 1 });
+      if (existing.total === 0) {
+        console.error(`PATCH [/content/:type/:id/edits] Content not found: type=${type}, id=${id}, tenant=${tenant}`);
+        return fail(res, 404, 'Content not found');
+      }
+
+      const current = existing.items[0][field];
+      const currentText = textOf(current);
+      const currentVersion = textVersion(currentText);
+      if (expectedVersion && expectedVersion !== currentVersion) {
+        res.set('ETag', `"${currentVersion}"`);
+        return fail(res, 412, `${field} changed since version ${expectedVersion}`, 'VERSION_MISMATCH', { version: currentVersion });
+      }
+
+      let nextText: string;
+      try {
+        nextText = applyTextEdits(currentText, edits);
+      } catch (e: any) {
+        if (e instanceof TextEditError) return fail(res, 422, e.message, 'EDIT_NOT_APPLICABLE');
+        throw e;
+      }
+
+      const updated = await prism.update(type, id, { [field]: withText(current, nextText) }, tenant);
+      if (!updated || updated.total === 0) return fail(res, 500, 'Update failed', 'CONTENT_UPDATE_FAIL');
+      const version = textVersion(nextText);
+      res.set('ETag', `"${version}"`);
+      return ok(res, updated.items[0], { version });
+    });
+  } catch (e: any) {
+    console.error(`PATCH [/content/:type/:id/edits] Content edit error:`, e);
+    return fail(res, 500, 'Internal error', 'CONTENT_EDIT_ERR');
+  }
+});
+
 contentApiRouter.delete('/content/:type/:id', async (req: express.Request, res: express.Response) => {
   try {
     const { type, id } = req.params;
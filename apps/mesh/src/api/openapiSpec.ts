@@ -204,6 +204,55 @@ Content-Type: application/json
         responses: { '200': { description: 'Deleted' }, '404': { description: 'Not found' } }
       }
     },
+    '/content/{type}/{id}/edits': {
+      patch: {
+        summary: 'Apply text edits to one field',
+        description: 'Applies position/anchor edits to a text field on the server (a string, or an object with a string content). Send If-Match (or expectedVersion) with the version last read to make the write conditional; the response carries the new version and ETag.',
+        parameters: [
+          { name: 'type', in: 'path', required: true, schema: { type: 'string' } },
+          { name: 'id', in: 'path', required: true, schema: { type: 'string' } },
+          { name: 'If-Match', in: 'header', schema: { type: 'string' }, description: 'Version (sha256 of the field text, first 16 hex chars) the edits are based on' }
+        ],
+        requestBody: {
+          required: true,
+          content: {
+            'application/json': {
+              schema: {
+                type: 'object',
+                properties: {
+                  field: { type: 'string', default: 'content' },
+                  expectedVersion: { type: 'string', description: 'Alternative to the If-Match header' },
+                  edits: {
+                    type: 'array',
+                    items: {
+                      type: 'object',
+                      properties: {
+                        op: { type: 'string', enum: ['insert', 'remove', 'replace'] },
+                        text: { type: 'string' },
+                        anchor: { type: 'string' },
+                        position: { type: 'string', enum: ['start', 'end', 'before', 'after'], default: 'end' },
+                        separator: { type: 'string', default: '\n' },
+                        count: { type: 'integer', default: -1, description: 'Occurrences to remove/replace; -1 for all' }
+                      },
+                      required: ['op']
+                    }
+                  }
+                },
+                required: ['edits']
+              },
+              example: { field: 'content', expectedVersion: '3f2a9c1b0d4e5f67', edits: [{ op: 'insert', text: '- milk', position: 'end' }] }
+            }
+          }
+        },
+        responses: {
+          '200': { description: 'Updated content, with the new version' },
+          '400': { description: 'Missing field or edits' },
+          '404': { description: 'Not found' },
+          '412': { description: 'Field changed since the expected version' },
+          '422': { description: 'An edit does not apply (e.g. anchor not found)' }
+        }
+      }
+    },
     '/content/{type}': {
       get: {
         summary: 'Query content list',
@@ -213,6 +262,7 @@ Content-Type: application/json
           { name: 'limit', in: 'query', schema: { type: 'integer', minimum: 1, maximum: 500, default: 50 }, description: 'Max items to return' },
           { name: 'offset', in: 'query', schema: { type: 'integer', minimum: 0, default: 0 }, description: 'Skip this many items' },
           { name: 'page_id', in: 'query', schema: { type: 'string' }, description: 'Shorthand filter by specific page_id' },
+          { name: 'fields', in: 'query', schema: { type: 'string' }, description: 'Comma-separated top-level fields to return (_id is always included)', example: 'title,createdBy' },
           { 
             name: 'where', 
             in: 'query', 
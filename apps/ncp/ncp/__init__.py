@@ -1,8 +1,35 @@
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 
-from ncp.routers import agenda_routes, exhibitor_routes, keyword_routes, speaker_routes
+from ncp.routers import (
+    agenda_routes,
+    event_store_routes,
+    exhibitor_routes,
+    keyword_routes,
+    speaker_routes,
+)
+from ncp.services.event_store import (
+    EVENT_STORE_ASSISTANTS,
+    EVENT_STORE_ENABLED,
+    event_store,
+)
+from ncp.services.utils import close_http_client, get_http_client
+
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
+    # One keep-alive client for all upstream API calls, closed on shutdown
+    get_http_client()
+    if EVENT_STORE_ENABLED:
+        event_store.start(EVENT_STORE_ASSISTANTS)
+    yield
+    await event_store.stop()
+    await close_http_client()
+
 
-app = FastAPI()
+app = FastAPI(lifespan=lifespan)
 
 # Include the router from agenda_routes.py
 # Routes will be at the root, e.g. /showAgenda
@@ -10,6 +37,7 @@ app.include_router(agenda_routes.router, tags=["Agendas"])
 app.include_router(speaker_routes.router, tags=["Speakers"])
 app.include_router(exhibitor_routes.router, tags=["Exhibitors"])
 app.include_router(keyword_routes.router, tags=["Keywords"])  # Add this line
+app.include_router(event_store_routes.router, tags=["Event Store"])
 
 if __name__ == "__main__":
     # To run this server:
@@ -0,0 +1,16 @@
+from typing import Any
+
+from fastapi import APIRouter
+
+from ncp.services.event_store import event_store
+
+router = APIRouter()
+
+
+@router.post("/eventStoreStatus")
+async def eventStoreStatus() -> dict[str, Any]:
+    """
+    Reports the local event store: per assistant, snapshot age, last refresh
+    duration, item counts and refresh failures.
+    """
+    return event_store.status()
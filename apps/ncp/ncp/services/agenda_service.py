@@ -1,5 +1,6 @@
-from typing import Any, cast
+from typing import Any
 
+from ncp.services.event_store import AGENDAS, event_store, list_items
 from ncp.services.utils import API_BASE_URL, make_api_get_request
 
 
@@ -8,22 +9,9 @@ async def fetch_agendas_from_api(
 ) -> list[dict[str, Any]]:
     """
     Fetches agenda data from the /api/agendaList endpoint.
+    Served from the local event store while it holds a fresh snapshot.
     """
-    params = {"agent": assistant_name}
-    if query_params:
-        params["query"] = ",".join(query_params)
-
-    url = f"{API_BASE_URL}/api/agendaList"
-
-    data = await make_api_get_request(url, params)
-
-    if data is None:
-        return []  # Return empty list on error, as per original logic
-
-    agendas_value = data.get("agendas")
-    if isinstance(agendas_value, list):
-        return cast("list[dict[str, Any]]", agendas_value)
-    return []
+    return await list_items(AGENDAS, assistant_name, query_params)
 
 
 async def fetch_individual_agenda_from_api(
@@ -31,7 +19,14 @@ async def fetch_individual_agenda_from_api(
 ) -> dict[str, Any] | None:
     """
     Fetches a single agenda item by its title from the /api/agendaDetail endpoint.
+    Exact and close title matches are served from the local event store.
     """
+    collection = event_store.collection(assistant_name, "agendas")
+    if collection is not None:
+        item = collection.find(agenda_title)
+        if item is not None:
+            return item
+
     params = {"agent": assistant_name, "title": agenda_title}
     url = f"{API_BASE_URL}/api/agendaDetail"
 
@@ -0,0 +1,354 @@
+import asyncio
+import difflib
+import os
+import re
+import time
+from collections import Counter
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from typing import Any, cast
+
+from ncp.services.utils import API_BASE_URL, fetch_api_json, make_api_get_request
+
+# Snapshots are refreshed this often and stop being served once older than the
+# max age (e.g. while the backend is down), falling back to live API calls.
+EVENT_STORE_ENABLED = os.getenv("NCP_EVENT_STORE_ENABLED", "true").lower() == "true"
+EVENT_STORE_REFRESH_SECONDS = float(os.getenv("NCP_EVENT_STORE_REFRESH_SECONDS", "60"))
+EVENT_STORE_MAX_AGE_SECONDS = float(os.getenv("NCP_EVENT_STORE_MAX_AGE_SECONDS", "300"))
+# Comma-separated assistants to load at startup; others are added on first use.
+EVENT_STORE_ASSISTANTS = [
+    name.strip()
+    for name in os.getenv("NCP_EVENT_STORE_ASSISTANTS", "").split(",")
+    if name.strip()
+]
+
+FUZZY_TITLE_CUTOFF = 0.8
+FUZZY_TITLE_CANDIDATES = 25
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+@dataclass(frozen=True)
+class CollectionSpec:
+    """How one kind of event content is listed and indexed."""
+
+    kind: str  # "agendas", "speakers", "exhibitors"
+    api_endpoint_path: str
+    title_field: str
+    category_fields: tuple[str, ...]
+    text_fields: tuple[str, ...] = ()
+
+
+AGENDAS = CollectionSpec(
+    kind="agendas",
+    api_endpoint_path="/api/agendaList",
+    title_field="title",
+    category_fields=("track", "type", "category", "categories", "tags"),
+    text_fields=("location", "dayTime"),
+)
+SPEAKERS = CollectionSpec(
+    kind="speakers",
+    api_endpoint_path="/api/speakerList",
+    title_field="name",
+    category_fields=("company", "session", "category", "categories", "tags"),
+    text_fields=("title",),
+)
+EXHIBITORS = CollectionSpec(
+    kind="exhibitors",
+    api_endpoint_path="/api/exhibitor",
+    title_field="title",
+    category_fields=("category", "categories", "exTags", "tags"),
+    text_fields=("location",),
+)
+COLLECTION_SPECS = (AGENDAS, SPEAKERS, EXHIBITORS)
+
+
+def _normalize(text: str) -> str:
+    return " ".join(_TOKEN_RE.findall(text.lower()))
+
+
+def _tokens(text: str) -> set[str]:
+    return set(_TOKEN_RE.findall(text.lower()))
+
+
+def _field_values(item: dict[str, Any], field_name: str) -> list[str]:
+    value = item.get(field_name)
+    if isinstance(value, str):
+        return [value]
+    if isinstance(value, list):
+        return [v for v in value if isinstance(v, str)]
+    return []
+
+
+class IndexedCollection:
+    """
+    Immutable list of items with category, title and keyword indexes.
+
+    Built once per refresh so that list filters and title lookups are dict
+    probes and small set operations instead of API round trips.
+    """
+
+    def __init__(self, spec: CollectionSpec, items: list[dict[str, Any]]) -> None:
+        self.spec = spec
+        self.items = items
+        self._by_category: dict[str, list[int]] = {}
+        self._by_title: dict[str, int] = {}
+        self._by_token: dict[str, set[int]] = {}
+        self._title_tokens: dict[str, set[int]] = {}
+
+        for position, item in enumerate(items):
+            for title in _field_values(item, spec.title_field):
+                normalized = _normalize(title)
+                self._by_title.setdefault(normalized, position)
+                for token in normalized.split():
+                    self._title_tokens.setdefault(token, set()).add(position)
+            categories = {
+                _normalize(value)
+                for field_name in spec.category_fields
+                for value in _field_values(item, field_name)
+            }
+            for category in categories:
+                self._by_category.setdefault(category, []).append(position)
+            for field_name in (
+                spec.title_field,
+                *spec.category_fields,
+                *spec.text_fields,
+            ):
+                for value in _field_values(item, field_name):
+                    for token in _tokens(value):
+                        self._by_token.setdefault(token, set()).add(position)
+
+    def _match_term(self, term: str) -> Iterable[int]:
+        """
+        Positions matching one query term (case and punctuation insensitive).
+
+        A term equal to a category value (``category_fields``) matches exactly
+        that category; any other term matches items whose title, category or
+        text fields contain every word of it.
+        """
+        normalized = _normalize(term)
+        by_category = self._by_category.get(normalized)
+        if by_category is not None:
+            return by_category
+        # Not an exact category: items carrying every word of the term
+        token_sets = [self._by_token.get(token, set()) for token in normalized.split()]
+        return set.intersection(*token_sets) if token_sets else ()
+
+    def filter(self, query: list[str] | None) -> list[dict[str, Any]]:
+        """
+        Items matching any of the query terms (see ``_match_term``), in
+        upstream order; an empty query returns every item.
+        """
+        if not query:
+            return list(self.items)
+        positions: set[int] = set()
+        for term in query:
+            positions.update(self._match_term(term))
+        return [self.items[position] for position in sorted(positions)]
+
+    def find(self, title: str) -> dict[str, Any] | None:
+        """Exact (case and punctuation insensitive) or close title match."""
+        normalized = _normalize(title)
+        position = self._by_title.get(normalized)
+        if position is not None:
+            return self.items[position]
+        # Only the titles sharing the most words with the request are compared
+        shared_words: Counter[int] = Counter()
+        for token in normalized.split():
+            shared_words.update(self._title_tokens.get(token, ()))
+        titles = {
+            _normalize(value): candidate
+            for candidate, _ in shared_words.most_common(FUZZY_TITLE_CANDIDATES)
+            for value in _field_values(self.items[candidate], self.spec.title_field)
+        }
+        matches = difflib.get_close_matches(
+            normalized, list(titles), n=1, cutoff=FUZZY_TITLE_CUTOFF
+        )
+        return self.items[titles[matches[0]]] if matches else None
+
+
+@dataclass
+class AssistantSnapshot:
+    """The latest indexed content for one assistant and how it was obtained."""
+
+    collections: dict[str, IndexedCollection] = field(default_factory=dict)
+    refreshed_at: float | None = None  # time.time() of the last full success
+    refreshed_monotonic: float | None = None
+    last_refresh_ms: float | None = None
+    refresh_count: int = 0
+    failure_count: int = 0
+    last_error: str | None = None
+
+    def age_seconds(self) -> float | None:
+        if self.refreshed_monotonic is None:
+            return None
+        return time.monotonic() - self.refreshed_monotonic
+
+
+class EventStore:
+    """
+    In-process, periodically refreshed snapshots of each assistant's agenda,
+    speakers and exhibitors.
+
+    The store only serves data while its refresh loop is running (started by
+    the app lifespan) and the snapshot is younger than max_age_seconds;
+    otherwise callers fall back to the API. Assistants are tracked from the
+    configured list and from the first request that mentions them.
+    """
+
+    def __init__(
+        self,
+        refresh_seconds: float = EVENT_STORE_REFRESH_SECONDS,
+        max_age_seconds: float = EVENT_STORE_MAX_AGE_SECONDS,
+    ) -> None:
+        self.refresh_seconds = refresh_seconds
+        self.max_age_seconds = max_age_seconds
+        self._snapshots: dict[str, AssistantSnapshot] = {}
+        self._refreshing: dict[str, asyncio.Task[None]] = {}
+        self._loop_task: asyncio.Task[None] | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._loop_task is not None and not self._loop_task.done()
+
+    def start(self, assistant_names: Iterable[str] = ()) -> None:
+        if self.running:
+            return
+        for name in assistant_names:
+            self._snapshots.setdefault(name, AssistantSnapshot())
+        self._loop_task = asyncio.create_task(self._refresh_loop())
+
+    async def stop(self) -> None:
+        tasks = [*self._refreshing.values()]
+        if self._loop_task is not None:
+            tasks.append(self._loop_task)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._loop_task = None
+        self._refreshing.clear()
+        self._snapshots.clear()
+
+    def collection(self, assistant_name: str, kind: str) -> IndexedCollection | None:
+        """
+        The fresh indexed collection for an assistant, or None to use the API.
+
+        Unknown assistants are registered and loaded in the background.
+        """
+        if not self.running:
+            return None
+        snapshot = self._snapshots.get(assistant_name)
+        if snapshot is None:
+            self._snapshots[assistant_name] = AssistantSnapshot()
+            self._schedule_refresh(assistant_name)
+            return None
+        age = snapshot.age_seconds()
+        if age is None or age > self.max_age_seconds:
+            return None
+        return snapshot.collections.get(kind)
+
+    def status(self) -> dict[str, Any]:
+        """Freshness and refresh cost of every tracked assistant's snapshot."""
+        assistants: dict[str, Any] = {}
+        for name, snapshot in self._snapshots.items():
+            age = snapshot.age_seconds()
+            assistants[name] = {
+                "fresh": age is not None and age <= self.max_age_seconds,
+                "age_seconds": None if age is None else round(age, 3),
+                "refreshed_at": snapshot.refreshed_at,
+                "last_refresh_ms": snapshot.last_refresh_ms,
+                "refresh_count": snapshot.refresh_count,
+                "failure_count": snapshot.failure_count,
+                "last_error": snapshot.last_error,
+                "counts": {
+                    kind: len(collection.items)
+                    for kind, collection in snapshot.collections.items()
+                },
+            }
+        return {
+            "running": self.running,
+            "refresh_seconds": self.refresh_seconds,
+            "max_age_seconds": self.max_age_seconds,
+            "assistants": assistants,
+        }
+
+    def _schedule_refresh(self, assistant_name: str) -> None:
+        if assistant_name in self._refreshing:
+            return
+        task = asyncio.create_task(self.refresh(assistant_name))
+        self._refreshing[assistant_name] = task
+        task.add_done_callback(lambda _: self._refreshing.pop(assistant_name, None))
+
+    async def _refresh_loop(self) -> None:
+        while True:
+            for name in list(self._snapshots):
+                self._schedule_refresh(name)
+            await asyncio.sleep(self.refresh_seconds)
+
+    async def refresh(self, assistant_name: str) -> None:
+        """
+        Reloads every collection for an assistant and rebuilds its indexes.
+
+        A collection whose list request fails keeps its previous contents, and
+        the snapshot only counts as refreshed when every list request succeeded.
+        """
+        snapshot = self._snapshots.setdefault(assistant_name, AssistantSnapshot())
+        started = time.perf_counter()
+        responses = await asyncio.gather(
+            *(
+                fetch_api_json(
+                    f"{API_BASE_URL}{spec.api_endpoint_path}",
+                    {"agent": assistant_name},
+                )
+                for spec in COLLECTION_SPECS
+            )
+        )
+        collections = dict(snapshot.collections)
+        failed: list[str] = []
+        for spec, data in zip(COLLECTION_SPECS, responses, strict=True):
+            items = data.get(spec.kind) if data is not None else None
+            if isinstance(items, list):
+                collections[spec.kind] = IndexedCollection(spec, items)
+            else:
+                failed.append(spec.kind)
+
+        snapshot.collections = collections
+        snapshot.last_refresh_ms = round((time.perf_counter() - started) * 1000, 3)
+        if failed:
+            snapshot.failure_count += 1
+            snapshot.last_error = f"Failed to load {', '.join(failed)}"
+            print(f"Event store refresh for {assistant_name}: {snapshot.last_error}")
+            return
+        snapshot.refreshed_at = time.time()
+        snapshot.refreshed_monotonic = time.monotonic()
+        snapshot.refresh_count += 1
+        snapshot.last_error = None
+
+
+event_store = EventStore()
+
+
+async def list_items(
+    spec: CollectionSpec, assistant_name: str, query_params: list[str] | None
+) -> list[dict[str, Any]]:
+    """
+    Lists a collection from the local event store while it holds a fresh
+    snapshot, otherwise from its API list endpoint (empty list on error).
+    A query the local indexes cannot match is passed on to the API, whose
+    search rules may be broader.
+    """
+    collection = event_store.collection(assistant_name, spec.kind)
+    if collection is not None:
+        local_items = collection.filter(query_params)
+        if local_items:
+            return local_items
+
+    params = {"agent": assistant_name}
+    if query_params:
+        params["query"] = ",".join(query_params)
+
+    data = await make_api_get_request(f"{API_BASE_URL}{spec.api_endpoint_path}", params)
+    items = data.get(spec.kind) if data is not None else None
+    if isinstance(items, list):
+        return cast("list[dict[str, Any]]", items)
+    return []
@@ -1,5 +1,6 @@
-from typing import Any, cast
+from typing import Any
 
+from ncp.services.event_store import EXHIBITORS, event_store, list_items
 from ncp.services.utils import API_BASE_URL, make_api_get_request
 
 
@@ -8,22 +9,9 @@ async def fetch_exhibitors_from_api(
 ) -> list[dict[str, Any]]:
     """
     Fetches exhibitor data from the /api/exhibitor endpoint.
+    Served from the local event store while it holds a fresh snapshot.
     """
-    params = {"agent": assistant_name}
-    if query_params:
-        params["query"] = ",".join(query_params)
-
-    url = f"{API_BASE_URL}/api/exhibitor"
-
-    data = await make_api_get_request(url, params)
-
-    if data is None:
-        return []
-
-    exhibitors_value = data.get("exhibitors")
-    if isinstance(exhibitors_value, list):
-        return cast("list[dict[str, Any]]", exhibitors_value)
-    return []
+    return await list_items(EXHIBITORS, assistant_name, query_params)
 
 
 async def fetch_individual_exhibitor_from_api(
@@ -31,7 +19,14 @@ async def fetch_individual_exhibitor_from_api(
 ) -> dict[str, Any] | None:
     """
     Fetches a single exhibitor by their title from the /api/exhibitorDetail endpoint.
+    Exact and close title matches are served from the local event store.
     """
+    collection = event_store.collection(assistant_name, "exhibitors")
+    if collection is not None:
+        item = collection.find(exhibitor_title)
+        if item is not None:
+            return item
+
     params = {"agent": assistant_name, "title": exhibitor_title}
     url = f"{API_BASE_URL}/api/exhibitorDetail"
 
@@ -0,0 +1,65 @@
+import asyncio
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any
+
+CacheValue = dict[str, Any] | None
+
+
+class ResponseCache:
+    """
+    TTL cache for upstream API responses with request coalescing.
+
+    Concurrent lookups for the same key share one in-flight fetch, and
+    successful (non-None) results are served from memory until they expire.
+    Failures are not cached, so the next caller retries the backend.
+    Cached dictionaries are shared between callers and must be treated as
+    read-only.
+    """
+
+    def __init__(self, ttl_seconds: float, max_entries: int = 1024) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: OrderedDict[Hashable, tuple[float, dict[str, Any]]] = (
+            OrderedDict()
+        )
+        self._in_flight: dict[Hashable, asyncio.Task[CacheValue]] = {}
+
+    async def get_or_fetch(
+        self, key: Hashable, fetch: Callable[[], Awaitable[CacheValue]]
+    ) -> CacheValue:
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires_at, value = entry
+            if expires_at > time.monotonic():
+                self._entries.move_to_end(key)
+                return value
+            del self._entries[key]
+
+        task = self._in_flight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch_and_store(key, fetch))
+            self._in_flight[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+        # Shield so one cancelled caller does not cancel the fetch for the others
+        return await asyncio.shield(task)
+
+    async def _fetch_and_store(
+        self, key: Hashable, fetch: Callable[[], Awaitable[CacheValue]]
+    ) -> CacheValue:
+        value = await fetch()
+        if value is not None and self.ttl_seconds > 0:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return value
+
+    def _forget(self, key: Hashable, task: asyncio.Task[CacheValue]) -> None:
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._in_flight.clear()
@@ -1,5 +1,6 @@
-from typing import Any, cast
+from typing import Any
 
+from ncp.services.event_store import SPEAKERS, event_store, list_items
 from ncp.services.utils import API_BASE_URL, make_api_get_request
 
 
@@ -8,22 +9,9 @@ async def fetch_speakers_from_api(
 ) -> list[dict[str, Any]]:
     """
     Fetches speaker data from the /api/speakerList endpoint.
+    Served from the local event store while it holds a fresh snapshot.
     """
-    params = {"agent": assistant_name}
-    if query_params:
-        params["query"] = ",".join(query_params)
-
-    url = f"{API_BASE_URL}/api/speakerList"
-
-    data = await make_api_get_request(url, params)
-
-    if data is None:
-        return []  # Return empty list on error, as per original logic
-
-    speakers_value = data.get("speakers")
-    if isinstance(speakers_value, list):
-        return cast("list[dict[str, Any]]", speakers_value)
-    return []
+    return await list_items(SPEAKERS, assistant_name, query_params)
 
 
 async def fetch_individual_speaker_from_api(
@@ -31,7 +19,14 @@ async def fetch_individual_speaker_from_api(
 ) -> dict[str, Any] | None:
     """
     Fetches a single speaker by their name from the /api/speakerDetail endpoint.
+    Exact and close name matches are served from the local event store.
     """
+    collection = event_store.collection(assistant_name, "speakers")
+    if collection is not None:
+        item = collection.find(speaker_name)
+        if item is not None:
+            return item
+
     params = {"agent": assistant_name, "name": speaker_name}
     url = f"{API_BASE_URL}/api/speakerDetail"
 
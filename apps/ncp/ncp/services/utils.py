@@ -1,9 +1,72 @@
+import os
 from typing import Any
 
 import httpx
 
+from ncp.services.response_cache import ResponseCache
+
 API_BASE_URL = "http://localhost:3000"  # Centralized API base URL
 
+# Successful upstream responses are reused for this long; 0 disables caching
+# (concurrent identical requests are still coalesced into one).
+API_CACHE_TTL_SECONDS = float(os.getenv("NCP_API_CACHE_TTL_SECONDS", "30"))
+API_CACHE_MAX_ENTRIES = int(os.getenv("NCP_API_CACHE_MAX_ENTRIES", "1024"))
+
+_HTTP_TIMEOUT = httpx.Timeout(10.0)
+_HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20)
+
+_client: httpx.AsyncClient | None = None
+response_cache = ResponseCache(API_CACHE_TTL_SECONDS, API_CACHE_MAX_ENTRIES)
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Returns the shared keep-alive client, creating it on first use.
+
+    The app lifespan opens it at startup and closes it at shutdown; creating it
+    lazily keeps the services usable outside the app (scripts, tests).
+    """
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(timeout=_HTTP_TIMEOUT, limits=_HTTP_LIMITS)
+    return _client
+
+
+async def close_http_client() -> None:
+    """Closes the shared client and drops cached responses."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+    response_cache.clear()
+
+
+async def fetch_api_json(url: str, params: dict[str, str]) -> dict[str, Any] | None:
+    """
+    Uncached GET through the shared client; see make_api_get_request.
+    """
+    client = get_http_client()
+    try:
+        response = await client.get(url, params=params)
+        response.raise_for_status()  # Raise for HTTP errors (4xx or 5xx)
+        # Ensure that json() is only called on non-empty responses if necessary,
+        # though httpx typically handles this. An empty JSON body might be {}.
+        data = response.json()
+        return data if isinstance(data, dict) else None
+    except httpx.HTTPStatusError as e:
+        error_message = (
+            f"HTTP error for URL {url} with params {params}: "
+            f"{e.response.status_code} - {e.response.text}"
+        )
+        print(error_message)
+        return None
+    except httpx.RequestError as e:
+        print(f"Request error occurred for URL {url} with params {params}: {e}")
+        return None
+    except Exception as e:  # Catch other potential errors, e.g., JSONDecodeError
+        print(f"An unexpected error occurred for URL {url} with params {params}: {e}")
+        return None
+
 
 async def make_api_get_request(
     url: str, params: dict[str, str]
@@ -13,27 +76,9 @@ async def make_api_get_request(
 
     Handles common HTTP errors and returns the JSON response as a dictionary
     or None if an error occurs or the response is empty. Prints error details.
+    Requests go through the shared client; identical requests in flight are
+    coalesced and successful responses are cached for API_CACHE_TTL_SECONDS.
+    The returned dictionary may be shared with other callers; do not mutate it.
     """
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.get(url, params=params)
-            response.raise_for_status()  # Raise for HTTP errors (4xx or 5xx)
-            # Ensure that json() is only called on non-empty responses if necessary,
-            # though httpx typically handles this. An empty JSON body might be {}.
-            data = response.json()
-            return data if isinstance(data, dict) else None
-        except httpx.HTTPStatusError as e:
-            error_message = (
-                f"HTTP error for URL {url} with params {params}: "
-                f"{e.response.status_code} - {e.response.text}"
-            )
-            print(error_message)
-            return None
-        except httpx.RequestError as e:
-            print(f"Request error occurred for URL {url} with params {params}: {e}")
-            return None
-        except Exception as e:  # Catch other potential errors, e.g., JSONDecodeError
-            print(
-                f"An unexpected error occurred for URL {url} with params {params}: {e}"
-            )
-            return None
+    key = (url, tuple(sorted(params.items())))
+    return await response_cache.get_or_fetch(key, lambda: fetch_api_json(url, params))
@@ -0,0 +1,13 @@
+from collections.abc import Iterator
+
+import pytest
+
+from ncp.services import utils
+
+
+@pytest.fixture(autouse=True)
+def clear_response_cache() -> Iterator[None]:
+    """Keeps cached upstream responses from leaking between tests."""
+    utils.response_cache.clear()
+    yield
+    utils.response_cache.clear()
@@ -0,0 +1,99 @@
+import asyncio
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from ncp.services.agenda_service import (
+    fetch_agendas_from_api,
+    fetch_individual_agenda_from_api,
+)
+from ncp.services.event_store import AGENDAS, EventStore, IndexedCollection
+from ncp.services.utils import API_BASE_URL
+
+AGENDA_ITEMS: list[dict[str, Any]] = [
+    {"title": "Opening Keynote", "track": "Keynotes", "location": "Main Hall"},
+    {"title": "Cruise Ship Design Trends", "track": "Design", "tags": ["ships"]},
+    {"title": "Port Operations Panel", "track": "Operations", "type": "Panel"},
+]
+
+
+def _upstream(url: str, params: dict[str, str]) -> dict[str, Any] | None:
+    if url == f"{API_BASE_URL}/api/agendaList":
+        return {"agendas": AGENDA_ITEMS}
+    if url == f"{API_BASE_URL}/api/speakerList":
+        return {"speakers": [{"name": "Ada Lovelace", "company": "Engines"}]}
+    return None  # exhibitors unavailable
+
+
+def test_indexed_collection_filters_and_finds_titles() -> None:
+    """Category, keyword and title lookups are answered from the indexes."""
+    agendas = IndexedCollection(AGENDAS, AGENDA_ITEMS)
+
+    assert agendas.filter(None) == AGENDA_ITEMS
+    assert agendas.filter(["keynotes"]) == [AGENDA_ITEMS[0]]
+    assert agendas.filter(["Panel", "design"]) == AGENDA_ITEMS[1:]
+    assert agendas.filter(["main hall"]) == [AGENDA_ITEMS[0]]
+    assert agendas.filter(["unknown"]) == []
+
+    assert agendas.find("opening keynote!") == AGENDA_ITEMS[0]
+    assert agendas.find("Port Operation Panel") == AGENDA_ITEMS[2]
+    assert agendas.find("Closing Party") is None
+
+
+@pytest.mark.asyncio
+async def test_refresh_keeps_partial_results_but_stays_stale() -> None:
+    """A failed collection is reported and the snapshot is not marked fresh."""
+    store = EventStore(refresh_seconds=60, max_age_seconds=300)
+    with patch(
+        "ncp.services.event_store.fetch_api_json", AsyncMock(side_effect=_upstream)
+    ):
+        await store.refresh("expo")
+
+    status = store.status()["assistants"]["expo"]
+    assert status["counts"] == {"agendas": 3, "speakers": 1}
+    assert status["fresh"] is False
+    assert status["failure_count"] == 1
+    assert status["last_error"] == "Failed to load exhibitors"
+    assert status["last_refresh_ms"] is not None
+
+
+@pytest.mark.asyncio
+async def test_services_answer_from_fresh_snapshot() -> None:
+    """Once loaded, agenda lookups no longer reach the API."""
+    store = EventStore(refresh_seconds=60, max_age_seconds=300)
+    fetch_json = AsyncMock(
+        side_effect=lambda url, params: (
+            {"agendas": AGENDA_ITEMS}
+            if url.endswith("/api/agendaList")
+            else {"speakers": [], "exhibitors": []}
+        )
+    )
+    api_get = AsyncMock(return_value=None)
+
+    with (
+        patch("ncp.services.event_store.fetch_api_json", fetch_json),
+        patch("ncp.services.event_store.event_store", store),
+        patch("ncp.services.agenda_service.event_store", store),
+        patch("ncp.services.event_store.make_api_get_request", api_get),
+        patch("ncp.services.agenda_service.make_api_get_request", api_get),
+    ):
+        store.start()
+        try:
+            # First request registers the assistant and goes to the API
+            assert await fetch_agendas_from_api("expo", ["design"]) == []
+            await asyncio.sleep(0)
+            await asyncio.gather(*store._refreshing.values())
+
+            assert await fetch_agendas_from_api("expo", ["design"]) == [AGENDA_ITEMS[1]]
+            # Nothing matches locally, so the API decides
+            assert await fetch_agendas_from_api("expo", ["catering"]) == []
+            agenda = await fetch_individual_agenda_from_api("expo", "Opening Keynote")
+            assert agenda == AGENDA_ITEMS[0]
+            assert store.status()["assistants"]["expo"]["fresh"] is True
+        finally:
+            await store.stop()
+
+    assert api_get.call_count == 2
+    assert api_get.call_args.args[1] == {"agent": "expo", "query": "catering"}
+    assert store.collection("expo", "agendas") is None  # stopped store serves nothing
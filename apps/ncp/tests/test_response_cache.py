@@ -0,0 +1,84 @@
+import asyncio
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from httpx import Request, RequestError, Response
+
+from ncp.services.agenda_service import fetch_agendas_from_api
+from ncp.services.response_cache import ResponseCache
+from ncp.services.utils import API_BASE_URL
+
+
+@pytest.mark.asyncio
+async def test_concurrent_agenda_queries_share_one_upstream_call() -> None:
+    """Identical in-flight list queries collapse into a single GET."""
+    expected_agendas = [{"id": 1, "title": "Keynote"}]
+
+    async def slow_get(*_args: Any, **_kwargs: Any) -> Response:
+        await asyncio.sleep(0.01)
+        return Response(
+            200,
+            json={"agendas": expected_agendas},
+            request=Request("GET", f"{API_BASE_URL}/api/agendaList"),
+        )
+
+    with patch(
+        "ncp.services.utils.httpx.AsyncClient.get", AsyncMock(side_effect=slow_get)
+    ) as mock_get:
+        results = await asyncio.gather(
+            *(fetch_agendas_from_api("test_assistant", ["day1"]) for _ in range(50))
+        )
+        # Served from the cache once the first response is in
+        assert await fetch_agendas_from_api("test_assistant", ["day1"]) == (
+            expected_agendas
+        )
+
+    assert mock_get.call_count == 1
+    assert all(agendas == expected_agendas for agendas in results)
+
+
+@pytest.mark.asyncio
+async def test_failed_requests_are_not_cached() -> None:
+    """An upstream error is returned to every waiter, then retried."""
+    mock_get = AsyncMock(side_effect=RequestError("Network error"))
+
+    with patch("ncp.services.utils.httpx.AsyncClient.get", mock_get):
+        assert await fetch_agendas_from_api("test_assistant") == []
+        assert await fetch_agendas_from_api("test_assistant") == []
+
+    assert mock_get.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_entries_expire_after_ttl() -> None:
+    """Cached values are refetched once their TTL has passed."""
+    cache = ResponseCache(ttl_seconds=0.05)
+    fetch = AsyncMock(side_effect=[{"n": 1}, {"n": 2}])
+
+    assert await cache.get_or_fetch("k", fetch) == {"n": 1}
+    assert await cache.get_or_fetch("k", fetch) == {"n": 1}
+    await asyncio.sleep(0.06)
+    assert await cache.get_or_fetch("k", fetch) == {"n": 2}
+    assert fetch.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_does_not_cancel_shared_fetch() -> None:
+    """Other callers still get the result when the first caller goes away."""
+    cache = ResponseCache(ttl_seconds=30)
+    release = asyncio.Event()
+
+    async def fetch() -> dict[str, Any]:
+        await release.wait()
+        return {"ok": True}
+
+    first = asyncio.create_task(cache.get_or_fetch("k", fetch))
+    second = asyncio.create_task(cache.get_or_fetch("k", fetch))
+    await asyncio.sleep(0)
+    first.cancel()
+    release.set()
+
+    assert await second == {"ok": True}
+    with pytest.raises(asyncio.CancelledError):
+        await first
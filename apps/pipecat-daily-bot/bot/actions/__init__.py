@@ -26,6 +26,7 @@ __all__ = [
     'get_note_by_id',
     'create_note',
     'update_note_content',
+    'patch_note_content',
     'append_to_note',
     'update_note_title',
     'delete_note',
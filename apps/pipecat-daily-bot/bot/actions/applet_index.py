@@ -0,0 +1,169 @@
+"""Per-user in-memory index of applet titles.
+
+Backs ``html_actions.fuzzy_search_applets`` and ``make_unique_title`` so that
+resolving an applet by name does not list every applet from Mesh. An index is
+filled from one metadata listing, kept current by the create/update/delete and
+share actions running in this process, and reloaded after
+``BOT_APPLET_INDEX_TTL_SECS`` to pick up changes made elsewhere.
+"""
+
+import re
+import time
+from collections import OrderedDict
+from difflib import SequenceMatcher
+from typing import Awaitable, Callable, Optional
+
+from core.config import BOT_APPLET_INDEX_TTL_SECS
+
+MAX_INDEXED_USERS = 256
+
+# "Title", "Title 2", "Title 3" ... -> (stem, number)
+_SUFFIX_RE = re.compile(r"^(.*?)(?: (\d+))?$")
+
+Loader = Callable[[], Awaitable[list[dict]]]
+
+
+def normalize_title(title: Optional[str]) -> str:
+    return (title or "").strip().lower()
+
+
+class AppletTitleIndex:
+    """Applet metadata for one user, keyed by id with title lookups."""
+
+    def __init__(self, generations: list[dict]):
+        self.loaded_at = time.monotonic()
+        self._entries: dict[str, dict] = {}
+        # normalized title -> ids (dict keeps listing order for ties)
+        self._by_title: dict[str, dict[str, None]] = {}
+        # title stem -> {suffix number: entry count}
+        self._suffixes: dict[str, dict[int, int]] = {}
+        for gen in generations:
+            self.upsert(gen)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, gen_id: str) -> bool:
+        return gen_id in self._entries
+
+    def upsert(self, gen: dict) -> None:
+        gen_id = gen.get("_id")
+        if not gen_id:
+            return
+        self.remove(gen_id)
+        self._entries[gen_id] = gen
+        title = normalize_title(gen.get("title"))
+        self._by_title.setdefault(title, {})[gen_id] = None
+        stem, number = self._split(title)
+        numbers = self._suffixes.setdefault(stem, {})
+        numbers[number] = numbers.get(number, 0) + 1
+
+    def update(self, gen_id: str, changes: dict) -> None:
+        entry = self._entries.get(gen_id)
+        if entry is not None:
+            self.upsert({**entry, **changes})
+
+    def remove(self, gen_id: str) -> None:
+        entry = self._entries.pop(gen_id, None)
+        if entry is None:
+            return
+        title = normalize_title(entry.get("title"))
+        ids = self._by_title[title]
+        del ids[gen_id]
+        if not ids:
+            del self._by_title[title]
+        stem, number = self._split(title)
+        numbers = self._suffixes[stem]
+        numbers[number] -= 1
+        if not numbers[number]:
+            del numbers[number]
+            if not numbers:
+                del self._suffixes[stem]
+
+    def best_match(self, title: str) -> tuple[float, Optional[dict]]:
+        """Highest SequenceMatcher ratio against ``title`` and its applet."""
+        search_term = normalize_title(title)
+        exact = self._by_title.get(search_term)
+        if exact:
+            return 1.0, self._entries[next(iter(exact))]
+        best_score, best_gen = 0.0, None
+        matcher = SequenceMatcher(None)
+        matcher.set_seq1(search_term)
+        for gen_title, ids in self._by_title.items():
+            matcher.set_seq2(gen_title)
+            # Cheap upper bounds first; only candidates that could win get the full ratio
+            if matcher.real_quick_ratio() <= best_score or matcher.quick_ratio() <= best_score:
+                continue
+            score = matcher.ratio()
+            if score > best_score:
+                best_score, best_gen = score, self._entries[next(iter(ids))]
+        return best_score, best_gen
+
+    def next_free_title(self, base_title: str) -> str:
+        """``base_title`` if unused, else the base with the next free number."""
+        base = normalize_title(base_title)
+        if base not in self._by_title:
+            return base_title
+        # The plain title counts as 1, so the first duplicate becomes "Title 2"
+        numbers = self._suffixes.get(base, {})
+        return f"{base_title} {max([1, *numbers]) + 1}"
+
+    @staticmethod
+    def _split(title: str) -> tuple[str, int]:
+        stem, number = _SUFFIX_RE.match(title).groups()
+        if number is None:
+            return title, 1
+        return stem, int(number)
+
+
+_indexes: "OrderedDict[tuple[str, str], AppletTitleIndex]" = OrderedDict()
+
+
+async def get_index(tenant_id: str, user_id: str, loader: Loader) -> Optional[AppletTitleIndex]:
+    """Return the user's index, loading it with ``loader`` when missing or expired.
+
+    Returns None when the index is disabled; callers then fall back to a listing.
+    A loader that raises leaves any previous index in place and propagates.
+    """
+    ttl = BOT_APPLET_INDEX_TTL_SECS()
+    if ttl <= 0:
+        return None
+    key = (tenant_id, user_id)
+    index = _indexes.get(key)
+    if index is not None and time.monotonic() - index.loaded_at < ttl:
+        _indexes.move_to_end(key)
+        return index
+
+    index = AppletTitleIndex(await loader())
+    _indexes[key] = index
+    _indexes.move_to_end(key)
+    while len(_indexes) > MAX_INDEXED_USERS:
+        _indexes.popitem(last=False)
+    return index
+
+
+def applet_created(tenant_id: str, user_id: str, gen: dict) -> None:
+    index = _indexes.get((tenant_id, user_id))
+    if index is not None:
+        index.upsert(gen)
+
+
+def applet_updated(gen_id: str, changes: dict) -> None:
+    """Apply metadata changes to every index holding the applet (owner and sharees)."""
+    for index in _indexes.values():
+        if gen_id in index:
+            index.update(gen_id, changes)
+
+
+def applet_deleted(gen_id: str) -> None:
+    for index in _indexes.values():
+        index.remove(gen_id)
+
+
+def invalidate(tenant_id: str, user_id: str) -> None:
+    """Drop a user's index, e.g. after an applet was shared with them."""
+    _indexes.pop((tenant_id, user_id), None)
+
+
+def clear() -> None:
+    _indexes.clear()
@@ -8,12 +8,13 @@ This module handles HTML generation (creation engine) operations:
 Uses mesh_client.request() for all HTTP operations to /content/HtmlGeneration endpoint.
 """
 
+import asyncio
 import logging
-from typing import Optional, Callable, Awaitable, TypeVar
+from typing import Optional, Callable, Awaitable, Sequence, TypeVar
 from loguru import logger
-from difflib import SequenceMatcher
 from tools.sharing import utils as sharing_tools
-from actions import sharing_actions
+from actions import applet_index, sharing_actions
+from actions.applet_index import AppletTitleIndex
 import json
 import sys
 import os
@@ -26,6 +27,21 @@ from services import mesh as mesh_client
 # Type variable for ensure wrapper return type
 T = TypeVar('T')
 
+# Fields needed by listings, title lookups and permission checks. Requesting only
+# these keeps htmlContent (often hundreds of KB per applet) off the wire; bodies
+# are fetched by id when an applet is actually rendered or edited.
+HTML_GENERATION_METADATA_FIELDS = (
+    "title",
+    "contentType",
+    "createdBy",
+    "tenantId",
+    "tags",
+    "userRequest",
+    "sourceNoteId",
+    "createdAt",
+    "updatedAt",
+)
+
 
 async def create_html_generation_definition(tenant_id: str) -> bool:
     """Create the HtmlGeneration content definition in Mesh for this tenant.
@@ -46,11 +62,15 @@ async def create_html_generation_definition(tenant_id: str) -> bool:
         
         mesh_secret = os.getenv("MESH_SHARED_SECRET")
         
-        success = register_content_definition(
+        # Mesh just reported it missing, so bypass the process-level ensured cache;
+        # the registration uses blocking requests, keep it off the event loop
+        success = await asyncio.to_thread(
+            register_content_definition,
             definition=HTMLGENERATION_DEFINITION,
             mesh_url=mesh_url,
             tenant=tenant_id,
-            mesh_secret=mesh_secret
+            mesh_secret=mesh_secret,
+            force=True,
         )
         
         if success:
@@ -121,6 +141,70 @@ async def ensure_html_generation_definition(
             raise
 
 
+def _generation_metadata(gen: dict) -> dict:
+    """Listing metadata for a generation (never includes htmlContent)."""
+    sharing_info = gen.get('_sharing', {})
+    return {
+        "_id": gen.get("_id"),
+        "title": gen.get("title", ""),
+        "contentType": gen.get("contentType", "app"),
+        "createdBy": gen.get("createdBy", ""),
+        "tenantId": gen.get("tenantId", ""),
+        "tags": gen.get("tags", []),
+        "userRequest": gen.get("userRequest", ""),
+        "sourceNoteId": gen.get("sourceNoteId"),
+        "createdAt": gen.get("createdAt"),
+        "updatedAt": gen.get("updatedAt"),
+        # Add sharing metadata
+        "isShared": bool(sharing_info),
+        "accessLevel": sharing_info.get('role', 'owner'),
+        "isGlobal": sharing_info.get('isGlobal', False)
+    }
+
+
+async def _list_generation_metadata(tenant_id: str, user_id: str) -> tuple[list[dict], bool]:
+    """Personal and shared generation metadata, plus whether both lookups succeeded."""
+    # Aggregate all generations/applets for user
+    generations = []
+    complete = True
+
+    # get user generations/applets
+    # BUILD QUERY (actions layer responsibility)
+    where = {"AND": [
+        {"indexer": {"path": "tenantId", "equals": tenant_id}},
+        {"parent_id": {"eq": user_id}}
+    ]}
+    params = {
+        "tenant": tenant_id,
+        "where": json.dumps(where, separators=(',', ':')),
+        "limit": '100',
+        "fields": ",".join(HTML_GENERATION_METADATA_FIELDS),
+    }
+    # EXECUTE REQUEST (mesh_client responsibility)
+    response = await mesh_client.request("GET", "/content/HtmlGeneration", params=params)
+    # VALIDATE & TRANSFORM (actions layer responsibility)
+    if response.get("success"):
+        personal_generations = response.get("data", [])
+        generations.extend(personal_generations)
+        logger.debug(f"[html_actions] Listed {len(personal_generations)} personal generations for tenant {tenant_id}")
+    else:
+        complete = False
+        logger.error(f"[html_actions] Failed to list work generations: {response.get('error')}")
+
+    # Now get shared generations/applets
+    response = await sharing_tools.get_user_shared_resources(
+        tenant_id, user_id, content_type="HtmlGeneration", fields=HTML_GENERATION_METADATA_FIELDS
+    )
+    if response.get("success"):
+        shared_generations = response.get("resources", [])
+        generations.extend(shared_generations)
+        logger.debug(f"[html_actions] Listed {len(shared_generations)} shared generations for user {user_id}")
+    else:
+        complete = False
+
+    return [_generation_metadata(gen) for gen in generations], complete
+
+
 async def list_html_generations(tenant_id: str, user_id: str) -> list[dict]:
     """Fetch all HTML generations for tenant (metadata only).
     
@@ -134,61 +218,8 @@ async def list_html_generations(tenant_id: str, user_id: str) -> list[dict]:
         _id, title, contentType, createdBy, tags, userRequest, sourceNoteId
     """
     try:
-        # Aggregate all generations/applets for user
-        generations = []
-
-        # get user generations/applets
-        # BUILD QUERY (actions layer responsibility)
-        where = {"AND": [
-            {"indexer": {"path": "tenantId", "equals": tenant_id}},
-            {"parent_id": {"eq": user_id}}
-        ]}
-        params = {
-            "tenant": tenant_id,
-            "where": json.dumps(where, separators=(',', ':')),
-            "limit": '100'
-        }
-        # EXECUTE REQUEST (mesh_client responsibility)
-        response = await mesh_client.request("GET", "/content/HtmlGeneration", params=params)
-        # VALIDATE & TRANSFORM (actions layer responsibility)
-        if response.get("success"):
-            personal_generations = response.get("data", [])
-            generations.extend(personal_generations)
-            logger.debug(f"[html_actions] Listed {len(personal_generations)} personal generations for tenant {tenant_id}")
-        else:
-            logger.error(f"[html_actions] Failed to list work generations: {response.get('error')}")
-
-        # Now get shared generations/applets
-        response = await sharing_tools.get_user_shared_resources(tenant_id, user_id, content_type="HtmlGeneration")
-        if response.get("success"):
-            shared_generations = response.get("resources", [])
-            generations.extend(shared_generations)
-            logger.debug(f"[html_actions] Listed {len(shared_generations)} shared generations for user {user_id}")
-        
-        if generations:
-            # Extract metadata only (exclude htmlContent)
-            metadata_list = []
-            for gen in generations:
-                sharing_info = gen.get('_sharing', {})
-                
-                metadata = {
-                    "_id": gen.get("_id"),
-                    "title": gen.get("title", ""),
-                    "contentType": gen.get("contentType", "app"),
-                    "createdBy": gen.get("createdBy", ""),
-                    "tenantId": gen.get("tenantId", ""),
-                    "tags": gen.get("tags", []),
-                    "userRequest": gen.get("userRequest", ""),
-                    "sourceNoteId": gen.get("sourceNoteId"),
-                    "createdAt": gen.get("createdAt"),
-                    "updatedAt": gen.get("updatedAt"),
-                    # Add sharing metadata
-                    "isShared": bool(sharing_info),
-                    "accessLevel": sharing_info.get('role', 'owner'),
-                    "isGlobal": sharing_info.get('isGlobal', False)
-                }
-                metadata_list.append(metadata)
-            
+        metadata_list, _complete = await _list_generation_metadata(tenant_id, user_id)
+        if metadata_list:
             logger.info(f"[html_actions] Found {len(metadata_list)} HTML generations for tenant {tenant_id}")
             return metadata_list
         
@@ -200,11 +231,38 @@ async def list_html_generations(tenant_id: str, user_id: str) -> list[dict]:
         return []
 
 
+async def _title_index(tenant_id: str, user_id: str) -> AppletTitleIndex:
+    """The user's cached applet title index.
+
+    Falls back to a one-off index over a fresh listing when caching is disabled
+    or the listing was partial, so a failed lookup is never cached.
+    """
+    listing: Optional[list[dict]] = None
+
+    async def _load() -> list[dict]:
+        nonlocal listing
+        listing, complete = await _list_generation_metadata(tenant_id, user_id)
+        if not complete:
+            raise RuntimeError("partial applet listing")
+        return listing
+
+    try:
+        index = await applet_index.get_index(tenant_id, user_id, _load)
+        if index is not None:
+            return index
+    except Exception as e:
+        logger.warning(f"[html_actions] Applet title index not refreshed for user {user_id}: {e}")
+    if listing is None:
+        listing = await list_html_generations(tenant_id, user_id)
+    return AppletTitleIndex(listing)
+
+
 async def fuzzy_search_applets(tenant_id: str, title: str, user_id: str) -> Optional[dict]:
     """Find HTML generation by fuzzy title match.
     
     Uses SequenceMatcher to find the best match for the given title.
     Returns None if no reasonable match is found (similarity < 0.6).
+    Titles come from the per-user applet title index, not a fresh listing.
     
     Args:
         tenant_id: Tenant identifier
@@ -214,48 +272,24 @@ async def fuzzy_search_applets(tenant_id: str, title: str, user_id: str) -> Opti
         Best matching generation or None
     """
     try:
-        logger.info(f"[html_actions] 🔍 FUZZY SEARCH - tenant_id={tenant_id}, title='{title}', user_id={user_id}")
-        generations = await list_html_generations(tenant_id, user_id)
+        index = await _title_index(tenant_id, user_id)
         
-        logger.info(f"[html_actions] 📊 SEARCH RESULTS - Found {len(generations)} total applets for tenant {tenant_id}")
-        
-        if not generations:
+        if not len(index):
             logger.warning(f"[html_actions] ❌ NO APPLETS - No applets found for tenant {tenant_id}")
             return None
         
-        # Log all available applets for debugging
-        logger.info(f"[html_actions] 📝 AVAILABLE APPLETS:")
-        for idx, gen in enumerate(generations[:10], 1):  # Log first 10
-            logger.info(
-                "[html_actions]   %s. '%s' (id=%s, createdBy=%s, tenantId=%s)",
-                idx,
-                gen.get("title"),
-                gen.get("_id"),
-                gen.get("createdBy"),
-                gen.get("tenantId"),
-            )
-        
-        search_term = title.lower().strip()
-        
-        matches = []
-        for gen in generations:
-            gen_title = gen.get('title', '').lower().strip()
-            similarity = SequenceMatcher(None, search_term, gen_title).ratio()
-            matches.append((similarity, gen))
-            if similarity >= 0.6:
-                logger.info(f"[html_actions] 🎯 MATCH CANDIDATE - '{gen.get('title')}' similarity={similarity:.2f}")
-        
-        matches.sort(key=lambda x: x[0], reverse=True)
-        best_score, best_gen = matches[0]
-        
-        logger.info(f"[html_actions] 🏆 BEST MATCH - '{best_gen.get('title')}' similarity={best_score:.2f} (threshold=0.6)")
+        best_score, best_gen = index.best_match(title)
+        logger.debug(
+            f"[html_actions] Fuzzy search '{title}' over {len(index)} applets: "
+            f"best='{best_gen.get('title') if best_gen else None}' similarity={best_score:.2f}"
+        )
         
-        if best_score >= 0.6:
+        if best_gen is not None and best_score >= 0.6:
             logger.info(
                 f"[html_actions] ✅ FUZZY MATCH SUCCESS - '{title}' → '{best_gen.get('title')}' "
                 f"(similarity: {best_score:.2f}, applet_id={best_gen.get('_id')}, createdBy={best_gen.get('createdBy')}, tenantId={best_gen.get('tenantId')})"
             )
-            return best_gen
+            return dict(best_gen)
         else:
             logger.warning(
                 f"[html_actions] ❌ NO MATCH - Best score {best_score:.2f} below threshold 0.6 "
@@ -270,12 +304,18 @@ async def fuzzy_search_applets(tenant_id: str, title: str, user_id: str) -> Opti
         return None
 
 
-async def get_html_generation_by_id(tenant_id: str, gen_id: str) -> Optional[dict]:
+async def get_html_generation_by_id(
+    tenant_id: str,
+    gen_id: str,
+    fields: Optional[Sequence[str]] = None,
+) -> Optional[dict]:
     """Fetch HTML generation by ID.
     
     Args:
         tenant_id: Tenant identifier
         gen_id: Generation document ID (_id)
+        fields: Optional projection (e.g. HTML_GENERATION_METADATA_FIELDS) for
+            callers that only need metadata; omit to load htmlContent too
         
     Returns:
         Generation document or None
@@ -287,6 +327,8 @@ async def get_html_generation_by_id(tenant_id: str, gen_id: str) -> Optional[dic
             "where": json.dumps(where),
             "limit": "1"
         }
+        if fields:
+            params["fields"] = ",".join(fields)
         
         response = await mesh_client.request("GET", "/content/HtmlGeneration", params=params)
         
@@ -321,39 +363,10 @@ async def make_unique_title(tenant_id: str, user_id: str, base_title: str) -> st
         Unique title (either original or with appended number)
     """
     try:
-        # Get all existing generations to check for title conflicts
-        generations = await list_html_generations(tenant_id, user_id)
-        
-        if not generations:
-            return base_title
-        
-        # Extract all existing titles
-        existing_titles = {gen.get('title', '').strip().lower() for gen in generations}
-        
-        # Check if base title exists
-        if base_title.lower() not in existing_titles:
-            return base_title
-        
-        # Find the highest number suffix for this title pattern
-        # Pattern: "Title", "Title 2", "Title 3", etc.
-        import re
-        base_lower = base_title.lower()
-        pattern = re.compile(rf"^{re.escape(base_lower)}(?: (\d+))?$")
-        
-        max_number = 1  # Start at 1 because base title exists
-        for title in existing_titles:
-            match = pattern.match(title)
-            if match:
-                num_str = match.group(1)
-                if num_str:
-                    num = int(num_str)
-                    max_number = max(max_number, num)
-        
-        # Generate next number
-        next_number = max_number + 1
-        unique_title = f"{base_title} {next_number}"
-        
-        logger.info(f"[html_actions] Made title unique: '{base_title}' -> '{unique_title}'")
+        index = await _title_index(tenant_id, user_id)
+        unique_title = index.next_free_title(base_title)
+        if unique_title != base_title:
+            logger.info(f"[html_actions] Made title unique: '{base_title}' -> '{unique_title}'")
         return unique_title
         
     except Exception as e:
@@ -424,6 +437,7 @@ async def create_html_generation(
             data = response["data"]
             if data:
                 logger.info(f"[html_actions] Created HTML generation '{unique_title}' (id={data.get('_id')})")
+                applet_index.applet_created(tenant_id, user_id, _generation_metadata(data))
                 return data
         
         # Mesh API returned an error - raise exception to trigger ensure wrapper
@@ -503,6 +517,9 @@ async def update_html_generation(
         
         if response["success"]:
             logger.info(f"[html_actions] Updated HTML generation {gen_id}")
+            changes = {k: v for k, v in update_payload.items() if k in ("title", "tags")}
+            if changes:
+                applet_index.applet_updated(gen_id, changes)
             return True
         
         # Raise exception to trigger ensure wrapper if needed
@@ -554,6 +571,7 @@ async def delete_html_generation(tenant_id: str, gen_id: str, user_id: str) -> b
 
         if response.get("success"):
             logger.info(f"[html_actions] Deleted HTML generation {gen_id}")
+            applet_index.applet_deleted(gen_id)
             return True
 
         logger.warning(
@@ -15,9 +15,12 @@ Architecture:
 - Returns business objects
 """
 
+import asyncio
+import hashlib
 import json
 import logging
-from typing import Optional, Callable, Awaitable, TypeVar
+from dataclasses import asdict, dataclass
+from typing import Iterable, Optional, Callable, Awaitable, TypeVar
 from tools.sharing import utils as sharing_tools
 from actions import sharing_actions
 from loguru import logger
@@ -69,6 +72,104 @@ def _extract_note_content(note: dict) -> str:
     return str(note_content) if note_content else ""
 
 
+class NotePatchError(ValueError):
+    """A note edit could not be applied (e.g. its anchor text is not in the note)."""
+
+
+class NoteVersionConflict(Exception):
+    """The note changed after the version the edits were based on."""
+
+
+@dataclass(frozen=True)
+class NoteEdit:
+    """One position- or anchor-based change to a note body.
+
+    Edits describe *where* text goes rather than carrying the whole document,
+    so they apply cleanly to whatever version of the note is current.
+
+    Attributes:
+        op: 'insert', 'remove' or 'replace'
+        text: Inserted text, or the replacement for 'replace'
+        anchor: Text the edit is relative to ('remove'/'replace', and
+            'insert' at 'before'/'after')
+        position: For 'insert': 'start', 'end', 'before' or 'after' the anchor
+        separator: Joins inserted text to its neighbour
+        count: Occurrences of the anchor to remove/replace; -1 for all
+    """
+
+    op: str
+    text: str = ""
+    anchor: Optional[str] = None
+    position: str = "end"
+    separator: str = "\n"
+    count: int = -1
+
+    @property
+    def anchored(self) -> bool:
+        """Whether the edit depends on text already in the note."""
+        return not (self.op == "insert" and self.position in ("start", "end"))
+
+
+def note_version(content: str) -> str:
+    """Fingerprint of a note body, used to detect concurrent edits.
+
+    Mesh computes the same value for its If-Match check on text edits.
+    """
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()[:16]
+
+
+# Version of each note as this process last read or wrote it, keyed by
+# (tenant_id, note_id); edits are made conditional on it.
+_note_versions: dict[tuple[str, str], str] = {}
+
+
+def known_note_version(tenant_id: str, note_id: str) -> Optional[str]:
+    """The version of a note as last read or written here, if any."""
+    return _note_versions.get((tenant_id, note_id))
+
+
+def apply_note_edits(content: str, edits: Iterable[NoteEdit]) -> str:
+    """Apply edits in order and return the new body.
+
+    Mesh applies edits sent to ``/content/Notes/{id}/edits`` with the same
+    semantics.
+
+    Raises:
+        NotePatchError: If an edit is malformed or its anchor is not found
+    """
+    for edit in edits:
+        if edit.op == "insert" and edit.position in ("start", "end"):
+            if not content:
+                content = edit.text
+            elif edit.position == "start":
+                content = f"{edit.text}{edit.separator}{content}"
+            else:
+                content = f"{content}{edit.separator}{edit.text}"
+            continue
+
+        if not edit.anchor:
+            raise NotePatchError(f"'{edit.op}' at '{edit.position}' needs anchor text")
+        index = content.find(edit.anchor)
+        if index < 0:
+            raise NotePatchError(f"'{edit.anchor[:80]}' not found in note")
+
+        if edit.op == "insert":
+            if edit.position == "before":
+                content = f"{content[:index]}{edit.text}{edit.separator}{content[index:]}"
+            elif edit.position == "after":
+                end = index + len(edit.anchor)
+                content = f"{content[:end]}{edit.separator}{edit.text}{content[end:]}"
+            else:
+                raise NotePatchError(f"Unknown insert position: {edit.position}")
+        elif edit.op == "remove":
+            content = content.replace(edit.anchor, "", edit.count)
+        elif edit.op == "replace":
+            content = content.replace(edit.anchor, edit.text, edit.count)
+        else:
+            raise NotePatchError(f"Unknown note edit op: {edit.op}")
+    return content
+
+
 async def create_notes_definition(tenant_id: str) -> bool:
     """Create the Notes content definition in Mesh for this tenant.
     
@@ -88,11 +189,15 @@ async def create_notes_definition(tenant_id: str) -> bool:
         
         mesh_secret = os.getenv("MESH_SHARED_SECRET")
         
-        success = register_content_definition(
+        # Mesh just reported it missing, so bypass the process-level ensured cache;
+        # the registration uses blocking requests, keep it off the event loop
+        success = await asyncio.to_thread(
+            register_content_definition,
             definition=NOTES_DEFINITION,
             mesh_url=mesh_url,
             tenant=tenant_id,
-            mesh_secret=mesh_secret
+            mesh_secret=mesh_secret,
+            force=True,
         )
         
         if success:
@@ -377,6 +482,7 @@ async def get_note_by_id(tenant_id: str, note_id: str) -> Optional[dict]:
             data = response.get("data", [])
             if isinstance(data, list) and len(data) > 0:
                 note = data[0]
+                _note_versions[(tenant_id, note_id)] = note_version(_extract_note_content(note))
                 logger.info(f"[notes_actions] 📋 FOUND NOTE - note_id={note_id}, note_keys={list(note.keys())}, content_type={type(note.get('content')).__name__}, content_preview={repr(note.get('content'))[:200] if note.get('content') else 'None/Empty'}")
                 return note
         
@@ -533,6 +639,7 @@ async def update_note_content(
         # VALIDATE & TRANSFORM
         if response.get("success"):
             logger.info(f"[notes_actions] Updated note {note_id}")
+            _note_versions[(tenant_id, note_id)] = note_version(content)
             return True
         else:
             # Raise exception to trigger ensure wrapper if needed
@@ -550,6 +657,95 @@ async def update_note_content(
         return False
 
 
+async def patch_note_content(
+    tenant_id: str,
+    note_id: str,
+    edits: Iterable[NoteEdit],
+    user_id: str,
+    expected_version: Optional[str] = None,
+) -> Optional[dict]:
+    """Apply position/anchor-based edits to a note.
+
+    Only the edits are sent: Mesh applies them to the current body under its
+    per-note write lock and returns the updated note. Failures other than a
+    rejected edit, a version conflict or a missing note are retried up to
+    three times with exponential backoff.
+
+    Args:
+        tenant_id: Tenant identifier
+        note_id: Note document ID (page_id)
+        edits: Edits to apply in order
+        user_id: User ID for permission check
+        expected_version: Optional ``note_version`` the edits were based on;
+            Mesh refuses the write if the note has changed since
+
+    Returns:
+        The updated note from Mesh, or None if the note was not found,
+        permission was denied or the write failed
+
+    Raises:
+        NotePatchError: If an edit does not apply to the current body
+        NoteVersionConflict: If ``expected_version`` no longer matches
+    """
+    from services import mesh as mesh_client
+
+    edits = list(edits)
+    user_id_norm = _normalize_user_id(user_id)
+    has_write = await sharing_actions.check_resource_write_permission(
+        tenant_id=tenant_id,
+        user_id=user_id_norm,
+        resource_id=note_id,
+        content_type='Notes'
+    )
+    if not has_write:
+        logger.warning(f"[notes_actions] User {user_id} does not have write permission for note {note_id}")
+        return None
+
+    payload: dict = {
+        "field": "content",
+        "edits": [{k: v for k, v in asdict(edit).items() if v is not None} for edit in edits],
+    }
+    if expected_version is not None:
+        payload["expectedVersion"] = expected_version
+    params = {"tenant": tenant_id}
+
+    max_retries = 3
+    retry_delay = 1.0
+    for attempt in range(max_retries):
+        response = await mesh_client.request(
+            "PATCH",
+            f"/content/Notes/{note_id}/edits",
+            params=params,
+            json_body=payload
+        )
+        if response.get("success"):
+            note = response.get("data") or None
+            if note:
+                _note_versions[(tenant_id, note_id)] = (
+                    response.get("version") or note_version(_extract_note_content(note))
+                )
+                logger.info(f"[notes_actions] Patched note {note_id} with {len(edits)} edit(s)")
+            return note
+
+        status = response.get("status")
+        error_msg = response.get("error")
+        if status == 412:
+            _note_versions.pop((tenant_id, note_id), None)
+            raise NoteVersionConflict(f"Note {note_id} changed since version {expected_version}")
+        if status in (400, 422):
+            raise NotePatchError(str(error_msg))
+        if status in (403, 404):
+            logger.warning(f"[notes_actions] Cannot patch note {note_id}: {error_msg}")
+            return None
+
+        logger.warning(f"[notes_actions] Attempt {attempt + 1}/{max_retries} to patch note {note_id} failed: {error_msg}")
+        if attempt < max_retries - 1:
+            await asyncio.sleep(retry_delay * (2 ** attempt))
+
+    logger.error(f"[notes_actions] Failed to patch note {note_id} after {max_retries} attempts")
+    return None
+
+
 async def append_to_note(tenant_id: str, note_id: str, item: str, user_id: str) -> bool:
     """Append item to note content as list item.
     
@@ -565,26 +761,10 @@ async def append_to_note(tenant_id: str, note_id: str, item: str, user_id: str)
         True if append succeeded, False if note not found or permission denied
     """
     try:
-        # Fetch current note
-        note = await get_note_by_id(tenant_id, note_id)
-        if not note:
-            return False
-        
-        current_content = _extract_note_content(note)
-        
-        # Append as list item
-        if current_content:
-            new_content = f"{current_content}\n- {item}"
-        else:
-            new_content = f"- {item}"
-        
-        # Update note (permission check happens in update_note_content)
-        success = await update_note_content(tenant_id, note_id, new_content, user_id)
-        
-        if success:
+        note = await patch_note_content(tenant_id, note_id, [NoteEdit("insert", f"- {item}")], user_id)
+        if note:
             logger.info(f"[notes_actions] Appended item to note {note_id}")
-        
-        return success
+        return note is not None
         
     except Exception as e:
         # Log exception but don't re-raise - return False so caller can handle gracefully
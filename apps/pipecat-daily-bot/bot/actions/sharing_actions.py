@@ -23,9 +23,11 @@ Content Types:
 import sys
 import os
 import json
-from typing import Dict, List, Literal
+from typing import Dict, List, Literal, Sequence
 from loguru import logger
 
+from actions import applet_index
+
 # Add parent directory to path for mesh_client import
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
@@ -199,6 +201,9 @@ async def share_resource_with_user(
             organization_id=organization_id,
             role=role
         )
+        if success and content_type == 'HtmlGeneration':
+            # The recipient's applet titles now include this one
+            applet_index.invalidate(tenant_id, user_id)
         
         return success
         
@@ -394,7 +399,8 @@ async def get_or_create_user_by_email(tenant_id: str, email: str, name: str | No
 async def get_resources_by_id(
     tenant_id: str,
     resource_ids: list[str],
-    content_type: Literal['Notes', 'HtmlGeneration']
+    content_type: Literal['Notes', 'HtmlGeneration'],
+    fields: Sequence[str] | None = None,
 ) -> dict | None:
     """Get resource (Notes or HtmlGeneration) by ID.
     
@@ -404,6 +410,7 @@ async def get_resources_by_id(
         tenant_id: Tenant identifier
         resource_id: Resource _id
         content_type: 'Notes' or 'HtmlGeneration'
+        fields: Optional projection; only these top-level fields (plus _id) are returned
         
     Returns:
         Resource document or None if not found
@@ -424,6 +431,8 @@ async def get_resources_by_id(
             "tenant": tenant_id,
             "where": json.dumps(where, separators=(',', ':'))
         }
+        if fields:
+            params["fields"] = ",".join(fields)
         
         logger.info(
             f"[sharing_actions] 📡 FETCHING RESOURCES - "
@@ -1045,6 +1054,8 @@ async def update_user_organization_role(
         
         if update_response.get("success"):
             logger.info(f"[sharing] Updated role for user {user_id} to {internal_role} (bot role: {new_role})")
+            if content_type == 'HtmlGeneration':
+                applet_index.invalidate(tenant_id, user_id)
             return True
         else:
             logger.error(f"[sharing] Failed to update role: {update_response.get('error')}")
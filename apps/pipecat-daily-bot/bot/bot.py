@@ -16,6 +16,7 @@ from loguru import logger
 from providers.daily import create_daily_room_token
 from utils.logging_utils import _configure_logging_filters, _install_fd_muter
 from core.config import BOT_PID
+from core.session_context import update_session
 
 # Import pipeline runner
 try:
@@ -79,26 +80,20 @@ async def bot(runner_args):  # Entry point expected by pipecat runner
     voiceId = getattr(runner_args, "voice", None) or getattr(runner_args, "voiceId", None) or body.get("voice") or body.get("voiceId") or os.getenv("BOT_VOICE_ID")
     activeNoteId = getattr(runner_args, "activeNoteId", None) or body.get("activeNoteId")
 
-    # Propagate additional runner args to environment variables for warm bot reuse
-    
-    # Voice Provider
+    # Voice overrides are session-scoped: bind them to this session's context
+    # rather than os.environ, which concurrent sessions would share
     voiceProvider = getattr(runner_args, "voiceProvider", None) or body.get("voiceProvider")
-    if voiceProvider:
-        os.environ["BOT_TTS_PROVIDER"] = str(voiceProvider)
-
-    # Voice Parameters
     voiceParameters = getattr(runner_args, "voiceParameters", None) or body.get("voiceParameters")
-    if voiceParameters and isinstance(voiceParameters, dict):
-        if voiceParameters.get("speed") is not None:
-            os.environ["BOT_VOICE_SPEED"] = str(voiceParameters.get("speed"))
-        if voiceParameters.get("stability") is not None:
-            os.environ["BOT_VOICE_STABILITY"] = str(voiceParameters.get("stability"))
-        if voiceParameters.get("similarityBoost") is not None:
-            os.environ["BOT_VOICE_SIMILARITY_BOOST"] = str(voiceParameters.get("similarityBoost"))
-        if voiceParameters.get("style") is not None:
-            os.environ["BOT_VOICE_STYLE"] = str(voiceParameters.get("style"))
-        if voiceParameters.get("optimizeStreamingLatency") is not None:
-            os.environ["BOT_VOICE_OPTIMIZE_STREAMING_LATENCY"] = str(voiceParameters.get("optimizeStreamingLatency"))
+    if not isinstance(voiceParameters, dict):
+        voiceParameters = {}
+    update_session(
+        tts_provider=voiceProvider or None,
+        voice_speed=voiceParameters.get("speed"),
+        voice_stability=voiceParameters.get("stability"),
+        voice_similarity_boost=voiceParameters.get("similarityBoost"),
+        voice_style=voiceParameters.get("style"),
+        voice_optimize_streaming_latency=voiceParameters.get("optimizeStreamingLatency"),
+    )
 
     # Mode Personality Voice Config (Static Path)
     modePersonalityVoiceConfig = getattr(runner_args, "modePersonalityVoiceConfig", None) or body.get("modePersonalityVoiceConfig")
@@ -21,6 +21,7 @@ from typing import Optional, Dict, Any
 from loguru import logger
 
 from tools.logging_utils import bind_context_logger
+from services.config_subscriber import config_channel, publish_config_sync
 
 from auth import require_auth
 
@@ -1834,9 +1835,9 @@ async def update_config(request: ConfigRequest):
     config_key = f"bot:config:latest:{request.room_url}"
     r.setex(config_key, 300, payload)
     
-    # 2. Publish to room-based channel
-    channel = f"bot:config:room:{request.room_url}"
-    r.publish(channel, payload)
+    # 2. Publish to room-based channel (and the catch-up stream for reconnecting bots)
+    channel = config_channel(request.room_url)
+    publish_config_sync(r, request.room_url, payload)
     
     config_logger.info(
         "Published config update",
@@ -12,6 +12,11 @@ import sys
 from dotenv import load_dotenv
 from loguru import logger
 
+try:
+    from core.session_context import session_value
+except ImportError:  # pragma: no cover
+    from bot.core.session_context import session_value
+
 # Load env only once at import – safe & cheap
 load_dotenv(override=True)
 
@@ -278,36 +283,38 @@ def BOT_GREETING_GRACE_SECS() -> float:
 
 # ---------------------------------------------------------------------------
 # Voice parameters for ElevenLabs TTS
+#
+# Per-session launch overrides (core.session_context) win over the env default.
 # ---------------------------------------------------------------------------
 
 
 def BOT_VOICE_SPEED() -> float | None:
     """Voice speed parameter (0.7 to 1.2). Default: 1.2 (matches DailyCall)."""
-    v = os.getenv("BOT_VOICE_SPEED")
+    v = session_value("voice_speed")
     return float(v) if v is not None else 1.2
 
 
 def BOT_VOICE_STABILITY() -> float | None:
     """Voice stability parameter (0.0 to 1.0). Default: 0.7 (matches DailyCall)."""
-    v = os.getenv("BOT_VOICE_STABILITY")
+    v = session_value("voice_stability")
     return float(v) if v is not None else 0.7
 
 
 def BOT_VOICE_SIMILARITY_BOOST() -> float | None:
     """Voice similarity boost parameter (0.0 to 1.0). Default: 0.8 (matches DailyCall)."""
-    v = os.getenv("BOT_VOICE_SIMILARITY_BOOST")
+    v = session_value("voice_similarity_boost")
     return float(v) if v is not None else 0.8
 
 
 def BOT_VOICE_STYLE() -> float | None:
     """Voice style parameter (0.0 to 1.0). Default: 0.3 (matches DailyCall)."""
-    v = os.getenv("BOT_VOICE_STYLE")
+    v = session_value("voice_style")
     return float(v) if v is not None else 0.3
 
 
 def BOT_VOICE_OPTIMIZE_STREAMING_LATENCY() -> float | None:
     """Optimize streaming latency parameter (0.0 to 1.0). Default: 1 (matches DailyCall)."""
-    v = os.getenv("BOT_VOICE_OPTIMIZE_STREAMING_LATENCY")
+    v = session_value("voice_optimize_streaming_latency")
     return float(v) if v is not None else 1
 
 
@@ -396,6 +403,192 @@ def KOKORO_TTS_SEED() -> int | None:
         return None
 
 
+# ---------------------------------------------------------------------------
+# App-message forwarder transport
+# ---------------------------------------------------------------------------
+
+
+def BOT_EVENT_FORWARDER_QUEUE_MAX() -> int:
+    return max(1, _env_int("BOT_EVENT_FORWARDER_QUEUE_MAX", 256))
+
+
+def BOT_EVENT_FORWARDER_CONCURRENCY() -> int:
+    return max(1, _env_int("BOT_EVENT_FORWARDER_CONCURRENCY", 4))
+
+
+def BOT_EVENT_FORWARDER_COALESCE_MS() -> int:
+    """Window for coalescing small envelopes into one send (0 disables)."""
+    return max(0, _env_int("BOT_EVENT_FORWARDER_COALESCE_MS", 0))
+
+
+def BOT_EVENT_FORWARDER_COALESCE_MAX() -> int:
+    return max(1, _env_int("BOT_EVENT_FORWARDER_COALESCE_MAX", 16))
+
+
+def BOT_EVENT_FORWARDER_CHUNK_MS() -> int:
+    """Pacing between fragments of one oversized envelope."""
+    return max(0, _env_int("BOT_EVENT_FORWARDER_CHUNK_MS", 15))
+
+
+def BOT_EVENT_FORWARDER_MAX_BYTES() -> int:
+    """Largest envelope delivered in chunks; anything bigger is truncated."""
+    return _env_int("BOT_EVENT_FORWARDER_MAX_BYTES", 2_000_000)
+
+
+def BOT_EVENT_FORWARDER_DEDUP_MS() -> int:
+    """Skip re-sending an identical large (chunked) payload within this window."""
+    return max(0, _env_int("BOT_EVENT_FORWARDER_DEDUP_MS", 2000))
+
+
+# ---------------------------------------------------------------------------
+# Phrase audio cache (fillers / tool narration)
+# ---------------------------------------------------------------------------
+
+
+def BOT_PHRASE_CACHE_ENABLED() -> bool:
+    return _env_bool("BOT_PHRASE_CACHE_ENABLED", True)
+
+
+def BOT_PHRASE_CACHE_DIR() -> str:
+    """Directory for rendered phrase WAVs; empty keeps the cache in memory only."""
+    return _env_str("BOT_PHRASE_CACHE_DIR", "")
+
+
+def BOT_PHRASE_CACHE_MAX_ENTRIES() -> int:
+    return max(1, _env_int("BOT_PHRASE_CACHE_MAX_ENTRIES", 256))
+
+
+def BOT_PHRASE_CACHE_RENDER_TIMEOUT_SECS() -> float:
+    """Per-phrase timeout while pre-rendering at warm-up."""
+    return _env_float("BOT_PHRASE_CACHE_RENDER_TIMEOUT_SECS", 10.0)
+
+
+# ---------------------------------------------------------------------------
+# Workspace context cache
+# ---------------------------------------------------------------------------
+
+
+def BOT_WORKSPACE_CONTEXT_RECHECK_SECS() -> float:
+    """Serve cached workspace context without re-stat'ing files for this long."""
+    return max(0.0, _env_float("BOT_WORKSPACE_CONTEXT_RECHECK_SECS", 2.0))
+
+
+# ---------------------------------------------------------------------------
+# Conversation history window (LLM processors)
+# ---------------------------------------------------------------------------
+
+
+def BOT_HISTORY_TOKEN_BUDGET() -> int:
+    """Approximate token budget for conversation turns sent with each request."""
+    return max(256, _env_int("BOT_HISTORY_TOKEN_BUDGET", 6000))
+
+
+def BOT_HISTORY_SUMMARY_CHARS() -> int:
+    """Size of the rolling summary that replaces turns evicted from the window."""
+    return max(0, _env_int("BOT_HISTORY_SUMMARY_CHARS", 1200))
+
+
+# ---------------------------------------------------------------------------
+# Room state cache (room/state.py)
+# ---------------------------------------------------------------------------
+
+
+def BOT_ROOM_STATE_CACHE_TTL_SECS() -> float:
+    """Upper bound on serving cached room state; 0 disables the cache.
+
+    Entries are invalidated over pub/sub as soon as another process writes, so
+    this only limits staleness if an invalidation message is lost.
+    """
+    return max(0.0, _env_float("BOT_ROOM_STATE_CACHE_TTL_SECS", 30.0))
+
+
+# ---------------------------------------------------------------------------
+# Applet title index (actions/applet_index.py)
+# ---------------------------------------------------------------------------
+
+
+def BOT_APPLET_INDEX_TTL_SECS() -> float:
+    """How long a user's applet title index is trusted; 0 disables the index.
+
+    Creates, renames, deletes and shares made by this process update the index
+    directly, so the TTL only bounds staleness from changes made elsewhere.
+    """
+    return max(0.0, _env_float("BOT_APPLET_INDEX_TTL_SECS", 120.0))
+
+
+# ---------------------------------------------------------------------------
+# Rolling conversation summary (session/lifecycle.py)
+# ---------------------------------------------------------------------------
+
+
+def BOT_ROLLING_SUMMARY_TURNS() -> int:
+    """Fold new messages into the running summary once this many accumulate.
+
+    0 disables the background summarizer; the whole conversation is then
+    summarized when the session ends.
+    """
+    return max(0, _env_int("BOT_ROLLING_SUMMARY_TURNS", 12))
+
+
+def BOT_ROLLING_SUMMARY_POLL_SECS() -> float:
+    """How often the background summarizer checks for new messages."""
+    return max(1.0, _env_float("BOT_ROLLING_SUMMARY_POLL_SECS", 10.0))
+
+
+# ---------------------------------------------------------------------------
+# Hedged / speculative LLM requests (NonBlockingToolRouter voice path)
+# ---------------------------------------------------------------------------
+
+
+def BOT_HEDGE_ENABLED() -> bool:
+    """Fire a backup LLM request when the first token is late (opt-in)."""
+    return _env_bool("BOT_HEDGE_ENABLED", False)
+
+
+def BOT_HEDGE_API_URL() -> str | None:
+    value = os.getenv("BOT_HEDGE_API_URL")
+    return value.strip() if value else None
+
+
+def BOT_HEDGE_API_KEY() -> str | None:
+    value = os.getenv("BOT_HEDGE_API_KEY")
+    return value.strip() if value else None
+
+
+def BOT_HEDGE_MODEL() -> str | None:
+    """Backup model; hedging stays off when unset."""
+    value = os.getenv("BOT_HEDGE_MODEL")
+    return value.strip() if value else None
+
+
+def BOT_HEDGE_PERCENTILE() -> float:
+    """First-token latency percentile of the primary used as the hedge deadline."""
+    return min(0.999, max(0.5, _env_float("BOT_HEDGE_PERCENTILE", 0.9)))
+
+
+def BOT_HEDGE_MIN_DELAY_MS() -> int:
+    return max(0, _env_int("BOT_HEDGE_MIN_DELAY_MS", 300))
+
+
+def BOT_HEDGE_MAX_DELAY_MS() -> int:
+    return max(1, _env_int("BOT_HEDGE_MAX_DELAY_MS", 2500))
+
+
+def BOT_HEDGE_INITIAL_DELAY_MS() -> int:
+    """Deadline used until enough first-token samples were observed."""
+    return max(0, _env_int("BOT_HEDGE_INITIAL_DELAY_MS", 1200))
+
+
+def BOT_SPECULATIVE_INTERIM_ENABLED() -> bool:
+    """Start the voice request on a stable interim transcript (opt-in)."""
+    return _env_bool("BOT_SPECULATIVE_INTERIM_ENABLED", False)
+
+
+def BOT_SPECULATIVE_STABLE_MS() -> int:
+    """How long an interim transcript must stay unchanged to speculate on it."""
+    return max(50, _env_int("BOT_SPECULATIVE_STABLE_MS", 350))
+
+
 # ---------------------------------------------------------------------------
 # Default system messages for greetings (used as backstops)
 # ---------------------------------------------------------------------------
@@ -534,6 +727,42 @@ __all__ = [
     "KOKORO_TTS_ENABLE_LOGGING",
     "KOKORO_TTS_ENABLE_SSML",
     "KOKORO_TTS_SEED",
+    # app-message forwarder
+    "BOT_EVENT_FORWARDER_QUEUE_MAX",
+    "BOT_EVENT_FORWARDER_CONCURRENCY",
+    "BOT_EVENT_FORWARDER_COALESCE_MS",
+    "BOT_EVENT_FORWARDER_COALESCE_MAX",
+    "BOT_EVENT_FORWARDER_CHUNK_MS",
+    "BOT_EVENT_FORWARDER_MAX_BYTES",
+    "BOT_EVENT_FORWARDER_DEDUP_MS",
+    # phrase audio cache
+    "BOT_PHRASE_CACHE_ENABLED",
+    "BOT_PHRASE_CACHE_DIR",
+    "BOT_PHRASE_CACHE_MAX_ENTRIES",
+    "BOT_PHRASE_CACHE_RENDER_TIMEOUT_SECS",
+    # workspace context
+    "BOT_WORKSPACE_CONTEXT_RECHECK_SECS",
+    # conversation history window
+    "BOT_HISTORY_TOKEN_BUDGET",
+    "BOT_HISTORY_SUMMARY_CHARS",
+    # rolling conversation summary
+    "BOT_ROLLING_SUMMARY_TURNS",
+    "BOT_ROLLING_SUMMARY_POLL_SECS",
+    # room state cache
+    "BOT_ROOM_STATE_CACHE_TTL_SECS",
+    # applet title index
+    "BOT_APPLET_INDEX_TTL_SECS",
+    # hedged / speculative LLM requests
+    "BOT_HEDGE_ENABLED",
+    "BOT_HEDGE_API_URL",
+    "BOT_HEDGE_API_KEY",
+    "BOT_HEDGE_MODEL",
+    "BOT_HEDGE_PERCENTILE",
+    "BOT_HEDGE_MIN_DELAY_MS",
+    "BOT_HEDGE_MAX_DELAY_MS",
+    "BOT_HEDGE_INITIAL_DELAY_MS",
+    "BOT_SPECULATIVE_INTERIM_ENABLED",
+    "BOT_SPECULATIVE_STABLE_MS",
     # user profile
     "BOT_PROFILE_PREAMBLE_MESSAGE",
     "BOT_PROFILE_INSTRUCTION_MESSAGE",
@@ -1,4 +1,3 @@
-import copy
 from typing import Any, List, Optional
 from loguru import logger
 from pipecat.processors.aggregators.llm_response import LLMUserContextAggregator
@@ -59,7 +58,12 @@ class MultiUserContextAggregator(LLMUserContextAggregator):
         await super().process_frame(frame, direction)
 
     def snapshot_messages(self) -> list[dict[str, Any]]:
-        """Return a copy of the current LLM context messages for inspection/logging."""
+        """Return the current LLM context messages for inspection/logging.
+
+        The list is a new (shallow) list but the message dicts are shared with
+        the live context, so callers must not mutate them. Deep-copying the whole
+        conversation on every call grew with meeting length.
+        """
 
         context = self._context_ref
         if context is None:
@@ -67,14 +71,14 @@ class MultiUserContextAggregator(LLMUserContextAggregator):
 
         messages = getattr(context, "messages", None)
         if isinstance(messages, list):
-            return copy.deepcopy(messages)
+            return list(messages)
 
         getter = getattr(context, "get_messages", None)
         if callable(getter):
             try:
                 data = getter()
                 if isinstance(data, list):
-                    return copy.deepcopy(data)
+                    return list(data)
             except Exception:  # pragma: no cover - defensive guard
                 logger.exception('[context-snapshot] Failed to read messages via get_messages')
         return []
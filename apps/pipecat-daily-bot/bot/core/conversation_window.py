@@ -0,0 +1,265 @@
+"""Token-budgeted conversation history for the OpenClaw LLM processors.
+
+The context aggregator hands the processors the *full* conversation on every
+turn. Rebuilding, filtering and slicing that list per turn made prompt size and
+copy cost grow with meeting length. ``ConversationWindow`` instead:
+
+* ingests only the messages appended since the previous turn (the prefix is
+  verified by comparing the last consumed message; any rewrite triggers a
+  one-off resync),
+* caches an approximate token count per message and evicts the oldest turns
+  once the window exceeds its token budget or message cap,
+* folds evicted user/assistant turns into a bounded rolling summary that is
+  sent as a system message right after the system prompt, and
+* hands out immutable tuple snapshots whose message dicts are shared with the
+  window (and with later snapshots) rather than deep copies.
+
+Messages recorded locally by a processor (its own streamed reply, placeholder
+turns) are provisional: the next ``sync`` drops them, because the aggregator's
+view of the conversation includes the authoritative versions.
+"""
+
+from __future__ import annotations
+
+import json
+from collections import deque
+from typing import Any, Sequence
+
+from core.config import BOT_HISTORY_SUMMARY_CHARS, BOT_HISTORY_TOKEN_BUDGET
+
+Message = dict[str, Any]
+Snapshot = tuple[Message, ...]
+
+# Rough per-message framing cost (role, separators) in tokens
+MESSAGE_OVERHEAD_TOKENS = 4
+# Non-text content parts (images, audio) are charged a flat amount
+NON_TEXT_PART_TOKENS = 256
+# Longest excerpt of a single evicted turn kept in the rolling summary
+SUMMARY_LINE_CHARS = 200
+
+SUMMARY_HEADER = "Earlier in this conversation (condensed, oldest first):"
+
+
+def _message_text(message: Message) -> str:
+    content = message.get("content")
+    if isinstance(content, str):
+        return content
+    if isinstance(content, list):
+        return " ".join(
+            part["text"]
+            for part in content
+            if isinstance(part, dict) and isinstance(part.get("text"), str)
+        )
+    return ""
+
+
+def estimate_tokens(message: Message) -> int:
+    """Cheap token estimate (~4 characters per token) for one chat message."""
+    chars = 0
+    tokens = MESSAGE_OVERHEAD_TOKENS
+    content = message.get("content")
+    if isinstance(content, str):
+        chars += len(content)
+    elif isinstance(content, list):
+        for part in content:
+            if isinstance(part, dict) and isinstance(part.get("text"), str):
+                chars += len(part["text"])
+            else:
+                tokens += NON_TEXT_PART_TOKENS
+    tool_calls = message.get("tool_calls")
+    if tool_calls:
+        chars += len(json.dumps(tool_calls, default=str))
+    return tokens + (chars + 3) // 4
+
+
+def _same_message(a: Any, b: Any) -> bool:
+    if not isinstance(a, dict) or not isinstance(b, dict):
+        return a is b
+    return a.get("role") == b.get("role") and a.get("content") == b.get("content")
+
+
+class ConversationWindow:
+    """Bounded, incrementally synced conversation history.
+
+    Snapshots are ``(system, [summary], *turns)`` tuples. Their message dicts are
+    shared, so callers must treat them as read-only.
+    """
+
+    def __init__(
+        self,
+        system_prompt: str,
+        *,
+        token_budget: int | None = None,
+        max_messages: int = 40,
+        summary_chars: int | None = None,
+    ) -> None:
+        self._system: Message = {"role": "system", "content": system_prompt}
+        self._token_budget = token_budget if token_budget is not None else BOT_HISTORY_TOKEN_BUDGET()
+        self._max_messages = max_messages
+        self._summary_chars = summary_chars if summary_chars is not None else BOT_HISTORY_SUMMARY_CHARS()
+
+        # (message, cached token estimate); oldest first
+        self._turns: deque[tuple[Message, int]] = deque()
+        self._turn_tokens = 0
+        self._provisional: list[tuple[Message, int]] = []
+
+        self._summary_lines: deque[str] = deque()
+        self._summary_length = 0
+        self._summary_message: Message | None = None
+
+        # Incremental sync state: how much of the upstream list was consumed
+        self._consumed = 0
+        self._last_consumed: Message | None = None
+
+        self._snapshot: Snapshot | None = None
+        self.evicted = 0
+        self.resyncs = 0
+
+    # ------------------------------------------------------------------
+    # System prompt
+    # ------------------------------------------------------------------
+
+    @property
+    def system_prompt(self) -> str:
+        return self._system["content"]
+
+    def set_system_prompt(self, content: str) -> None:
+        self._system = {"role": "system", "content": content}
+        self._snapshot = None
+
+    # ------------------------------------------------------------------
+    # Ingest
+    # ------------------------------------------------------------------
+
+    def sync(self, incoming: Sequence[Any]) -> None:
+        """Adopt the upstream conversation, processing only new messages.
+
+        System messages from upstream are ignored; this window owns the system
+        prompt. An empty ``incoming`` keeps the current history untouched.
+        """
+        total = len(incoming)
+        if not total:
+            return
+        start = self._consumed
+        if start > total or (start and not _same_message(incoming[start - 1], self._last_consumed)):
+            # Upstream rewrote its history (context reset, flow transition)
+            self.clear()
+            self.resyncs += 1
+            start = 0
+
+        self._drop_provisional()
+        for index in range(start, total):
+            message = incoming[index]
+            if isinstance(message, dict) and message.get("role") != "system":
+                self._push(dict(message))
+        last = incoming[total - 1]
+        self._last_consumed = dict(last) if isinstance(last, dict) else last
+        self._consumed = total
+        self._evict()
+
+    def add_local(self, message: Message) -> None:
+        """Record a locally produced message until the next ``sync`` replaces it."""
+        self._provisional.append((message, estimate_tokens(message)))
+        self._snapshot = None
+
+    def clear(self) -> None:
+        """Forget turns and summary (the system prompt is kept)."""
+        self._turns.clear()
+        self._turn_tokens = 0
+        self._provisional.clear()
+        self._summary_lines.clear()
+        self._summary_length = 0
+        self._summary_message = None
+        self._consumed = 0
+        self._last_consumed = None
+        self._snapshot = None
+
+    def _push(self, message: Message) -> None:
+        tokens = estimate_tokens(message)
+        self._turns.append((message, tokens))
+        self._turn_tokens += tokens
+        self._snapshot = None
+
+    def _drop_provisional(self) -> None:
+        if self._provisional:
+            self._provisional.clear()
+            self._snapshot = None
+
+    def _evict(self) -> None:
+        turns = self._turns
+        # Always keep the newest turn, however large
+        while len(turns) > 1 and (
+            self._turn_tokens > self._token_budget or len(turns) > self._max_messages
+        ):
+            message, tokens = turns.popleft()
+            self._turn_tokens -= tokens
+            self.evicted += 1
+            self._summarize(message)
+            self._snapshot = None
+        # A tool result without its assistant tool call is rejected upstream
+        while len(turns) > 1 and turns[0][0].get("role") == "tool":
+            _, tokens = turns.popleft()
+            self._turn_tokens -= tokens
+            self.evicted += 1
+            self._snapshot = None
+
+    def _summarize(self, message: Message) -> None:
+        role = message.get("role")
+        if self._summary_chars <= 0 or role not in ("user", "assistant"):
+            return
+        text = " ".join(_message_text(message).split())
+        if not text:
+            return
+        if len(text) > SUMMARY_LINE_CHARS:
+            text = text[: SUMMARY_LINE_CHARS - 1].rstrip() + "…"
+        line = f"{role[0].upper()}: {text}"
+        self._summary_lines.append(line)
+        self._summary_length += len(line) + 1
+        while self._summary_length > self._summary_chars and len(self._summary_lines) > 1:
+            self._summary_length -= len(self._summary_lines.popleft()) + 1
+        self._summary_message = None
+
+    # ------------------------------------------------------------------
+    # Read
+    # ------------------------------------------------------------------
+
+    @property
+    def has_conversation(self) -> bool:
+        return bool(self._turns or self._provisional)
+
+    @property
+    def summary(self) -> str:
+        return "\n".join(self._summary_lines)
+
+    @property
+    def token_count(self) -> int:
+        """Estimated prompt tokens of the current snapshot."""
+        head = self.snapshot()[: 2 if self._summary_lines else 1]
+        provisional = sum(tokens for _, tokens in self._provisional)
+        return sum(estimate_tokens(m) for m in head) + self._turn_tokens + provisional
+
+    def snapshot(self) -> Snapshot:
+        """Immutable view of system prompt, summary and retained turns.
+
+        Unchanged windows return the same tuple object; snapshots never copy
+        message dicts.
+        """
+        snapshot = self._snapshot
+        if snapshot is None:
+            head: list[Message] = [self._system]
+            if self._summary_lines:
+                if self._summary_message is None:
+                    self._summary_message = {
+                        "role": "system",
+                        "content": f"{SUMMARY_HEADER}\n{self.summary}",
+                    }
+                head.append(self._summary_message)
+            snapshot = self._snapshot = (
+                *head,
+                *(message for message, _ in self._turns),
+                *(message for message, _ in self._provisional),
+            )
+        return snapshot
+
+    def __len__(self) -> int:
+        return len(self.snapshot())
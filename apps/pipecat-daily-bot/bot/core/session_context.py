@@ -0,0 +1,117 @@
+"""Session-scoped identity and voice settings.
+
+The runner used to write the session id, user identity and voice overrides
+into ``os.environ`` before building each pipeline, so two sessions launching
+concurrently in one runner could read each other's values. The per-session
+values now live in a ``SessionContext`` bound to a ``contextvars.ContextVar``
+for the session task; every task spawned from it (pipeline, tools, actions,
+forwarder) inherits the same context.
+
+Environment variables remain the process-wide defaults: each accessor falls
+back to its ``BOT_*`` variable when no session is bound or the session does not
+set the field (e.g. single-session pods configured by the operator).
+"""
+
+from __future__ import annotations
+
+import os
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from dataclasses import dataclass, fields, replace
+from typing import Any, Iterator
+
+
+@dataclass(frozen=True)
+class SessionContext:
+    session_id: str | None = None
+    user_id: str | None = None
+    user_name: str | None = None
+    user_email: str | None = None
+    # Voice overrides from the launch request (strings, like the env values)
+    tts_provider: str | None = None
+    voice_speed: str | None = None
+    voice_stability: str | None = None
+    voice_similarity_boost: str | None = None
+    voice_style: str | None = None
+    voice_optimize_streaming_latency: str | None = None
+
+
+# Field → environment variable used as the process-wide default
+ENV_DEFAULTS = {
+    "session_id": "BOT_SESSION_ID",
+    "user_id": "BOT_SESSION_USER_ID",
+    "user_name": "BOT_SESSION_USER_NAME",
+    "user_email": "BOT_SESSION_USER_EMAIL",
+    "tts_provider": "BOT_TTS_PROVIDER",
+    "voice_speed": "BOT_VOICE_SPEED",
+    "voice_stability": "BOT_VOICE_STABILITY",
+    "voice_similarity_boost": "BOT_VOICE_SIMILARITY_BOOST",
+    "voice_style": "BOT_VOICE_STYLE",
+    "voice_optimize_streaming_latency": "BOT_VOICE_OPTIMIZE_STREAMING_LATENCY",
+}
+
+_FIELDS = {f.name for f in fields(SessionContext)}
+
+_current_session: ContextVar[SessionContext | None] = ContextVar("bot_session", default=None)
+
+
+def current_session() -> SessionContext | None:
+    return _current_session.get()
+
+
+def bind_session(session: SessionContext) -> Token:
+    """Bind ``session`` in the current context (normally the session task's)."""
+    return _current_session.set(session)
+
+
+def reset_session(token: Token) -> None:
+    _current_session.reset(token)
+
+
+@contextmanager
+def use_session(session: SessionContext) -> Iterator[SessionContext]:
+    token = bind_session(session)
+    try:
+        yield session
+    finally:
+        reset_session(token)
+
+
+def update_session(**changes: Any) -> SessionContext:
+    """Set fields on the bound session (binding a new one if needed).
+
+    ``None`` values are ignored so callers can pass optional request fields
+    straight through.
+    """
+    unknown = set(changes) - _FIELDS
+    if unknown:
+        raise TypeError(f"Unknown session fields: {sorted(unknown)}")
+    values = {k: str(v) for k, v in changes.items() if v is not None}
+    session = replace(current_session() or SessionContext(), **values)
+    _current_session.set(session)
+    return session
+
+
+def session_value(name: str) -> str | None:
+    """Session value for ``name``, falling back to its environment default."""
+    session = _current_session.get()
+    value = getattr(session, name) if session is not None else None
+    if value is not None:
+        return value
+    return os.getenv(ENV_DEFAULTS[name])
+
+
+def current_session_id() -> str | None:
+    return session_value("session_id")
+
+
+def current_user_id() -> str | None:
+    return session_value("user_id")
+
+
+def current_user_name() -> str | None:
+    return session_value("user_name")
+
+
+def current_user_email() -> str | None:
+    return session_value("user_email")
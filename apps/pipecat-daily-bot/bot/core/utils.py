@@ -1,4 +1,6 @@
+import asyncio
 import hashlib
+import os
 
 def get_room_hash(room_url: str) -> str:
     """Generate deterministic room hash for consistent file naming across processes.
@@ -7,3 +9,29 @@ def get_room_hash(room_url: str) -> str:
     generate identical hash values for the same room URL.
     """
     return hashlib.sha256(room_url.encode('utf-8')).hexdigest()[:12]
+
+
+def _append_once(path: str, data: bytes) -> None:
+    fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        written = os.write(fd, data)
+        while written < len(data):
+            written += os.write(fd, data[written:])
+    finally:
+        os.close(fd)
+
+
+async def append_text(path: str, text: str) -> None:
+    """Append ``text`` to ``path`` off the event loop.
+
+    The entry is issued as one O_APPEND write, so concurrent appenders (other
+    sessions, the agent workspace) do not interleave inside an entry.
+    Missing parent directories are created.
+    """
+    data = text.encode("utf-8")
+
+    def _write() -> None:
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        _append_once(path, data)
+
+    await asyncio.to_thread(_write)
@@ -0,0 +1,273 @@
+"""Process-wide cache of Pearl's workspace context.
+
+``load_workspace_context`` gives voice Pearl the same identity and
+cross-session awareness as Discord/webchat Pearl by reading SOUL, IDENTITY,
+USER, the cross-session state, the activity log, today's memory file and
+MEMORY.md from the OpenClaw workspace.
+
+Every pipeline build used to re-read all of those files, and the activity log
+only grows. Now each file is tracked by its ``(mtime_ns, size)`` signature and
+its rendered section is kept until the file changes; the assembled context is
+memoized on the combined signature. Within ``BOT_WORKSPACE_CONTEXT_RECHECK_SECS``
+of the last check not even a ``stat`` is issued, so warm-pool runners building
+back-to-back pipelines do not touch disk. The activity log, daily memory and
+MEMORY.md are tail-read with a bounded window instead of read in full.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Callable
+
+from loguru import logger
+
+from core.config import BOT_PID, BOT_WORKSPACE_CONTEXT_RECHECK_SECS
+
+# Signature of a workspace file; None when the file is missing
+Signature = tuple[int, int] | None
+
+# Bytes read from the end of a growing file before widening the window
+TAIL_WINDOW_BYTES = 16 * 1024
+ACTIVITY_LOG_ENTRIES = 10
+MEMORY_TAIL_LINES = 50
+DAILY_MEMORY_CHARS = 2000
+
+_IDENTITY_FILES = [
+    ("SOUL.md", "Core Identity"),
+    ("IDENTITY.md", "Personal Details"),
+    ("USER.md", "User Context"),
+]
+
+_CROSS_CHANNEL_NOTE = (
+    "## Your Identity Across Channels\n\n"
+    "You are Pearl — the SAME Pearl across PearlOS voice, Discord, Telegram, and webchat.\n"
+    "When the user mentions 'Discord', that's one of YOUR channels — you ARE the Discord bot.\n\n"
+    "## Voice Session Rules\n\n"
+    "- Only send messages to Discord/Telegram when the user explicitly asks.\n"
+    "- You have full tool access via OpenClaw — web search, messaging, exec, files, everything.\n"
+    "- Never say 'I can't do that' — check your tools first.\n"
+)
+
+
+def _signature(path: str) -> Signature:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _read_text(path: str) -> str:
+    with open(path, "r", encoding="utf-8") as f:
+        return f.read()
+
+
+def _read_tail_lines(path: str, keep: Callable[[str], bool], count: int) -> list[str]:
+    """Last ``count`` lines satisfying ``keep``, reading backwards in windows."""
+    with open(path, "rb") as f:
+        size = f.seek(0, os.SEEK_END)
+        window = TAIL_WINDOW_BYTES
+        while True:
+            start = max(0, size - window)
+            f.seek(start)
+            lines = f.read(size - start).decode("utf-8", errors="replace").splitlines(keepends=True)
+            if start > 0 and lines:
+                lines = lines[1:]  # first line may be cut mid-way
+            kept = [line for line in lines if keep(line)]
+            if len(kept) >= count or start == 0:
+                return kept[-count:]
+            window *= 4
+
+
+def _read_tail_text(path: str, chars: int) -> tuple[str, bool]:
+    """At least the last ``chars`` characters, and whether the head was skipped."""
+    with open(path, "rb") as f:
+        size = f.seek(0, os.SEEK_END)
+        budget = chars * 4 + 64  # UTF-8 is at most 4 bytes per character
+        if size <= budget:
+            f.seek(0)
+            return f.read().decode("utf-8", errors="replace"), False
+        f.seek(size - budget)
+        return f.read().decode("utf-8", errors="ignore"), True
+
+
+def _identity_section(label: str) -> Callable[[str], str | None]:
+    def render(path: str) -> str | None:
+        content = _read_text(path).strip()
+        return f"## {label}\n{content}" if content else None
+
+    return render
+
+
+def _cross_session_section(path: str) -> str | None:
+    content = _read_text(path).strip()
+    if not content:
+        return None
+    return (
+        "## RECENT CONVERSATIONS (from other channels)\n"
+        "This is what you (Pearl) have been discussing with the user in other sessions. "
+        f"Treat this as your own memory.\n\n{content}"
+    )
+
+
+def _activity_section(path: str) -> str | None:
+    entries = _read_tail_lines(
+        path, lambda line: bool(line.strip()) and line.startswith("["), ACTIVITY_LOG_ENTRIES
+    )
+    if not entries:
+        return None
+    return (
+        "## Recent Cross-Session Activity\n"
+        "You are the same Pearl across all channels (Discord, webchat, PearlOS voice). "
+        "Here's what happened in other sessions recently:\n"
+        + "\n".join(line.strip() for line in entries)
+    )
+
+
+def _daily_section(today: str) -> Callable[[str], str | None]:
+    def render(path: str) -> str | None:
+        content, truncated = _read_tail_text(path, DAILY_MEMORY_CHARS)
+        content = content.strip()
+        if not content:
+            return None
+        # Limit to the tail to avoid blowing up the context window
+        if truncated or len(content) > DAILY_MEMORY_CHARS:
+            content = "...\n" + content[-DAILY_MEMORY_CHARS:]
+        return f"## Today's Activity Detail ({today})\n{content}"
+
+    return render
+
+
+def _memory_section(path: str) -> str | None:
+    content = "".join(_read_tail_lines(path, lambda line: True, MEMORY_TAIL_LINES)).strip()
+    return f"## Long-Term Memory (recent entries)\n{content}" if content else None
+
+
+class WorkspaceContextCache:
+    """Memoizes rendered workspace sections keyed by file signatures."""
+
+    def __init__(self, workspace_root: str, *, recheck_secs: float = 2.0):
+        self.workspace_root = workspace_root
+        self._recheck_secs = recheck_secs
+        self._lock = threading.Lock()
+        # path -> (signature, rendered section)
+        self._sections: dict[str, tuple[Signature, str | None]] = {}
+        self._context: str | None = None
+        self._context_key: tuple | None = None
+        self._checked_at = 0.0
+        self.reads = 0
+
+    def _sources(self) -> list[tuple[str, Callable[[str], str | None], bool]]:
+        """(path, renderer, warn_if_missing) in prompt order."""
+        root = self.workspace_root
+        today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+        sources = [
+            (os.path.join(root, filename), _identity_section(label), True)
+            for filename, label in _IDENTITY_FILES
+        ]
+        sources += [
+            (os.path.join(root, "memory", "cross-session-state.md"), _cross_session_section, True),
+            (os.path.join(root, "memory", "activity-log.md"), _activity_section, True),
+            (os.path.join(root, "memory", f"{today}.md"), _daily_section(today), False),
+            (os.path.join(root, "MEMORY.md"), _memory_section, False),
+        ]
+        return sources
+
+    def _section(self, path: str, render: Callable[[str], str | None], warn: bool) -> tuple[Signature, str | None]:
+        signature = _signature(path)
+        cached = self._sections.get(path)
+        if cached is not None and cached[0] == signature:
+            return cached
+        section = None
+        if signature is None:
+            if warn:
+                logger.warning(f"[{BOT_PID}] Workspace file not found: {path}")
+        else:
+            try:
+                section = render(path)
+                self.reads += 1
+            except FileNotFoundError:
+                signature = None
+            except Exception as e:
+                logger.error(f"[{BOT_PID}] Error reading {path}: {e}")
+        entry = (signature, section)
+        self._sections[path] = entry
+        return entry
+
+    def get(self) -> str:
+        with self._lock:
+            now = time.monotonic()
+            if self._context is not None and now - self._checked_at < self._recheck_secs:
+                return self._context
+            parts: list[str] = []
+            key: list = []
+            for path, render, warn in self._sources():
+                signature, section = self._section(path, render, warn)
+                key.append((path, signature))
+                if section:
+                    parts.append(section)
+            self._checked_at = now
+            if tuple(key) != self._context_key or self._context is None:
+                parts.append(_CROSS_CHANNEL_NOTE)
+                self._context = "\n\n".join(parts)
+                self._context_key = tuple(key)
+            return self._context
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._sections.clear()
+            self._context = None
+            self._context_key = None
+
+
+_caches: dict[str, WorkspaceContextCache] = {}
+
+
+def get_workspace_context_cache(workspace_root: str | None = None) -> WorkspaceContextCache:
+    root = workspace_root or os.getenv("OPENCLAW_WORKSPACE", "/root/.openclaw/workspace")
+    cache = _caches.get(root)
+    if cache is None:
+        cache = _caches[root] = WorkspaceContextCache(
+            root, recheck_secs=BOT_WORKSPACE_CONTEXT_RECHECK_SECS()
+        )
+    return cache
+
+
+def load_workspace_context() -> str:
+    """Load Pearl's identity and context from workspace files.
+
+    Returns combined context from SOUL.md, IDENTITY.md, USER.md, and activity-log.md
+    to give voice Pearl the same awareness as Discord/webchat Pearl. Served from
+    the process-wide cache unless a workspace file changed.
+    """
+    return get_workspace_context_cache().get()
+
+
+_fragments: dict[tuple[str, int], tuple[str, str]] = {}
+
+
+def workspace_prompt_fragment(max_chars: int) -> str:
+    """Workspace context as injected into the voice prompt.
+
+    Context longer than ``max_chars`` is dropped entirely so the personality
+    prompt carries the identity. The decision is memoized per context
+    revision so repeated builds skip re-deriving it.
+    """
+    cache = get_workspace_context_cache()
+    context = cache.get()
+    key = (cache.workspace_root, max_chars)
+    memo = _fragments.get(key)
+    if memo is not None and memo[0] is context:
+        return memo[1]
+    if len(context) > max_chars:
+        logger.warning(
+            f"[{BOT_PID}] Workspace context too long for voice ({len(context)} chars), trimming to identity only"
+        )
+        fragment = ""
+    else:
+        fragment = context
+    _fragments[key] = (context, fragment)
+    return fragment
@@ -21,6 +21,8 @@ from .bus import (
     emit_bot_speaking_stopped,
     emit_bot_transcript,
     BOT_TRANSCRIPT,
+    bus_stats,
+    flush_log,
     publish,
     register_stream,
     stream_events_generator,
@@ -44,6 +46,8 @@ __all__ = [
     # bus
     "subscribe",
     "publish",
+    "bus_stats",
+    "flush_log",
     "emit_call_state",
     "emit_first_participant_join",
     "emit_participant_join",
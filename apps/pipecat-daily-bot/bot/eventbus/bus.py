@@ -16,7 +16,10 @@ symbolic names in ``eventbus.events`` for clarity.
 from __future__ import annotations
 
 import asyncio
+import contextvars
 import os
+import queue
+import threading
 import uuid
 from collections.abc import Callable
 from datetime import datetime, timezone
@@ -27,10 +30,37 @@ from loguru import logger
 from . import events as _evt
 
 EVENT_BUS_BACKEND = os.getenv("BOT_EVENT_BUS", "log")
+# Per-topic log sampling: "bot.transcript=0,window.*=10" logs every Nth publish
+# of a topic (0 = never). Topics not listed are always logged.
+EVENT_BUS_LOG_SAMPLE = os.getenv("BOT_EVENT_BUS_LOG_SAMPLE", "")
+# Upper bound on envelopes waiting for the background log writer.
+EVENT_BUS_LOG_QUEUE_MAX = int(os.getenv("BOT_EVENT_BUS_LOG_QUEUE_MAX", "10000") or 10000)
 
-_subscribers: dict[str, list[Callable[[str, dict[str, Any]], None]]] = {}
-_wildcard_subscribers: list[Callable[[str, dict[str, Any]], None]] = []
+Handler = Callable[[str, dict[str, Any]], None]
+
+_subscribers: dict[str, list[Handler]] = {}
+_wildcard_subscribers: list[Handler] = []
 _stream_queues: list[asyncio.Queue[dict[str, Any]]] = []  # full envelopes
+# topic -> resolved handlers (topic subscribers followed by wildcards);
+# rebuilt lazily after any subscription change.
+_dispatch_index: dict[str, tuple[Handler, ...]] = {}
+_drop_counts: dict[str, int] = {}
+
+
+def _invalidate_index() -> None:
+    _dispatch_index.clear()
+
+
+def _handlers_for(topic: str) -> tuple[Handler, ...]:
+    handlers = _dispatch_index.get(topic)
+    if handlers is None:
+        handlers = tuple(_subscribers.get(topic, ())) + tuple(_wildcard_subscribers)
+        _dispatch_index[topic] = handlers
+    return handlers
+
+
+def _record_drop(topic: str) -> None:
+    _drop_counts[topic] = _drop_counts.get(topic, 0) + 1
 
 
 def subscribe(topic: str, handler: Callable[[str, dict[str, Any]], None]):
@@ -38,7 +68,7 @@ def subscribe(topic: str, handler: Callable[[str, dict[str, Any]], None]):
 
     Returns an unsubscribe callable (idempotent).
     """
-    
+    _invalidate_index()
     if topic == '*':
         _wildcard_subscribers.append(handler)
 
@@ -47,6 +77,7 @@ def subscribe(topic: str, handler: Callable[[str, dict[str, Any]], None]):
                 _wildcard_subscribers.remove(handler)
             except ValueError:
                 pass
+            _invalidate_index()
 
         return _unsub
     bucket = _subscribers.setdefault(topic, [])
@@ -57,6 +88,7 @@ def subscribe(topic: str, handler: Callable[[str, dict[str, Any]], None]):
             bucket.remove(handler)
         except ValueError:
             pass
+        _invalidate_index()
 
     return _unsub
 
@@ -71,40 +103,132 @@ def _envelope(topic: str, data: dict[str, Any]) -> dict[str, Any]:
     }
 
 
+# ---------------------------------------------------------------------------
+# Background log sink
+# ---------------------------------------------------------------------------
+
+
+def _parse_sample_rates(raw: str) -> tuple[dict[str, int], list[tuple[str, int]]]:
+    exact: dict[str, int] = {}
+    prefixes: list[tuple[str, int]] = []
+    for part in raw.split(","):
+        topic, _, rate = part.strip().partition("=")
+        if not topic or not rate:
+            continue
+        try:
+            every = max(0, int(rate))
+        except ValueError:
+            continue
+        if topic.endswith("*"):
+            prefixes.append((topic[:-1], every))
+        else:
+            exact[topic] = every
+    return exact, prefixes
+
+
+_sample_exact, _sample_prefixes = _parse_sample_rates(EVENT_BUS_LOG_SAMPLE)
+_sample_counters: dict[str, int] = {}
+_log_queue: "queue.Queue[Any]" = queue.Queue(maxsize=EVENT_BUS_LOG_QUEUE_MAX)
+_log_thread: threading.Thread | None = None
+_log_thread_lock = threading.Lock()
+_log_dropped = 0
+
+
+def _sample_every(topic: str) -> int:
+    every = _sample_exact.get(topic)
+    if every is not None:
+        return every
+    for prefix, rate in _sample_prefixes:
+        if topic.startswith(prefix):
+            return rate
+    return 1
+
+
+def _should_log(topic: str, payload: dict[str, Any]) -> bool:
+    # Skip repetitive partial transcripts logging
+    if topic == BOT_TRANSCRIPT and not payload.get("isFinal"):
+        return False
+    every = _sample_every(topic)
+    if every <= 1:
+        return every == 1
+    count = _sample_counters.get(topic, 0)
+    _sample_counters[topic] = count + 1
+    return count % every == 0
+
+
+def _log_writer() -> None:
+    while True:
+        item = _log_queue.get()
+        try:
+            if isinstance(item, threading.Event):
+                item.set()
+                continue
+            context, topic, env = item
+            context.run(logger.info, f"[eventbus] {topic} {env}")
+        except Exception:  # pragma: no cover - never let the writer die
+            pass
+
+
+def _enqueue_log(topic: str, env: dict[str, Any]) -> None:
+    global _log_thread, _log_dropped
+    if _log_thread is None:
+        with _log_thread_lock:
+            if _log_thread is None:
+                _log_thread = threading.Thread(
+                    target=_log_writer, name="eventbus-log", daemon=True
+                )
+                _log_thread.start()
+    # Only a shallow snapshot is taken here, so keys callers set on the payload
+    # after publish() returns do not leak into the line; the writer thread
+    # renders it, inside a copy of this thread's context so contextvar
+    # bindings (session identity, loguru's contextualize()) still apply.
+    snapshot = {**env, "data": dict(env["data"])}
+    try:
+        _log_queue.put_nowait((contextvars.copy_context(), topic, snapshot))
+    except queue.Full:
+        _log_dropped += 1
+
+
+def flush_log(timeout: float = 2.0) -> bool:
+    """Block until envelopes queued for logging so far have been written."""
+    if _log_thread is None:
+        return True
+    marker = threading.Event()
+    try:
+        _log_queue.put(marker, timeout=timeout)
+    except queue.Full:
+        return False
+    return marker.wait(timeout)
+
+
+# ---------------------------------------------------------------------------
+# Streaming consumers
+# ---------------------------------------------------------------------------
+
+
 def publish(topic: str, payload: dict[str, Any]):
     """Publish an event with a versioned envelope.
 
     Subscribers get the raw (topic, payload).
     Streaming consumers (SSE/WS) receive the full envelope object.
+    Logging happens on a background writer so it never delays delivery.
     """
     env = _envelope(topic, payload)
-    if EVENT_BUS_BACKEND == "log":
-        # Skip repetitive partial transcripts logging
-        if topic == "bot.transcript" and not payload.get("isFinal"):
-            pass
-        else:
-            logger.info(f"[eventbus] {topic} {env}")
+    if EVENT_BUS_BACKEND == "log" and _should_log(topic, payload):
+        _enqueue_log(topic, env)
 
-    # Topic subscribers
-    subscribers = list(_subscribers.get(topic, []))
-    for h in subscribers:
+    # Topic + wildcard subscribers, resolved once per subscription change
+    for h in _handlers_for(topic):
         try:
             h(topic, payload)
         except Exception as e:  # pragma: no cover
             logger.warning(f"[eventbus] subscriber error topic={topic} err={e}")
 
-    # Wildcard subscribers
-    for h in list(_wildcard_subscribers):
-        try:
-            h(topic, payload)
-        except Exception as e:  # pragma: no cover
-            logger.warning(f"[eventbus] wildcard subscriber error topic={topic} err={e}")
-
-    # Streaming fan‑out (best effort)
-    for q in list(_stream_queues):
+    # Streaming fan‑out (best effort); a full stream drops its oldest envelope
+    for q in _stream_queues:
         if q.full():
             try:
-                q.get_nowait()
+                _record_drop(q.get_nowait().get("type", ""))
             except Exception:
                 pass
         try:
@@ -114,6 +238,19 @@ def publish(topic: str, payload: dict[str, Any]):
     return env
 
 
+def bus_stats() -> dict[str, Any]:
+    """Per-topic drop counters and log sink pressure."""
+    return {
+        "drops": dict(_drop_counts),
+        "streams": [
+            {"depth": q.qsize(), "maxsize": q.maxsize}
+            for q in _stream_queues
+        ],
+        "logQueueDepth": _log_queue.qsize(),
+        "logDropped": _log_dropped,
+    }
+
+
 # Convenience emitters (kept here; they reference canonical names from events.py)
 def emit_call_state(room_url: str, phase: str):
     return publish(_evt.DAILY_CALL_STATE, {"room": room_url, "phase": phase})
@@ -206,15 +343,15 @@ def emit_bot_transcript(room_url: str, text: str, is_final: bool = False):
     return publish(BOT_TRANSCRIPT, data)
 
 
-async def register_stream() -> asyncio.Queue[dict[str, Any]]:
-    q: asyncio.Queue[dict[str, Any]] = asyncio.Queue(maxsize=1000)
+async def register_stream(maxsize: int = 1000) -> asyncio.Queue[dict[str, Any]]:
+    q: asyncio.Queue[dict[str, Any]] = asyncio.Queue(maxsize=maxsize)
     _stream_queues.append(q)
     return q
 
 
 def unregister_stream(q: asyncio.Queue):
     try:
-        _stream_queues.remove(q)  # type: ignore[arg-type]
+        _stream_queues.remove(q)
     except ValueError:
         pass
 
@@ -223,6 +360,7 @@ def reset_bus():
     """Reset the event bus state (clear all subscribers)."""
     _subscribers.clear()
     _wildcard_subscribers.clear()
+    _invalidate_index()
     # We do NOT clear stream queues as those might be long-lived monitoring connections
     logger.info("[eventbus] Bus state reset (subscribers cleared)")
 
@@ -240,6 +378,8 @@ async def stream_events_generator():
 __all__ = [
     "subscribe",
     "publish",
+    "bus_stats",
+    "flush_log",
     "emit_call_state",
     "emit_first_participant_join",
     "emit_participant_join",
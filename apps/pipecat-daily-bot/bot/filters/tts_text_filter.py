@@ -3,86 +3,155 @@
 This prevents the TTS engine from trying to vocalize markdown formatting
 (e.g., **bold**, *italic*, # headings, ```code```) which causes garbled
 or distorted audio output.
+
+All markdown rules, character replacements and (optionally) the provider
+"non-speakable" sanitizing rules are folded into one compiled alternation, so
+each aggregated chunk is normalized in a single left-to-right scan plus a
+whitespace collapse, instead of ~20 sequential ``re.sub`` passes.
 """
 
 import re
+
 from pipecat.utils.text.base_text_filter import BaseTextFilter
 
+# Characters that TTS engines commonly stumble on
+_CHAR_REPLACEMENTS = {
+    "—": ", ",      # em dash → pause
+    "–": ", ",      # en dash → pause
+    "…": "...",     # ellipsis (some TTS handle ... better)
+    "•": "",        # bullet
+    "→": "to",
+    "←": "from",
+    "≥": "greater than or equal to",
+    "≤": "less than or equal to",
+    "≠": "not equal to",
+    "±": "plus or minus",
+    "&": "and",
+    "#": "number ",
+    "@": "at ",
+}
 
-class MarkdownStripFilter(BaseTextFilter):
-    """Strips markdown formatting from text before TTS synthesis."""
-
-    # Patterns ordered from most specific to least specific
-    _PATTERNS = [
-        # Code blocks (fenced)
-        (re.compile(r"```[\s\S]*?```", re.MULTILINE), ""),
-        # Inline code
-        (re.compile(r"`([^`]+)`"), r"\1"),
-        # Bold+italic (***text*** or ___text___)
-        (re.compile(r"\*{3}(.+?)\*{3}"), r"\1"),
-        (re.compile(r"_{3}(.+?)_{3}"), r"\1"),
-        # Bold (**text** or __text__)
-        (re.compile(r"\*{2}(.+?)\*{2}"), r"\1"),
-        (re.compile(r"_{2}(.+?)_{2}"), r"\1"),
-        # Italic (*text* or _text_) — avoid matching mid-word underscores
-        (re.compile(r"(?<!\w)\*(.+?)\*(?!\w)"), r"\1"),
-        (re.compile(r"(?<!\w)_(.+?)_(?!\w)"), r"\1"),
-        # Strikethrough (~~text~~)
-        (re.compile(r"~~(.+?)~~"), r"\1"),
-        # Headers (# text)
-        (re.compile(r"^#{1,6}\s+", re.MULTILINE), ""),
-        # Blockquotes (> text)
-        (re.compile(r"^>\s+", re.MULTILINE), ""),
-        # Unordered list markers (- or * at line start)
-        (re.compile(r"^[\-\*]\s+", re.MULTILINE), ""),
-        # Ordered list markers (1. 2. etc.)
-        (re.compile(r"^\d+\.\s+", re.MULTILINE), ""),
-        # Links [text](url) → text
-        (re.compile(r"\[([^\]]+)\]\([^\)]+\)"), r"\1"),
-        # Bare URLs
-        (re.compile(r"https?://\S+"), ""),
-        # HTML tags
-        (re.compile(r"<[^>]+>"), ""),
-        # Horizontal rules
-        (re.compile(r"^[-*_]{3,}\s*$", re.MULTILINE), ""),
-        # Multiple newlines → single space
-        (re.compile(r"\n{2,}"), " "),
-        # Remaining newlines → space
-        (re.compile(r"\n"), " "),
-        # Collapse multiple spaces
-        (re.compile(r" {2,}"), " "),
-    ]
-
-    # Characters that TTS engines commonly stumble on
-    _CHAR_REPLACEMENTS = {
-        "—": ", ",      # em dash → pause
-        "–": ", ",      # en dash → pause
-        "…": "...",     # ellipsis (some TTS handle ... better)
-        "•": "",        # bullet
-        "→": "to",
-        "←": "from",
-        "≥": "greater than or equal to",
-        "≤": "less than or equal to",
-        "≠": "not equal to",
-        "±": "plus or minus",
-        "&": "and",
-        "#": "number ",
-        "@": "at ",
-    }
+# Emoji ranges stripped for providers that would otherwise read them aloud
+EMOJI_CLASS = (
+    "\U0001F600-\U0001F64F"  # Emoticons
+    "\U0001F300-\U0001F5FF"  # Misc Symbols and Pictographs
+    "\U0001F680-\U0001F6FF"  # Transport and Map
+    "\U0001F700-\U0001F77F"  # Alchemical Symbols
+    "\U0001F780-\U0001F7FF"  # Geometric Shapes Extended
+    "\U0001F800-\U0001F8FF"  # Supplemental Arrows-C
+    "\U0001F900-\U0001F9FF"  # Supplemental Symbols and Pictographs
+    "\U0001FA00-\U0001FA6F"  # Chess Symbols
+    "\U0001FA70-\U0001FAFF"  # Symbols and Pictographs Extended-A
+    "\U0001F1E0-\U0001F1FF"  # Regional indicator symbols (flags)
+    "\U0001F3FB-\U0001F3FF"  # Skin tone modifiers
+    "\U0000200D"             # Zero-width joiner (used in ZWJ sequences)
+    "\U0000FE0F"             # Variation selector-16 (emoji presentation)
+    "\U00002600-\U000026FF"  # Misc symbols (sun, clouds, etc.)
+    "\U00002702-\U000027BF"  # Dingbats
+    "\U000024C2-\U000024CF"  # Enclosed alphanumerics subset (circled letters)
+    "\U0001F200-\U0001F251"  # Enclosed ideographic supplement
+)
 
-    async def filter(self, text: str) -> str:
+# Markdown/code formatting, bullets, arrows, stars/checks and box drawing
+# characters that Kokoro pronounces literally.
+NONSPEAKABLE_CLASS = (
+    r"#*_`~\[\]<>|\\^{}"
+    "•●○◦◆◇▪▫▸▹►▻"
+    "→←↑↓↔↕⇒⇐⇑⇓⇔"
+    "★☆✓✔✕✖✗✘"
+    "│┃┆┇┊┋╎╏║"
+    "─━┄┅┈┉╌╍═"
+    "┌┐└┘├┤┬┴┼╔╗╚╝╠╣╦╩╬"
+)
+
+# Alternatives are tried left to right at each position, which mirrors the old
+# "most specific first" ordering of the sequential substitutions.
+_MARKDOWN_ALTERNATIVES = [
+    r"(?P<fence>```[\s\S]*?```)",                      # Code blocks (fenced)
+    r"`(?P<code>[^`]+)`",                              # Inline code
+    r"\*{3}(?P<bi1>.+?)\*{3}",                         # Bold+italic
+    r"_{3}(?P<bi2>.+?)_{3}",
+    r"\*{2}(?P<b1>.+?)\*{2}",                          # Bold
+    r"_{2}(?P<b2>.+?)_{2}",
+    r"(?<!\w)\*(?P<i1>.+?)\*(?!\w)",                   # Italic, not mid-word
+    r"(?<!\w)_(?P<i2>.+?)_(?!\w)",
+    r"~~(?P<strike>.+?)~~",                            # Strikethrough
+    r"(?P<hr>^[-*_]{3,}[ \t]*$)",                      # Horizontal rules
+    r"(?P<block>^(?:#{1,6}|>|[\-\*]|\d+\.)\s+)",       # Headers, quotes, list markers
+    r"\[(?P<link>[^\]]+)\]\([^\)]+\)",                 # Links [text](url) → text
+    r"(?P<url>https?://\S+)",                          # Bare URLs
+    r"(?P<tag><[^>]+>)",                               # HTML tags
+    r"(?P<newline>\n+)",                               # Newlines → single space
+]
+_INNER_GROUPS = ("code", "bi1", "bi2", "b1", "b2", "i1", "i2", "strike", "link")
+_SPACES = re.compile(r" {2,}")
+_WHITESPACE_RUNS = re.compile(r"\s{2,}")
+
+
+class TextNormalizer:
+    """Compiled single-pass markdown/special-character normalizer.
+
+    With ``strip_nonspeakable`` the provider sanitizing rules (emoji and
+    non-speakable characters, formerly applied again inside Kokoro) are part
+    of the same pattern, so text leaving the filter needs no further cleanup.
+    """
+
+    def __init__(self, strip_nonspeakable: bool = False):
+        self.strip_nonspeakable = strip_nonspeakable
+        alternatives = list(_MARKDOWN_ALTERNATIVES)
+        chars = "".join(re.escape(c) for c in _CHAR_REPLACEMENTS)
+        alternatives.append(f"(?P<char>[{chars}])")
+        if strip_nonspeakable:
+            alternatives.append(f"(?P<emoji>[{EMOJI_CLASS}]+)")
+            alternatives.append(f"(?P<nonspeak>[{NONSPEAKABLE_CLASS}]+)")
+        self._pattern = re.compile("|".join(alternatives), re.MULTILINE)
+
+    def _replace(self, match: re.Match) -> str:
+        group = match.lastgroup
+        if group in _INNER_GROUPS:
+            # Nested markup (e.g. a link inside bold) is normalized recursively.
+            return self._pattern.sub(self._replace, match.group(group))
+        if group == "char":
+            return _CHAR_REPLACEMENTS[match.group(group)]
+        if group in ("newline", "nonspeak"):
+            return " "
+        return ""  # fence, hr, block, url, tag, emoji
+
+    def normalize(self, text: str) -> str:
         if not text:
             return text
+        text = self._pattern.sub(self._replace, text)
+        if self.strip_nonspeakable:
+            return _WHITESPACE_RUNS.sub(" ", text).strip()
+        return _SPACES.sub(" ", text).strip()
+
+
+_DEFAULT_NORMALIZER = TextNormalizer()
+_SPEAKABLE_NORMALIZER = TextNormalizer(strip_nonspeakable=True)
+
+
+def get_normalizer(strip_nonspeakable: bool = False) -> TextNormalizer:
+    """Shared compiled normalizers (patterns are built once per process)."""
+    return _SPEAKABLE_NORMALIZER if strip_nonspeakable else _DEFAULT_NORMALIZER
 
-        # Regex patterns first (strips markdown structure)
-        for pattern, replacement in self._PATTERNS:
-            text = pattern.sub(replacement, text)
 
-        # Character replacements after (handles remaining special chars)
-        for char, replacement in self._CHAR_REPLACEMENTS.items():
-            text = text.replace(char, replacement)
+class MarkdownStripFilter(BaseTextFilter):
+    """Strips markdown formatting from text before TTS synthesis.
+
+    Pass ``strip_nonspeakable=True`` for providers (Kokoro) that also need
+    emoji and decorative characters removed; the provider can then skip its
+    own sanitizing pass.
+    """
+
+    def __init__(self, strip_nonspeakable: bool = False):
+        self._normalizer = get_normalizer(strip_nonspeakable)
 
-        return text.strip()
+    @property
+    def strips_nonspeakable(self) -> bool:
+        return self._normalizer.strip_nonspeakable
+
+    async def filter(self, text: str) -> str:
+        return self._normalizer.normalize(text)
 
     async def handle_interruption(self):
         pass
@@ -1,16 +1,27 @@
 from __future__ import annotations
 
+import atexit
 import itertools
 import json
 import logging
 import os
+import queue
 import sys
+import time
 from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
 from typing import Any
 
 _handler_ids = itertools.count(1)
 _handlers: dict[int, logging.Handler] = {}
 
+# Records go through a bounded queue to a writer thread (BOT_LOG_ASYNC=false
+# writes inline). BOT_LOG_QUEUE_SIZE bounds the queue; records are dropped
+# when it is full. BOT_LOG_RATE_LIMIT_PER_SEC caps DEBUG/INFO records per call
+# site (0 disables).
+_DEFAULT_QUEUE_SIZE = 10000
+_DEFAULT_RATE_LIMIT_PER_SEC = 50
+
 
 def _level_to_int(level: str | int | None) -> int:
     if isinstance(level, int):
@@ -34,6 +45,18 @@ def _resolve_default_level() -> int:
     return logging.INFO
 
 
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.getenv(name, str(default)))
+    except ValueError:
+        return default
+
+
+def _async_logging_enabled() -> bool:
+    raw = (os.getenv("BOT_LOG_ASYNC") or "true").strip().lower()
+    return raw not in ("0", "false", "no", "off")
+
+
 def _frame_logging_enabled() -> bool:
     raw = (os.getenv("PIPECAT_FRAME_DEBUG") or "").strip().lower()
     return raw in ("1", "true", "yes", "on")
@@ -84,6 +107,27 @@ class StructuredLogger:
         return StructuredLogger(self._base, merged)
 
     def _log(self, level: int, message: str, *args: Any, **kwargs: Any) -> None:
+        base = self._base
+        # Disabled levels return before any context is merged or records built
+        if not base.isEnabledFor(level):
+            return
+        # As in logging, stacklevel=1 is the code calling debug()/info()/...;
+        # wrappers pass a higher value to attribute records to their callers.
+        # The +2 steps over this method and the level method above it.
+        stacklevel = kwargs.pop("stacklevel", 1) + 2
+        suppressed = 0
+        if level < logging.WARNING and _sampler is not None:
+            # Key on the calling code object and line: one frame lookup
+            # instead of Logger.findCaller's walk, which only emitted records pay.
+            try:
+                caller = sys._getframe(stacklevel - 1)
+                site: Any = (level, caller.f_code, caller.f_lineno)
+            except ValueError:
+                site = (level, message)
+            admitted, suppressed = _sampler.admit(site)
+            if not admitted:
+                return
+
         exc_info = kwargs.pop("exc_info", None)
         stack_info = kwargs.pop("stack_info", False)
         context = {**self._context}
@@ -91,9 +135,21 @@ class StructuredLogger:
         for key, value in kwargs.items():
             if value is not None:
                 context[key] = value
+        if suppressed:
+            context["suppressed"] = suppressed
 
         extra = {"context": context} if context else None
-        self._base.log(level, message, *args, exc_info=exc_info, stack_info=stack_info, extra=extra)
+        if stack_info:
+            base.log(level, message, *args, exc_info=exc_info, stack_info=True, stacklevel=stacklevel, extra=extra)
+            return
+        if exc_info:
+            if isinstance(exc_info, BaseException):
+                exc_info = (type(exc_info), exc_info, exc_info.__traceback__)
+            elif not isinstance(exc_info, tuple):
+                exc_info = sys.exc_info()
+        filename, lineno, func, _ = base.findCaller(stacklevel=stacklevel)
+        record = base.makeRecord(base.name, level, filename, lineno, message, args, exc_info, func, extra)
+        base.handle(record)
 
     def debug(self, message: str, *args: Any, **kwargs: Any) -> None:
         self._log(logging.DEBUG, message, *args, **kwargs)
@@ -180,13 +236,83 @@ class StructuredLogger:
             pass
 
 
+class _RateLimiter:
+    """Caps records per call site to ``limit`` per second.
+
+    Records over the cap are counted and the count is attached as
+    ``suppressed`` to the next record admitted from that call site. Counts are
+    approximate when several threads log from the same site at once.
+    """
+
+    def __init__(self, limit: int, window_secs: float = 1.0):
+        self.limit = limit
+        self.window_secs = window_secs
+        self.total_suppressed = 0
+        # call site -> [window start, admitted in window, suppressed in window]
+        self._sites: dict[Any, list] = {}
+
+    def admit(self, site: Any) -> tuple[bool, int]:
+        now = time.monotonic()
+        state = self._sites.get(site)
+        if state is None or now - state[0] >= self.window_secs:
+            carried = state[2] if state is not None else 0
+            self._sites[site] = [now, 1, 0]
+            return True, carried
+        if state[1] < self.limit:
+            state[1] += 1
+            return True, 0
+        state[2] += 1
+        self.total_suppressed += 1
+        return False, 0
+
+
+class _DirectQueueHandler(QueueHandler):
+    """Hands records to the listener thread; drops them when the queue is full.
+
+    Like the stock ``QueueHandler.prepare``, the message is rendered on the
+    calling thread so arguments mutated after the call are logged as they
+    were. JSON formatting and the write are left to the listener thread.
+    """
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            # A stalled stderr must never block the event loop
+            self.dropped += 1
+
+
+class _DrainingListener(QueueListener):
+    def enqueue_sentinel(self) -> None:
+        # The stock put_nowait raises when a bounded queue is full at shutdown;
+        # wait for the writer thread to make room instead
+        self.queue.put(self._sentinel)
+
+
+def _drop_frame_chatter(record: logging.LogRecord) -> bool:
+    # Keep the rendered message so the formatter does not render it again
+    record.message = record.getMessage()
+    return "Frame#" not in record.message
+
+
 class _JSONFormatter(logging.Formatter):
     def format(self, record: logging.LogRecord) -> str:  # type: ignore[override]
         ts = datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat()
+        message = record.__dict__.get("message")
         payload: dict[str, Any] = {
             "ts": ts,
             "level": record.levelname,
-            "message": record.getMessage(),
+            "message": record.getMessage() if message is None else message,
         }
 
         context = getattr(record, "context", None)
@@ -218,15 +344,48 @@ def _serialize_payload(payload: dict[str, Any], ts: str, record: logging.LogReco
         return f"{ts} {record.levelname} {record.getMessage()} context={context}"
 
 
+def _stream_handler(stream: Any) -> logging.Handler:
+    handler = logging.StreamHandler(stream)
+    handler.setFormatter(_JSONFormatter())
+    # Drop frame-level chatter unless explicitly enabled
+    if not _frame_logging_enabled():
+        handler.addFilter(_drop_frame_chatter)
+    return handler
+
+
+def _install_handlers(logger: logging.Logger, stream: Any, *, queued: bool) -> QueueListener | None:
+    """Attach the JSON stream handler, behind a queue and listener thread when ``queued``."""
+    output = _stream_handler(stream)
+    if not queued:
+        logger.addHandler(output)
+        return None
+    log_queue: queue.Queue = queue.Queue(maxsize=max(0, _env_int("BOT_LOG_QUEUE_SIZE", _DEFAULT_QUEUE_SIZE)))
+    listener = _DrainingListener(log_queue, output, respect_handler_level=True)
+    listener.start()
+    logger.addHandler(_DirectQueueHandler(log_queue))
+    return listener
+
+
+_listener: QueueListener | None = None
+_rate_limit = _env_int("BOT_LOG_RATE_LIMIT_PER_SEC", _DEFAULT_RATE_LIMIT_PER_SEC)
+_sampler: _RateLimiter | None = _RateLimiter(_rate_limit) if _rate_limit > 0 else None
+
+
+def _stop_listener() -> None:
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
 def _base_logger() -> logging.Logger:
+    global _listener
     logger = logging.getLogger("pipecat")
     if not logger.handlers:
-        handler = logging.StreamHandler(sys.stderr)
-        handler.setFormatter(_JSONFormatter())
-        # Drop frame-level chatter unless explicitly enabled
-        if not _frame_logging_enabled():
-            handler.addFilter(lambda record: "Frame#" not in record.getMessage())
-        logger.addHandler(handler)
+        _listener = _install_handlers(logger, sys.stderr, queued=_async_logging_enabled())
+        if _listener is not None:
+            # Drain queued records on interpreter exit
+            atexit.register(_stop_listener)
     logger.setLevel(_resolve_default_level())
     logger.propagate = False
     _configure_noisy_subloggers()
@@ -260,7 +419,8 @@ def set_base_level(level: str | int) -> None:
     numeric_level = _level_to_int(level)
     base = _base_logger()
     base.setLevel(numeric_level)
-    for handler in base.handlers:
+    listener_handlers = _listener.handlers if _listener is not None else ()
+    for handler in (*base.handlers, *listener_handlers):
         try:
             handler.setLevel(numeric_level)
         except Exception:
@@ -268,4 +428,17 @@ def set_base_level(level: str | int) -> None:
             pass
 
 
-__all__ = ["logger", "StructuredLogger", "set_base_level", "get_logger"]
+def flush() -> None:
+    """Block until queued records have been written (tests, shutdown hooks)."""
+    if _listener is not None:
+        _listener.queue.join()
+
+
+def log_stats() -> dict[str, int]:
+    """Records dropped on a full queue and suppressed by the per-site rate limit."""
+    dropped = sum(getattr(handler, "dropped", 0) for handler in _base_logger().handlers)
+    suppressed = _sampler.total_suppressed if _sampler is not None else 0
+    return {"dropped": dropped, "suppressed": suppressed}
+
+
+__all__ = ["logger", "StructuredLogger", "set_base_level", "get_logger", "flush", "log_stats"]
@@ -1,5 +1,7 @@
+import asyncio
 import os
-from typing import Any
+import time
+from typing import Any, Callable
 from loguru import logger as base_logger
 
 from core.config import BOT_PID
@@ -54,115 +56,14 @@ from core.config import (
     KOKORO_TTS_SAMPLE_RATE, KOKORO_TTS_AUTO_MODE,
     KOKORO_TTS_APPLY_TEXT_NORMALIZATION, KOKORO_TTS_ENABLE_LOGGING,
     KOKORO_TTS_ENABLE_SSML, KOKORO_TTS_SEED, KOKORO_TTS_INACTIVITY_TIMEOUT,
-    KOKORO_TTS_CHUNK_SCHEDULE, KOKORO_TTS_TRY_TRIGGER_GENERATION
+    KOKORO_TTS_CHUNK_SCHEDULE, KOKORO_TTS_TRY_TRIGGER_GENERATION,
+    BOT_SPECULATIVE_INTERIM_ENABLED,
 )
 
 from core.prompts import MULTI_USER_NOTE, SMART_SILENCE_NOTE, ONBOARDING_NOTE, NOTES_NOTE
+from core.session_context import current_session_id, current_user_id, current_user_name, session_value
+from core.workspace_context import workspace_prompt_fragment
 
-def load_workspace_context() -> str:
-    """Load Pearl's identity and context from workspace files.
-    
-    Returns combined context from SOUL.md, IDENTITY.md, USER.md, and activity-log.md
-    to give voice Pearl the same awareness as Discord/webchat Pearl.
-    """
-    workspace_root = os.getenv("OPENCLAW_WORKSPACE", "/root/.openclaw/workspace")
-    context_parts = []
-    
-    # Read identity files
-    identity_files = [
-        ("SOUL.md", "Core Identity"),
-        ("IDENTITY.md", "Personal Details"),
-        ("USER.md", "User Context"),
-    ]
-    
-    for filename, label in identity_files:
-        filepath = os.path.join(workspace_root, filename)
-        try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                content = f.read().strip()
-                if content:
-                    context_parts.append(f"## {label}\n{content}")
-        except FileNotFoundError:
-            base_logger.warning(f"[{BOT_PID}] Workspace file not found: {filepath}")
-        except Exception as e:
-            base_logger.error(f"[{BOT_PID}] Error reading {filepath}: {e}")
-    
-    # Read cross-session state file (quick-read shared state)
-    cross_session_path = os.path.join(workspace_root, "memory", "cross-session-state.md")
-    try:
-        with open(cross_session_path, 'r', encoding='utf-8') as f:
-            content = f.read().strip()
-            if content:
-                context_parts.append(f"## RECENT CONVERSATIONS (from other channels)\nThis is what you (Pearl) have been discussing with the user in other sessions. Treat this as your own memory.\n\n{content}")
-    except FileNotFoundError:
-        base_logger.warning(f"[{BOT_PID}] Cross-session state not found: {cross_session_path}")
-    except Exception as e:
-        base_logger.error(f"[{BOT_PID}] Error reading cross-session state: {e}")
-    
-    # Read recent activity log for cross-session awareness
-    activity_log_path = os.path.join(workspace_root, "memory", "activity-log.md")
-    try:
-        with open(activity_log_path, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
-            # Get last 10 entries for recent context
-            recent_entries = [line.strip() for line in lines if line.strip() and line.startswith('[')][-10:]
-            if recent_entries:
-                context_parts.append(
-                    "## Recent Cross-Session Activity\n" +
-                    "You are the same Pearl across all channels (Discord, webchat, PearlOS voice). " +
-                    "Here's what happened in other sessions recently:\n" +
-                    "\n".join(recent_entries)
-                )
-    except FileNotFoundError:
-        base_logger.warning(f"[{BOT_PID}] Activity log not found: {activity_log_path}")
-    except Exception as e:
-        base_logger.error(f"[{BOT_PID}] Error reading activity log: {e}")
-    
-    # Read today's daily memory file for detailed context
-    from datetime import datetime, timezone
-    today_str = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-    daily_memory_path = os.path.join(workspace_root, "memory", f"{today_str}.md")
-    try:
-        with open(daily_memory_path, 'r', encoding='utf-8') as f:
-            content = f.read().strip()
-            if content:
-                # Limit to last ~2000 chars to avoid blowing up context window
-                if len(content) > 2000:
-                    content = "...\n" + content[-2000:]
-                context_parts.append(f"## Today's Activity Detail ({today_str})\n{content}")
-    except FileNotFoundError:
-        pass  # Normal - no activity yet today
-    except Exception as e:
-        base_logger.error(f"[{BOT_PID}] Error reading daily memory: {e}")
-    
-    # Read MEMORY.md for long-term context (trimmed)
-    memory_path = os.path.join(workspace_root, "MEMORY.md")
-    try:
-        with open(memory_path, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
-            if lines:
-                # Take last 50 lines to stay within context budget
-                trimmed = lines[-50:]
-                content = "".join(trimmed).strip()
-                if content:
-                    context_parts.append(f"## Long-Term Memory (recent entries)\n{content}")
-    except FileNotFoundError:
-        pass  # Normal - MEMORY.md may not exist yet
-    except Exception as e:
-        base_logger.error(f"[{BOT_PID}] Error reading MEMORY.md: {e}")
-    
-    # Cross-channel identity clarity (concise version for token efficiency)
-    context_parts.append(
-        "## Your Identity Across Channels\n\n"
-        "You are Pearl — the SAME Pearl across PearlOS voice, Discord, Telegram, and webchat.\n"
-        "When the user mentions 'Discord', that's one of YOUR channels — you ARE the Discord bot.\n\n"
-        "## Voice Session Rules\n\n"
-        "- Only send messages to Discord/Telegram when the user explicitly asks.\n"
-        "- You have full tool access via OpenClaw — web search, messaging, exec, files, everything.\n"
-        "- Never say 'I can't do that' — check your tools first.\n"
-    )
-    
-    return "\n\n".join(context_parts) if context_parts else ""
 
 async def build_pipeline(
     room_url: str,
@@ -176,17 +77,22 @@ async def build_pipeline(
     supportedFeatures: list[str] | None = None,
     sessionOverride: dict[str, Any] | None = None,
     isOnboarding: bool = False,
+    transport_factory: Callable[[Any], Any] | None = None,
 ):
     """Build and return (pipeline, task, context_agg, transport, messages, multi_user_aggregator).
 
     Heavy imports are inside so unit tests for parameter validation can run
     without needing the pipecat native / network dependencies unless invoked.
+
+    ``transport_factory`` replaces the Daily transport: it is called with the
+    ``TransportParams`` the Daily transport would get (audio format, VAD) and
+    returns the transport to use. Offline benchmarks pass a loopback here.
     """
     logger = base_logger.bind(
         roomUrl=room_url,
-        sessionId=os.getenv("BOT_SESSION_ID"),
-        userId=os.getenv("BOT_SESSION_USER_ID"),
-        userName=os.getenv("BOT_SESSION_USER_NAME"),
+        sessionId=current_session_id(),
+        userId=current_user_id(),
+        userName=current_user_name(),
     )
     from pipecat.audio.vad.silero import SileroVADAnalyzer
 
@@ -195,7 +101,7 @@ async def build_pipeline(
     from pipecat.pipeline.pipeline import Pipeline
     from pipecat.pipeline.task import PipelineParams, PipelineTask
     from pipecat.services.openai.llm import OpenAILLMService
-    from pipecat.pipeline.service_switcher import ServiceSwitcher, ServiceSwitcherStrategyManual
+    from pipeline.tts_switcher import ModeServiceSwitcher, ModeVoice
 
     # --- OpenClaw LLM subclass ---------------------------------------------------
     # Thin wrapper around OpenAILLMService that:
@@ -219,8 +125,7 @@ async def build_pipeline(
                 context.add_message({"role": "user", "content": "[user has joined the conversation]"})
             await super()._process_context(context)
     # ---------------------------------------------------------------------------
-    from pipecat.transports.daily.transport import DailyParams, DailyTransport
-    from daily import LogLevel as DailyLogLevel
+    from pipecat.transports.base_transport import TransportParams
     from pipecat.services.openai.llm import OpenAIContextAggregatorPair
     from pipecat.processors.aggregators.openai_llm_context import OpenAILLMContext
     
@@ -327,8 +232,12 @@ async def build_pipeline(
     # produce distorted output. The MarkdownStripFilter runs before synthesis.
     markdown_filter = MarkdownStripFilter()
     text_filters = [markdown_filter]
+    # Kokoro's emoji/non-speakable sanitizing is folded into the same compiled
+    # pass so the provider does not re-scan every sentence.
+    kokoro_text_filters = [MarkdownStripFilter(strip_nonspeakable=True)]
     if use_smart_silence:
         text_filters.append(SilenceTextFilter())
+        kokoro_text_filters.append(SilenceTextFilter())
 
     use_lull_detection = 'lullDetection' in supported_features_list
     lull_timeout_secs = 8.0
@@ -343,11 +252,27 @@ async def build_pipeline(
             lull_timeout_secs = 10.0
         logger.info(f"[{BOT_PID}] Lull timeout set to {lull_timeout_secs} seconds.")
 
-    _raw_env = os.getenv("BOT_TTS_PROVIDER")
+    _raw_env = session_value("tts_provider")
     _use_el = os.getenv("USE_ELEVENLABS")
     tts_provider = BOT_TTS_PROVIDER()
     logger.info(f"Selected TTS provider: {tts_provider} (raw_env={_raw_env!r}, use_el={_use_el!r})")
 
+    # Helper to build Kokoro voice parameters from a (frontend) voice config
+    def kokoro_input_params(v_params):
+        # Helper to get param with fallback to env var (if not in v_params)
+        def get_p(key, default_val):
+            return v_params.get(key, default_val)
+
+        chunk_schedule = KOKORO_TTS_CHUNK_SCHEDULE()
+        return KokoroTTSService.InputParams(
+            speed=get_p("speed", voice_speed),
+            stability=get_p("stability", voice_stability),
+            similarity_boost=get_p("similarityBoost", voice_similarity_boost),
+            style=get_p("style", voice_style),
+            chunk_length_schedule=list(chunk_schedule) if chunk_schedule else None,
+            try_trigger_generation=KOKORO_TTS_TRY_TRIGGER_GENERATION(),
+        )
+
     # Helper to create TTS service
     async def create_tts_service(provider, v_id, v_params=None):
         v_params = v_params or {}
@@ -357,9 +282,6 @@ async def build_pipeline(
         # But here we assume they match or we handle it.
         # Actually, let's use the global env vars as defaults if not in v_params
         
-        def get_p(key, default_val):
-            return v_params.get(key, default_val)
-
         if provider == "kokoro":
             base_url = KOKORO_TTS_BASE_URL()
             # For local Chorus TTS, API key is optional (use dummy value if not provided)
@@ -374,15 +296,7 @@ async def build_pipeline(
                     logger.warning(f"[{BOT_PID}] ⚠️  KOKORO_TTS_API_KEY not found. Cannot create Kokoro service.")
                     return None
             
-            chunk_schedule = KOKORO_TTS_CHUNK_SCHEDULE()
-            kokoro_params = KokoroTTSService.InputParams(
-                speed=get_p("speed", voice_speed),
-                stability=get_p("stability", voice_stability),
-                similarity_boost=get_p("similarityBoost", voice_similarity_boost),
-                style=get_p("style", voice_style),
-                chunk_length_schedule=list(chunk_schedule) if chunk_schedule else None,
-                try_trigger_generation=KOKORO_TTS_TRY_TRIGGER_GENERATION(),
-            )
+            kokoro_params = kokoro_input_params(v_params)
             
             # Use requested voice_id if provided, else default
             k_voice = v_id or KOKORO_TTS_VOICE_ID(None)
@@ -401,7 +315,7 @@ async def build_pipeline(
                 seed=KOKORO_TTS_SEED(),
                 inactivity_timeout=KOKORO_TTS_INACTIVITY_TIMEOUT(),
                 params=kokoro_params,
-                text_filters=text_filters,
+                text_filters=kokoro_text_filters,
             )
         
         elif provider == "pocket":
@@ -427,9 +341,12 @@ async def build_pipeline(
 
     services = []
     mode_map = {}
+    mode_voices = {}
+    service_by_provider = {}
+    tts_build_started = time.monotonic()
 
-    # Helper to extract config and create service for a specific mode
-    async def create_service_from_mode_config(mode_name, mode_data):
+    # Helper to extract provider and voice for a specific mode
+    def resolve_mode_voice_config(mode_data):
         # Extract provider and voice ID
         # The structure is typically mode_data -> voice -> { provider, voiceId, ... }
         # But we support flat structure or 'config' sub-object for backward compatibility if needed,
@@ -453,14 +370,29 @@ async def build_pipeline(
         if not p_provider:
             p_provider = "kokoro"
         
-        # Handle aliases
-        if p_provider == "11labs": p_provider = "elevenlabs"
+        # Handle aliases (ElevenLabs is disabled and served by PocketTTS)
+        if p_provider in ("11labs", "elevenlabs"): p_provider = "pocket"
 
         # Extract voice params
-        v_params = voice_config
-        
-        logger.info(f"[{BOT_PID}] Creating dedicated service for mode '{mode_name}': {p_provider}, voice={v_id}")
-        return await create_tts_service(p_provider, v_id, v_params)
+        return p_provider, v_id, voice_config
+
+    # Modes on the same provider share one service; the mode's voice is
+    # applied when it is first activated. Services are built here rather than
+    # on first switch because the switcher's branches are fixed at
+    # construction (see pipeline/tts_switcher.py).
+    async def add_mode(mode_name, mode_data):
+        p_provider, v_id, v_params = resolve_mode_voice_config(mode_data)
+        if p_provider not in service_by_provider:
+            logger.info(f"[{BOT_PID}] Creating service for provider '{p_provider}' (mode '{mode_name}', voice={v_id})")
+            svc = await create_tts_service(p_provider, v_id, v_params)
+            if not svc:
+                return
+            services.append(svc)
+            service_by_provider[p_provider] = len(services) - 1
+        else:
+            logger.info(f"[{BOT_PID}] Mode '{mode_name}' shares the '{p_provider}' service (voice={v_id})")
+        mode_map[mode_name] = service_by_provider[p_provider]
+        mode_voices[mode_name] = ModeVoice.from_config(v_id, v_params)
 
     # Determine initial mode to prioritize it (Index 0)
     initial_mode_name = None
@@ -484,21 +416,14 @@ async def build_pipeline(
     
     if initial_mode_name:
         logger.info(f"[{BOT_PID}] Initial mode identified: '{initial_mode_name}'")
-        svc = await create_service_from_mode_config(initial_mode_name, modePersonalityVoiceConfig[initial_mode_name])
-        if svc:
-            services.append(svc)
-            mode_map[initial_mode_name] = 0
+        await add_mode(initial_mode_name, modePersonalityVoiceConfig[initial_mode_name])
 
-    # Process all other modes - One Service Per Mode Pattern
+    # Process all other modes
     if modePersonalityVoiceConfig:
         for mode, mode_data in modePersonalityVoiceConfig.items():
             if mode == initial_mode_name:
                 continue
-                
-            svc = await create_service_from_mode_config(mode, mode_data)
-            if svc:
-                services.append(svc)
-                mode_map[mode] = len(services) - 1
+            await add_mode(mode, mode_data)
 
     # Fallback: If no services created (e.g. no config), create default based on env vars
     if not services:
@@ -509,6 +434,11 @@ async def build_pipeline(
         if svc:
             services.append(svc)
 
+    logger.info(
+        f"[{BOT_PID}] Built {len(services)} TTS service(s) for {len(mode_map)} mode(s) "
+        f"in {(time.monotonic() - tts_build_started) * 1000:.0f}ms"
+    )
+
     # Update speaker sample rate based on the primary (first) service
     speaker_sample_rate = 16000 # Default
     if services and isinstance(services[0], KokoroTTSService):
@@ -523,14 +453,54 @@ async def build_pipeline(
         # Fallback to dummy or raise?
         # For now, let it fail downstream or create a dummy if needed, but raising is better.
     
-    # Wrap TTS in ServiceSwitcher to allow runtime hot-swapping (e.g. mode changes)
-    logger.info(f"[{BOT_PID}] Wrapping TTS service in ServiceSwitcher with {len(services)} services")
-    tts = ServiceSwitcher(services=services, strategy_type=ServiceSwitcherStrategyManual)
-    
-    # Attach mode map to TTS instance for config listener to use
-    tts.mode_map = mode_map
+    try:
+        from processors.openclaw_session import filler_phrases
+        from processors.tool_narration import narration_phrases
+        from services.phrase_audio_cache import get_phrase_cache, warm_phrase_cache
+    except ImportError:
+        from bot.processors.openclaw_session import filler_phrases
+        from bot.processors.tool_narration import narration_phrases
+        from bot.services.phrase_audio_cache import get_phrase_cache, warm_phrase_cache
+
+    async def apply_mode_voice(svc, mode_voice):
+        if isinstance(svc, KokoroTTSService):
+            if mode_voice.voice_id:
+                await svc.set_voice(mode_voice.voice_id)
+            await svc.set_voice_parameters(kokoro_input_params(mode_voice.params))
+        elif isinstance(svc, PocketTTSService):
+            svc.set_voice_url(mode_voice.params.get("voice_url"))
+
+    async def warm_tts_service(svc):
+        # A mode switch is imminent: connect and render phrase audio for the
+        # new voice before the first sentence arrives.
+        if hasattr(svc, "warm_connection"):
+            try:
+                await svc.warm_connection()
+            except Exception as e:
+                logger.warning(f"[{BOT_PID}] TTS connection warm-up failed: {e}")
+        if get_phrase_cache() is not None:
+            await warm_phrase_cache([svc], filler_phrases() + narration_phrases())
+
+    # Wrap TTS in a mode-aware ServiceSwitcher to allow runtime hot-swapping (e.g. mode changes)
+    logger.info(f"[{BOT_PID}] Wrapping TTS service in ModeServiceSwitcher with {len(services)} services")
+    tts = ModeServiceSwitcher(
+        services,
+        mode_map=mode_map,
+        mode_voices=mode_voices,
+        voice_applier=apply_mode_voice,
+        on_prepared=warm_tts_service,
+    )
     logger.info(f"[{BOT_PID}] Mode map: {mode_map}")
 
+    # Pre-render filler and narration phrases in the background so they can be
+    # played from the phrase cache instead of waiting on a TTS round trip.
+    # Only the initial service is warmed; other providers warm on switch.
+    if services and get_phrase_cache() is not None:
+        # Keep a reference on the switcher so the task is not garbage collected
+        tts.phrase_warm_task = asyncio.create_task(
+            warm_phrase_cache(services[:1], filler_phrases() + narration_phrases())
+        )
+
     # Configure failover for all services
     # We iterate through all created services and attach error handlers if supported
     for svc_index, svc in enumerate(services):
@@ -620,10 +590,10 @@ async def build_pipeline(
         """Get user_id for HTML content creation from first non-bot participant."""
         logger.info(f"[{BOT_PID}] [html_tools] get_user_id_for_html called")
         
-        # Check environment override first (for testing)
-        if hasattr(os, 'environ') and 'BOT_SESSION_USER_ID' in os.environ:
-            env_user_id = os.environ.get('BOT_SESSION_USER_ID')
-            logger.info(f"[{BOT_PID}] [html_tools] Using environment override user_id: {env_user_id}")
+        # Check session (or environment) override first
+        env_user_id = current_user_id()
+        if env_user_id is not None:
+            logger.info(f"[{BOT_PID}] [html_tools] Using session override user_id: {env_user_id}")
             return env_user_id
         
         # Get the first non-bot participant and extract their sessionUserId
@@ -973,10 +943,9 @@ async def build_pipeline(
     
     # Load workspace context (identity + cross-session awareness)
     # In voice mode, keep it minimal to avoid confusing the LLM
-    workspace_context = load_workspace_context()
-    if len(workspace_context) > 2000:
-        logger.warning(f'[{BOT_PID}] Workspace context too long for voice ({len(workspace_context)} chars), trimming to identity only')
-        workspace_context = ""  # Let the personality prompt carry the identity
+    # Served from the process-wide cache unless a workspace file changed;
+    # context over 2000 chars is dropped so the personality prompt carries the identity.
+    workspace_context = workspace_prompt_fragment(2000)
     logger.info(f'[{BOT_PID}] Loaded workspace context (len={len(workspace_context)})')
     
     # Build tool awareness note
@@ -1126,52 +1095,63 @@ async def build_pipeline(
     except Exception:
         logger.warning(f'[{BOT_PID}] Failed to attach multi_user_aggregator to context_agg (non-fatal)')
 
-    logger.info(f'[{BOT_PID}] Initializing DailyTransport for room: {room_url} ...')
-    try:
-        transport = DailyTransport(
-            room_url,
-            token,
-            persona.capitalize(),
-            DailyParams(
-                audio_in_enabled=True,
-                audio_out_enabled=True,
-                camera_out_enabled=False,
-                audio_in_user_tracks=False,
-                audio_out_sample_rate=speaker_sample_rate,
-                audio_out_10ms_chunks=20,  # 200ms buffer — prevents crackling from underruns
-                # Enable Daily's built-in transcription service
-                transcription_enabled=True,
-                vad_analyzer=SileroVADAnalyzer(
-                    params=VADParams(
-                        confidence=0.6,
-                        start_secs=0.5,
-                        stop_secs=0.8,  # Reduced from 1.5s — faster end-of-speech detection
-                        min_volume=0.15,
-                    )
+    transport_kwargs = dict(
+        audio_in_enabled=True,
+        audio_out_enabled=True,
+        audio_out_sample_rate=speaker_sample_rate,
+        audio_out_10ms_chunks=20,  # 200ms buffer — prevents crackling from underruns
+        vad_analyzer=SileroVADAnalyzer(
+            params=VADParams(
+                confidence=0.6,
+                start_secs=0.5,
+                stop_secs=0.8,  # Reduced from 1.5s — faster end-of-speech detection
+                min_volume=0.15,
+            )
+        ),
+    )
+    if transport_factory is not None:
+        logger.info(f'[{BOT_PID}] Initializing custom transport for room: {room_url} ...')
+        transport = transport_factory(TransportParams(**transport_kwargs))
+        set_transport(transport)
+    else:
+        from pipecat.transports.daily.transport import DailyParams, DailyTransport
+        from daily import LogLevel as DailyLogLevel
+
+        logger.info(f'[{BOT_PID}] Initializing DailyTransport for room: {room_url} ...')
+        try:
+            transport = DailyTransport(
+                room_url,
+                token,
+                persona.capitalize(),
+                DailyParams(
+                    camera_out_enabled=False,
+                    audio_in_user_tracks=False,
+                    # Enable Daily's built-in transcription service
+                    transcription_enabled=True,
+                    **transport_kwargs,
                 ),
-            ),
-        )
-    except Exception as e:
-        logger.error(f'[{BOT_PID}] CRITICAL: Failed to initialize DailyTransport: {e}')
-        raise
-    
-    # Store transport globally for participant metadata access
-    set_transport(transport)
-    
-    # Reduce Daily transport logs; fallback gracefully if enum is different.
-    logger.info(f'[{BOT_PID}] Initializing transport logs...')
-    try:
-        lvl = (
-            getattr(DailyLogLevel, 'Error', None)
-            or getattr(DailyLogLevel, 'ERROR', None)
-            or DailyLogLevel.Info
-        )
-        transport.set_log_level(lvl)
-    except Exception:
+            )
+        except Exception as e:
+            logger.error(f'[{BOT_PID}] CRITICAL: Failed to initialize DailyTransport: {e}')
+            raise
+
+        # Store transport globally for participant metadata access
+        set_transport(transport)
+
+        # Reduce Daily transport logs; fallback gracefully if enum is different.
+        logger.info(f'[{BOT_PID}] Initializing transport logs...')
         try:
-            transport.set_log_level(DailyLogLevel.Info)
+            lvl = (
+                getattr(DailyLogLevel, 'Error', None)
+                or getattr(DailyLogLevel, 'ERROR', None)
+                or DailyLogLevel.Info
+            )
+            transport.set_log_level(lvl)
         except Exception:
-            pass
+            try:
+                transport.set_log_level(DailyLogLevel.Info)
+            except Exception:
+                pass
 
     logger.info(f'[{BOT_PID}] Initializing Pipeline...')
     
@@ -1197,7 +1177,7 @@ async def build_pipeline(
 
     if os.getenv("BOT_NON_BLOCKING_TOOLS", "false").lower() == "true":
         # NON-BLOCKING TOOLS mode: use NonBlockingToolRouter for parallel tool execution
-        from processors.non_blocking_router import NonBlockingToolRouter
+        from processors.non_blocking_router import InterimTranscriptTap, NonBlockingToolRouter
 
         # Voice-specific system prompt (same as openclaw_session mode)
         _wonder_template_prompt = (
@@ -1242,6 +1222,10 @@ async def build_pipeline(
         )
         logger.info(f'[{BOT_PID}] Created NonBlockingToolRouter for pipeline')
 
+        if BOT_SPECULATIVE_INTERIM_ENABLED():
+            # Interims never reach the router past the user aggregator
+            pipeline_processors.append(InterimTranscriptTap(non_blocking))
+
         pipeline_processors.extend([
             context_agg.user(),
             non_blocking,
@@ -0,0 +1,96 @@
+"""Mode-aware TTS service switcher.
+
+``build_pipeline`` used to construct a dedicated TTS service for every
+personality mode and hand them all to a ``ServiceSwitcher``, even though the
+provider is normally pinned by ``BOT_TTS_PROVIDER`` and modes differ only in
+voice. ``ModeServiceSwitcher`` holds one service per distinct provider; each
+mode records the voice it wants and that voice is applied when the mode is
+activated (Kokoro reconnects lazily on the next utterance; the provider
+setters are no-ops when nothing changed).
+
+When a switch is requested, ``prepare_mode`` applies the voice and then warms
+the target in the background (connection + phrase audio) via the
+``on_prepared`` hook so the first sentence in the new mode does not pay for it.
+
+Provider services are still built when the pipeline is built, not on the first
+``prepare_mode``: ``ServiceSwitcher`` is a ``ParallelPipeline`` whose branches
+are linked in its constructor and cannot be added once frames flow, and a
+service is a ``FrameProcessor`` bound to a single pipeline, so it cannot be
+shared across sessions either. With the provider pinned this is the one
+service the initial mode needs anyway; the expensive parts (HTTP session,
+phrase audio) are acquired lazily and pooled per process by the providers.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable
+
+from loguru import logger
+from pipecat.pipeline.service_switcher import ServiceSwitcher, ServiceSwitcherStrategyManual
+from pipecat.processors.frame_processor import FrameProcessor
+
+
+@dataclass(frozen=True)
+class ModeVoice:
+    """Voice selection for one mode on a shared provider service."""
+
+    voice_id: str | None
+    params: dict[str, Any] = field(default_factory=dict)
+
+    @classmethod
+    def from_config(cls, voice_id: str | None, params: dict[str, Any] | None) -> "ModeVoice":
+        return cls(voice_id, dict(params or {}))
+
+
+VoiceApplier = Callable[[FrameProcessor, ModeVoice], Awaitable[None]]
+PreparedHook = Callable[[FrameProcessor], Awaitable[None]]
+
+
+class ModeServiceSwitcher(ServiceSwitcher):
+    """``ServiceSwitcher`` whose modes may share a provider service.
+
+    Args:
+        services: One service per distinct provider, initial mode first.
+        mode_map: Mode name → index into ``services``.
+        mode_voices: Mode name → voice to apply on activation.
+        voice_applier: Applies a ``ModeVoice`` to a service.
+        on_prepared: Optional background warm-up after a mode is prepared.
+    """
+
+    def __init__(
+        self,
+        services: list[FrameProcessor],
+        *,
+        mode_map: dict[str, int] | None = None,
+        mode_voices: dict[str, ModeVoice] | None = None,
+        voice_applier: VoiceApplier | None = None,
+        on_prepared: PreparedHook | None = None,
+    ):
+        super().__init__(services=services, strategy_type=ServiceSwitcherStrategyManual)
+        self.mode_map = dict(mode_map or {})
+        self.mode_voices = dict(mode_voices or {})
+        self._voice_applier = voice_applier
+        self._on_prepared = on_prepared
+        self._warm_tasks: set[asyncio.Task] = set()
+
+    async def prepare_mode(self, mode: str) -> FrameProcessor | None:
+        """Apply ``mode``'s voice to its service and warm it in the background.
+
+        Returns the service that should become active, or ``None`` when the
+        mode is unknown.
+        """
+        index = self.mode_map.get(mode)
+        if index is None or not 0 <= index < len(self.services):
+            return None
+        service = self.services[index]
+        voice = self.mode_voices.get(mode)
+        if voice is not None and self._voice_applier is not None:
+            await self._voice_applier(service, voice)
+            logger.info(f"[tts-switcher] Applied voice {voice.voice_id!r} for mode '{mode}'")
+        if self._on_prepared is not None:
+            task = asyncio.create_task(self._on_prepared(service))
+            self._warm_tasks.add(task)
+            task.add_done_callback(self._warm_tasks.discard)
+        return service
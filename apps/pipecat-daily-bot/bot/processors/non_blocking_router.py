@@ -5,24 +5,31 @@ Phase 2: Full tool execution via OpenClaw (background, results go to UI only)
 """
 
 import asyncio
-import json
 import os
+import re
 import time
-from typing import Any
+from contextlib import aclosing
+from typing import Any, AsyncIterator
 
 import aiohttp
 from loguru import logger
 
 from pipecat.frames.frames import (
     Frame,
+    InterimTranscriptionFrame,
     LLMFullResponseEndFrame,
     LLMFullResponseStartFrame,
     LLMMessagesFrame,
     StartInterruptionFrame,
     TextFrame,
+    TranscriptionFrame,
 )
 from pipecat.processors.frame_processor import FrameDirection, FrameProcessor
 
+from core.config import BOT_SPECULATIVE_INTERIM_ENABLED, BOT_SPECULATIVE_STABLE_MS
+from core.conversation_window import ConversationWindow
+from services.llm_hedging import HedgedLLM, LLMEndpoint, LLMStreamError
+
 try:
     from pipecat.frames.frames import LLMContextFrame
 except ImportError:
@@ -61,6 +68,16 @@ Reply with ONLY "yes" or "no".
 
 User message: {message}"""
 
+# Voice requests (fast and simple path) share one timeout policy
+_VOICE_TIMEOUT = aiohttp.ClientTimeout(total=None, sock_connect=5, sock_read=15)
+_FAST_VOICE_PARAMS = {"max_tokens": 200, "temperature": 0.8}  # Keep it short
+_SIMPLE_VOICE_PARAMS = {"max_tokens": 1024, "user": "pearlos-voice"}
+
+
+def _speculation_key(text: str) -> str:
+    """Normalized transcript used to match an interim against the final."""
+    return " ".join(re.sub(r"[^\w\s']", " ", text.lower()).split())
+
 
 class NonBlockingToolRouter(FrameProcessor):
     """Routes voice responses and tool execution in parallel.
@@ -106,7 +123,7 @@ class NonBlockingToolRouter(FrameProcessor):
         self._system_prompt = system_prompt
         self._max_history = max_history
         self._timeout = timeout
-        self._messages: list[dict] = [{"role": "system", "content": system_prompt}]
+        self._history = ConversationWindow(system_prompt, max_messages=max_history)
         
         self._http_session: aiohttp.ClientSession | None = None
         self._cancel_event = asyncio.Event()
@@ -123,6 +140,19 @@ class NonBlockingToolRouter(FrameProcessor):
         # Track background tasks for cleanup
         self._background_tasks: set[asyncio.Task] = set()
         
+        # Voice requests go through the hedging layer (a plain stream unless
+        # BOT_HEDGE_ENABLED configures a backup provider/model)
+        self._voice_llm = HedgedLLM.from_config(
+            LLMEndpoint("fast", self._fast_api_url, self._fast_api_key, self._fast_model)
+        )
+        # Speculative start on stable interim transcripts (InterimTranscriptTap)
+        self._speculative = BOT_SPECULATIVE_INTERIM_ENABLED()
+        self._speculation_stable_secs = BOT_SPECULATIVE_STABLE_MS() / 1000.0
+        self._interim_timer: asyncio.Task | None = None
+        self._speculation: _Speculation | None = None
+        self.speculation_hits = 0
+        self.speculation_misses = 0
+        
         logger.info(
             f"[NonBlockingRouter] Init — fast={self._fast_model} "
             f"openclaw={self._oc_model} session={self._oc_session_key}"
@@ -147,10 +177,10 @@ class NonBlockingToolRouter(FrameProcessor):
             messages = frame.messages
         elif OpenAILLMContextFrame and isinstance(frame, OpenAILLMContextFrame):
             ctx = frame.context
-            messages = ctx.get_messages_for_logging() if hasattr(ctx, "get_messages_for_logging") else ctx.messages
+            messages = ctx.messages  # live list; the history window copies only new messages
         elif LLMContextFrame and isinstance(frame, LLMContextFrame):
             ctx = frame.context
-            messages = ctx.get_messages_for_logging() if hasattr(ctx, "get_messages_for_logging") else getattr(ctx, "messages", None)
+            messages = getattr(ctx, "messages", None)
 
         if messages is not None:
             logger.warning(f"[NonBlockingRouter] GOT MESSAGES FRAME: {len(messages)} messages, last role={messages[-1].get('role') if messages else 'none'}")
@@ -171,20 +201,17 @@ class NonBlockingToolRouter(FrameProcessor):
         self._is_processing = True
         self._processing_start_time = time.monotonic()
         
-        # Sync message history
-        non_system = [m for m in incoming_messages if m.get("role") != "system"]
-        self._messages = [self._messages[0]] + non_system
-        if len(non_system) > self._max_history:
-            self._messages = [self._messages[0]] + non_system[-self._max_history:]
+        # Sync message history (incremental, token budgeted)
+        self._history.sync(incoming_messages)
+        messages = self._history.snapshot()
         
         # Get latest user message
         user_text = ""
-        for m in reversed(self._messages):
+        for m in reversed(messages):
             if m.get("role") == "user":
                 content = m.get("content", "")
                 if isinstance(content, str) and content.strip():
                     # Strip multi-user "[User name, pid: xxx]: " prefix if present
-                    import re
                     cleaned = re.sub(r'^\[User [^]]+, pid: [^]]+\]:\s*', '', content)
                     if cleaned.strip():
                         user_text = cleaned
@@ -192,8 +219,8 @@ class NonBlockingToolRouter(FrameProcessor):
         
         if not user_text:
             # Log what user messages look like
-            user_msgs = [m for m in self._messages if m.get("role") == "user"]
-            logger.warning(f"[NonBlockingRouter] NO USER TEXT FOUND in {len(self._messages)} messages. User msgs: {[str(m.get('content',''))[:80] for m in user_msgs[-3:]]}")
+            user_msgs = [m for m in messages if m.get("role") == "user"]
+            logger.warning(f"[NonBlockingRouter] NO USER TEXT FOUND in {len(messages)} messages. User msgs: {[str(m.get('content',''))[:80] for m in user_msgs[-3:]]}")
             self._is_processing = False
             return
         logger.warning(f"[NonBlockingRouter] User text: '{user_text[:100]}'")
@@ -216,13 +243,14 @@ class NonBlockingToolRouter(FrameProcessor):
         
         # Determine if this needs tools (simple heuristic — no LLM call needed)
         needs_tools = self._needs_tools_heuristic(user_text)
+        speculation = self._take_speculation(user_text, needs_tools)
         
         if needs_tools:
             # TWO-PHASE: fast voice + background OpenClaw
             logger.info(f"[NonBlockingRouter] Two-phase: voice + tools for: {user_text[:80]}")
             
             # Phase 1: Stream fast voice response immediately
-            await self._stream_fast_voice(user_text, cancel)
+            await self._stream_fast_voice(user_text, cancel, speculation)
             
             # Phase 2: Fire OpenClaw in background (no voice output)
             task = asyncio.create_task(self._run_openclaw_background(user_text))
@@ -231,7 +259,7 @@ class NonBlockingToolRouter(FrameProcessor):
         else:
             # SIMPLE: Just use OpenClaw directly (streams voice like before)
             logger.info(f"[NonBlockingRouter] Simple response (no tools): {user_text[:80]}")
-            await self._stream_openclaw_voice(cancel)
+            await self._stream_openclaw_voice(cancel, speculation)
         
         self._is_processing = False
 
@@ -251,65 +279,64 @@ class NonBlockingToolRouter(FrameProcessor):
         ]
         return any(kw in lower for kw in tool_keywords)
 
-    async def _stream_fast_voice(self, user_text: str, cancel: asyncio.Event) -> None:
-        """Phase 1: Stream a fast conversational response to TTS."""
-        session = await self._get_session()
-        
-        # Build minimal context for fast model
-        fast_messages = [
+    def _fast_voice_messages(self, history: tuple[dict, ...]) -> list[dict]:
+        """Minimal context for the fast model: voice rules + last few exchanges."""
+        return [
             {"role": "system", "content": VOICE_FAST_SYSTEM},
-            # Include last few exchanges for context
-            *self._messages[-5:],
+            *history[-5:],
         ]
-        
-        payload = {
-            "model": self._fast_model,
-            "messages": fast_messages,
-            "stream": True,
-            "max_tokens": 200,  # Keep it short
-            "temperature": 0.8,
-        }
-        
+
+    async def _voice_chunks(self, messages: Any, params: dict[str, Any]) -> AsyncIterator[str]:
+        """Content deltas from the (possibly hedged) fast voice LLM."""
+        session = await self._get_session()
+        async with aclosing(
+            self._voice_llm.stream(session, messages, timeout=_VOICE_TIMEOUT, **params)
+        ) as chunks:
+            async for chunk in chunks:
+                yield chunk
+
+    async def _speak(
+        self,
+        chunks: AsyncIterator[str],
+        cancel: asyncio.Event,
+        *,
+        status_error_text: str,
+        error_text: str,
+        timeout_text: str | None = None,
+    ) -> None:
+        """Push a streamed reply to TTS, speaking a fallback line on failure."""
         await self.push_frame(LLMFullResponseStartFrame())
-        
         try:
-            async with session.post(
-                f"{self._fast_api_url}/chat/completions",
-                json=payload,
-                headers={
-                    "Authorization": f"Bearer {self._fast_api_key}",
-                    "Content-Type": "application/json",
-                },
-                timeout=aiohttp.ClientTimeout(total=None, sock_connect=5, sock_read=15),
-            ) as resp:
-                if resp.status != 200:
-                    logger.error(f"[NonBlockingRouter] Fast LLM error: {resp.status}")
-                    await self.push_frame(TextFrame(text="Sure, let me look into that. "))
-                    await self.push_frame(LLMFullResponseEndFrame())
-                    return
-                
-                async for raw_line in resp.content:
+            async with aclosing(chunks) as stream:
+                async for content in stream:
                     if cancel.is_set():
                         break
-                    line = raw_line.decode("utf-8", errors="replace").strip()
-                    if not line.startswith("data:"):
-                        continue
-                    data_str = line[len("data:"):].strip()
-                    if data_str == "[DONE]":
-                        break
-                    try:
-                        chunk = json.loads(data_str)
-                        content = chunk.get("choices", [{}])[0].get("delta", {}).get("content")
-                        if content:
-                            await self.push_frame(TextFrame(text=content))
-                    except (json.JSONDecodeError, IndexError, KeyError):
-                        continue
+                    await self.push_frame(TextFrame(text=content))
+        except LLMStreamError as e:
+            logger.error(f"[NonBlockingRouter] Voice LLM error: {e.status}")
+            await self.push_frame(TextFrame(text=status_error_text))
+        except asyncio.TimeoutError:
+            logger.error("[NonBlockingRouter] Voice stream timed out (sock_read=15s)")
+            await self.push_frame(TextFrame(text=timeout_text or error_text))
         except Exception as e:
-            logger.error(f"[NonBlockingRouter] Fast voice error: {type(e).__name__}: {e}")
-            await self.push_frame(TextFrame(text="Let me look into that for you. "))
-        
+            logger.error(f"[NonBlockingRouter] Voice stream error: {type(e).__name__}: {e}")
+            await self.push_frame(TextFrame(text=error_text))
         await self.push_frame(LLMFullResponseEndFrame())
 
+    async def _stream_fast_voice(
+        self, user_text: str, cancel: asyncio.Event, speculation: "_Speculation | None" = None
+    ) -> None:
+        """Phase 1: Stream a fast conversational response to TTS."""
+        chunks = speculation.chunks() if speculation else self._voice_chunks(
+            self._fast_voice_messages(self._history.snapshot()), _FAST_VOICE_PARAMS
+        )
+        await self._speak(
+            chunks,
+            cancel,
+            status_error_text="Sure, let me look into that. ",
+            error_text="Let me look into that for you. ",
+        )
+
     async def _run_openclaw_background(self, user_text: str) -> None:
         """Phase 2: Run OpenClaw agent in background for tool execution only.
         
@@ -318,7 +345,7 @@ class NonBlockingToolRouter(FrameProcessor):
         session = await self._get_session()
         
         # Add instruction to NOT produce conversational text — only execute tools
-        tool_only_messages = list(self._messages)
+        tool_only_messages = list(self._history.snapshot())
         tool_only_messages.append({
             "role": "system", 
             "content": (
@@ -366,70 +393,153 @@ class NonBlockingToolRouter(FrameProcessor):
         except Exception as e:
             logger.error(f"[NonBlockingRouter] Background tool error: {e}")
 
-    async def _stream_openclaw_voice(self, cancel: asyncio.Event) -> None:
+    async def _stream_openclaw_voice(
+        self, cancel: asyncio.Event, speculation: "_Speculation | None" = None
+    ) -> None:
         """Simple path: stream OpenClaw response directly to voice (no tools expected).
         
         Uses the fast model for quick TTFB since no tools are needed.
         Falls back to a spoken error if the request hangs or fails.
         """
-        session = await self._get_session()
-        
         # Use fast model for simple responses — no need for full agentic loop
-        payload = {
-            "model": self._fast_model,
-            "messages": self._messages,
-            "stream": True,
-            "max_tokens": 1024,
-            "user": "pearlos-voice",
-        }
-        
-        await self.push_frame(LLMFullResponseStartFrame())
-        
-        try:
-            async with session.post(
-                f"{self._fast_api_url}/chat/completions",
-                json=payload,
-                headers={
-                    "Authorization": f"Bearer {self._fast_api_key}",
-                    "Content-Type": "application/json",
-                },
-                timeout=aiohttp.ClientTimeout(total=None, sock_connect=5, sock_read=15),
-            ) as resp:
-                if resp.status != 200:
-                    error = await resp.text()
-                    logger.error(f"[NonBlockingRouter] OpenClaw voice error: {resp.status}")
-                    await self.push_frame(TextFrame(text="Sorry, I'm having trouble right now."))
-                    await self.push_frame(LLMFullResponseEndFrame())
-                    return
-                
-                async for raw_line in resp.content:
-                    if cancel.is_set():
-                        break
-                    line = raw_line.decode("utf-8", errors="replace").strip()
-                    if not line.startswith("data:"):
-                        continue
-                    data_str = line[len("data:"):].strip()
-                    if data_str == "[DONE]":
-                        break
-                    try:
-                        chunk = json.loads(data_str)
-                        content = chunk.get("choices", [{}])[0].get("delta", {}).get("content")
-                        if content:
-                            await self.push_frame(TextFrame(text=content))
-                    except (json.JSONDecodeError, IndexError, KeyError):
-                        continue
-        except asyncio.TimeoutError:
-            logger.error("[NonBlockingRouter] Simple voice stream timed out (sock_read=15s)")
-            await self.push_frame(TextFrame(text="Sorry, I'm having a little trouble responding right now. Could you try again?"))
-        except Exception as e:
-            logger.error(f"[NonBlockingRouter] Voice stream error: {type(e).__name__}: {e}")
-            await self.push_frame(TextFrame(text="Something went wrong, let me try again."))
-        
-        await self.push_frame(LLMFullResponseEndFrame())
+        chunks = speculation.chunks() if speculation else self._voice_chunks(
+            self._history.snapshot(), _SIMPLE_VOICE_PARAMS
+        )
+        await self._speak(
+            chunks,
+            cancel,
+            status_error_text="Sorry, I'm having trouble right now.",
+            error_text="Something went wrong, let me try again.",
+            timeout_text="Sorry, I'm having a little trouble responding right now. Could you try again?",
+        )
+
+    # ------------------------------------------------------------------
+    # Speculative start on interim transcripts
+    # ------------------------------------------------------------------
+
+    def on_interim_transcript(self, text: str) -> None:
+        """Note an interim transcript; speculate once it stays unchanged."""
+        if not self._speculative:
+            return
+        key = _speculation_key(text)
+        if not key:
+            return
+        timer = self._interim_timer
+        if timer is not None and not timer.done():
+            if getattr(timer, "speculation_key", None) == key:
+                return
+            timer.cancel()
+        timer = asyncio.create_task(self._speculate_when_stable(text))
+        timer.speculation_key = key  # type: ignore[attr-defined]
+        self._interim_timer = timer
+
+    def on_final_transcript(self) -> None:
+        """A final transcript arrived; stop waiting for the interim to settle."""
+        if self._interim_timer is not None:
+            self._interim_timer.cancel()
+            self._interim_timer = None
+
+    async def _speculate_when_stable(self, text: str) -> None:
+        await asyncio.sleep(self._speculation_stable_secs)
+        self._interim_timer = None
+        key = _speculation_key(text)
+        current = self._speculation
+        if current is not None and current.key == key:
+            return
+        self._discard_speculation()
+        needs_tools = self._needs_tools_heuristic(text)
+        history = (*self._history.snapshot(), {"role": "user", "content": text})
+        if needs_tools:
+            chunks = self._voice_chunks(self._fast_voice_messages(history), _FAST_VOICE_PARAMS)
+        else:
+            chunks = self._voice_chunks(history, _SIMPLE_VOICE_PARAMS)
+        logger.info(f"[NonBlockingRouter] Speculative start on interim: {text[:80]!r}")
+        self._speculation = _Speculation(key, needs_tools, chunks)
+
+    def _take_speculation(self, user_text: str, needs_tools: bool) -> "_Speculation | None":
+        """Adopt the in-flight speculation if the final transcript matches it."""
+        self.on_final_transcript()
+        speculation, self._speculation = self._speculation, None
+        if speculation is None:
+            return None
+        if speculation.key == _speculation_key(user_text) and speculation.needs_tools == needs_tools:
+            self.speculation_hits += 1
+            logger.info("[NonBlockingRouter] Using speculative response")
+            return speculation
+        speculation.cancel()
+        self.speculation_misses += 1
+        return None
+
+    def _discard_speculation(self) -> None:
+        if self._speculation is not None:
+            self._speculation.cancel()
+            self._speculation = None
 
     async def cleanup(self):
+        self.on_final_transcript()
+        self._discard_speculation()
         for task in self._background_tasks:
             task.cancel()
         if self._http_session and not self._http_session.closed:
             await self._http_session.close()
         await super().cleanup()
+
+
+class _Speculation:
+    """A voice request started on an interim transcript, buffered until adopted."""
+
+    _END = object()
+
+    def __init__(self, key: str, needs_tools: bool, chunks: AsyncIterator[str]):
+        self.key = key
+        self.needs_tools = needs_tools
+        self._queue: asyncio.Queue[Any] = asyncio.Queue()
+        self._task = asyncio.create_task(self._pump(chunks), name="nb-router-speculation")
+
+    async def _pump(self, chunks: AsyncIterator[str]) -> None:
+        try:
+            async with aclosing(chunks) as stream:
+                async for chunk in stream:
+                    self._queue.put_nowait(chunk)
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            self._queue.put_nowait(exc)
+            return
+        self._queue.put_nowait(self._END)
+
+    async def chunks(self) -> AsyncIterator[str]:
+        try:
+            while True:
+                item = await self._queue.get()
+                if item is self._END:
+                    return
+                if isinstance(item, BaseException):
+                    raise item
+                yield item
+        finally:
+            self.cancel()
+
+    def cancel(self) -> None:
+        self._task.cancel()
+
+
+class InterimTranscriptTap(FrameProcessor):
+    """Feeds interim transcripts to the router ahead of the user aggregator.
+
+    The user context aggregator consumes transcription frames, so the router
+    never sees interims; this pass-through tap sits in front of it when
+    ``BOT_SPECULATIVE_INTERIM_ENABLED`` is set.
+    """
+
+    def __init__(self, router: NonBlockingToolRouter, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self._router = router
+
+    async def process_frame(self, frame: Frame, direction: FrameDirection) -> None:
+        await super().process_frame(frame, direction)
+        if isinstance(frame, InterimTranscriptionFrame):
+            self._router.on_interim_transcript(frame.text)
+        elif isinstance(frame, TranscriptionFrame):
+            self._router.on_final_transcript()
+        await self.push_frame(frame, direction)
@@ -33,6 +33,8 @@ from pipecat.frames.frames import (
 )
 from pipecat.processors.frame_processor import FrameDirection, FrameProcessor
 
+from core.conversation_window import ConversationWindow
+
 try:
     from pipecat.frames.frames import LLMContextFrame
 except ImportError:
@@ -100,6 +102,14 @@ _CONTEXTUAL_FILLERS = {
 }
 
 
+def filler_phrases() -> list[str]:
+    """Every filler phrase that can be spoken (used to pre-render audio)."""
+    phrases = list(_INSTANT_FILLERS)
+    for contextual in _CONTEXTUAL_FILLERS.values():
+        phrases.extend(contextual)
+    return list(dict.fromkeys(phrases))
+
+
 def _pick_filler(user_text: str) -> str:
     """Pick a contextual filler phrase based on user message keywords."""
     lower = user_text.lower()
@@ -160,12 +170,11 @@ class OpenClawSessionProcessor(FrameProcessor):
         self._max_tokens = max_tokens
         self._timeout = timeout
 
-        # Conversation history maintained for the session lifetime.
-        # Capped to prevent unbounded growth (system + last N turns).
-        self._max_history = 40  # ~20 user/assistant pairs
-        self._messages: list[dict[str, str]] = [
-            {"role": "system", "content": system_prompt},
-        ]
+        # Conversation history maintained for the session lifetime: token
+        # budgeted, capped at N turns (~20 user/assistant pairs), with older
+        # turns folded into a rolling summary.
+        self._max_history = 40
+        self._history = ConversationWindow(system_prompt, max_messages=self._max_history)
 
         # Meeting mode: when active, Pearl only responds if addressed by name
         self._meeting_mode: bool = False
@@ -211,9 +220,9 @@ class OpenClawSessionProcessor(FrameProcessor):
         self._meeting_mode = active
         # Swap system prompt
         if active:
-            self._messages[0] = {"role": "system", "content": self._MEETING_SYSTEM_PROMPT + self._original_system_prompt}
+            self._history.set_system_prompt(self._MEETING_SYSTEM_PROMPT + self._original_system_prompt)
         else:
-            self._messages[0] = {"role": "system", "content": self._original_system_prompt}
+            self._history.set_system_prompt(self._original_system_prompt)
         logger.info(f"[openclaw_session] Meeting mode {'ENABLED' if active else 'DISABLED'}")
 
     def _is_addressing_pearl(self, text: str) -> bool:
@@ -242,18 +251,12 @@ class OpenClawSessionProcessor(FrameProcessor):
             messages = frame.messages
         elif OpenAILLMContextFrame and isinstance(frame, OpenAILLMContextFrame):
             ctx = frame.context
-            messages = (
-                ctx.get_messages_for_logging()
-                if hasattr(ctx, "get_messages_for_logging")
-                else ctx.messages
-            )
+            # The live list, not get_messages_for_logging() (a deep copy of the
+            # whole conversation); the history window copies only new messages.
+            messages = ctx.messages
         elif LLMContextFrame and isinstance(frame, LLMContextFrame):
             ctx = frame.context
-            messages = (
-                ctx.get_messages_for_logging()
-                if hasattr(ctx, "get_messages_for_logging")
-                else getattr(ctx, "messages", None)
-            )
+            messages = getattr(ctx, "messages", None)
 
         if messages is not None:
             await self._run_completion(messages)
@@ -283,30 +286,22 @@ class OpenClawSessionProcessor(FrameProcessor):
         self._processing_start_time = time.monotonic()
 
         # Merge incoming messages into our session history.
-        # The context aggregator sends the *full* conversation each time,
-        # so we sync: keep our system prompt, then adopt everything after.
-        if incoming_messages:
-            # Find non-system messages from incoming
-            non_system = [m for m in incoming_messages if m.get("role") != "system"]
-            # Rebuild: our system prompt + all conversation messages
-            self._messages = [self._messages[0]] + non_system
+        # The context aggregator sends the *full* conversation each time;
+        # the window only ingests what was appended since the last turn.
+        self._history.sync(incoming_messages)
 
         # Ensure at least one user message (Anthropic requirement).
-        if all(m.get("role") == "system" for m in self._messages):
-            self._messages.append(
+        if not self._history.has_conversation:
+            self._history.add_local(
                 {"role": "user", "content": "[user has joined the conversation]"}
             )
 
-        # Trim history: keep system prompt + last N non-system messages
-        non_system = [m for m in self._messages if m.get("role") != "system"]
-        if len(non_system) > self._max_history:
-            self._messages = [self._messages[0]] + non_system[-self._max_history:]
-
+        messages = self._history.snapshot()
         cancel = self._cancel_event
 
         payload = {
             "model": self._model,
-            "messages": self._messages,
+            "messages": messages,
             "stream": True,
             "max_tokens": self._max_tokens,
             "user": "pearlos-voice",
@@ -318,7 +313,7 @@ class OpenClawSessionProcessor(FrameProcessor):
 
         # -- Instant acknowledgment: speak BEFORE the HTTP request fires --
         user_text = ""
-        for m in reversed(self._messages):
+        for m in reversed(messages):
             if m.get("role") == "user":
                 content = m.get("content", "")
                 if isinstance(content, str) and not content.startswith("["):
@@ -435,7 +430,7 @@ class OpenClawSessionProcessor(FrameProcessor):
                 filler_task.cancel()
             # Record assistant response in history.
             if full_response_chunks:
-                self._messages.append(
+                self._history.add_local(
                     {"role": "assistant", "content": "".join(full_response_chunks)}
                 )
             await self.push_frame(LLMFullResponseEndFrame())
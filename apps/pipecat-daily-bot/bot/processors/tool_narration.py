@@ -49,6 +49,11 @@ _EXTENDED_PHRASES = [
 ]
 
 
+def narration_phrases() -> list[str]:
+    """Every phrase this processor can emit (used to pre-render audio)."""
+    return _NARRATION_PHRASES + _EXTENDED_PHRASES
+
+
 class ToolNarrationProcessor(FrameProcessor):
     """Emits narration text frames while tool calls are in progress.
 
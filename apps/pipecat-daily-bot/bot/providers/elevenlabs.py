@@ -6,11 +6,12 @@ updating the voice ID dynamically without replacing the service instance.
 
 from __future__ import annotations
 
-import os
 from typing import Callable, Optional, Awaitable
 from loguru import logger as base_logger
 from pipecat.services.elevenlabs.tts import ElevenLabsTTSService as BaseElevenLabsTTSService
 
+from core.session_context import current_session_id, current_user_id, current_user_name
+
 class ElevenLabsTTSService(BaseElevenLabsTTSService):
     """Extended ElevenLabs client with set_voice support and error handling."""
 
@@ -20,9 +21,9 @@ class ElevenLabsTTSService(BaseElevenLabsTTSService):
 
     def _log(self):
         return base_logger.bind(
-            sessionId=os.getenv("BOT_SESSION_ID"),
-            userId=os.getenv("BOT_SESSION_USER_ID"),
-            userName=os.getenv("BOT_SESSION_USER_NAME"),
+            sessionId=current_session_id(),
+            userId=current_user_id(),
+            userName=current_user_name(),
         )
 
     def set_error_handler(self, handler: Callable[[Exception], Awaitable[None]]):
@@ -13,6 +13,7 @@ import asyncio
 import base64
 import json
 import re
+import time
 from typing import AsyncGenerator, Dict, List, Optional, Callable, Awaitable
 from urllib.parse import urlencode
 
@@ -27,10 +28,21 @@ from pipecat.frames.frames import (
     StartFrame,
     TTSAudioRawFrame,
     TTSStartedFrame,
+    TTSStoppedFrame,
 )
 from pipecat.services.tts_service import WebsocketTTSService
 from pipecat.utils.tracing.service_decorators import traced_tts
 
+try:
+    from filters.tts_text_filter import EMOJI_CLASS, NONSPEAKABLE_CLASS, get_normalizer
+except ImportError:  # pragma: no cover - package-style import
+    from bot.filters.tts_text_filter import EMOJI_CLASS, NONSPEAKABLE_CLASS, get_normalizer
+
+try:
+    from services.phrase_audio_cache import CachedPhrase, PhraseKey, get_phrase_cache, phrase_key
+except ImportError:  # pragma: no cover - package-style import
+    from bot.services.phrase_audio_cache import CachedPhrase, PhraseKey, get_phrase_cache, phrase_key
+
 try:
     from websockets.asyncio.client import connect as websocket_connect
     from websockets.exceptions import ConnectionClosedError, ConnectionClosedOK
@@ -59,53 +71,17 @@ def _output_format_from_rate(sample_rate: int) -> str:
     return result
 
 
-# Regex pattern to match emoji characters
-# Covers most common emoji ranges including:
-# - Emoticons, Dingbats, Symbols
-# - Miscellaneous Symbols and Pictographs
-# - Emoticons, Transport/Map, Enclosed Characters
-# - Supplemental Symbols and Pictographs
-# - Regional indicators, Skin tone modifiers, ZWJ sequences
-_EMOJI_PATTERN = re.compile(
-    "["
-    "\U0001F600-\U0001F64F"  # Emoticons
-    "\U0001F300-\U0001F5FF"  # Misc Symbols and Pictographs
-    "\U0001F680-\U0001F6FF"  # Transport and Map
-    "\U0001F700-\U0001F77F"  # Alchemical Symbols
-    "\U0001F780-\U0001F7FF"  # Geometric Shapes Extended
-    "\U0001F800-\U0001F8FF"  # Supplemental Arrows-C
-    "\U0001F900-\U0001F9FF"  # Supplemental Symbols and Pictographs
-    "\U0001FA00-\U0001FA6F"  # Chess Symbols
-    "\U0001FA70-\U0001FAFF"  # Symbols and Pictographs Extended-A
-    "\U0001F1E0-\U0001F1FF"  # Regional indicator symbols (flags)
-    "\U0001F3FB-\U0001F3FF"  # Skin tone modifiers
-    "\U0000200D"             # Zero-width joiner (used in ZWJ sequences)
-    "\U0000FE0F"             # Variation selector-16 (emoji presentation)
-    "\U00002600-\U000026FF"  # Misc symbols (sun, clouds, etc.)
-    "\U00002702-\U000027BF"  # Dingbats
-    "\U000024C2-\U000024CF"  # Enclosed alphanumerics subset (circled letters)
-    "\U0001F200-\U0001F251"  # Enclosed ideographic supplement
-    "]+",
-    flags=re.UNICODE,
-)
+# Emoji and non-speakable character classes are shared with the markdown
+# filter so the pipeline can fold all sanitizing into one compiled pattern.
+_EMOJI_PATTERN = re.compile(f"[{EMOJI_CLASS}]+", flags=re.UNICODE)
+_NONSPEAKABLE_CHARS_PATTERN = re.compile(f"[{NONSPEAKABLE_CLASS}]+")
+_WHITESPACE_RUNS = re.compile(r"\s{2,}")
 
-# Characters that should not be spoken by TTS - they cause pronunciation issues
-# Includes markdown formatting, special symbols, and decorative characters
-_NONSPEAKABLE_CHARS_PATTERN = re.compile(
-    r"[#*_`~\[\]<>|\\^{}]"  # Markdown/code formatting and decorative chars
-    r"|"
-    r"(?:^|\s)[•●○◦◆◇▪▫▸▹►▻]+(?:\s|$)"  # Bullet points (preserve surrounding space logic)
-    r"|"
-    r"[→←↑↓↔↕⇒⇐⇑⇓⇔]"  # Arrows
-    r"|"
-    r"[★☆✓✔✕✖✗✘]"  # Stars and check marks
-    r"|"
-    r"[│┃┆┇┊┋╎╏║]"  # Box drawing verticals
-    r"|"
-    r"[─━┄┅┈┉╌╍═]"  # Box drawing horizontals
-    r"|"
-    r"[┌┐└┘├┤┬┴┼╔╗╚╝╠╣╦╩╬]"  # Box corners and intersections
-)
+
+def _strip_emojis(text: str) -> str:
+    """Remove emoji characters (including ZWJ sequences and modifiers)."""
+    result = _EMOJI_PATTERN.sub("", text)
+    return _WHITESPACE_RUNS.sub(" ", result).strip()
 
 
 def _strip_nonspeakable(text: str) -> str:
@@ -124,24 +100,16 @@ def _strip_nonspeakable(text: str) -> str:
     Transcripts retain the original text with all characters.
     """
     result = _NONSPEAKABLE_CHARS_PATTERN.sub(" ", text)
-    # Clean up any double spaces left by character removal
-    result = re.sub(r"\s{2,}", " ", result)
-    return result.strip()
+    return _WHITESPACE_RUNS.sub(" ", result).strip()
 
 
 def _sanitize_for_tts(text: str) -> str:
-    """Sanitize text for TTS by removing emojis and non-speakable characters.
+    """Sanitize text for TTS: markdown, emojis and non-speakable characters.
     
     This is the main entry point for text sanitization before TTS.
     Transcripts retain the original text - only the audio synthesis uses sanitized text.
     """
-    # First strip emojis
-    result = _EMOJI_PATTERN.sub("", text)
-    # Then strip non-speakable characters
-    result = _NONSPEAKABLE_CHARS_PATTERN.sub(" ", result)
-    # Clean up any double spaces
-    result = re.sub(r"\s{2,}", " ", result)
-    return result.strip()
+    return get_normalizer(strip_nonspeakable=True).normalize(text)
 
 
 class KokoroTTSService(WebsocketTTSService):
@@ -221,6 +189,14 @@ class KokoroTTSService(WebsocketTTSService):
         self._connect_lock = asyncio.Lock()
         self._ttfb_stopped = False
         self._error_handler: Optional[Callable[[Exception], Awaitable[None]]] = None
+        # Start time of a live request, used to measure time to first audio
+        self._request_started: float | None = None
+        # Flushed live requests whose finalOutput has not arrived yet
+        self._live_pending = 0
+        # Skip the provider sanitize pass when a text filter already applies it
+        self._presanitized = any(
+            getattr(f, "strips_nonspeakable", False) for f in (kwargs.get("text_filters") or [])
+        )
 
     def set_error_handler(self, handler: Callable[[Exception], Awaitable[None]]):
         """Set a callback to be invoked when a critical error occurs."""
@@ -304,6 +280,10 @@ class KokoroTTSService(WebsocketTTSService):
     async def flush_audio(self):  # pragma: no cover - chorus flush happens with explicit flush flags
         return
 
+    async def warm_connection(self):
+        """Open the websocket ahead of the first utterance (e.g. on mode switch)."""
+        await self._ensure_connected()
+
     async def _ensure_connected(self):
         if self._websocket and self._websocket.state is State.OPEN:
             return
@@ -335,19 +315,30 @@ class KokoroTTSService(WebsocketTTSService):
         await self._connect_websocket()
         await self._initialize_connection()
 
-    async def _connect_websocket(self):
+    def _stream_url(self) -> str:
         url = f"{self._base_url}/v1/text-to-speech/{self._voice_id}/stream-input"
         query = self._build_query()
-        if query:
-            url = f"{url}?{query}"
+        return f"{url}?{query}" if query else url
+
+    def _open_websocket(self):
+        return websocket_connect(
+            self._stream_url(),
+            max_size=16 * 1024 * 1024,
+            additional_headers={"xi-api-key": self._api_key},
+        )
 
-        logger.debug("KokoroTTSService: connecting to %s", url)
+    def _handshake_message(self) -> Dict[str, object]:
+        handshake_message: Dict[str, object] = {"text": " "}
+        if self._voice_settings:
+            handshake_message["voice_settings"] = self._voice_settings
+        if self._generation_config:
+            handshake_message["generation_config"] = self._generation_config
+        return handshake_message
+
+    async def _connect_websocket(self):
+        logger.debug("KokoroTTSService: connecting to %s", self._stream_url())
         try:
-            self._websocket = await websocket_connect(
-                url,
-                max_size=16 * 1024 * 1024,
-                additional_headers={"xi-api-key": self._api_key},
-            )
+            self._websocket = await self._open_websocket()
         except OSError as e:
             # Catch connection refused and other OS-level connection errors
             logger.error(f"KokoroTTSService connection error: {e}")
@@ -375,12 +366,7 @@ class KokoroTTSService(WebsocketTTSService):
             voice_id=payload.get("voice_id"),
         )
 
-        handshake_message: Dict[str, object] = {"text": " "}
-        if self._voice_settings:
-            handshake_message["voice_settings"] = self._voice_settings
-        if self._generation_config:
-            handshake_message["generation_config"] = self._generation_config
-        await self._websocket.send(json.dumps(handshake_message))
+        await self._websocket.send(json.dumps(self._handshake_message()))
 
         if self._receive_task:
             await self.cancel_task(self._receive_task)
@@ -388,6 +374,7 @@ class KokoroTTSService(WebsocketTTSService):
         self._ttfb_stopped = False
 
     async def _disconnect(self):
+        self._live_pending = 0
         if self._receive_task:
             await self.cancel_task(self._receive_task)
             self._receive_task = None
@@ -402,14 +389,50 @@ class KokoroTTSService(WebsocketTTSService):
         except Exception as exc:  # noqa: BLE001
             logger.debug("KokoroTTSService close message failed: %s", exc)
 
+    def phrase_cache_key(self, text: str) -> PhraseKey:
+        return self._sanitized_phrase_key(_sanitize_for_tts(text))
+
+    def _sanitized_phrase_key(self, tts_text: str) -> PhraseKey:
+        speed = (self._voice_settings or {}).get("speed")
+        return phrase_key("kokoro", self._voice_id, speed, tts_text)
+
+    async def render_phrase(self, text: str) -> CachedPhrase | None:
+        """Synthesize a whole phrase on a dedicated connection for the phrase cache.
+
+        A separate websocket keeps warm-up renders from interleaving with audio
+        of the live session connection.
+        """
+        tts_text = _sanitize_for_tts(text)
+        if not tts_text:
+            return None
+        audio = bytearray()
+        sample_rate = self.sample_rate or 22050
+        async with self._open_websocket() as websocket:
+            handshake = json.loads(await websocket.recv())
+            if handshake.get("event") != "connected":
+                return None
+            await websocket.send(json.dumps(self._handshake_message()))
+            await websocket.send(json.dumps({"text": f"{tts_text} ", "flush": True}))
+            async for message in websocket:
+                payload = json.loads(message)
+                event = payload.get("event")
+                if event == "audioOutput" and payload.get("audio"):
+                    audio.extend(base64.b64decode(payload["audio"]))
+                    sample_rate = int(payload.get("sample_rate") or sample_rate)
+                elif event == "finalOutput":
+                    break
+                elif event == "error":
+                    return None
+        if not audio:
+            return None
+        return CachedPhrase(bytes(audio), sample_rate, 1)
+
     @traced_tts
     async def run_tts(self, text: str) -> AsyncGenerator[Frame, None]:
-        await self._ensure_connected()
-
         # Sanitize text before TTS - remove emojis and non-speakable characters
         # Kokoro TTS tries to pronounce them literally which sounds bad
         # Note: Transcripts retain the original text with all characters
-        tts_text = _sanitize_for_tts(text)
+        tts_text = text.strip() if self._presanitized else _sanitize_for_tts(text)
         if not tts_text:
             # If text was only emojis/non-speakable chars, skip TTS entirely
             logger.debug("KokoroTTSService: skipping TTS for non-speakable text")
@@ -417,6 +440,26 @@ class KokoroTTSService(WebsocketTTSService):
             yield None
             return
 
+        # Filler/narration phrases rendered at warm-up skip the round trip.
+        # Live audio is pushed from the receive task as it streams in, so the
+        # cache is only used when no live request is still streaming; cached
+        # frames would otherwise overtake or interleave with that audio.
+        started = time.monotonic()
+        cache = get_phrase_cache()
+        cached = None
+        if cache and not self._live_pending:
+            cached = cache.get(self._sanitized_phrase_key(tts_text))
+        if cached is not None:
+            cache.record_first_audio(True, (time.monotonic() - started) * 1000)
+            logger.debug(f"KokoroTTSService phrase cache hit: {tts_text!r}")
+            yield TTSStartedFrame()
+            for frame in cached.frames():
+                yield frame
+            yield TTSStoppedFrame()
+            return
+
+        await self._ensure_connected()
+
         message_text = tts_text if tts_text.endswith(" ") else f"{tts_text} "
         payload: Dict[str, object] = {
             "text": message_text,
@@ -426,8 +469,10 @@ class KokoroTTSService(WebsocketTTSService):
             payload["try_trigger_generation"] = True
 
         self._ttfb_stopped = False
+        self._request_started = started if cache else None
         await self.start_ttfb_metrics()
         await self._websocket.send(json.dumps(payload))
+        self._live_pending += 1
         await self.start_tts_usage_metrics(text)
 
         yield TTSStartedFrame()
@@ -447,8 +492,10 @@ class KokoroTTSService(WebsocketTTSService):
                 if event == "audioOutput":
                     await self._handle_audio_output(payload)
                 elif event == "error":
+                    self._live_pending = 0
                     await self._handle_error(payload)
                 elif event == "finalOutput":
+                    self._live_pending = max(0, self._live_pending - 1)
                     logger.debug(
                         "KokoroTTSService final output received",
                         chunks=payload.get("chunks"),
@@ -468,6 +515,7 @@ class KokoroTTSService(WebsocketTTSService):
             await self._call_event_handler("on_connection_error", str(exc))
         finally:
             self._websocket = None
+            self._live_pending = 0
 
     async def _handle_audio_output(self, payload: Dict[str, object]):
         audio_b64 = payload.get("audio")
@@ -491,6 +539,11 @@ class KokoroTTSService(WebsocketTTSService):
         if not self._ttfb_stopped:
             await self.stop_ttfb_metrics()
             self._ttfb_stopped = True
+            if self._request_started is not None:
+                cache = get_phrase_cache()
+                if cache:
+                    cache.record_first_audio(False, (time.monotonic() - self._request_started) * 1000)
+                self._request_started = None
 
         frame = TTSAudioRawFrame(audio, sample_rate, 1)
         await self.push_frame(frame)
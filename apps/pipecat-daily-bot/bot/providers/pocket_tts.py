@@ -10,9 +10,12 @@ to first audio chunk.
 
 from __future__ import annotations
 
+import asyncio
 import io
 import struct
+import time
 import wave
+from dataclasses import dataclass
 from typing import AsyncGenerator, Optional
 
 import aiohttp
@@ -28,6 +31,57 @@ from pipecat.frames.frames import (
 )
 from pipecat.services.tts_service import TTSService
 
+try:
+    from services.phrase_audio_cache import CachedPhrase, PhraseKey, get_phrase_cache, phrase_key
+except ImportError:  # pragma: no cover - package-style import
+    from bot.services.phrase_audio_cache import CachedPhrase, PhraseKey, get_phrase_cache, phrase_key
+
+
+# PocketTTS is stateless HTTP, so services on the same event loop share one
+# keep-alive connection pool per server. Each service holds a reference from
+# its first request until cleanup(); the last reference closes the pool.
+_SessionKey = tuple[asyncio.AbstractEventLoop, str]
+
+
+@dataclass
+class _SharedSession:
+    session: aiohttp.ClientSession
+    refs: int = 0
+
+
+_shared_sessions: dict[_SessionKey, _SharedSession] = {}
+
+
+def _new_session() -> aiohttp.ClientSession:
+    # Use a TCP connector with keepalive to reduce connection overhead
+    return aiohttp.ClientSession(connector=aiohttp.TCPConnector(keepalive_timeout=300))
+
+
+def _acquire_session(base_url: str) -> _SessionKey:
+    key = (asyncio.get_running_loop(), base_url)
+    shared = _shared_sessions.get(key)
+    if shared is None:
+        shared = _shared_sessions[key] = _SharedSession(_new_session())
+    shared.refs += 1
+    return key
+
+
+def _shared_session(key: _SessionKey) -> aiohttp.ClientSession:
+    shared = _shared_sessions[key]
+    if shared.session.closed:
+        shared.session = _new_session()
+    return shared.session
+
+
+async def _release_session(key: _SessionKey) -> None:
+    shared = _shared_sessions.get(key)
+    if shared is None:
+        return
+    shared.refs -= 1
+    if shared.refs <= 0:
+        del _shared_sessions[key]
+        await shared.session.close()
+
 
 class PocketTTSService(TTSService):
     """TTS service backed by a local PocketTTS HTTP server.
@@ -56,19 +110,29 @@ class PocketTTSService(TTSService):
         self._base_url = base_url.rstrip("/")
         self._params = params or self.InputParams()
         self._session: Optional[aiohttp.ClientSession] = None
+        self._session_key: Optional[_SessionKey] = None
         logger.info(f"PocketTTSService initialized: base_url={self._base_url}, sample_rate={sample_rate}")
 
     async def _ensure_session(self):
+        if self._session_key is None:
+            self._session_key = _acquire_session(self._base_url)
         if self._session is None or self._session.closed:
-            # Use a TCP connector with keepalive to reduce connection overhead
-            connector = aiohttp.TCPConnector(keepalive_timeout=300)
-            self._session = aiohttp.ClientSession(connector=connector)
+            self._session = _shared_session(self._session_key)
 
     async def cleanup(self):
-        if self._session and not self._session.closed:
-            await self._session.close()
+        # The pool is shared with other services on this loop; the last one closes it
+        key, self._session_key, self._session = self._session_key, None, None
+        if key is not None:
+            await _release_session(key)
         await super().cleanup()
 
+    def set_voice_url(self, voice_url: Optional[str]):
+        """Switch the cloned voice used for subsequent requests."""
+        self._params = self._params.model_copy(update={"voice_url": voice_url})
+
+    async def warm_connection(self):
+        await self._ensure_session()
+
     def can_generate_metrics(self) -> bool:
         return True
 
@@ -95,7 +159,52 @@ class PocketTTSService(TTSService):
             logger.error(f"PocketTTS WAV header parse error: {e}")
             return None
 
-    async def run_tts(self, text: str, context_id: str) -> AsyncGenerator[Frame, None]:
+    def phrase_cache_key(self, text: str) -> PhraseKey:
+        return phrase_key("pocket", self._params.voice_url, self._params.speed, text)
+
+    async def render_phrase(self, text: str) -> CachedPhrase | None:
+        """Synthesize a whole phrase into PCM for the phrase audio cache."""
+        audio = bytearray()
+        sample_rate = self.sample_rate or 24000
+        num_channels = 1
+        async for frame in self._stream_tts(text.strip()):
+            if isinstance(frame, ErrorFrame):
+                return None
+            if isinstance(frame, TTSAudioRawFrame):
+                audio.extend(frame.audio)
+                sample_rate = frame.sample_rate
+                num_channels = frame.num_channels
+        if not audio:
+            return None
+        return CachedPhrase(bytes(audio), sample_rate, num_channels)
+
+    async def run_tts(self, text: str, context_id: Optional[str] = None) -> AsyncGenerator[Frame, None]:
+        """Synthesize text via PocketTTS, serving cached filler phrases directly."""
+        # Skip empty or whitespace-only text
+        text = text.strip()
+        if not text:
+            return
+
+        started = time.monotonic()
+        cache = get_phrase_cache()
+        cached = cache.get(self.phrase_cache_key(text)) if cache else None
+        if cached is not None:
+            cache.record_first_audio(True, (time.monotonic() - started) * 1000)
+            logger.debug(f"PocketTTS phrase cache hit: {text!r}")
+            yield TTSStartedFrame()
+            for frame in cached.frames():
+                yield frame
+            yield TTSStoppedFrame()
+            return
+
+        first_audio = True
+        async for frame in self._stream_tts(text):
+            if first_audio and cache and isinstance(frame, TTSAudioRawFrame):
+                cache.record_first_audio(False, (time.monotonic() - started) * 1000)
+                first_audio = False
+            yield frame
+
+    async def _stream_tts(self, text: str) -> AsyncGenerator[Frame, None]:
         """Synthesize text via PocketTTS HTTP API and yield audio frames.
 
         Streams the response incrementally — reads the WAV header from the first
@@ -105,11 +214,6 @@ class PocketTTSService(TTSService):
         """
         await self._ensure_session()
 
-        # Skip empty or whitespace-only text
-        text = text.strip()
-        if not text:
-            return
-
         logger.debug(f"PocketTTS synthesizing ({len(text)} chars): {text[:80]}...")
 
         # Build multipart form data
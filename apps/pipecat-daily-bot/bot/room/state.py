@@ -1,8 +1,14 @@
+import asyncio
 import os
 import json
+import time
+import uuid
+from dataclasses import dataclass
 from typing import Any, Dict
 from loguru import logger
-from core.config import BOT_PID
+from redis.exceptions import WatchError
+from core.config import BOT_PID, BOT_ROOM_STATE_CACHE_TTL_SECS
+from core.session_context import current_session_id, current_user_id, current_user_name
 from services.redis import RedisClient
 
 # Global forwarder registry (room_url → AppMessageForwarder instance)
@@ -18,11 +24,35 @@ _local_active_applets: Dict[str, Dict[str, str]] = {}
 # Redis client
 _redis = RedisClient()
 
+# Room state lives at room:{room_url}:{field} as JSON carrying a "version" that
+# increases on every write, so concurrent writers can compare-and-set. Each
+# write publishes the key on INVALIDATION_CHANNEL; every process keeps a local
+# copy of what it read or wrote and drops it when another process publishes.
+ROOM_STATE_FIELDS = ("active_note", "active_applet", "desktop_mode")
+ROOM_STATE_TTL_SECS = 86400
+INVALIDATION_CHANNEL = "room-state:invalidate"
+_WRITE_RETRIES = 5
+_LISTENER_RETRY_SECS = 5.0
+_ORIGIN = f"{BOT_PID}:{uuid.uuid4().hex[:8]}"
+
+
+@dataclass
+class _CacheEntry:
+    payload: Dict[str, Any] | None
+    version: int
+    expires_at: float
+
+
+_cache: Dict[str, _CacheEntry] = {}
+# Bumped on every foreign invalidation; guards cache fills racing with one
+_invalidations = 0
+_listener: "_InvalidationListener | None" = None
+
 
 def _room_logger(room_url: str):
-    session_id = os.getenv("BOT_SESSION_ID")
-    user_id = os.getenv("BOT_SESSION_USER_ID")
-    user_name = os.getenv("BOT_SESSION_USER_NAME")
+    session_id = current_session_id()
+    user_id = current_user_id()
+    user_name = current_user_name()
     return logger.bind(roomUrl=room_url, sessionId=session_id, userId=user_id, userName=user_name)
 
 
@@ -41,38 +71,214 @@ def remove_forwarder(room_url: str) -> None:
     _room_forwarders.pop(room_url, None)
 
 
-async def get_active_note_id(room_url: str) -> str | None:
-    """Get the active note ID for a room from Redis, falling back to in-memory."""
+def _state_key(room_url: str, field: str) -> str:
+    if field not in ROOM_STATE_FIELDS:
+        raise ValueError(f"Unknown room state field: {field}")
+    return f"room:{room_url}:{field}"
+
+
+def _decode_state(field: str, raw: str | None) -> tuple[Dict[str, Any] | None, int]:
+    """Split a stored value into (payload, version); cleared values have no payload."""
+    if not raw:
+        return None, 0
+    try:
+        data = json.loads(raw)
+    except ValueError:
+        data = None
+    if not isinstance(data, dict):
+        # desktop_mode used to be stored as a bare string
+        return ({"mode": raw} if field == "desktop_mode" else None), 0
+    version = int(data.pop("version", 0) or 0)
+    return (data or None), version
+
+
+def _remember(key: str, payload: Dict[str, Any] | None, version: int) -> None:
+    ttl = BOT_ROOM_STATE_CACHE_TTL_SECS()
+    if ttl > 0:
+        _cache[key] = _CacheEntry(payload, version, time.monotonic() + ttl)
+
+
+def _apply_invalidation(raw: Any) -> None:
+    global _invalidations
+    try:
+        message = json.loads(raw)
+    except (TypeError, ValueError):
+        return
+    if not isinstance(message, dict) or message.get("origin") == _ORIGIN:
+        # Our own writes already updated the cache
+        return
+    _invalidations += 1
+    for key in message.get("keys") or ():
+        _cache.pop(key, None)
+
+
+class _InvalidationListener:
+    """Drops cached room state when another process publishes a write.
+
+    Cached entries are only served while the subscription is confirmed; any
+    disconnect clears the cache because invalidations may have been missed.
+    """
+
+    def __init__(self, client: Any):
+        self.client = client
+        self.live = False
+        self.stopped_at: float | None = None
+        self.task = asyncio.create_task(self._run(), name="room-state-invalidations")
+
+    def serves(self, client: Any) -> bool:
+        return self.client is client and self.task.get_loop() is asyncio.get_running_loop()
+
+    def stop(self) -> None:
+        if not self.task.done() and self.task.get_loop() is asyncio.get_running_loop():
+            self.task.cancel()
+
+    async def _run(self) -> None:
+        pubsub = None
+        try:
+            pubsub = self.client.pubsub()
+            await pubsub.subscribe(INVALIDATION_CHANNEL)
+            async for message in pubsub.listen():
+                if message["type"] == "subscribe":
+                    # Entries cached before the subscription may have missed an invalidation
+                    _cache.clear()
+                    self.live = True
+                elif message["type"] == "message":
+                    _apply_invalidation(message["data"])
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"[{BOT_PID}] [state] Room state invalidation listener stopped: {e}")
+        finally:
+            self.live = False
+            self.stopped_at = time.monotonic()
+            _cache.clear()
+            if pubsub is not None:
+                try:
+                    await pubsub.aclose()
+                except Exception:
+                    pass
+
+
+def _cache_ready(client: Any) -> bool:
+    """True when cached entries may be served; starts the listener on demand."""
+    global _listener
+    if BOT_ROOM_STATE_CACHE_TTL_SECS() <= 0:
+        return False
+    current = _listener
+    if current is not None and current.serves(client):
+        if not current.task.done():
+            return current.live
+        if current.stopped_at is not None and time.monotonic() - current.stopped_at < _LISTENER_RETRY_SECS:
+            return False
+    elif current is not None:
+        current.stop()
+    _cache.clear()
+    _listener = _InvalidationListener(client)
+    return False
+
+
+async def _read_state(room_url: str, field: str) -> tuple[Dict[str, Any] | None, int]:
+    key = _state_key(room_url, field)
+    client = await _redis._get_redis()
+    cacheable = _cache_ready(client)
+    if cacheable:
+        entry = _cache.get(key)
+        if entry is not None and entry.expires_at > time.monotonic():
+            return entry.payload, entry.version
+    generation = _invalidations
+    payload, version = _decode_state(field, await client.get(key))
+    # Skip the fill if an invalidation arrived while the GET was in flight
+    if cacheable and generation == _invalidations:
+        _remember(key, payload, version)
+    return payload, version
+
+
+async def _write_state(
+    room_url: str,
+    field: str,
+    payload: Dict[str, Any] | None,
+    expected_version: int | None = None,
+) -> int | None:
+    """Write a room field (``None`` clears it) and publish an invalidation.
+
+    With ``expected_version`` the write only succeeds if the stored version
+    still matches; returns the new version, or None on a conflict.
+    """
+    key = _state_key(room_url, field)
+    client = await _redis._get_redis()
+    for _ in range(_WRITE_RETRIES):
+        generation = _invalidations
+        async with client.pipeline(transaction=True) as pipe:
+            try:
+                await pipe.watch(key)
+                _, current = _decode_state(field, await pipe.get(key))
+                if expected_version is not None and current != expected_version:
+                    return None
+                version = current + 1
+                pipe.multi()
+                # Cleared values keep their version so compare-and-set never sees it go backwards
+                pipe.set(key, json.dumps({**(payload or {}), "version": version}), ex=ROOM_STATE_TTL_SECS)
+                pipe.publish(INVALIDATION_CHANNEL, json.dumps({"keys": [key], "version": version, "origin": _ORIGIN}))
+                await pipe.execute()
+            except WatchError:
+                if expected_version is not None:
+                    return None
+                continue
+        if generation == _invalidations:
+            _remember(key, payload, version)
+        else:
+            _cache.pop(key, None)
+        return version
+    raise RuntimeError(f"Room state {key} changed concurrently {_WRITE_RETRIES} times")
+
+
+async def get_room_state(room_url: str, field: str) -> tuple[Dict[str, Any] | None, int]:
+    """Return ``(payload, version)`` for one of ``ROOM_STATE_FIELDS``.
+
+    Raises when Redis is unavailable; pair with ``compare_and_set_room_state``
+    for read-modify-write updates.
+    """
+    return await _read_state(room_url, field)
+
+
+async def compare_and_set_room_state(
+    room_url: str,
+    field: str,
+    expected_version: int,
+    payload: Dict[str, Any] | None,
+) -> int | None:
+    """Write ``payload`` only if the field is still at ``expected_version``.
+
+    Returns the new version, or None when another writer got there first.
+    """
     log = _room_logger(room_url)
+    version = await _write_state(room_url, field, payload, expected_version)
+    if version is None:
+        log.info(f"[{BOT_PID}] [state] Lost compare-and-set on {field} for room {room_url} (expected v{expected_version})")
+    return version
+
+
+async def _get_active(room_url: str, field: str, fallback: Dict[str, Dict[str, str]]) -> Dict[str, Any] | None:
     try:
-        client = await _redis._get_redis()
-        data = await client.get(f"room:{room_url}:active_note")
-        if data:
-            return json.loads(data).get("note_id")
+        payload, _ = await _read_state(room_url, field)
+        if payload:
+            return payload
     except Exception as e:
-        log.debug(f"[{BOT_PID}] [state] Redis unavailable for active note ({e}); using local fallback")
+        _room_logger(room_url).debug(f"[{BOT_PID}] [state] Redis unavailable for {field} ({e}); using local fallback")
     # Always check local fallback when Redis fails or returns nothing
-    fallback = _local_active_notes.get(room_url)
-    if fallback:
-        return fallback.get("note_id")
-    return None
+    return fallback.get(room_url)
+
+
+async def get_active_note_id(room_url: str) -> str | None:
+    """Get the active note ID for a room, falling back to in-memory."""
+    active = await _get_active(room_url, "active_note", _local_active_notes)
+    return active.get("note_id") if active else None
 
 
 async def get_active_note_owner(room_url: str) -> str | None:
     """Get the participant ID of who opened the active note, falling back to in-memory."""
-    log = _room_logger(room_url)
-    try:
-        client = await _redis._get_redis()
-        data = await client.get(f"room:{room_url}:active_note")
-        if data:
-            return json.loads(data).get("owner")
-    except Exception as e:
-        log.debug(f"[{BOT_PID}] [state] Redis unavailable for note owner ({e}); using local fallback")
-    # Always check local fallback when Redis fails or returns nothing
-    fallback = _local_active_notes.get(room_url)
-    if fallback:
-        return fallback.get("owner")
-    return None
+    active = await _get_active(room_url, "active_note", _local_active_notes)
+    return active.get("owner") if active else None
 
 
 async def set_active_note_id(room_url: str, note_id: str | None, owner: str | None = None) -> None:
@@ -84,62 +290,32 @@ async def set_active_note_id(room_url: str, note_id: str | None, owner: str | No
         owner: The participant ID who is opening the note (required when setting)
     """
     log = _room_logger(room_url)
+    active = None if note_id is None else {"note_id": note_id, "owner": owner or "unknown"}
     try:
-        client = await _redis._get_redis()
-        key = f"room:{room_url}:active_note"
+        await _write_state(room_url, "active_note", active)
         if note_id is None:
-            await client.delete(key)
             log.info(f"[{BOT_PID}] [state] Cleared active note for room: {room_url}")
         else:
-            await client.set(key, json.dumps({
-                'note_id': note_id,
-                'owner': owner or 'unknown'
-            }))
-            # Set expiry to 24 hours to prevent stale state
-            await client.expire(key, 86400)
             log.info(f"[{BOT_PID}] [state] Set active note for room {room_url}: {note_id} (owner: {owner})")
     except Exception as e:
         log.error(f"[{BOT_PID}] [state] Failed to set active note for {room_url}: {e}")
         # Fallback to in-memory storage so tests and local runs without Redis still work
-        if note_id is None:
+        if active is None:
             _local_active_notes.pop(room_url, None)
         else:
-            _local_active_notes[room_url] = {
-                "note_id": note_id,
-                "owner": owner or "unknown"
-            }
+            _local_active_notes[room_url] = active
 
 
 async def get_active_applet_id(room_url: str) -> str | None:
     """Get the active applet ID for a room, falling back to in-memory."""
-    log = _room_logger(room_url)
-    try:
-        client = await _redis._get_redis()
-        data = await client.get(f"room:{room_url}:active_applet")
-        if data:
-            return json.loads(data).get("applet_id")
-    except Exception as e:
-        log.debug(f"[{BOT_PID}] [state] Redis unavailable for active applet ({e}); using local fallback")
-    fallback = _local_active_applets.get(room_url)
-    if fallback:
-        return fallback.get("applet_id")
-    return None
+    active = await _get_active(room_url, "active_applet", _local_active_applets)
+    return active.get("applet_id") if active else None
 
 
 async def get_active_applet_owner(room_url: str) -> str | None:
     """Get the participant ID of who opened the active applet, falling back to in-memory."""
-    log = _room_logger(room_url)
-    try:
-        client = await _redis._get_redis()
-        data = await client.get(f"room:{room_url}:active_applet")
-        if data:
-            return json.loads(data).get("owner")
-    except Exception as e:
-        log.debug(f"[{BOT_PID}] [state] Redis unavailable for applet owner ({e}); using local fallback")
-    fallback = _local_active_applets.get(room_url)
-    if fallback:
-        return fallback.get("owner")
-    return None
+    active = await _get_active(room_url, "active_applet", _local_active_applets)
+    return active.get("owner") if active else None
 
 
 async def set_active_applet_id(room_url: str, applet_id: str | None, owner: str | None = None) -> None:
@@ -151,42 +327,30 @@ async def set_active_applet_id(room_url: str, applet_id: str | None, owner: str
         owner: The participant ID who is opening the applet (required when setting)
     """
     log = _room_logger(room_url)
+    active = None if applet_id is None else {"applet_id": applet_id, "owner": owner or "unknown"}
     try:
-        client = await _redis._get_redis()
-        key = f"room:{room_url}:active_applet"
+        await _write_state(room_url, "active_applet", active)
         if applet_id is None:
-            await client.delete(key)
             log.info(f"[{BOT_PID}] [state] Cleared active applet for room: {room_url}")
         else:
-            await client.set(key, json.dumps({
-                'applet_id': applet_id,
-                'owner': owner or 'unknown'
-            }))
-            # Set expiry to 24 hours to prevent stale state
-            await client.expire(key, 86400)
             log.info(f"[{BOT_PID}] [state] Set active applet for room {room_url}: {applet_id} (owner: {owner})")
     except Exception as e:
         log.error(f"[{BOT_PID}] [state] Failed to set active applet for {room_url}: {e}")
         # Fallback to in-memory storage
-        if applet_id is None:
+        if active is None:
             _local_active_applets.pop(room_url, None)
         else:
-            _local_active_applets[room_url] = {
-                "applet_id": applet_id,
-                "owner": owner or "unknown"
-            }
+            _local_active_applets[room_url] = active
 
 
 async def get_desktop_mode(room_url: str) -> str:
     """Get the current desktop mode for a room from Redis. Defaults to 'home'."""
-    log = _room_logger(room_url)
     try:
-        client = await _redis._get_redis()
-        data = await client.get(f"room:{room_url}:desktop_mode")
-        if data:
-            return data
+        payload, _ = await _read_state(room_url, "desktop_mode")
+        if payload and payload.get("mode"):
+            return payload["mode"]
     except Exception as e:
-        log.error(f"[{BOT_PID}] [state] Failed to get desktop mode for {room_url}: {e}")
+        _room_logger(room_url).error(f"[{BOT_PID}] [state] Failed to get desktop mode for {room_url}: {e}")
     return "home"
 
 
@@ -194,11 +358,7 @@ async def set_desktop_mode(room_url: str, mode: str) -> None:
     """Set the current desktop mode for a room in Redis."""
     log = _room_logger(room_url)
     try:
-        client = await _redis._get_redis()
-        key = f"room:{room_url}:desktop_mode"
-        await client.set(key, mode)
-        # Set expiry to 24 hours
-        await client.expire(key, 86400)
+        await _write_state(room_url, "desktop_mode", {"mode": mode})
         log.info(f"[{BOT_PID}] [state] Set desktop mode for room {room_url}: {mode}")
     except Exception as e:
         log.error(f"[{BOT_PID}] [state] Failed to set desktop mode for {room_url}: {e}")
@@ -207,11 +367,13 @@ async def set_desktop_mode(room_url: str, mode: str) -> None:
 async def clear_room_state(room_url: str) -> None:
     """Clear all active state for a room in Redis."""
     log = _room_logger(room_url)
+    keys = [_state_key(room_url, field) for field in ROOM_STATE_FIELDS]
+    for key in keys:
+        _cache.pop(key, None)
     try:
         client = await _redis._get_redis()
-        await client.delete(f"room:{room_url}:active_note")
-        await client.delete(f"room:{room_url}:active_applet")
-        await client.delete(f"room:{room_url}:desktop_mode")
+        await client.delete(*keys)
+        await client.publish(INVALIDATION_CHANNEL, json.dumps({"keys": keys, "origin": _ORIGIN}))
         log.info(f"[{BOT_PID}] [state] Cleared all active state for room: {room_url}")
     except Exception as e:
         log.error(f"[{BOT_PID}] [state] Failed to clear room state for {room_url}: {e}")
@@ -263,5 +425,7 @@ def cleanup_room_state(room_url: str) -> None:
     _room_tenants.pop(room_url, None)
     _local_active_notes.pop(room_url, None)
     _local_active_applets.pop(room_url, None)
+    for field in ROOM_STATE_FIELDS:
+        _cache.pop(_state_key(room_url, field), None)
     log = _room_logger(room_url)
     log.info(f"[{BOT_PID}] [state] Cleaned up state for room: {room_url}")
@@ -11,6 +11,7 @@ Container entrypoint (MODE=runner) launches this file.
 from __future__ import annotations
 
 import asyncio
+import contextvars
 import json
 import os
 import signal
@@ -30,6 +31,7 @@ from loguru import logger
 from pipecat.runner.types import DailyRunnerArguments
 import redis.asyncio as redis
 from core.config import BOT_PID
+from core.session_context import SessionContext, bind_session
 
 ROOT_DIR = Path(__file__).resolve().parent.parent
 if str(ROOT_DIR) not in sys.path:
@@ -443,17 +445,17 @@ async def _launch_session(room_url: str, token: str | None, personalityId: str,
     "[runner] Canonical sessionId prepared (generated=%s, debugTraceId=%s)" % (generated_session_id, debug_trace_id)
   )
 
-  # Ensure downstream modules relying on env vars see the canonical session/user identity
-  os.environ["BOT_SESSION_ID"] = str(canonical_session_id)
+  # Bind the canonical session/user identity to this session's task context
+  # (not os.environ, which concurrent sessions in this runner would share)
   session_user_id = body.get("sessionUserId")
   session_user_name = body.get("sessionUserName")
   session_user_email = body.get("sessionUserEmail")
-  if session_user_id:
-    os.environ["BOT_SESSION_USER_ID"] = str(session_user_id)
-  if session_user_name:
-    os.environ["BOT_SESSION_USER_NAME"] = str(session_user_name)
-  if session_user_email:
-    os.environ["BOT_SESSION_USER_EMAIL"] = str(session_user_email)
+  session_ctx = SessionContext(
+    session_id=str(canonical_session_id),
+    user_id=str(session_user_id) if session_user_id else None,
+    user_name=str(session_user_name) if session_user_name else None,
+    user_email=str(session_user_email) if session_user_email else None,
+  )
 
   runner_args = DailyRunnerArguments(room_url=room_url, token=token, body=body)  # type: ignore[arg-type]
   session_logger = logger.bind(
@@ -572,7 +574,9 @@ async def _launch_session(room_url: str, token: str | None, personalityId: str,
         os.kill(os.getpid(), signal.SIGTERM)
 
   keepalive_task: asyncio.Task | None = asyncio.create_task(_keepalive(room_url, canonical_session_id)) if USE_REDIS else None
-  task = asyncio.create_task(_run(), name=f"pipecat-session:{room_url}")
+  task_context = contextvars.copy_context()
+  task_context.run(bind_session, session_ctx)
+  task = asyncio.create_task(_run(), name=f"pipecat-session:{room_url}", context=task_context)
   info = SessionInfo(
     canonical_session_id,
     task,
@@ -12,8 +12,11 @@ arrive in the same unified envelope shape.
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import json
 import os
+import time
+from collections import OrderedDict
 from collections.abc import Awaitable, Callable
 from typing import Any
 
@@ -23,6 +26,16 @@ except Exception:  # pragma: no cover
     aiohttp = None
 from eventbus import events as evt
 from eventbus.bus import subscribe
+from core.config import (
+    BOT_EVENT_FORWARDER_CHUNK_MS,
+    BOT_EVENT_FORWARDER_DEDUP_MS,
+    BOT_EVENT_FORWARDER_MAX_BYTES,
+)
+from services.app_message_transport import (
+    DAILY_MESSAGE_LIMIT,
+    PooledAppMessageTransport,
+    chunk_envelope,
+)
 from tools.logging_utils import bind_context_logger
 
 BRIDGE_VERSION = 1
@@ -50,7 +63,14 @@ class AppMessageForwarder:
         self._room_url = room_url or getattr(transport, 'room_url', None) or ''
         self._room_name = self._derive_room_name(self._room_url)
         self._api_key = os.getenv('DAILY_API_KEY') or ''
-        self._http_sem = asyncio.Semaphore(4)
+        self._http_transport: PooledAppMessageTransport | None = None
+        self._ws_broadcast_fn: Callable[..., Awaitable[Any]] | None = None
+        self._ws_broadcast_resolved = False
+        self._chunk_interval = BOT_EVENT_FORWARDER_CHUNK_MS() / 1000.0
+        self._max_chunked_bytes = BOT_EVENT_FORWARDER_MAX_BYTES()
+        self._dedup_window = BOT_EVENT_FORWARDER_DEDUP_MS() / 1000.0
+        # content hash of large payloads -> monotonic time of delivery, oldest first
+        self._recent_sends: OrderedDict[str, float] = OrderedDict()
         self._warned_http_error = False
         self._log = bind_context_logger(
             room_url=self._room_url,
@@ -89,33 +109,115 @@ class AppMessageForwarder:
             return ''
 
     async def _send(self, envelope: dict[str, Any]):
+        if self._mode == 'html' and not (self._api_key and self._room_name and aiohttp is not None):
+            if not self._warned_missing:
+                self._log.warning(
+                    'cannot send app-message (missing DAILY_API_KEY, room name, or aiohttp)'
+                )
+                self._warned_missing = True
+            # Even without Daily, try WebSocket delivery
+            await self._ws_broadcast(envelope)
+            return
+        messages, size = self._frame_for_daily(envelope)
         if self._mode == 'html':
-            if not (self._api_key and self._room_name and aiohttp is not None):
-                if not self._warned_missing:
-                    self._log.warning(
-                        'cannot send app-message (missing DAILY_API_KEY, room name, or aiohttp)'
-                    )
-                    self._warned_missing = True
-                # Even without Daily, try WebSocket delivery
-                await self._ws_broadcast(envelope)
-                return
-            await self._http_post_send(envelope)
+            if len(messages) > 1:
+                # One queue entry, so the fragments are sent or dropped together
+                await self._http_post_send_chunks(messages, size or 0)
+            else:
+                await self._http_post_send(messages[0], size)
         else:
-            await self._inproc_send(envelope)
+            for index, message in enumerate(messages):
+                if index and self._chunk_interval:
+                    # Pace fragments so one large payload does not trip Daily rate limits
+                    await asyncio.sleep(self._chunk_interval)
+                await self._inproc_send(message)
         # Also broadcast to WebSocket clients (for non-Daily frontends)
         await self._ws_broadcast(envelope)
 
+    def _frame_for_daily(self, envelope: dict[str, Any]) -> tuple[list[dict[str, Any]], int | None]:
+        """Return the Daily messages for an envelope (itself, or its chunks) and its size.
+
+        Oversized envelopes are split into ``nia.chunk`` fragments.
+        """
+        try:
+            raw = json.dumps(envelope, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+        except Exception:
+            return [envelope], None
+        if len(raw) <= DAILY_MESSAGE_LIMIT:
+            return [envelope], len(raw)
+        if len(raw) > self._max_chunked_bytes:
+            self._log.warning(
+                'envelope too large to deliver over Daily; truncating payload',
+                length=len(raw),
+                event=envelope.get('event'),
+            )
+            truncated = {
+                k: (v if k != 'payload' else {'truncated': True}) for k, v in envelope.items()
+            }
+            return [truncated], None
+        chunks = chunk_envelope(envelope, raw)
+        self._log.debug(
+            'chunking large envelope',
+            event=envelope.get('event'),
+            length=len(raw),
+            chunks=len(chunks),
+        )
+        return chunks, len(raw)
+
+    def _is_duplicate(self, topic: str, payload: dict[str, Any], target: str | None = None) -> bool:
+        """Whether an identical large payload was sent within the dedup window.
+
+        Only payloads too big for one Daily message (the ones that would be
+        chunked) are hashed, keyed on event name, target and payload; small
+        events are always delivered. Callers check before assigning a seq, so
+        a skipped re-send leaves no sequence gap.
+        """
+        if not self._dedup_window:
+            return False
+        try:
+            raw = json.dumps(
+                [topic, target, payload],
+                separators=(',', ':'),
+                ensure_ascii=False,
+                sort_keys=True,
+                default=str,
+            ).encode('utf-8')
+        except Exception:
+            return False
+        if len(raw) <= DAILY_MESSAGE_LIMIT:
+            return False
+        digest = hashlib.sha1(raw).hexdigest()
+        now = time.monotonic()
+        recent = self._recent_sends
+        while recent and now - next(iter(recent.values())) >= self._dedup_window:
+            recent.popitem(last=False)
+        if digest in recent:
+            self._log.debug('skipping duplicate large payload', event=topic, length=len(raw))
+            return True
+        recent[digest] = now
+        return False
+
     async def _ws_broadcast(self, envelope: dict[str, Any]):
         """Forward envelope to the gateway WebSocket event channel (best-effort).
         
         Scoped to this forwarder's room name so only clients in the same
         session receive the event.
         """
+        if not self._ws_broadcast_resolved:
+            # Resolve once; re-importing on every send is measurable on hot paths.
+            self._ws_broadcast_resolved = True
+            try:
+                from bot_gateway import ws_broadcast
+
+                self._ws_broadcast_fn = ws_broadcast
+            except Exception:
+                self._ws_broadcast_fn = None  # gateway not co-located or import failed
+        if self._ws_broadcast_fn is None:
+            return
         try:
-            from bot_gateway import ws_broadcast
-            await ws_broadcast(envelope, session_id=self._room_name or None)
+            await self._ws_broadcast_fn(envelope, session_id=self._room_name or None)
         except Exception:
-            pass  # gateway not co-located or import failed
+            pass
 
     async def _inproc_send(self, envelope: dict[str, Any]):
         """Send envelope via in-process Daily transport.
@@ -200,57 +302,29 @@ class AppMessageForwarder:
                 self._log.warning('inproc frame send exception', error=str(e))
                 self._warned_http_error = True
 
-    async def _http_post_send(self, envelope: dict[str, Any]):
+    async def _http_post_send(self, envelope: dict[str, Any], size: int | None = None):
         if not (self._api_key and self._room_name and aiohttp):
             return
-        try:
-            raw = json.dumps(envelope)
-            if len(raw) > 49000:
-                self._log.warning(
-                    'envelope size exceeds Daily limit (~50KB)',
-                    length=len(raw),
-                )
-                envelope = {
-                    k: (v if k != 'payload' else {'truncated': True}) for k, v in envelope.items()
-                }
-        except Exception:
-            pass
-        url = f"https://api.daily.co/v1/rooms/{self._room_name}/send-app-message"
-        body = {"data": envelope, "recipient": "*"}
-        headers = {
-            'Authorization': f'Bearer {self._api_key}',
-            'Content-Type': 'application/json',
-            'Accept': 'application/json',
-        }
-        async with self._http_sem:
-            try:
-                async with aiohttp.ClientSession() as session:  # type: ignore
-                    async with session.post(url, json=body, headers=headers, timeout=10) as resp:
-                        if resp.status >= 300:
-                            txt = await resp.text()
-                            # Suppress 404 warnings when room is not hosting a call (common during startup/shutdown)
-                            if resp.status == 404:
-                                self._log.debug(
-                                    'http app-message send skipped (room inactive)',
-                                    status=resp.status,
-                                    body=txt[:100],
-                                )
-                            elif not self._warned_http_error:
-                                self._log.warning(
-                                    'http app-message send failed',
-                                    status=resp.status,
-                                    body=txt[:300],
-                                )
-                                self._warned_http_error = True
-                        else:
-                            self._log.debug(
-                                'http app-message sent',
-                                status=resp.status,
-                            )
-            except Exception as e:  # pragma: no cover
-                if not self._warned_http_error:
-                    self._log.warning('http send exception', error=str(e))
-                    self._warned_http_error = True
+        if self._http_transport is None:
+            self._http_transport = PooledAppMessageTransport(
+                self._room_name, self._api_key, log=self._log
+            )
+        self._http_transport.submit(envelope, size)
+
+    async def _http_post_send_chunks(self, chunks: list[dict[str, Any]], size: int):
+        if not (self._api_key and self._room_name and aiohttp):
+            return
+        if self._http_transport is None:
+            self._http_transport = PooledAppMessageTransport(
+                self._room_name, self._api_key, log=self._log
+            )
+        self._http_transport.submit_chunks(chunks, size)
+
+    def transport_stats(self) -> dict[str, Any]:
+        """Queue depth, drop and coalescing counters for the REST send path."""
+        if self._http_transport is None:
+            return {}
+        return self._http_transport.stats()
 
     async def _handle(self, topic: str, payload: dict[str, Any]):
         import time
@@ -283,6 +357,8 @@ class AppMessageForwarder:
                 self._log.warning('stealth filtering error', error=str(e))
         try:
             async with self._lock:
+                if self._is_duplicate(topic, payload):
+                    return
                 self.seq += 1
                 try:
                     ts_val = payload.get('ts')
@@ -374,7 +450,12 @@ class AppMessageForwarder:
         except Exception as e:
             self._log.error('error publishing event', topic=topic, error=str(e))
 
-    async def emit_tool_event(self, topic: str, data: dict[str, Any], target_session_user_id: str | None = None) -> None:
+    async def emit_tool_event(
+        self,
+        topic: str,
+        data: dict[str, Any],
+        target_session_user_id: str | None = None,
+    ) -> None:
         """Public method for tools to emit events directly to browser interface.
         
         This method sends events directly via the app-message transport, bypassing
@@ -387,6 +468,9 @@ class AppMessageForwarder:
             target_session_user_id: Optional session user ID to target this event to.
                      If set, only the client with matching sessionUserId will process this event.
                      If None, all clients will process the event (broadcast).
+
+        A large payload identical to one sent within BOT_EVENT_FORWARDER_DEDUP_MS
+        is not re-sent.
         """
         import time
 
@@ -400,6 +484,8 @@ class AppMessageForwarder:
         
         # Create envelope and send directly to browser
         async with self._lock:
+            if self._is_duplicate(topic, payload, target_session_user_id):
+                return
             self.seq += 1
             env = {
                 'v': BRIDGE_VERSION,
@@ -469,14 +555,20 @@ class AppMessageForwarder:
     async def shutdown(self):
         """Async friendly shutdown for tests / app teardown."""
         self.stop()
-        if not self._tasks:
-            return
-        pending = list(self._tasks)
-        self._tasks.clear()
-        for task in pending:
-            if not task.done():
-                task.cancel()
-        await asyncio.gather(*pending, return_exceptions=True)
+        if self._tasks:
+            pending = list(self._tasks)
+            self._tasks.clear()
+            for task in pending:
+                if not task.done():
+                    task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+        if self._http_transport is not None:
+            transport, self._http_transport = self._http_transport, None
+            try:
+                await asyncio.wait_for(transport.flush(), timeout=2.0)
+            except Exception:
+                pass
+            await transport.close()
 
     def _track_task(self, coro: Awaitable[Any]) -> asyncio.Task[Any]:
         task = asyncio.create_task(coro)
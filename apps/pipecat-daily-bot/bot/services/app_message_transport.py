@@ -0,0 +1,354 @@
+"""Pooled Daily REST transport for app-message envelopes.
+
+``AppMessageForwarder`` used to open a fresh ``aiohttp.ClientSession`` for every
+``send-app-message`` call. This module keeps one keep-alive session per
+forwarder, buffers outbound envelopes in a bounded queue drained by a small
+worker pool, and (optionally) coalesces small envelopes that arrive within a
+short window into a single ``nia.batch`` envelope so bursts of canvas and
+transcript events share one round trip.
+
+Envelopes above Daily's ~50KB app-message limit are split by
+``chunk_envelope`` into base64 ``nia.chunk`` fragments that the browser
+reassembles (see appMessageFraming.ts), instead of being truncated. The
+fragments of one envelope occupy a single queue slot, so the drop-oldest
+policy discards whole messages and never leaves a message unassemblable.
+
+Tunables live in ``core.config`` (``BOT_EVENT_FORWARDER_*``).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import json
+import uuid
+from dataclasses import asdict, dataclass
+from typing import Any
+
+try:
+    import aiohttp  # type: ignore
+except Exception:  # pragma: no cover
+    aiohttp = None
+from core.config import (
+    BOT_EVENT_FORWARDER_CHUNK_MS,
+    BOT_EVENT_FORWARDER_COALESCE_MAX,
+    BOT_EVENT_FORWARDER_COALESCE_MS,
+    BOT_EVENT_FORWARDER_CONCURRENCY,
+    BOT_EVENT_FORWARDER_QUEUE_MAX,
+)
+
+BATCH_KIND = 'nia.batch'  # Unpacked by the browser bridge (appMessageFraming.ts)
+CHUNK_KIND = 'nia.chunk'  # Reassembled by the browser bridge (appMessageFraming.ts)
+DAILY_API_BASE = 'https://api.daily.co/v1'
+# Daily rejects app-messages above ~50KB; keep batches comfortably under it.
+MAX_BATCH_BYTES = 40000
+# Envelopes larger than this are always sent on their own.
+SMALL_ENVELOPE_BYTES = 4096
+# Serialized envelopes above this are fragmented into nia.chunk messages.
+DAILY_MESSAGE_LIMIT = 49000
+# Raw bytes per chunk; a multiple of 3 so base64 segments concatenate cleanly.
+CHUNK_BYTES = 30000
+
+
+def chunk_envelope(
+    envelope: dict[str, Any], raw: bytes, *, chunk_bytes: int = CHUNK_BYTES
+) -> list[dict[str, Any]]:
+    """Split a serialized envelope into ordered ``nia.chunk`` fragments.
+
+    ``raw`` is the UTF-8 JSON of ``envelope``. Each fragment carries the
+    reassembly id, its index and the total count; ``seq``/``event`` (and the
+    optional ``targetSessionUserId``) are repeated for diagnostics and early
+    filtering on the client.
+    """
+    chunk_bytes = max(3, chunk_bytes - chunk_bytes % 3)
+    total = max(1, -(-len(raw) // chunk_bytes))
+    reassembly_id = uuid.uuid4().hex[:16]
+    header: dict[str, Any] = {
+        'v': envelope.get('v', 1),
+        'kind': CHUNK_KIND,
+        'id': reassembly_id,
+        'total': total,
+        'seq': envelope.get('seq'),
+        'event': envelope.get('event'),
+    }
+    if envelope.get('targetSessionUserId'):
+        header['targetSessionUserId'] = envelope['targetSessionUserId']
+    return [
+        {
+            **header,
+            'index': index,
+            'data': base64.b64encode(raw[index * chunk_bytes:(index + 1) * chunk_bytes]).decode(
+                'ascii'
+            ),
+        }
+        for index in range(total)
+    ]
+
+
+@dataclass
+class TransportStats:
+    """Counters describing queue pressure and delivery outcomes."""
+
+    enqueued: int = 0
+    sent: int = 0
+    batches: int = 0
+    coalesced: int = 0
+    dropped: int = 0
+    failed: int = 0
+    queue_depth: int = 0
+    queue_high_watermark: int = 0
+
+
+class PooledAppMessageTransport:
+    """Queue-backed sender for Daily ``send-app-message`` with a persistent session."""
+
+    def __init__(
+        self,
+        room_name: str,
+        api_key: str,
+        *,
+        log: Any,
+        max_queue: int | None = None,
+        concurrency: int | None = None,
+        coalesce_ms: int | None = None,
+        coalesce_max: int | None = None,
+        chunk_ms: int | None = None,
+    ):
+        self._room_name = room_name
+        self._api_key = api_key
+        self._log = log
+        self._max_queue = max(1, max_queue or BOT_EVENT_FORWARDER_QUEUE_MAX())
+        self._concurrency = max(1, concurrency or BOT_EVENT_FORWARDER_CONCURRENCY())
+        if coalesce_ms is None:
+            coalesce_ms = BOT_EVENT_FORWARDER_COALESCE_MS()
+        self._coalesce_window = max(0, coalesce_ms) / 1000.0
+        self._coalesce_max = max(1, coalesce_max or BOT_EVENT_FORWARDER_COALESCE_MAX())
+        # (envelope, size) or (fragments of one chunked envelope, total size)
+        self._queue: asyncio.Queue[tuple[dict[str, Any] | list[dict[str, Any]], int]] | None = None
+        self._workers: list[asyncio.Task[Any]] = []
+        self._session: Any | None = None
+        self._stats = TransportStats()
+        self._warned_http_error = False
+        self._closed = False
+        if chunk_ms is None:
+            chunk_ms = BOT_EVENT_FORWARDER_CHUNK_MS()
+        self._chunk_interval = max(0, chunk_ms) / 1000.0
+
+    @property
+    def url(self) -> str:
+        return f"{DAILY_API_BASE}/rooms/{self._room_name}/send-app-message"
+
+    def stats(self) -> dict[str, Any]:
+        """Return a snapshot of queue and delivery counters."""
+        self._stats.queue_depth = self._queue.qsize() if self._queue else 0
+        return asdict(self._stats)
+
+    def submit(self, envelope: dict[str, Any], size: int | None = None) -> bool:
+        """Enqueue an envelope without waiting for delivery.
+
+        When the queue is full the oldest pending envelope is dropped so the
+        newest state reaches the browser. Returns ``False`` if the transport is
+        closed.
+        """
+        if self._closed:
+            return False
+        self._ensure_started()
+        if size is None:
+            try:
+                size = len(json.dumps(envelope))
+            except Exception:
+                size = MAX_BATCH_BYTES
+        self._enqueue(envelope, size)
+        return True
+
+    def submit_chunks(self, chunks: list[dict[str, Any]], size: int) -> bool:
+        """Enqueue the fragments of one envelope as a single queue entry.
+
+        One worker posts the fragments in order, paced by
+        ``BOT_EVENT_FORWARDER_CHUNK_MS``; a queue overflow drops them together.
+        Returns ``False`` if the transport is closed.
+        """
+        if self._closed:
+            return False
+        self._ensure_started()
+        self._enqueue(list(chunks), max(size, SMALL_ENVELOPE_BYTES + 1))
+        return True
+
+    def _enqueue(self, item: dict[str, Any] | list[dict[str, Any]], size: int) -> None:
+        assert self._queue is not None
+        if self._queue.full():
+            try:
+                self._queue.get_nowait()
+                self._queue.task_done()
+            except asyncio.QueueEmpty:  # pragma: no cover - raced with a worker
+                pass
+            self._stats.dropped += 1
+            if self._stats.dropped == 1 or self._stats.dropped % 100 == 0:
+                self._log.warning(
+                    'app-message queue full; dropping oldest envelope',
+                    dropped=self._stats.dropped,
+                    maxQueue=self._max_queue,
+                )
+        self._queue.put_nowait((item, size))
+        self._stats.enqueued += 1
+        depth = self._queue.qsize()
+        if depth > self._stats.queue_high_watermark:
+            self._stats.queue_high_watermark = depth
+
+    async def flush(self) -> None:
+        """Wait until every queued envelope has been handed to Daily."""
+        if self._queue is not None:
+            await self._queue.join()
+
+    async def close(self) -> None:
+        """Stop workers and release the pooled HTTP session."""
+        self._closed = True
+        workers, self._workers = self._workers, []
+        for task in workers:
+            task.cancel()
+        if workers:
+            await asyncio.gather(*workers, return_exceptions=True)
+        session, self._session = self._session, None
+        if session is not None and not session.closed:
+            try:
+                await session.close()
+            except Exception:  # pragma: no cover
+                pass
+
+    def _ensure_started(self) -> None:
+        if self._queue is None:
+            self._queue = asyncio.Queue(maxsize=self._max_queue)
+        if not self._workers:
+            self._workers = [
+                asyncio.create_task(self._worker()) for _ in range(self._concurrency)
+            ]
+
+    async def _ensure_session(self) -> Any:
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=self._concurrency, keepalive_timeout=60)
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=10),
+                headers={
+                    'Authorization': f'Bearer {self._api_key}',
+                    'Content-Type': 'application/json',
+                    'Accept': 'application/json',
+                },
+            )
+        return self._session
+
+    async def _next_batch(
+        self, first: tuple[dict[str, Any], int]
+    ) -> tuple[list[dict[str, Any]], tuple[dict[str, Any] | list[dict[str, Any]], int] | None]:
+        """Collect envelopes that can share a send with ``first``.
+
+        Returns the batch plus an item that was dequeued but did not fit, which
+        the caller must send next to preserve ordering.
+        """
+        envelope, size = first
+        if self._coalesce_window <= 0 or size > SMALL_ENVELOPE_BYTES:
+            return [envelope], None
+        assert self._queue is not None
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self._coalesce_window
+        batch = [envelope]
+        total = size
+        while len(batch) < self._coalesce_max:
+            try:
+                item = self._queue.get_nowait()
+            except asyncio.QueueEmpty:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self._queue.get(), remaining)
+                except asyncio.TimeoutError:
+                    break
+            if item[1] > SMALL_ENVELOPE_BYTES or total + item[1] > MAX_BATCH_BYTES:
+                return batch, item
+            batch.append(item[0])
+            total += item[1]
+            # Extra items are accounted for here; the first is done by the worker.
+            self._queue.task_done()
+        return batch, None
+
+    async def _worker(self) -> None:
+        assert self._queue is not None
+        carry: tuple[dict[str, Any] | list[dict[str, Any]], int] | None = None
+        while True:
+            item = carry if carry is not None else await self._queue.get()
+            carry = None
+            try:
+                if isinstance(item[0], list):
+                    await self._post_chunks(item[0])
+                    continue
+                batch, carry = await self._next_batch(item)
+                if len(batch) == 1:
+                    data = batch[0]
+                else:
+                    data = {'v': 1, 'kind': BATCH_KIND, 'items': batch}
+                    self._stats.batches += 1
+                    self._stats.coalesced += len(batch) - 1
+                await self._post(data, count=len(batch))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:  # pragma: no cover
+                self._log.warning('app-message worker error', error=str(e))
+            finally:
+                self._queue.task_done()
+
+    async def _post_chunks(self, chunks: list[dict[str, Any]]) -> None:
+        for index, chunk in enumerate(chunks):
+            if index and self._chunk_interval:
+                # Pace fragments so one large payload does not trip Daily rate limits
+                await asyncio.sleep(self._chunk_interval)
+            if not await self._post(chunk):
+                # The browser cannot reassemble the message without this fragment
+                self._stats.failed += len(chunks) - index - 1
+                return
+
+    async def _post(self, data: dict[str, Any], *, count: int = 1) -> bool:
+        if aiohttp is None:
+            return False
+        session = await self._ensure_session()
+        try:
+            async with session.post(self.url, json={"data": data, "recipient": "*"}) as resp:
+                if resp.status >= 300:
+                    self._stats.failed += count
+                    txt = await resp.text()
+                    # Suppress 404 warnings when room is not hosting a call (common during startup/shutdown)
+                    if resp.status == 404:
+                        self._log.debug(
+                            'http app-message send skipped (room inactive)',
+                            status=resp.status,
+                            body=txt[:100],
+                        )
+                    elif not self._warned_http_error:
+                        self._log.warning(
+                            'http app-message send failed',
+                            status=resp.status,
+                            body=txt[:300],
+                        )
+                        self._warned_http_error = True
+                    return False
+                self._stats.sent += count
+                self._log.debug('http app-message sent', status=resp.status, count=count)
+                return True
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:  # pragma: no cover
+            self._stats.failed += count
+            if not self._warned_http_error:
+                self._log.warning('http send exception', error=str(e))
+                self._warned_http_error = True
+            return False
+
+
+__all__ = [
+    "BATCH_KIND",
+    "CHUNK_KIND",
+    "DAILY_MESSAGE_LIMIT",
+    "PooledAppMessageTransport",
+    "TransportStats",
+    "chunk_envelope",
+]
@@ -0,0 +1,196 @@
+"""Process-wide subscriber for ``bot:config:room:*`` updates.
+
+Every session in the process shares one pattern subscription; sessions
+register a callback for their room and the subscriber routes messages through
+an in-memory table. Publishers also append each update to ``CONFIG_STREAM``
+so that after a reconnect the newest missed update per room is replayed.
+"""
+
+import asyncio
+import os
+from typing import Any, Callable, Dict, List, Optional
+
+import redis.asyncio as redis
+from loguru import logger
+
+from core.config import BOT_PID
+
+CONFIG_CHANNEL_PREFIX = "bot:config:room:"
+CONFIG_LATEST_PREFIX = "bot:config:latest:"
+CONFIG_STREAM = "bot:config:stream"
+CONFIG_STREAM_MAXLEN = 1000
+
+_MIN_BACKOFF_SECS = 0.5
+_MAX_BACKOFF_SECS = 10.0
+
+ConfigCallback = Callable[[str], None]
+
+
+def config_channel(room_url: str) -> str:
+    return f"{CONFIG_CHANNEL_PREFIX}{room_url}"
+
+
+def _stream_fields(room_url: str, payload: str) -> Dict[str, str]:
+    return {"room_url": room_url, "payload": payload}
+
+
+async def publish_config(client: Any, room_url: str, payload: str) -> None:
+    """Record a config update in the catch-up stream and publish it (async client)."""
+    await client.xadd(
+        CONFIG_STREAM,
+        _stream_fields(room_url, payload),
+        maxlen=CONFIG_STREAM_MAXLEN,
+        approximate=True,
+    )
+    await client.publish(config_channel(room_url), payload)
+
+
+def publish_config_sync(client: Any, room_url: str, payload: str) -> None:
+    """Synchronous variant of :func:`publish_config` for the gateway."""
+    client.xadd(
+        CONFIG_STREAM,
+        _stream_fields(room_url, payload),
+        maxlen=CONFIG_STREAM_MAXLEN,
+        approximate=True,
+    )
+    client.publish(config_channel(room_url), payload)
+
+
+def _redis_from_env() -> Any:
+    redis_url = os.getenv("REDIS_URL", "redis://localhost:6379")
+    password = (
+        os.getenv("REDIS_SHARED_SECRET")
+        if os.getenv("REDIS_AUTH_REQUIRED", "false").lower() == "true"
+        else None
+    )
+    return redis.from_url(redis_url, password=password, decode_responses=True)
+
+
+class ConfigSubscriber:
+    """One pub/sub connection fanning config updates out to registered sessions.
+
+    The subscription starts with the first registration and is torn down when
+    the last session unregisters. Config messages are last-writer-wins state,
+    so catch-up after a reconnect only replays the newest missed entry per
+    room, and skips it when it matches what that room last received.
+    """
+
+    def __init__(self, client_factory: Callable[[], Any] = _redis_from_env):
+        self._client_factory = client_factory
+        self._client: Any = None
+        self._routes: Dict[str, List[ConfigCallback]] = {}
+        self._last_payload: Dict[str, str] = {}
+        self._cursor: Optional[str] = None
+        self._task: Optional[asyncio.Task] = None
+        self.live = asyncio.Event()
+        self.reconnects = 0
+        self.replayed = 0
+
+    @property
+    def client(self) -> Any:
+        if self._client is None:
+            self._client = self._client_factory()
+        return self._client
+
+    def register(self, room_url: str, callback: ConfigCallback) -> Callable[[], None]:
+        """Route updates for ``room_url`` to ``callback``; returns an unregister function."""
+        self._routes.setdefault(room_url, []).append(callback)
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(), name="config-subscriber")
+
+        def unregister() -> None:
+            callbacks = self._routes.get(room_url)
+            if callbacks and callback in callbacks:
+                callbacks.remove(callback)
+            if not callbacks:
+                self._routes.pop(room_url, None)
+                self._last_payload.pop(room_url, None)
+            if not self._routes and self._task is not None:
+                self._task.cancel()
+                self._task = None
+
+        return unregister
+
+    async def latest_config(self, room_url: str) -> Optional[str]:
+        """Config persisted for a room before its session subscribed, if any."""
+        return await self.client.get(f"{CONFIG_LATEST_PREFIX}{room_url}")
+
+    def _dispatch(self, room_url: str, payload: str) -> None:
+        callbacks = self._routes.get(room_url)
+        if not callbacks:
+            return
+        self._last_payload[room_url] = payload
+        for callback in list(callbacks):
+            try:
+                callback(payload)
+            except Exception as e:
+                logger.error(f"[{BOT_PID}] [config.subscriber] Handler for {room_url} failed: {e}")
+
+    async def _catch_up(self, client: Any) -> None:
+        if self._cursor is None:
+            # First subscription: sessions read the latest-config key for anything older
+            newest = await client.xrevrange(CONFIG_STREAM, count=1)
+            self._cursor = newest[0][0] if newest else "0-0"
+            return
+        missed: Dict[str, str] = {}
+        for entry_id, fields in await client.xrange(CONFIG_STREAM, min=self._cursor):
+            if entry_id == self._cursor:
+                continue
+            self._cursor = entry_id
+            room_url = fields.get("room_url")
+            if room_url in self._routes:
+                missed[room_url] = fields.get("payload", "")
+        for room_url, payload in missed.items():
+            if payload and payload != self._last_payload.get(room_url):
+                self.replayed += 1
+                self._dispatch(room_url, payload)
+
+    async def _run(self) -> None:
+        client = self._client_factory()
+        self._cursor = None
+        backoff = _MIN_BACKOFF_SECS
+        try:
+            while self._routes:
+                pubsub = client.pubsub()
+                try:
+                    await pubsub.psubscribe(f"{CONFIG_CHANNEL_PREFIX}*")
+                    async for message in pubsub.listen():
+                        if message["type"] == "psubscribe":
+                            await self._catch_up(client)
+                            self.live.set()
+                            backoff = _MIN_BACKOFF_SECS
+                        elif message["type"] == "pmessage":
+                            room_url = message["channel"][len(CONFIG_CHANNEL_PREFIX):]
+                            self._dispatch(room_url, message["data"])
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    logger.warning(f"[{BOT_PID}] [config.subscriber] Subscription lost: {e}")
+                finally:
+                    self.live.clear()
+                    try:
+                        await pubsub.aclose()
+                    except Exception:
+                        pass
+                self.reconnects += 1
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, _MAX_BACKOFF_SECS)
+        finally:
+            try:
+                await client.aclose()
+            except Exception:
+                pass
+
+
+_subscriber: Optional[ConfigSubscriber] = None
+_subscriber_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def get_config_subscriber() -> ConfigSubscriber:
+    """Return the subscriber for the running event loop, creating it on first use."""
+    global _subscriber, _subscriber_loop
+    loop = asyncio.get_running_loop()
+    if _subscriber is None or _subscriber_loop is not loop:
+        _subscriber = ConfigSubscriber()
+        _subscriber_loop = loop
+    return _subscriber
@@ -0,0 +1,322 @@
+"""Hedged streaming chat completions for the voice fast path.
+
+``NonBlockingToolRouter`` used to send one streaming request per turn and wait
+for it, so a slow upstream turned directly into dead air. ``HedgedLLM`` wraps
+the primary endpoint (and an optional backup provider/model):
+
+* the primary request starts immediately;
+* if its first token has not arrived within a deadline derived from the
+  primary's observed first-token latency percentile (``BOT_HEDGE_PERCENTILE``,
+  clamped to ``BOT_HEDGE_MIN_DELAY_MS``..``BOT_HEDGE_MAX_DELAY_MS``), or it
+  fails before producing a token, the backup request is fired;
+* whichever streams a token first wins and the other request is cancelled.
+
+Endpoints speak the OpenAI-compatible ``/chat/completions`` SSE protocol.
+Hedging is opt-in (``BOT_HEDGE_ENABLED`` plus ``BOT_HEDGE_MODEL``); without a
+backup the wrapper is a plain stream that still records first-token latency.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import math
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Callable
+
+import aiohttp
+from loguru import logger
+
+from core.config import (
+    BOT_HEDGE_API_KEY,
+    BOT_HEDGE_API_URL,
+    BOT_HEDGE_ENABLED,
+    BOT_HEDGE_INITIAL_DELAY_MS,
+    BOT_HEDGE_MAX_DELAY_MS,
+    BOT_HEDGE_MIN_DELAY_MS,
+    BOT_HEDGE_MODEL,
+    BOT_HEDGE_PERCENTILE,
+)
+
+# First-token samples kept per endpoint for the percentile deadline
+LATENCY_WINDOW = 200
+# Below this many samples the configured initial deadline is used
+MIN_SAMPLES = 8
+
+
+class LLMStreamError(Exception):
+    """Upstream answered with a non-200 status."""
+
+    def __init__(self, endpoint: str, status: int, body: str):
+        super().__init__(f"{endpoint} returned {status}: {body[:200]}")
+        self.endpoint = endpoint
+        self.status = status
+        self.body = body
+
+
+@dataclass(frozen=True)
+class LLMEndpoint:
+    name: str
+    api_url: str
+    api_key: str
+    model: str
+    headers: tuple[tuple[str, str], ...] = ()
+
+    async def stream(
+        self,
+        session: aiohttp.ClientSession,
+        messages: Any,
+        *,
+        timeout: aiohttp.ClientTimeout,
+        **params: Any,
+    ) -> AsyncIterator[str]:
+        """Stream content deltas of one chat completion."""
+        payload = {"model": self.model, "messages": messages, "stream": True, **params}
+        headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json",
+            **dict(self.headers),
+        }
+        async with session.post(
+            f"{self.api_url}/chat/completions", json=payload, headers=headers, timeout=timeout
+        ) as resp:
+            if resp.status != 200:
+                raise LLMStreamError(self.name, resp.status, await resp.text())
+            async for raw_line in resp.content:
+                line = raw_line.decode("utf-8", errors="replace").strip()
+                if not line.startswith("data:"):
+                    continue
+                data_str = line[len("data:"):].strip()
+                if data_str == "[DONE]":
+                    return
+                try:
+                    chunk = json.loads(data_str)
+                    content = chunk.get("choices", [{}])[0].get("delta", {}).get("content")
+                except (ValueError, IndexError, KeyError, AttributeError):
+                    continue
+                if content:
+                    yield content
+
+
+class FirstTokenStats:
+    """Rolling first-token latencies (seconds) for one endpoint."""
+
+    def __init__(self, window: int = LATENCY_WINDOW):
+        self._samples: deque[float] = deque(maxlen=window)
+
+    def record(self, seconds: float) -> None:
+        self._samples.append(seconds)
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def percentile(self, q: float) -> float | None:
+        if not self._samples:
+            return None
+        ordered = sorted(self._samples)
+        index = min(len(ordered) - 1, max(0, math.ceil(q * len(ordered)) - 1))
+        return ordered[index]
+
+
+class _Attempt:
+    """One in-flight request feeding its chunks into a queue."""
+
+    _DONE = object()
+
+    def __init__(self, endpoint: LLMEndpoint, factory: Callable[[], AsyncIterator[str]]):
+        self.endpoint = endpoint
+        self.started = time.monotonic()
+        self.first: asyncio.Future[float] = asyncio.get_running_loop().create_future()
+        self.queue: asyncio.Queue[Any] = asyncio.Queue()
+        self.task = asyncio.create_task(self._run(factory), name=f"llm-hedge:{endpoint.name}")
+
+    async def _run(self, factory: Callable[[], AsyncIterator[str]]) -> None:
+        try:
+            async for chunk in factory():
+                if not self.first.done():
+                    self.first.set_result(time.monotonic() - self.started)
+                self.queue.put_nowait(chunk)
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            if not self.first.done():
+                self.first.set_exception(exc)
+            else:
+                self.queue.put_nowait(exc)
+            return
+        if not self.first.done():
+            self.first.set_exception(_EmptyCompletion(self.endpoint.name))
+        self.queue.put_nowait(self._DONE)
+
+    async def chunks(self) -> AsyncIterator[str]:
+        while True:
+            item = await self.queue.get()
+            if item is self._DONE:
+                return
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+
+    def cancel(self) -> None:
+        if not self.first.done():
+            self.first.cancel()
+        elif not self.first.cancelled():
+            self.first.exception()  # mark retrieved; failures were already handled
+        self.task.cancel()
+
+
+class _EmptyCompletion(Exception):
+    pass
+
+
+class HedgedLLM:
+    """Primary endpoint with an optional backup fired on a late first token."""
+
+    def __init__(
+        self,
+        primary: LLMEndpoint,
+        backup: LLMEndpoint | None = None,
+        *,
+        percentile: float = 0.9,
+        min_delay: float = 0.3,
+        max_delay: float = 2.5,
+        initial_delay: float = 1.2,
+    ):
+        self.primary = primary
+        self.backup = backup
+        self._percentile = percentile
+        self._min_delay = min_delay
+        self._max_delay = max(max_delay, min_delay)
+        self._initial_delay = initial_delay
+        self.stats: dict[str, FirstTokenStats] = {primary.name: FirstTokenStats()}
+        if backup is not None:
+            self.stats[backup.name] = FirstTokenStats()
+        # Time from request start to the first token that reached the caller
+        self.first_token = FirstTokenStats()
+        self.requests = 0
+        self.hedges = 0
+        self.backup_wins = 0
+
+    @classmethod
+    def from_config(cls, primary: LLMEndpoint) -> "HedgedLLM":
+        backup = None
+        model = BOT_HEDGE_MODEL()
+        if BOT_HEDGE_ENABLED() and model:
+            backup = LLMEndpoint(
+                name="backup",
+                api_url=(BOT_HEDGE_API_URL() or primary.api_url).rstrip("/"),
+                api_key=BOT_HEDGE_API_KEY() or primary.api_key,
+                model=model,
+            )
+        return cls(
+            primary,
+            backup,
+            percentile=BOT_HEDGE_PERCENTILE(),
+            min_delay=BOT_HEDGE_MIN_DELAY_MS() / 1000.0,
+            max_delay=BOT_HEDGE_MAX_DELAY_MS() / 1000.0,
+            initial_delay=BOT_HEDGE_INITIAL_DELAY_MS() / 1000.0,
+        )
+
+    def hedge_delay(self) -> float:
+        """Seconds to wait for the primary's first token before hedging."""
+        stats = self.stats[self.primary.name]
+        observed = stats.percentile(self._percentile) if len(stats) >= MIN_SAMPLES else None
+        delay = self._initial_delay if observed is None else observed
+        return min(self._max_delay, max(self._min_delay, delay))
+
+    async def stream(
+        self,
+        session: aiohttp.ClientSession,
+        messages: Any,
+        *,
+        timeout: aiohttp.ClientTimeout,
+        **params: Any,
+    ) -> AsyncIterator[str]:
+        """Stream the first endpoint to produce a token; cancel the other.
+
+        Raises the last upstream error if no endpoint produced a token. Close
+        the generator (``contextlib.aclosing``) to cancel in-flight requests
+        when the caller stops early.
+        """
+
+        def factory(endpoint: LLMEndpoint) -> Callable[[], AsyncIterator[str]]:
+            return lambda: endpoint.stream(session, messages, timeout=timeout, **params)
+
+        self.requests += 1
+        started = time.monotonic()
+        attempts = [_Attempt(self.primary, factory(self.primary))]
+        hedge_at = started + self.hedge_delay()
+        hedged = self.backup is None
+        winner: _Attempt | None = None
+        error: BaseException | None = None
+        try:
+            while winner is None:
+                live = [a for a in attempts if not a.first.done()]
+                if not hedged and (not live or time.monotonic() >= hedge_at):
+                    # Deadline passed, or the primary failed before a token
+                    hedged = True
+                    self.hedges += 1
+                    logger.info(
+                        f"[llm-hedge] No first token from {self.primary.name} after "
+                        f"{time.monotonic() - started:.2f}s; firing {self.backup.name}"
+                    )
+                    attempts.append(_Attempt(self.backup, factory(self.backup)))
+                    continue
+                if not live:
+                    break
+                await asyncio.wait(
+                    [a.first for a in live],
+                    timeout=None if hedged else max(0.0, hedge_at - time.monotonic()),
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                for attempt in live:
+                    if not attempt.first.done():
+                        continue
+                    exc = attempt.first.exception()
+                    if exc is None:
+                        winner = attempt
+                        break
+                    if not isinstance(exc, _EmptyCompletion):
+                        error = exc
+
+            if winner is None:
+                if error is not None:
+                    raise error
+                return
+
+            self._record(winner, attempts, started)
+            for attempt in attempts:
+                if attempt is not winner:
+                    attempt.cancel()
+            async for chunk in winner.chunks():
+                yield chunk
+        finally:
+            for attempt in attempts:
+                attempt.cancel()
+
+    def _record(self, winner: _Attempt, attempts: list[_Attempt], started: float) -> None:
+        now = time.monotonic()
+        self.first_token.record(now - started)
+        self.stats[winner.endpoint.name].record(winner.first.result())
+        if winner.endpoint is not self.primary:
+            self.backup_wins += 1
+            # The primary's latency is at least this long; keep the deadline honest
+            for attempt in attempts:
+                if attempt.endpoint is self.primary:
+                    self.stats[self.primary.name].record(now - attempt.started)
+
+    def summary(self) -> dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "hedges": self.hedges,
+            "backup_wins": self.backup_wins,
+            "first_token_p50_ms": _ms(self.first_token.percentile(0.5)),
+            "first_token_p99_ms": _ms(self.first_token.percentile(0.99)),
+            "hedge_delay_ms": _ms(self.hedge_delay()),
+        }
+
+
+def _ms(seconds: float | None) -> float | None:
+    return None if seconds is None else round(seconds * 1000.0, 1)
@@ -30,7 +30,9 @@ def _log():
 _DEFAULT_TIMEOUT_SECS = 10
 
 class MeshClientError(RuntimeError):
-    pass
+    def __init__(self, message: str, status: int | None = None) -> None:
+        super().__init__(message)
+        self.status = status  # HTTP status, when Mesh answered
 
 
 def _base_url() -> str:
@@ -181,7 +183,7 @@ async def _handle_response(request_log: Any, method: str, url: str, resp: aiohtt
     )
 
     if resp.status >= 400:
-        raise MeshClientError(f"Mesh {method} {url} failed {resp.status}: {txt[:200]}")
+        raise MeshClientError(f"Mesh {method} {url} failed {resp.status}: {txt[:200]}", status=resp.status)
     if not txt:
         return None
     if parsed is not None:
@@ -275,7 +277,8 @@ async def request(
             "data": any,           # Response data (list or dict)
             "total": int,          # Optional: total count
             "hasMore": bool,       # Optional: pagination flag
-            "error": str           # Optional: error message (if success=False)
+            "error": str,          # Optional: error message (if success=False)
+            "status": int          # Optional: HTTP status of a failed request
         }
         
     Example:
@@ -302,7 +305,7 @@ async def request(
             
         except MeshClientError as e:
             request_log.error("mesh request failed", error=str(e))
-            return {"success": False, "error": str(e)}
+            return {"success": False, "error": str(e), "status": e.status}
         except Exception as e:
             request_log.error("mesh unexpected error", error=str(e), exc_info=True)
             return {"success": False, "error": f"Unexpected error: {e}"}
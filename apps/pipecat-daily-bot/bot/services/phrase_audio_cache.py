@@ -0,0 +1,257 @@
+"""Pre-synthesized audio for filler and tool-narration phrases.
+
+The "instant" fillers spoken by ``OpenClawSessionProcessor`` and the phrases
+emitted by ``ToolNarrationProcessor`` come from small fixed banks, yet every
+utterance used to wait on a live Kokoro/PocketTTS round trip. This cache keeps
+rendered PCM keyed by ``(provider, voice, speed, text)`` so a TTS service can
+push the frames straight into the pipeline on a hit and fall back to live
+synthesis on a miss.
+
+Phrases are rendered in the background when a pipeline is built
+(``warm_phrase_cache``); the cache is process-wide, so warm-pool runners pay
+the cost once. With ``BOT_PHRASE_CACHE_DIR`` set, renders are also stored as
+WAV files and survive restarts.
+
+Providers opt in by implementing ``phrase_cache_key(text)`` and
+``async render_phrase(text) -> CachedPhrase | None``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import os
+import statistics
+import time
+import wave
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from typing import Any, Iterable
+
+from loguru import logger
+from pipecat.frames.frames import TTSAudioRawFrame
+
+from core.config import (
+    BOT_PHRASE_CACHE_DIR,
+    BOT_PHRASE_CACHE_ENABLED,
+    BOT_PHRASE_CACHE_MAX_ENTRIES,
+    BOT_PHRASE_CACHE_RENDER_TIMEOUT_SECS,
+)
+from utils.clause_text_aggregator import ClauseTextAggregator
+
+PhraseKey = tuple[str, str, float, str]
+
+# Matches the 20ms chunking used by the live PocketTTS stream
+FRAME_MS = 20
+
+
+def normalize_phrase(text: str) -> str:
+    return " ".join(text.split())
+
+
+def phrase_key(provider: str, voice: str | None, speed: float | None, text: str) -> PhraseKey:
+    return (provider, voice or "", float(speed or 1.0), normalize_phrase(text))
+
+
+@dataclass(frozen=True)
+class CachedPhrase:
+    audio: bytes
+    sample_rate: int
+    num_channels: int = 1
+
+    def frames(self, frame_ms: int = FRAME_MS) -> list[TTSAudioRawFrame]:
+        """Split the rendered audio into transport-sized frames."""
+        step = max(1, self.sample_rate * frame_ms // 1000) * self.num_channels * 2
+        return [
+            TTSAudioRawFrame(self.audio[i:i + step], self.sample_rate, self.num_channels)
+            for i in range(0, len(self.audio), step)
+        ]
+
+
+class PhraseAudioCache:
+    """LRU of rendered phrases with an optional WAV directory behind it."""
+
+    def __init__(self, *, max_entries: int = 256, cache_dir: str | None = None):
+        self._max_entries = max(1, max_entries)
+        self._cache_dir = cache_dir or None
+        self._entries: OrderedDict[PhraseKey, CachedPhrase] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._first_audio_ms: dict[str, deque[float]] = {
+            "hit": deque(maxlen=256),
+            "miss": deque(maxlen=256),
+        }
+        if self._cache_dir:
+            os.makedirs(self._cache_dir, exist_ok=True)
+
+    def _path(self, key: PhraseKey) -> str | None:
+        if not self._cache_dir:
+            return None
+        digest = hashlib.sha1(repr(key).encode("utf-8")).hexdigest()
+        return os.path.join(self._cache_dir, f"{digest}.wav")
+
+    def _remember(self, key: PhraseKey, phrase: CachedPhrase) -> None:
+        self._entries[key] = phrase
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def _load(self, key: PhraseKey) -> CachedPhrase | None:
+        path = self._path(key)
+        if not path or not os.path.exists(path):
+            return None
+        try:
+            with wave.open(path, "rb") as wf:
+                phrase = CachedPhrase(
+                    audio=wf.readframes(wf.getnframes()),
+                    sample_rate=wf.getframerate(),
+                    num_channels=wf.getnchannels(),
+                )
+        except (OSError, EOFError, wave.Error) as exc:
+            logger.warning(f"[phrase-cache] Unreadable cache file {path}: {exc}")
+            return None
+        self._remember(key, phrase)
+        return phrase
+
+    def store(self, key: PhraseKey, phrase: CachedPhrase) -> None:
+        """Write a phrase to the disk cache only (blocking; safe to run in a thread)."""
+        path = self._path(key)
+        if not path:
+            return
+        tmp = f"{path}.tmp"
+        try:
+            with wave.open(tmp, "wb") as wf:
+                wf.setnchannels(phrase.num_channels)
+                wf.setsampwidth(2)
+                wf.setframerate(phrase.sample_rate)
+                wf.writeframes(phrase.audio)
+            os.replace(tmp, path)
+        except OSError as exc:
+            logger.warning(f"[phrase-cache] Failed to write {path}: {exc}")
+
+    def contains(self, key: PhraseKey) -> bool:
+        return key in self._entries or self._load(key) is not None
+
+    def get(self, key: PhraseKey) -> CachedPhrase | None:
+        phrase = self._entries.get(key)
+        if phrase is not None:
+            self._entries.move_to_end(key)
+        else:
+            phrase = self._load(key)
+        if phrase is None:
+            self._misses += 1
+        else:
+            self._hits += 1
+        return phrase
+
+    def put(self, key: PhraseKey, phrase: CachedPhrase, *, persist: bool = True) -> None:
+        self._remember(key, phrase)
+        if persist:
+            self.store(key, phrase)
+
+    def record_first_audio(self, hit: bool, elapsed_ms: float) -> None:
+        """Time from TTS request to first audio frame, split by cache outcome."""
+        self._first_audio_ms["hit" if hit else "miss"].append(elapsed_ms)
+
+    def stats(self) -> dict[str, Any]:
+        first_audio = {
+            outcome: round(statistics.median(samples), 1) if samples else None
+            for outcome, samples in self._first_audio_ms.items()
+        }
+        return {
+            "entries": len(self._entries),
+            "hits": self._hits,
+            "misses": self._misses,
+            "first_audio_ms_p50": first_audio,
+        }
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._hits = self._misses = 0
+        for samples in self._first_audio_ms.values():
+            samples.clear()
+
+
+_cache: PhraseAudioCache | None = None
+
+
+def get_phrase_cache() -> PhraseAudioCache | None:
+    """Process-wide cache, or ``None`` when ``BOT_PHRASE_CACHE_ENABLED`` is off."""
+    global _cache
+    if not BOT_PHRASE_CACHE_ENABLED():
+        return None
+    if _cache is None:
+        _cache = PhraseAudioCache(
+            max_entries=BOT_PHRASE_CACHE_MAX_ENTRIES(),
+            cache_dir=BOT_PHRASE_CACHE_DIR(),
+        )
+    return _cache
+
+
+def reset_phrase_cache() -> None:
+    global _cache
+    _cache = None
+
+
+async def phrase_segments(phrases: Iterable[str]) -> list[str]:
+    """Texts as the TTS service will receive them.
+
+    Phrases are aggregated before synthesis, so "One moment..." reaches the
+    provider as more than one request; render each segment as well as the
+    whole phrase so both shapes can hit.
+    """
+    texts: dict[str, None] = {}
+    for phrase in phrases:
+        phrase = normalize_phrase(phrase)
+        if not phrase:
+            continue
+        texts[phrase] = None
+        aggregator = ClauseTextAggregator()
+        segments = [aggregation.text async for aggregation in aggregator.aggregate(phrase)]
+        tail = await aggregator.flush()
+        if tail:
+            segments.append(tail.text)
+        for segment in segments:
+            if any(ch.isalnum() for ch in segment):
+                texts[normalize_phrase(segment)] = None
+    return list(texts)
+
+
+async def warm_phrase_cache(services: Iterable[Any], phrases: Iterable[str]) -> int:
+    """Render every uncached phrase for each service that supports it.
+
+    Failures and timeouts are logged and skipped; those phrases simply keep
+    using live synthesis. Returns the number of newly rendered phrases.
+    """
+    cache = get_phrase_cache()
+    if cache is None:
+        return 0
+    texts = await phrase_segments(phrases)
+    timeout = BOT_PHRASE_CACHE_RENDER_TIMEOUT_SECS()
+    rendered = 0
+    started = time.monotonic()
+    for service in services:
+        if not hasattr(service, "render_phrase") or not hasattr(service, "phrase_cache_key"):
+            continue
+        for text in texts:
+            key = service.phrase_cache_key(text)
+            if cache.contains(key):
+                continue
+            try:
+                phrase = await asyncio.wait_for(service.render_phrase(text), timeout)
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:  # noqa: BLE001
+                logger.warning(
+                    f"[phrase-cache] Render failed for {type(service).__name__} {text!r}: {exc}"
+                )
+                continue
+            if phrase is not None and phrase.audio:
+                cache.put(key, phrase, persist=False)
+                await asyncio.to_thread(cache.store, key, phrase)
+                rendered += 1
+    logger.info(
+        f"[phrase-cache] Warmed {rendered} phrases in {time.monotonic() - started:.1f}s",
+        **cache.stats(),
+    )
+    return rendered
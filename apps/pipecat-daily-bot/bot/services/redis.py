@@ -10,12 +10,16 @@ import asyncio
 import json
 import os
 import threading
+import time
 from datetime import datetime
 from typing import Any
 
 import redis.asyncio as redis
 from loguru import logger
 
+# Identity records and room index entries live for 24 hours
+IDENTITY_TTL_SECS = 86400
+
 
 def _redis_enabled() -> bool:
     """Return True only when USE_REDIS explicitly enables Redis."""
@@ -72,25 +76,60 @@ class RedisClient:
             return False
 
     # Identity Operations
+    #
+    # Each identity lives in its own hash (identity:{room}:{participant}, 24h
+    # TTL) for point reads. Writes also maintain a per-room index so "who is in
+    # this room" is a single pipelined round trip instead of a SCAN plus one
+    # HGETALL per key:
+    #   identity-room:{room}      hash   participant -> serialized identity
+    #   identity-room-exp:{room}  zset   participant -> expiry (epoch seconds)
+    # Expiry is driven by the sorted set; both index keys carry the same
+    # sliding TTL so abandoned rooms disappear on their own.
+
+    @staticmethod
+    def _identity_key(room_url: str, participant_id: str) -> str:
+        return f"identity:{room_url}:{participant_id}"
+
+    @staticmethod
+    def _identity_index_keys(room_url: str) -> tuple[str, str]:
+        return f"identity-room:{room_url}", f"identity-room-exp:{room_url}"
+
+    @staticmethod
+    def _decode_identity(record: dict[str, Any]) -> dict[str, Any] | None:
+        if not record or 'data' not in record:
+            return None
+        parsed_data = json.loads(record['data'])
+        return {
+            "participant_id": record['participant_id'],
+            "room_url": record['room_url'],
+            "timestamp": record['timestamp'],
+            **parsed_data
+        }
+
     async def write_identity(self, room_url: str, participant_id: str, identity_data: dict[str, Any]) -> None:
-        """Write identity to Redis."""
+        """Write identity to Redis and the room's identity index (one round trip)."""
         if not _redis_enabled():
             logger.debug("[redis-identity] Skipping write; USE_REDIS not true")
             return
         try:
             client = await self._get_redis()
-            identity_key = f"identity:{room_url}:{participant_id}"
-
-            # Store identity data
-            await client.hset(identity_key, mapping={
+            identity_key = self._identity_key(room_url, participant_id)
+            index_key, expiry_key = self._identity_index_keys(room_url)
+            record = {
                 "participant_id": participant_id,
                 "room_url": room_url,
                 "timestamp": datetime.now().isoformat(),
                 "data": json.dumps(identity_data)
-            })
+            }
 
-            # Set TTL (24 hours)
-            await client.expire(identity_key, 86400)
+            pipe = client.pipeline(transaction=True)
+            pipe.hset(identity_key, mapping=record)
+            pipe.expire(identity_key, IDENTITY_TTL_SECS)
+            pipe.hset(index_key, participant_id, json.dumps(record))
+            pipe.zadd(expiry_key, {participant_id: time.time() + IDENTITY_TTL_SECS})
+            pipe.expire(index_key, IDENTITY_TTL_SECS)
+            pipe.expire(expiry_key, IDENTITY_TTL_SECS)
+            await pipe.execute()
 
             logger.debug(f"[redis-identity] Stored identity for participant {participant_id}")
 
@@ -105,43 +144,38 @@ class RedisClient:
             return None
         try:
             client = await self._get_redis()
-            identity_key = f"identity:{room_url}:{participant_id}"
-            identity_data = await client.hgetall(identity_key)
-
-            if identity_data and 'data' in identity_data:
-                parsed_data = json.loads(identity_data['data'])
-                return {
-                    "participant_id": identity_data['participant_id'],
-                    "room_url": identity_data['room_url'],
-                    "timestamp": identity_data['timestamp'],
-                    **parsed_data
-                }
-            return None
+            identity_data = await client.hgetall(self._identity_key(room_url, participant_id))
+            return self._decode_identity(identity_data)
 
         except Exception as e:
             logger.debug(f"[redis-identity] Failed to read identity for {participant_id}: {e}")
             return None
 
     async def scan_identities(self, room_url: str) -> list[dict[str, Any]]:
-        """Scan all identities for a room."""
+        """All live identities for a room, read from the room index in one round trip."""
         if not _redis_enabled():
             logger.debug("[redis-identity] Skipping scan; USE_REDIS not true")
             return []
         try:
             client = await self._get_redis()
-            pattern = f"identity:{room_url}:*"
-            identities = []
+            index_key, expiry_key = self._identity_index_keys(room_url)
+            pipe = client.pipeline(transaction=False)
+            pipe.zrangebyscore(expiry_key, f"({time.time()}", "+inf")
+            pipe.hgetall(index_key)
+            live, records = await pipe.execute()
 
-            async for key in client.scan_iter(match=pattern):
-                identity_data = await client.hgetall(key)
-                if identity_data and 'data' in identity_data:
-                    parsed_data = json.loads(identity_data['data'])
-                    identities.append({
-                        "participant_id": identity_data['participant_id'],
-                        "room_url": identity_data['room_url'],
-                        "timestamp": identity_data['timestamp'],
-                        **parsed_data
-                    })
+            identities = []
+            for participant_id in live:
+                raw = records.get(participant_id)
+                if not raw:
+                    continue
+                try:
+                    identity = self._decode_identity(json.loads(raw))
+                except (TypeError, ValueError):
+                    logger.warning(f"[redis-identity] Invalid index entry for {participant_id} in {room_url}")
+                    continue
+                if identity is not None:
+                    identities.append(identity)
 
             return identities
 
@@ -150,23 +184,22 @@ class RedisClient:
             return []
 
     async def cleanup_expired_identities(self, room_url: str) -> int:
-        """Clean up expired identity keys for a room."""
+        """Drop index entries whose expiry has passed; returns how many were removed."""
         if not _redis_enabled():
             logger.debug("[redis-identity] Skipping cleanup; USE_REDIS not true")
             return 0
         try:
             client = await self._get_redis()
-            pattern = f"identity:{room_url}:*"
-            deleted_count = 0
-
-            async for key in client.scan_iter(match=pattern):
-                ttl = await client.ttl(key)
-                if ttl == -1:  # Key exists but no TTL set
-                    await client.expire(key, 86400)  # Set 24 hour TTL
-                elif ttl == -2:  # Key doesn't exist (expired)
-                    deleted_count += 1
-
-            return deleted_count
+            index_key, expiry_key = self._identity_index_keys(room_url)
+            expired = await client.zrangebyscore(expiry_key, "-inf", time.time())
+            if not expired:
+                return 0
+
+            pipe = client.pipeline(transaction=True)
+            pipe.hdel(index_key, *expired)
+            pipe.zrem(expiry_key, *expired)
+            await pipe.execute()
+            return len(expired)
 
         except Exception as e:
             logger.error(f"[redis-identity] Failed to cleanup identities for room {room_url}: {e}")
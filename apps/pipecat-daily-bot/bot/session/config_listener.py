@@ -3,27 +3,25 @@ import json
 import os
 import hashlib
 from loguru import logger
-import redis.asyncio as redis
 from core.config import BOT_PID
+from core.session_context import current_session_id, current_user_id, current_user_name, session_value
 from core.prompts import MULTI_USER_NOTE, SMART_SILENCE_NOTE
 from actions import personality_actions
 from room.state import get_room_tenant_id, set_desktop_mode
+from services.config_subscriber import config_channel, get_config_subscriber
 from tools.sprite_bot_config import set_bot_config, clear_bot_config
 from providers.elevenlabs import ElevenLabsTTSService
 from providers.kokoro import KokoroTTSService
 from pipecat.frames.frames import ManuallySwitchServiceFrame
 
-# Track last applied config hash to deduplicate repeated configs
-_last_config_hash: str | None = None
-
 # Lock for personality switching to prevent race conditions
 _personality_switch_lock = asyncio.Lock()
 
 
 def _context_logger(room_url: str):
-    session_id = os.getenv("BOT_SESSION_ID")
-    user_id = os.getenv("BOT_SESSION_USER_ID")
-    user_name = os.getenv("BOT_SESSION_USER_NAME")
+    session_id = current_session_id()
+    user_id = current_user_id()
+    user_name = current_user_name()
     return logger.bind(roomUrl=room_url, sessionId=session_id, userId=user_id, userName=user_name)
 
 
@@ -39,6 +37,9 @@ async def start_config_listener(
     """
     Listen for configuration updates on Redis channel bot:config:room:{room_url}
     Also checks for any pending config on startup.
+
+    Updates arrive through the process-wide ConfigSubscriber, so sessions share
+    a single pub/sub connection instead of opening one each.
     """
     log = _context_logger(room_url)
 
@@ -46,23 +47,21 @@ async def start_config_listener(
         log.info(f"[{BOT_PID}] [session.config] USE_REDIS not true; skipping config listener")
         return
 
-    redis_url = os.getenv("REDIS_URL", "redis://localhost:6379")
-    password = (
-        os.getenv("REDIS_SHARED_SECRET")
-        if os.getenv("REDIS_AUTH_REQUIRED", "false").lower() == "true"
-        else None
-    )
+    subscriber = get_config_subscriber()
+    updates: asyncio.Queue[str] = asyncio.Queue()
+    # Register before reading the pending config so nothing published in between is lost
+    unregister = subscriber.register(room_url, updates.put_nowait)
+    # Track last applied config hash to deduplicate repeated configs
+    last_config_hash: str | None = None
 
     try:
-        r = redis.from_url(redis_url, password=password, decode_responses=True)
-
         # 1. Check for pending config immediately
-        config_key = f"bot:config:latest:{room_url}"
-        pending_config = await r.get(config_key)
+        pending_config = await subscriber.latest_config(room_url)
         if pending_config:
             try:
                 data = json.loads(pending_config)
                 log.info(f"[{BOT_PID}] [session.config] Found pending config on startup: {data}")
+                last_config_hash = _config_hash(pending_config)
                 await apply_config_update(
                     data,
                     tts_service,
@@ -79,44 +78,44 @@ async def start_config_listener(
             except Exception as e:
                 log.error(f"[{BOT_PID}] [session.config] Failed to process pending config: {e}")
 
-        # 2. Subscribe to real-time updates
-        pubsub = r.pubsub()
-        # Subscribe to room-based channel
-        channel = f"bot:config:room:{room_url}"
-        await pubsub.subscribe(channel)
-
-        log.info(f"[{BOT_PID}] [session.config] Listening for config updates on {channel}")
+        # 2. Real-time updates routed by the shared subscriber
+        log.info(f"[{BOT_PID}] [session.config] Listening for config updates on {config_channel(room_url)}")
 
-        async for message in pubsub.listen():
-            if message["type"] == "message":
-                try:
-                    global _last_config_hash
-                    raw_data = message["data"]
-                    
-                    # Deduplicate: skip if this config matches the last one we processed
-                    config_hash = hashlib.sha256(raw_data if isinstance(raw_data, bytes) else raw_data.encode()).hexdigest()[:16]
-                    if config_hash == _last_config_hash:
-                        log.info(f"[{BOT_PID}] [session.config] Skipping duplicate config (hash={config_hash[:8]})")
-                        continue
-                    _last_config_hash = config_hash
-                    
-                    data = json.loads(raw_data)
-                    log.info(f"[{BOT_PID}] [session.config] Received config update: {data}")
-                    await apply_config_update(
-                        data,
-                        tts_service,
-                        context,
-                        flow_manager,
-                        room_url,
-                        task,
-                        sessionOverride,
-                        supported_features,
-                        log,
-                    )
-                except Exception as e:
-                    log.error(f"[{BOT_PID}] [session.config] Failed to process config update: {e}")
+        while True:
+            raw_data = await updates.get()
+            try:
+                # Deduplicate: skip if this config matches the last one we processed
+                config_hash = _config_hash(raw_data)
+                if config_hash == last_config_hash:
+                    log.info(f"[{BOT_PID}] [session.config] Skipping duplicate config (hash={config_hash[:8]})")
+                    continue
+                last_config_hash = config_hash
+
+                data = json.loads(raw_data)
+                log.info(f"[{BOT_PID}] [session.config] Received config update: {data}")
+                await apply_config_update(
+                    data,
+                    tts_service,
+                    context,
+                    flow_manager,
+                    room_url,
+                    task,
+                    sessionOverride,
+                    supported_features,
+                    log,
+                )
+            except Exception as e:
+                log.error(f"[{BOT_PID}] [session.config] Failed to process config update: {e}")
+    except asyncio.CancelledError:
+        raise
     except Exception as e:
         log.error(f"[{BOT_PID}] [session.config] Config listener failed: {e}")
+    finally:
+        unregister()
+
+
+def _config_hash(raw_data) -> str:
+    return hashlib.sha256(raw_data if isinstance(raw_data, bytes) else raw_data.encode()).hexdigest()[:16]
 
 
 async def apply_config_update(
@@ -157,6 +156,10 @@ async def apply_config_update(
             index = tts_service.mode_map[mode]
             log.info(f"[{BOT_PID}] [session.config] Switching to service index {index} for mode '{mode}'")
 
+            # Modes may share a provider service; apply this mode's voice first
+            if hasattr(tts_service, "prepare_mode"):
+                await tts_service.prepare_mode(mode)
+
             # Resolve the service instance
             if (
                 hasattr(tts_service, "services")
@@ -209,7 +212,7 @@ async def apply_config_update(
     # Update Voice
     if config.get("voice"):
         new_voice = config["voice"]
-        voice_provider = config.get("voiceProvider") or os.getenv("BOT_TTS_PROVIDER")
+        voice_provider = config.get("voiceProvider") or session_value("tts_provider")
 
         # Handle case where voice is a config object (from frontend) rather than just an ID string
         voice_id_to_set = new_voice
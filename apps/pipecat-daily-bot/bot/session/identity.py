@@ -1,10 +1,10 @@
 import asyncio
-import os
 from typing import Any, Dict
 
 from loguru import logger
 
 from core.config import BOT_PID
+from core.session_context import current_user_email, current_user_id, current_user_name
 from eventbus import emit_participant_join, events as _eb_events
 from eventbus.bus import subscribe as _eb_subscribe
 from services.redis import get_redis_client
@@ -41,9 +41,9 @@ class IdentityManager:
     def _seed_pending_identity(self):
         """Seed pending identity from environment variables."""
         try:
-            eid = os.getenv("BOT_SESSION_USER_ID")
-            ename = os.getenv("BOT_SESSION_USER_NAME")
-            eemail = os.getenv("BOT_SESSION_USER_EMAIL")
+            eid = current_user_id()
+            ename = current_user_name()
+            eemail = current_user_email()
             tmp: Dict[str, str] = {}
             if isinstance(eid, str) and eid.strip():
                 tmp["sessionUserId"] = eid.strip()
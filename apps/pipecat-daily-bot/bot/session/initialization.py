@@ -9,6 +9,7 @@ from loguru import logger as base_logger
 
 from actions import personality_actions
 from core.config import BOT_PID
+from core.session_context import current_session_id, current_user_id, current_user_name
 from tools import toolbox
 from room.state import set_room_tenant_id
 
@@ -26,9 +27,9 @@ async def initialize_session_config(
     """Initialize session configuration, fetching personality and prompts."""
     logger = base_logger.bind(
         roomUrl=room_url,
-        sessionId=os.getenv("BOT_SESSION_ID"),
-        userId=os.getenv("BOT_SESSION_USER_ID"),
-        userName=os.getenv("BOT_SESSION_USER_NAME"),
+        sessionId=current_session_id(),
+        userId=current_user_id(),
+        userName=current_user_name(),
     )
     
     # Store tenant_id for note operations
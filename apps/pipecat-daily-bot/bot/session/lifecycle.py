@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import asyncio
 import os
-from typing import Any
+from typing import Any, Callable
 
 from loguru import logger
 
@@ -10,26 +10,38 @@ from core.config import (
     BOT_PID,
     BOT_EMPTY_INITIAL_SECS,
     BOT_EMPTY_POST_LEAVE_SECS,
+    BOT_ROLLING_SUMMARY_POLL_SECS,
+    BOT_ROLLING_SUMMARY_TURNS,
     BOT_VOICE_ONLY,
 )
+from core.session_context import current_session_id, current_user_id
+from core.utils import append_text
 from session.participants import ParticipantManager
 from session.participant_data import extract_user_metadata
 from actions import profile_actions
 
-async def generate_conversation_summary(messages: list[dict[str, Any]]) -> str | None:
-    """Generate a concise summary of conversation messages using Groq (Llama) or fallback."""
+def _conversation_messages(messages: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    return [msg for msg in messages if msg.get("role") in ("user", "assistant") and msg.get("content")]
+
+
+async def generate_conversation_summary(
+    messages: list[dict[str, Any]],
+    previous_summary: str | None = None,
+) -> str | None:
+    """Generate a concise summary of conversation messages using Groq (Llama) or fallback.
+
+    With ``previous_summary``, ``messages`` are only the messages since that
+    summary and the result is the updated summary.
+    """
     try:
         from openai import AsyncOpenAI
         
         # Filter to user and assistant messages only
-        conversation_messages = [
-            msg for msg in messages
-            if msg.get("role") in ("user", "assistant") and msg.get("content")
-        ]
+        conversation_messages = _conversation_messages(messages)
         
         if not conversation_messages:
             logger.info(f"[{BOT_PID}] No conversation messages to summarize")
-            return None
+            return previous_summary
         
         # Prefer Groq (no OpenAI dependency), fall back to OpenAI if no Groq key
         groq_key = os.getenv("GROQ_API_KEY")
@@ -42,20 +54,110 @@ async def generate_conversation_summary(messages: list[dict[str, Any]]) -> str |
         else:
             client = AsyncOpenAI(api_key=os.getenv("OPENAI_API_KEY"))
             model = "gpt-4o-mini"
-        
-        response = await client.chat.completions.create(
-            model=model,
-            messages=[
+
+        if previous_summary:
+            prompt = [
+                {
+                    "role": "system",
+                    "content": "Update the running summary of a conversation with the new messages. "
+                    "Reply with the complete updated summary, kept concise.",
+                },
+                {
+                    "role": "user",
+                    "content": json.dumps({"summary": previous_summary, "new_messages": conversation_messages}),
+                },
+            ]
+        else:
+            prompt = [
                 {"role": "system", "content": "Summarize the following conversation concisely."},
                 {"role": "user", "content": json.dumps(conversation_messages)}
             ]
-        )
+
+        response = await client.chat.completions.create(model=model, messages=prompt)
         return response.choices[0].message.content
         
     except Exception as e:
         logger.error(f"[{BOT_PID}] Failed to generate summary: {e}")
         return None
 
+
+class RollingSummary:
+    """Keeps a conversation summary current while the session runs.
+
+    Once ``every`` new user/assistant messages have accumulated, only those
+    messages and the previous summary are sent to the summarizer. ``finish``
+    folds in whatever arrived since the last update, so the work left for
+    teardown does not grow with meeting length.
+    """
+
+    def __init__(
+        self,
+        source: Callable[[], list[dict[str, Any]]],
+        *,
+        every: int,
+        poll_secs: float,
+    ):
+        self._source = source
+        self._every = max(1, every)
+        self._poll_secs = poll_secs
+        self.summary: str | None = None
+        # User/assistant messages already folded into the summary
+        self.summarized = 0
+        self._last: dict[str, Any] | None = None
+        self._lock = asyncio.Lock()
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="rolling-summary")
+
+    async def stop(self) -> None:
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self._poll_secs)
+            try:
+                await self.update()
+            except Exception as e:
+                logger.warning(f"[{BOT_PID}] Rolling summary update failed: {e}")
+
+    def _pending(self) -> list[dict[str, Any]]:
+        conversation = _conversation_messages(self._source() or [])
+        if self._last is not None:
+            for index in range(len(conversation) - 1, -1, -1):
+                if conversation[index] is self._last:
+                    return conversation[index + 1:]
+        if self.summarized <= len(conversation):
+            return conversation[self.summarized:]
+        # The context was rewritten (e.g. a flow reset); only the tail is new
+        return conversation[-self._every:]
+
+    async def update(self, *, final: bool = False) -> None:
+        async with self._lock:
+            pending = self._pending()
+            if not pending or (len(pending) < self._every and not final):
+                return
+            summary = await generate_conversation_summary(pending, previous_summary=self.summary)
+            if summary:
+                self.summary = summary
+                self.summarized += len(pending)
+                self._last = pending[-1]
+                logger.debug(
+                    f"[{BOT_PID}] Rolling summary updated with {len(pending)} messages "
+                    f"({self.summarized} total)"
+                )
+
+    async def finish(self) -> str | None:
+        """Stop the background task and fold in the last delta."""
+        await self.stop()
+        await self.update(final=True)
+        return self.summary
+
+
 import json
 import os
 import redis.asyncio as redis
@@ -76,6 +178,7 @@ class SessionLifecycle:
         self.room_url = room_url  # Store for immediate Redis state clearing
         self.headless = headless
         self.shutdown_task: asyncio.Task | None = None
+        self.rolling_summary: RollingSummary | None = None
         self.log = logger.bind(
             tag="[lifecycle]",
             botPid=BOT_PID,
@@ -105,6 +208,18 @@ class SessionLifecycle:
             f"post_leave_idle={self.post_leave_idle_secs}s (voice_only={BOT_VOICE_ONLY()})"
         )
 
+    def start_rolling_summary(self, source: Callable[[], list[dict[str, Any]]]) -> None:
+        """Summarize the conversation incrementally while the session runs."""
+        every = BOT_ROLLING_SUMMARY_TURNS()
+        if every <= 0 or self.rolling_summary is not None:
+            return
+        self.rolling_summary = RollingSummary(source, every=every, poll_secs=BOT_ROLLING_SUMMARY_POLL_SECS())
+        self.rolling_summary.start()
+
+    async def stop_rolling_summary(self) -> None:
+        if self.rolling_summary is not None:
+            await self.rolling_summary.stop()
+
     def cancel_pending_shutdown(self):
         if self.shutdown_task and not self.shutdown_task.done():
             try:
@@ -198,7 +313,6 @@ class SessionLifecycle:
                             from datetime import datetime, timezone
                             workspace_root = os.getenv("OPENCLAW_WORKSPACE", "/root/.openclaw/workspace")
                             memory_dir = os.path.join(workspace_root, "memory")
-                            os.makedirs(memory_dir, exist_ok=True)
                             now = datetime.now(timezone.utc)
                             
                             conv_msgs = [m for m in messages if m.get("role") in ("user", "assistant") and m.get("content")]
@@ -208,20 +322,23 @@ class SessionLifecycle:
                                 raw_entry = f"[{now.strftime('%Y-%m-%d %H:%M')}] [voice] — Voice session ({len(conv_msgs)} messages). Started with: {first_user}\n"
                                 
                                 raw_log_path = os.path.join(memory_dir, "activity-log.md")
-                                with open(raw_log_path, 'a', encoding='utf-8') as f:
-                                    f.write(raw_entry)
+                                await append_text(raw_log_path, raw_entry)
                                 logger.info(f"[{BOT_PID}] ✅ Wrote raw voice session entry to activity log (pre-summary)")
                         except Exception as raw_err:
                             logger.warning(f"[{BOT_PID}] Failed to write raw activity entry: {raw_err}")
                         
                         logger.info(f"[{BOT_PID}] Generating conversation summary ({len(messages)} messages)...")
                         
-                        # Generate summary using LLM (once for all participants)
-                        summary_text = await generate_conversation_summary(messages)
+                        # Generate summary using LLM (once for all participants); the
+                        # rolling summary only has the last few messages left to fold in
+                        if self.rolling_summary is not None:
+                            summary_text = await self.rolling_summary.finish()
+                        else:
+                            summary_text = await generate_conversation_summary(messages)
                         
                         if summary_text:
                             # Extract session info
-                            canonical_session_id = session_id or os.getenv('BOT_SESSION_ID')
+                            canonical_session_id = session_id or current_session_id()
                             if not canonical_session_id:
                                 logger.warning(f"[{BOT_PID}] Missing session_id for summary; falling back to room slug")
                                 canonical_session_id = room_url.split('/')[-1] if room_url else "unknown"
@@ -257,7 +374,7 @@ class SessionLifecycle:
                                 
                                 # Fallback: if no users found in participants, use BOT_SESSION_USER_ID
                                 if not user_ids_to_update:
-                                    fallback_user_id = os.getenv('BOT_SESSION_USER_ID')
+                                    fallback_user_id = current_user_id()
                                     if fallback_user_id:
                                         user_ids_to_update.append(fallback_user_id)
                                         logger.info(
@@ -308,7 +425,6 @@ class SessionLifecycle:
                                 from datetime import datetime, timezone
                                 workspace_root = os.getenv("OPENCLAW_WORKSPACE", "/root/.openclaw/workspace")
                                 memory_dir = os.path.join(workspace_root, "memory")
-                                os.makedirs(memory_dir, exist_ok=True)
                                 
                                 now = datetime.now(timezone.utc)
                                 date_str = now.strftime("%Y-%m-%d")
@@ -316,10 +432,7 @@ class SessionLifecycle:
                                 
                                 daily_path = os.path.join(memory_dir, f"{date_str}.md")
                                 
-                                conv_messages = [
-                                    msg for msg in messages
-                                    if msg.get("role") in ("user", "assistant") and msg.get("content")
-                                ]
+                                conv_messages = _conversation_messages(messages)
                                 
                                 daily_entry_lines = [f"\n## Voice Session ({time_str} UTC)\n"]
                                 daily_entry_lines.append(f"**Summary:** {summary_text}\n")
@@ -334,8 +447,7 @@ class SessionLifecycle:
                                             content = content[:297] + "..."
                                         daily_entry_lines.append(f"- **{role}:** {content}\n")
                                 
-                                with open(daily_path, 'a', encoding='utf-8') as f:
-                                    f.writelines(daily_entry_lines)
+                                await append_text(daily_path, "".join(daily_entry_lines))
                                 
                                 logger.info(f"[{BOT_PID}] ✅ Wrote voice session details to {date_str}.md")
                                 
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import json
 from typing import Any, Callable
 
@@ -36,6 +37,7 @@ class SessionManagers:
         self.identity_manager = IdentityManager(room_url, self.participant_manager)
         self.forwarder: Any | None = None
         self.forwarder_stop: Callable[[], None] | None = None
+        self.config_listener_task: asyncio.Task | None = None
 
     async def start(self):
         """Initialize and start all managers."""
@@ -48,6 +50,10 @@ class SessionManagers:
     async def stop(self):
         """Stop all managers and cleanup."""
         self.identity_manager.stop()
+
+        if self.config_listener_task and not self.config_listener_task.done():
+            # Releases this room's route on the shared config subscriber
+            self.config_listener_task.cancel()
         
         if self.forwarder:
             try:
@@ -275,6 +275,9 @@ async def run_pipeline_session(
         session_id=session_id,
         headless=headless,
     )
+    snapshot_messages = getattr(multi_user_aggregator, "snapshot_messages", None)
+    if snapshot_messages is not None:
+        lifecycle.start_rolling_summary(snapshot_messages)
     
     # NOTE: Initial idle shutdown is now scheduled AFTER transport joins the room
     # (see transport "on_joined" handler below). This prevents race conditions where
@@ -314,6 +317,7 @@ async def run_pipeline_session(
             persona,
             session_id=session_id,
         )
+        await lifecycle.stop_rolling_summary()
         
         lifecycle.cancel_pending_shutdown()
         
@@ -89,6 +89,7 @@ def reset_eventbus():
     bus._subscribers.clear()
     bus._wildcard_subscribers.clear()
     bus._stream_queues.clear()
+    bus._dispatch_index.clear()
     
     yield
     
@@ -96,6 +97,7 @@ def reset_eventbus():
     bus._subscribers.clear()
     bus._wildcard_subscribers.clear()
     bus._stream_queues.clear()
+    bus._dispatch_index.clear()
 
 
 # =============================================================================
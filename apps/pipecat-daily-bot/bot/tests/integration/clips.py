@@ -0,0 +1,50 @@
+"""PCM clip fixtures shared by the live Daily harness and the loopback benchmarks."""
+
+from __future__ import annotations
+
+import audioop
+import pathlib
+import wave
+from dataclasses import dataclass
+from typing import Iterable
+
+AUDIO_FRAME_MS = 20
+_PCM_SAMPLE_WIDTH = 2
+
+
+@dataclass(slots=True)
+class AudioClip:
+    """PCM clip ready for streaming via Daily."""
+
+    pcm: bytes
+    sample_rate: int
+    channels: int = 1
+
+    def iter_frames(self, frame_ms: int = AUDIO_FRAME_MS) -> Iterable[bytes]:
+        frame_bytes = int(self.sample_rate * frame_ms / 1000) * self.channels * _PCM_SAMPLE_WIDTH
+        if frame_bytes <= 0:
+            raise ValueError("frame_bytes must be positive")
+        for start in range(0, len(self.pcm), frame_bytes):
+            chunk = self.pcm[start : start + frame_bytes]
+            if len(chunk) < frame_bytes:
+                chunk = chunk + b"\x00" * (frame_bytes - len(chunk))
+            yield chunk
+
+    @property
+    def duration_secs(self) -> float:
+        return len(self.pcm) / (self.sample_rate * self.channels * _PCM_SAMPLE_WIDTH)
+
+
+def read_wav_clip(path: pathlib.Path, sample_rate: int) -> AudioClip:
+    """Load a 16-bit WAV file as a mono clip at ``sample_rate``."""
+    with wave.open(str(path), "rb") as wav:
+        if wav.getsampwidth() != _PCM_SAMPLE_WIDTH:
+            raise ValueError(f"{path} is not 16-bit PCM")
+        source_rate = wav.getframerate()
+        channels = wav.getnchannels()
+        pcm = wav.readframes(wav.getnframes())
+    if channels > 1:
+        pcm = audioop.tomono(pcm, _PCM_SAMPLE_WIDTH, 0.5, 0.5)
+    if source_rate != sample_rate:
+        pcm = audioop.ratecv(pcm, _PCM_SAMPLE_WIDTH, 1, source_rate, sample_rate, None)[0]
+    return AudioClip(pcm=pcm, sample_rate=sample_rate)
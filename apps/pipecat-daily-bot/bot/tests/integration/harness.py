@@ -24,7 +24,7 @@ import uuid
 import wave
 from contextlib import asynccontextmanager, contextmanager
 from dataclasses import dataclass, field
-from typing import Any, Dict, Iterable, List, Optional
+from typing import Any, Dict, List, Optional
 from urllib import error, request
 from unittest.mock import patch
 
@@ -42,13 +42,14 @@ from daily import CallClient, CustomAudioSource, CustomAudioTrack, EventHandler
 import bot
 from bot.loguru import get_logger
 
+from .clips import AUDIO_FRAME_MS, AudioClip
+
 try:
     from pipecat.services.elevenlabs.tts import ElevenLabsTTSService
 except ImportError:  # pragma: no cover - ElevenLabs optional in test envs
     ElevenLabsTTSService = None  # type: ignore
 
 
-AUDIO_FRAME_MS = 20
 _DEFAULT_USER_UTTERANCE = "Hello, how are you?"
 _DEFAULT_ASSISTANT_WAIT_SECS = 30.0
 _PCM_SAMPLE_WIDTH = 2
@@ -57,25 +58,6 @@ _PCM_SAMPLE_WIDTH = 2
 logger = get_logger(__name__, tag="harness")
 
 
-@dataclass(slots=True)
-class AudioClip:
-    """PCM clip ready for streaming via Daily."""
-
-    pcm: bytes
-    sample_rate: int
-    channels: int = 1
-
-    def iter_frames(self, frame_ms: int = AUDIO_FRAME_MS) -> Iterable[bytes]:
-        frame_bytes = int(self.sample_rate * frame_ms / 1000) * self.channels * _PCM_SAMPLE_WIDTH
-        if frame_bytes <= 0:
-            raise ValueError("frame_bytes must be positive")
-        for start in range(0, len(self.pcm), frame_bytes):
-            chunk = self.pcm[start : start + frame_bytes]
-            if len(chunk) < frame_bytes:
-                chunk = chunk + b"\x00" * (frame_bytes - len(chunk))
-            yield chunk
-
-
 @dataclass(slots=True)
 class LiveSessionConfig:
     """Runtime configuration for a live integration session."""
@@ -0,0 +1,434 @@
+"""Offline loopback transport and fake services for voice latency benchmarks.
+
+``LoopbackTransport`` stands in for ``DailyTransport`` (pass
+``loopback_factory(...)`` as ``build_pipeline(transport_factory=...)``). Its
+input streams ``AudioClip`` fixtures in real time through the pipeline's own
+VAD and plays the part of Daily's transcription by pushing the clip's
+transcript shortly after the speech ends. Its output plays bot audio at
+real-time pace and timestamps every frame on a shared ``LoopbackTimeline``.
+
+``FakeLLMServer`` (OpenAI-compatible streaming chat completions) and
+``FakePocketTTSServer`` (the PocketTTS ``POST /tts`` WAV stream) run on
+127.0.0.1 with scripted latencies, so a full session needs no network.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import io
+import json
+import math
+import struct
+import time
+import wave
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Callable, Deque, List, Optional, Tuple
+
+from aiohttp import web
+from loguru import logger
+from pipecat.audio.vad.vad_analyzer import VADState
+from pipecat.frames.frames import (
+    CancelFrame,
+    EndFrame,
+    InputAudioRawFrame,
+    OutputAudioRawFrame,
+    StartFrame,
+    TranscriptionFrame,
+)
+from pipecat.processors.frame_processor import FrameProcessor
+from pipecat.transports.base_input import BaseInputTransport
+from pipecat.transports.base_output import BaseOutputTransport
+from pipecat.transports.base_transport import BaseTransport, TransportParams
+from pipecat.utils.time import time_now_iso8601
+
+from .clips import AUDIO_FRAME_MS, AudioClip
+
+_PCM_SAMPLE_WIDTH = 2
+
+# Timeline event names
+USER_AUDIO_START = "user_audio_start"
+USER_AUDIO_END = "user_audio_end"
+USER_STARTED_SPEAKING = "user_started_speaking"
+USER_STOPPED_SPEAKING = "user_stopped_speaking"
+TRANSCRIPTION = "transcription"
+BOT_AUDIO = "bot_audio"
+LLM_REQUEST = "llm_request"
+LLM_TOOL_CALL = "llm_tool_call"
+LLM_TOOL_RESULT = "llm_tool_result"
+
+
+@dataclass(slots=True)
+class TimelineEvent:
+    at: float
+    kind: str
+    detail: Any = None
+
+
+@dataclass(slots=True)
+class LoopbackTimeline:
+    """Monotonic-clock record of everything the loopback saw go in and out."""
+
+    events: List[TimelineEvent] = field(default_factory=list)
+
+    def mark(self, kind: str, detail: Any = None) -> float:
+        now = time.monotonic()
+        self.events.append(TimelineEvent(now, kind, detail))
+        return now
+
+    def first(self, kind: str, after: float = float("-inf")) -> Optional[TimelineEvent]:
+        for event in self.events:
+            if event.kind == kind and event.at >= after:
+                return event
+        return None
+
+    def last(self, kind: str, after: float = float("-inf")) -> Optional[TimelineEvent]:
+        found = None
+        for event in self.events:
+            if event.kind == kind and event.at >= after:
+                found = event
+        return found
+
+    async def wait_for(self, kind: str, after: float, timeout: float) -> TimelineEvent:
+        deadline = time.monotonic() + timeout
+        while True:
+            event = self.first(kind, after)
+            if event is not None:
+                return event
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"no {kind} event within {timeout}s")
+            await asyncio.sleep(0.01)
+
+    def bot_audio_end(self, after: float) -> Optional[float]:
+        """When the last bot audio written after ``after`` finished playing."""
+        event = self.last(BOT_AUDIO, after)
+        return None if event is None else event.at + event.detail
+
+    def bot_speech_end(self, start: float, max_gap_secs: float = 0.05) -> Optional[float]:
+        """End of the uninterrupted run of bot audio beginning at or after ``start``."""
+        end = None
+        for event in self.events:
+            if event.kind != BOT_AUDIO or event.at < start:
+                continue
+            if end is not None and event.at > end + max_gap_secs:
+                break
+            end = event.at + event.detail
+        return end
+
+    async def wait_for_bot_silence(self, after: float, quiet_secs: float, timeout: float) -> float:
+        """Wait until bot audio started after ``after`` has been quiet for ``quiet_secs``."""
+        await self.wait_for(BOT_AUDIO, after, timeout)
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            end = self.bot_audio_end(after)
+            if time.monotonic() - end >= quiet_secs:
+                return end
+            await asyncio.sleep(0.02)
+        raise TimeoutError(f"bot still speaking after {timeout}s")
+
+
+class LoopbackInputTransport(BaseInputTransport):
+    """Streams queued clips (and silence between them) in real time."""
+
+    def __init__(self, params: TransportParams, timeline: LoopbackTimeline, user_id: str, stt_delay_secs: float):
+        super().__init__(params)
+        self._timeline = timeline
+        self._user_id = user_id
+        self._stt_delay_secs = stt_delay_secs
+        self._pending: Deque[Tuple[bytes, List[Callable[[], None]]]] = deque()
+        self._feed_task: Optional[asyncio.Task] = None
+        self.ready = asyncio.Event()
+
+    async def start(self, frame: StartFrame):
+        await super().start(frame)
+        await self.set_transport_ready(frame)
+        if self._feed_task is None:
+            self._feed_task = self.create_task(self._feed())
+        self.ready.set()
+
+    async def stop(self, frame: EndFrame):
+        await self._cancel_feed()
+        await super().stop(frame)
+
+    async def cancel(self, frame: CancelFrame):
+        await self._cancel_feed()
+        await super().cancel(frame)
+
+    async def _cancel_feed(self):
+        if self._feed_task:
+            await self.cancel_task(self._feed_task)
+            self._feed_task = None
+
+    async def say(self, clip: AudioClip, transcript: str) -> float:
+        """Speak ``clip``; returns when its last frame was fed (the ``USER_AUDIO_END`` time)."""
+        if clip.sample_rate != self.sample_rate or clip.channels != 1:
+            raise ValueError(f"clip must be mono {self.sample_rate}Hz, got {clip.channels}ch {clip.sample_rate}Hz")
+        done = asyncio.get_running_loop().create_future()
+        frames = list(clip.iter_frames())
+
+        def on_start():
+            self._timeline.mark(USER_AUDIO_START, transcript)
+
+        def on_end():
+            ended = self._timeline.mark(USER_AUDIO_END, transcript)
+            self.create_task(self._transcribe(transcript))
+            done.set_result(ended)
+
+        for index, chunk in enumerate(frames):
+            callbacks = [on_start] if index == 0 else []
+            if index == len(frames) - 1:
+                callbacks.append(on_end)
+            self._pending.append((chunk, callbacks))
+        return await done
+
+    async def _transcribe(self, transcript: str):
+        # Daily delivers its final transcript a little after the speech ends
+        await asyncio.sleep(self._stt_delay_secs)
+        self._timeline.mark(TRANSCRIPTION, transcript)
+        await self.push_frame(TranscriptionFrame(transcript, self._user_id, time_now_iso8601()))
+
+    async def _feed(self):
+        frame_secs = AUDIO_FRAME_MS / 1000
+        silence = b"\x00" * (int(self.sample_rate * frame_secs) * _PCM_SAMPLE_WIDTH)
+        next_at = time.monotonic()
+        while True:
+            chunk, callbacks = self._pending.popleft() if self._pending else (silence, ())
+            await self.push_audio_frame(InputAudioRawFrame(audio=chunk, sample_rate=self.sample_rate, num_channels=1))
+            for callback in callbacks:
+                callback()
+            next_at += frame_secs
+            await asyncio.sleep(max(0.0, next_at - time.monotonic()))
+
+    async def _handle_user_interruption(self, vad_state: VADState, emulated: bool = False):
+        if vad_state == VADState.SPEAKING:
+            self._timeline.mark(USER_STARTED_SPEAKING)
+        elif vad_state == VADState.QUIET:
+            self._timeline.mark(USER_STOPPED_SPEAKING)
+        await super()._handle_user_interruption(vad_state, emulated)
+
+
+class LoopbackOutputTransport(BaseOutputTransport):
+    """Plays bot audio into the timeline at the pace a speaker would."""
+
+    def __init__(self, params: TransportParams, timeline: LoopbackTimeline):
+        super().__init__(params)
+        self._timeline = timeline
+        self._playing_until = 0.0
+
+    async def start(self, frame: StartFrame):
+        await super().start(frame)
+        await self.set_transport_ready(frame)
+
+    async def write_audio_frame(self, frame: OutputAudioRawFrame) -> bool:
+        duration = len(frame.audio) / (frame.sample_rate * frame.num_channels * _PCM_SAMPLE_WIDTH)
+        now = self._timeline.mark(BOT_AUDIO, duration)
+        # A device buffer accepts the next chunk once the previous one has played
+        self._playing_until = max(self._playing_until, now) + duration
+        await asyncio.sleep(self._playing_until - now)
+        return True
+
+
+class LoopbackTransport(BaseTransport):
+    """In-process replacement for ``DailyTransport`` in benchmarks and tests."""
+
+    def __init__(
+        self,
+        params: TransportParams,
+        *,
+        timeline: Optional[LoopbackTimeline] = None,
+        user_id: str = "loopback-user",
+        stt_delay_secs: float = 0.15,
+    ):
+        super().__init__()
+        self._params = params
+        self.timeline = timeline or LoopbackTimeline()
+        self._input = LoopbackInputTransport(params, self.timeline, user_id, stt_delay_secs)
+        self._output = LoopbackOutputTransport(params, self.timeline)
+
+    def input(self) -> FrameProcessor:
+        return self._input
+
+    def output(self) -> FrameProcessor:
+        return self._output
+
+    async def wait_until_ready(self, timeout: float = 30.0) -> None:
+        await asyncio.wait_for(self._input.ready.wait(), timeout)
+
+    async def say(self, clip: AudioClip, transcript: str) -> float:
+        return await self._input.say(clip, transcript)
+
+
+def loopback_factory(**kwargs: Any) -> Callable[[TransportParams], LoopbackTransport]:
+    """``build_pipeline(transport_factory=...)`` hook creating a ``LoopbackTransport``."""
+
+    def factory(params: TransportParams) -> LoopbackTransport:
+        return LoopbackTransport(params, **kwargs)
+
+    return factory
+
+
+async def _start_site(app: web.Application) -> Tuple[web.AppRunner, int]:
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    return runner, site._server.sockets[0].getsockname()[1]
+
+
+@dataclass(slots=True)
+class FakeLLMScript:
+    """What the fake LLM says and how fast.
+
+    A user message containing ``tool_trigger`` is answered with a call to
+    ``tool_name``; the request carrying that tool's result gets ``tool_reply``.
+    Everything else gets ``reply``.
+    """
+
+    reply: str = "I'm doing well, thanks for asking. It's a quiet day here, so tell me what you'd like to work on."
+    tool_trigger: str = "notepad"
+    tool_name: str = "loopback_probe"
+    tool_arguments: str = "{}"
+    tool_reply: str = "Done, your notepad is open."
+    first_token_secs: float = 0.25
+    token_secs: float = 0.01
+
+
+class FakeLLMServer:
+    """OpenAI-compatible ``/v1/chat/completions`` streaming server."""
+
+    def __init__(self, timeline: LoopbackTimeline, script: Optional[FakeLLMScript] = None):
+        self.timeline = timeline
+        self.script = script or FakeLLMScript()
+        self.requests: List[dict] = []
+        self.base_url = ""
+        self._runner: Optional[web.AppRunner] = None
+        self._calls = 0
+
+    async def start(self) -> str:
+        app = web.Application()
+        app.router.add_post("/v1/chat/completions", self._completions)
+        self._runner, port = await _start_site(app)
+        self.base_url = f"http://127.0.0.1:{port}/v1"
+        return self.base_url
+
+    async def stop(self) -> None:
+        if self._runner is not None:
+            await self._runner.cleanup()
+
+    def _chunk(self, delta: dict, finish_reason: Optional[str] = None) -> bytes:
+        body = {
+            "id": "chatcmpl-loopback",
+            "object": "chat.completion.chunk",
+            "created": int(time.time()),
+            "model": "loopback",
+            "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}],
+        }
+        return f"data: {json.dumps(body)}\n\n".encode()
+
+    async def _completions(self, request: web.Request) -> web.StreamResponse:
+        payload = await request.json()
+        self.requests.append(payload)
+        messages = payload.get("messages") or []
+        last = messages[-1] if messages else {}
+        script = self.script
+        if last.get("role") == "tool":
+            self.timeline.mark(LLM_TOOL_RESULT, last.get("tool_call_id"))
+            text, tool_call = script.tool_reply, None
+        else:
+            self.timeline.mark(LLM_REQUEST)
+            content = last.get("content")
+            if isinstance(content, list):
+                content = " ".join(part.get("text", "") for part in content if isinstance(part, dict))
+            wants_tool = script.tool_trigger and script.tool_trigger in str(content or "").lower()
+            text, tool_call = (None, script.tool_name) if wants_tool else (script.reply, None)
+
+        resp = web.StreamResponse(headers={"Content-Type": "text/event-stream"})
+        await resp.prepare(request)
+        await asyncio.sleep(script.first_token_secs)
+        try:
+            if tool_call:
+                self._calls += 1
+                call_id = f"call_loopback_{self._calls}"
+                delta = {
+                    "role": "assistant",
+                    "tool_calls": [
+                        {
+                            "index": 0,
+                            "id": call_id,
+                            "type": "function",
+                            "function": {"name": tool_call, "arguments": script.tool_arguments},
+                        }
+                    ],
+                }
+                await resp.write(self._chunk(delta))
+                await resp.write(self._chunk({}, "tool_calls"))
+                self.timeline.mark(LLM_TOOL_CALL, call_id)
+            else:
+                for index, token in enumerate(text.split(" ")):
+                    if index:
+                        token = " " + token
+                        await asyncio.sleep(script.token_secs)
+                    await resp.write(self._chunk({"content": token}))
+                await resp.write(self._chunk({}, "stop"))
+            await resp.write(b"data: [DONE]\n\n")
+        except ConnectionResetError:
+            pass  # the pipeline was interrupted mid-stream
+        return resp
+
+
+class FakePocketTTSServer:
+    """PocketTTS-compatible ``POST /tts`` returning a streamed 24kHz WAV tone.
+
+    The tone lasts ``secs_per_char`` per input character so replies take about
+    as long to play as real speech would.
+    """
+
+    def __init__(self, *, first_audio_secs: float = 0.12, secs_per_char: float = 0.06, sample_rate: int = 24000):
+        self.first_audio_secs = first_audio_secs
+        self.secs_per_char = secs_per_char
+        self.sample_rate = sample_rate
+        self.texts: List[str] = []
+        self.base_url = ""
+        self._runner: Optional[web.AppRunner] = None
+
+    async def start(self) -> str:
+        app = web.Application()
+        app.router.add_post("/tts", self._tts)
+        self._runner, port = await _start_site(app)
+        self.base_url = f"http://127.0.0.1:{port}"
+        return self.base_url
+
+    async def stop(self) -> None:
+        if self._runner is not None:
+            await self._runner.cleanup()
+
+    def _wav(self, text: str) -> bytes:
+        samples = max(1, int(len(text) * self.secs_per_char * self.sample_rate))
+        pcm = b"".join(
+            struct.pack("<h", int(6000 * math.sin(2 * math.pi * 180 * i / self.sample_rate)))
+            for i in range(samples)
+        )
+        out = io.BytesIO()
+        with wave.open(out, "wb") as wav:
+            wav.setnchannels(1)
+            wav.setsampwidth(_PCM_SAMPLE_WIDTH)
+            wav.setframerate(self.sample_rate)
+            wav.writeframes(pcm)
+        return out.getvalue()
+
+    async def _tts(self, request: web.Request) -> web.StreamResponse:
+        form = await request.post()
+        text = str(form.get("text", ""))
+        self.texts.append(text)
+        body = self._wav(text)
+        resp = web.StreamResponse(headers={"Content-Type": "audio/wav"})
+        resp.enable_chunked_encoding()
+        await resp.prepare(request)
+        await asyncio.sleep(self.first_audio_secs)
+        try:
+            for start in range(0, len(body), 8192):
+                await resp.write(body[start : start + 8192])
+            await resp.write_eof()
+        except ConnectionResetError:
+            logger.debug("[loopback] TTS client went away mid-stream")
+        return resp
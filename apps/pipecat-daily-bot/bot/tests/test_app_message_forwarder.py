@@ -67,3 +67,49 @@ async def test_inproc_mode(monkeypatch):
     env = t.sent[0]
     assert env['kind'] == BRIDGE_KIND and env['event'] == evt.DAILY_CALL_STATE
     stop()
+
+
+@pytest.mark.asyncio
+async def test_large_envelope_is_chunked_not_truncated(monkeypatch):
+    import base64
+    import json
+
+    from services.app_message_transport import CHUNK_KIND
+
+    t = DummyTransport()
+    monkeypatch.setenv('BOT_EVENT_FORWARDER', 'inproc')
+    monkeypatch.setenv('BOT_EVENT_FORWARDER_CHUNK_MS', '0')
+    fwd = AppMessageForwarder(t, snapshot_provider=lambda: {}, room_url=t.room_url)
+    html = '<div>' + 'x' * 120000 + '</div>'
+    await fwd.emit_tool_event('html.created', {'html': html})
+    assert len(t.sent) > 1
+    assert all(m['kind'] == CHUNK_KIND for m in t.sent)
+    ordered = sorted(t.sent, key=lambda m: m['index'])
+    env = json.loads(base64.b64decode(''.join(m['data'] for m in ordered)))
+    assert env['payload']['html'] == html and env['kind'] == BRIDGE_KIND
+
+
+@pytest.mark.asyncio
+async def test_identical_large_payload_is_not_resent(monkeypatch):
+    t = DummyTransport()
+    monkeypatch.setenv('BOT_EVENT_FORWARDER', 'inproc')
+    monkeypatch.setenv('BOT_EVENT_FORWARDER_CHUNK_MS', '0')
+    fwd = AppMessageForwarder(t, snapshot_provider=lambda: {}, room_url=t.room_url)
+
+    # Small repeated refreshes are new messages and are delivered
+    await fwd.emit_tool_event('apps.state', {'open': ['notes']})
+    await fwd.emit_tool_event('apps.state', {'open': ['notes']})
+    assert [m['seq'] for m in t.sent] == [1, 2]
+
+    html = '<div>' + 'x' * 120000 + '</div>'
+    await fwd.emit_tool_event('html.created', {'html': html})
+    chunked = len(t.sent)
+    assert chunked > 3
+    await fwd.emit_tool_event('html.created', {'html': html})
+    assert len(t.sent) == chunked
+
+    # A different target or event still goes out, with the next seq (no gap)
+    await fwd.emit_tool_event('html.created', {'html': html}, target_session_user_id='u2')
+    assert len(t.sent) > chunked
+    await fwd.emit_tool_event('apps.state', {'open': []})
+    assert t.sent[-1]['seq'] == 5
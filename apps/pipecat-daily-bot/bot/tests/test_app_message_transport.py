@@ -0,0 +1,144 @@
+import asyncio
+
+import pytest
+from services.app_message_transport import BATCH_KIND, PooledAppMessageTransport
+
+
+class _NullLog:
+    def __getattr__(self, _name):
+        return lambda *a, **k: None
+
+
+def _transport(monkeypatch, **kwargs):
+    posted = []
+    t = PooledAppMessageTransport('roomA', 'key', log=_NullLog(), **kwargs)
+
+    async def fake_post(data, *, count=1):
+        posted.append(data)
+        t._stats.sent += count
+        return True
+
+    monkeypatch.setattr(t, '_post', fake_post)
+    return t, posted
+
+
+@pytest.mark.asyncio
+async def test_sends_each_envelope_without_coalescing(monkeypatch):
+    t, posted = _transport(monkeypatch, concurrency=1, coalesce_ms=0)
+    for i in range(3):
+        t.submit({'seq': i})
+    await t.flush()
+    assert [p['seq'] for p in posted] == [0, 1, 2]
+    stats = t.stats()
+    assert stats['sent'] == 3 and stats['batches'] == 0 and stats['dropped'] == 0
+    await t.close()
+
+
+@pytest.mark.asyncio
+async def test_coalesces_small_envelopes_in_window(monkeypatch):
+    t, posted = _transport(monkeypatch, concurrency=1, coalesce_ms=50)
+    for i in range(5):
+        t.submit({'seq': i})
+    await t.flush()
+    assert len(posted) == 1
+    assert posted[0]['kind'] == BATCH_KIND
+    assert [e['seq'] for e in posted[0]['items']] == [0, 1, 2, 3, 4]
+    stats = t.stats()
+    assert stats['batches'] == 1 and stats['coalesced'] == 4 and stats['sent'] == 5
+    await t.close()
+
+
+@pytest.mark.asyncio
+async def test_large_envelope_breaks_batch_and_keeps_order(monkeypatch):
+    t, posted = _transport(monkeypatch, concurrency=1, coalesce_ms=50)
+    t.submit({'seq': 0})
+    t.submit({'seq': 1, 'blob': 'x' * 10000})
+    t.submit({'seq': 2})
+    await t.flush()
+    assert posted[0] == {'seq': 0}
+    assert posted[1]['seq'] == 1
+    assert posted[2] == {'seq': 2}
+    await t.close()
+
+
+@pytest.mark.asyncio
+async def test_full_queue_drops_oldest(monkeypatch):
+    t, posted = _transport(monkeypatch, concurrency=1, coalesce_ms=0, max_queue=2)
+    gate = asyncio.Event()
+
+    async def slow_post(data, *, count=1):
+        await gate.wait()
+        posted.append(data)
+
+    monkeypatch.setattr(t, '_post', slow_post)
+    t.submit({'seq': 0})
+    await asyncio.sleep(0)  # worker picks up seq 0 and blocks
+    for i in range(1, 5):
+        t.submit({'seq': i})
+    stats = t.stats()
+    assert stats['dropped'] == 2
+    assert stats['queue_high_watermark'] == 2
+    gate.set()
+    await t.flush()
+    assert [p['seq'] for p in posted] == [0, 3, 4]
+    await t.close()
+    assert t.submit({'seq': 5}) is False
+
+
+@pytest.mark.asyncio
+async def test_chunks_of_one_envelope_share_a_queue_slot(monkeypatch):
+    t, posted = _transport(monkeypatch, concurrency=1, coalesce_ms=0, max_queue=2, chunk_ms=0)
+    gate = asyncio.Event()
+
+    async def slow_post(data, *, count=1):
+        await gate.wait()
+        posted.append(data)
+        return True
+
+    monkeypatch.setattr(t, '_post', slow_post)
+    t.submit({'seq': 0})
+    await asyncio.sleep(0)  # worker picks up seq 0 and blocks
+    t.submit_chunks([{'seq': 1, 'index': i} for i in range(3)], 90000)
+    t.submit({'seq': 2})
+    t.submit_chunks([{'seq': 3, 'index': i} for i in range(3)], 90000)
+    assert t.stats()['dropped'] == 1
+    gate.set()
+    await t.flush()
+    # seq 1 was dropped whole; seq 3 arrived complete and in order
+    assert [(p['seq'], p.get('index')) for p in posted] == [
+        (0, None), (2, None), (3, 0), (3, 1), (3, 2)
+    ]
+    await t.close()
+
+
+@pytest.mark.asyncio
+async def test_failed_chunk_abandons_the_rest_of_its_envelope(monkeypatch):
+    t, posted = _transport(monkeypatch, concurrency=1, coalesce_ms=0, chunk_ms=0)
+
+    async def failing_post(data, *, count=1):
+        posted.append(data)
+        return data['index'] != 1
+
+    monkeypatch.setattr(t, '_post', failing_post)
+    t.submit_chunks([{'seq': 1, 'index': i} for i in range(4)], 120000)
+    await t.flush()
+    assert [p['index'] for p in posted] == [0, 1]
+    assert t.stats()['failed'] == 2
+    await t.close()
+
+
+def test_chunk_envelope_round_trip():
+    import base64
+    import json
+
+    from services.app_message_transport import CHUNK_KIND, chunk_envelope
+
+    envelope = {'v': 1, 'seq': 9, 'event': 'html.created', 'payload': {'html': 'é' * 50000}}
+    raw = json.dumps(envelope, ensure_ascii=False).encode('utf-8')
+    chunks = chunk_envelope(envelope, raw, chunk_bytes=30001)
+    assert len(chunks) == 4
+    assert {c['kind'] for c in chunks} == {CHUNK_KIND}
+    assert len({c['id'] for c in chunks}) == 1
+    assert all(len(json.dumps(c)) < 49000 for c in chunks)
+    joined = base64.b64decode(''.join(c['data'] for c in chunks))
+    assert json.loads(joined.decode('utf-8')) == envelope
@@ -0,0 +1,71 @@
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from actions import applet_index, html_actions
+from actions.applet_index import AppletTitleIndex
+
+
+@pytest.fixture(autouse=True)
+def fresh_index():
+    applet_index.clear()
+    yield
+    applet_index.clear()
+
+
+def _gen(gen_id, title):
+    return {"_id": gen_id, "title": title, "createdBy": "u1"}
+
+
+def test_next_free_title_and_removals():
+    index = AppletTitleIndex([_gen("a", "Snake"), _gen("b", "Snake 3"), _gen("c", "Snake 2 5"), _gen("d", "Pong 2")])
+    assert index.next_free_title("Tetris") == "Tetris"
+    assert index.next_free_title("snake") == "snake 4"
+    assert index.next_free_title("Pong") == "Pong"  # only a numbered copy exists
+    assert index.next_free_title("Pong 2") == "Pong 2 2"
+
+    index.remove("b")
+    assert index.next_free_title("Snake") == "Snake 2"
+    index.update("a", {"title": "Worm"})
+    assert index.next_free_title("Snake") == "Snake"
+    assert index.next_free_title("Worm") == "Worm 2"
+
+
+def test_best_match_prefers_exact_then_first_listed():
+    index = AppletTitleIndex([_gen("a", "Space Invaders"), _gen("b", "Space Invader"), _gen("c", "Space Invaders")])
+    assert index.best_match("space invaders") == (1.0, index._entries["a"])
+    score, gen = index.best_match("space invadr")
+    assert gen["_id"] == "b" and score > 0.9
+    assert index.best_match("zzz")[0] < 0.6
+
+
+@pytest.mark.asyncio
+async def test_create_then_open_by_name_lists_once(monkeypatch):
+    monkeypatch.setenv("BOT_APPLET_INDEX_TTL_SECS", "60")
+    listing = AsyncMock(return_value=([html_actions._generation_metadata(_gen("a", "Snake"))], True))
+    request = AsyncMock(return_value={"success": True, "data": {"_id": "new", "title": "Snake 2", "htmlContent": "<html/>"}})
+    with patch.object(html_actions, "_list_generation_metadata", listing), patch.object(
+        html_actions.mesh_client, "request", request
+    ):
+        created = await html_actions.create_html_generation("t1", "u1", "Snake", "<html/>")
+        assert request.await_args.kwargs["json_body"]["content"]["title"] == "Snake 2"
+        assert created["_id"] == "new"
+
+        found = await html_actions.fuzzy_search_applets("t1", "snake 2", "u1")
+        assert found["_id"] == "new" and "htmlContent" not in found
+        assert await html_actions.make_unique_title("t1", "u1", "Snake") == "Snake 3"
+    assert listing.await_count == 1
+
+    applet_index.applet_deleted("new")
+    index = await applet_index.get_index("t1", "u1", listing)
+    assert "new" not in index and "a" in index
+
+
+@pytest.mark.asyncio
+async def test_partial_listing_is_not_cached(monkeypatch):
+    monkeypatch.setenv("BOT_APPLET_INDEX_TTL_SECS", "60")
+    listing = AsyncMock(return_value=([html_actions._generation_metadata(_gen("a", "Snake"))], False))
+    with patch.object(html_actions, "_list_generation_metadata", listing):
+        assert (await html_actions.fuzzy_search_applets("t1", "snake", "u1"))["_id"] == "a"
+        assert (await html_actions.fuzzy_search_applets("t1", "snake", "u1"))["_id"] == "a"
+    assert listing.await_count == 2
@@ -0,0 +1,88 @@
+import random
+
+import pytest
+
+try:
+    from bot.filters.tts_text_filter import MarkdownStripFilter
+    from bot.utils.clause_text_aggregator import CLAUSE_BREAKS, SENTENCE_ENDINGS, ClauseTextAggregator
+except ImportError:
+    from filters.tts_text_filter import MarkdownStripFilter
+    from utils.clause_text_aggregator import CLAUSE_BREAKS, SENTENCE_ENDINGS, ClauseTextAggregator
+
+
+def _reference_chunks(tokens, min_length):
+    """Original per-character aggregation, kept as the behavioural spec."""
+    buf, out = "", []
+    for char in "".join(tokens):
+        buf += char
+        if char in SENTENCE_ENDINGS and len(buf.strip()) >= 3:
+            out.append(buf.strip())
+            buf = ""
+            continue
+        if char in CLAUSE_BREAKS and len(buf.strip()) >= min_length:
+            out.append(buf.strip())
+            buf = ""
+    if buf.strip():
+        out.append(buf.strip())
+    return [c for c in out if c]
+
+
+async def _chunks(tokens, min_length):
+    agg = ClauseTextAggregator(min_clause_length=min_length)
+    out = []
+    for token in tokens:
+        async for aggregation in agg.aggregate(token):
+            out.append(aggregation.text)
+    tail = await agg.flush()
+    if tail:
+        out.append(tail.text)
+    return out
+
+
+@pytest.mark.asyncio
+async def test_yields_on_sentences_and_long_clauses():
+    tokens = ["Hi", ".", " This clause is definitely long enough to split", ", and", " ok!"]
+    assert await _chunks(tokens, 40) == [
+        "Hi.",
+        "This clause is definitely long enough to split,",
+        "and ok!",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_matches_reference_on_random_streams():
+    rng = random.Random(29)
+    alphabet = "ab  .,;:!?—–\n"
+    for _ in range(300):
+        text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 120)))
+        cuts = sorted(rng.sample(range(len(text) + 1), k=min(len(text), rng.randint(0, 12))))
+        tokens = [text[i:j] for i, j in zip([0] + cuts, cuts + [len(text)], strict=True)]
+        min_length = rng.choice([1, 5, 40])
+        assert await _chunks(tokens, min_length) == _reference_chunks(tokens, min_length), repr(tokens)
+
+
+@pytest.mark.asyncio
+async def test_text_property_and_interruption():
+    agg = ClauseTextAggregator()
+    async for _ in agg.aggregate("  partial clause "):
+        pass
+    assert agg.text.text == "partial clause"
+    await agg.handle_interruption()
+    assert agg.text.text == ""
+    assert await agg.flush() is None
+
+
+@pytest.mark.asyncio
+async def test_markdown_filter_single_pass():
+    f = MarkdownStripFilter()
+    assert await f.filter("## Title\n**Bold [link](http://x.y)** and `code`") == "Title Bold link and code"
+    assert await f.filter("Costs ≥ 5 & up— see https://a.b/c") == "Costs greater than or equal to 5 and up, see"
+    assert await f.filter("snake_case_name stays") == "snake_case_name stays"
+
+
+@pytest.mark.asyncio
+async def test_markdown_filter_strips_nonspeakable_for_kokoro():
+    f = MarkdownStripFilter(strip_nonspeakable=True)
+    assert f.strips_nonspeakable
+    assert await f.filter("Done ✅ → next 🚀 step ★") == "Done to next step"
+    assert await f.filter("a | b\n\n\tc") == "a b c"
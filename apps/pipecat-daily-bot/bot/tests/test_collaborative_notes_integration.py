@@ -790,8 +790,8 @@ async def test_success_messages_for_user_feedback(unique_user_id):
         "_id": "note-existing",
         "content": "- Item 1\n- Item 2"
     }
-    with patch('actions.notes_actions.get_note_by_id', new_callable=AsyncMock, side_effect=[existing_note, existing_note, updated_note]), \
-        patch('actions.notes_actions.update_note_content', new_callable=AsyncMock, return_value=True), \
+    with patch('actions.notes_actions.get_note_by_id', new_callable=AsyncMock, return_value=existing_note), \
+        patch('services.mesh.request', new_callable=AsyncMock, return_value={"success": True, "data": updated_note}), \
         patch('tools.notes.crud.sharing_actions.check_resource_write_permission', new_callable=AsyncMock, return_value=True):
 
         captured_result: dict[str, Any] | None = None
@@ -0,0 +1,154 @@
+import asyncio
+import json
+
+import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+fakeredis = pytest.importorskip("fakeredis", reason="fakeredis required for config subscriber tests")
+
+from services import config_subscriber
+from services.config_subscriber import ConfigSubscriber, publish_config
+from session import config_listener
+
+ROOM_A = "https://example.daily.co/room-a"
+ROOM_B = "https://example.daily.co/room-b"
+
+
+@pytest.fixture
+def server():
+    return fakeredis.FakeServer()
+
+
+class _DroppablePubSub:
+    """Wraps a fake pubsub so a test can sever the subscription mid-listen."""
+
+    def __init__(self, inner):
+        self.inner = inner
+        self.dropped = asyncio.Event()
+
+    def __getattr__(self, name):
+        return getattr(self.inner, name)
+
+    async def listen(self):
+        messages = self.inner.listen()
+        drop = asyncio.ensure_future(self.dropped.wait())
+        message = None
+        try:
+            while True:
+                message = asyncio.ensure_future(messages.__anext__())
+                await asyncio.wait({message, drop}, return_when=asyncio.FIRST_COMPLETED)
+                if drop.done():
+                    message.cancel()
+                    raise RedisConnectionError("connection dropped")
+                yield message.result()
+        finally:
+            drop.cancel()
+            if message is not None:
+                message.cancel()
+
+
+@pytest.fixture
+async def subscriber(server):
+    clients = []
+
+    pubsubs = []
+
+    def factory():
+        client = fakeredis.aioredis.FakeRedis(server=server, decode_responses=True)
+        original = client.pubsub
+
+        def tracking_pubsub(**kwargs):
+            pubsubs.append(_DroppablePubSub(original(**kwargs)))
+            return pubsubs[-1]
+
+        client.pubsub = tracking_pubsub
+        clients.append(client)
+        return client
+
+    sub = ConfigSubscriber(client_factory=factory)
+    sub.clients = clients
+    sub.pubsubs = pubsubs
+    yield sub
+    tasks = [t for t in asyncio.all_tasks() if t.get_name() == "config-subscriber"]
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def _until(predicate):
+    for _ in range(200):
+        if predicate():
+            return
+        await asyncio.sleep(0.01)
+    raise AssertionError("condition not reached")
+
+
+@pytest.mark.asyncio
+async def test_sessions_share_one_subscription(server, subscriber):
+    received = {ROOM_A: [], ROOM_B: []}
+    unregister = [
+        subscriber.register(ROOM_A, received[ROOM_A].append),
+        subscriber.register(ROOM_A, received[ROOM_A].append),
+        subscriber.register(ROOM_B, received[ROOM_B].append),
+    ]
+    await _until(subscriber.live.is_set)
+    assert len(subscriber.clients) == 1
+
+    publisher = fakeredis.aioredis.FakeRedis(server=server, decode_responses=True)
+    await publish_config(publisher, ROOM_A, '{"mode": "work"}')
+    await publish_config(publisher, "https://example.daily.co/elsewhere", '{"mode": "home"}')
+    await _until(lambda: len(received[ROOM_A]) == 2)
+    assert received[ROOM_B] == []
+
+    for fn in unregister:
+        fn()
+    await asyncio.sleep(0.05)
+    assert subscriber._task is None
+
+
+@pytest.mark.asyncio
+async def test_reconnect_replays_newest_missed_update(server, subscriber, monkeypatch):
+    monkeypatch.setattr(config_subscriber, "_MIN_BACKOFF_SECS", 0.01)
+    received = []
+    unregister = subscriber.register(ROOM_A, received.append)
+    await _until(subscriber.live.is_set)
+
+    publisher = fakeredis.aioredis.FakeRedis(server=server, decode_responses=True)
+    await publish_config(publisher, ROOM_A, '{"mode": "work"}')
+    await _until(lambda: received == ['{"mode": "work"}'])
+
+    subscriber.pubsubs[-1].dropped.set()
+    await _until(lambda: not subscriber.live.is_set())
+    # Published while the subscriber was offline: only reachable through the stream
+    await publisher.xadd(config_subscriber.CONFIG_STREAM, {"room_url": ROOM_A, "payload": '{"mode": "creative"}'})
+    await publisher.xadd(config_subscriber.CONFIG_STREAM, {"room_url": ROOM_A, "payload": '{"mode": "home"}'})
+
+    await _until(lambda: received[-1] == '{"mode": "home"}')
+    assert received == ['{"mode": "work"}', '{"mode": "home"}']
+    assert subscriber.reconnects >= 1 and subscriber.replayed == 1
+    unregister()
+
+
+@pytest.mark.asyncio
+async def test_listener_applies_pending_and_routed_updates(server, subscriber, monkeypatch):
+    monkeypatch.setenv("USE_REDIS", "true")
+    monkeypatch.setattr(config_listener, "get_config_subscriber", lambda: subscriber)
+    applied = []
+
+    async def fake_apply(config, *args, **kwargs):
+        applied.append(config)
+
+    monkeypatch.setattr(config_listener, "apply_config_update", fake_apply)
+    publisher = fakeredis.aioredis.FakeRedis(server=server, decode_responses=True)
+    await publisher.set(f"bot:config:latest:{ROOM_A}", json.dumps({"mode": "work"}))
+
+    listener = asyncio.create_task(config_listener.start_config_listener(None, None, None, ROOM_A))
+    await _until(subscriber.live.is_set)
+    await publish_config(publisher, ROOM_A, json.dumps({"mode": "work"}))  # duplicate of pending
+    await publish_config(publisher, ROOM_A, json.dumps({"mode": "home"}))
+    await _until(lambda: len(applied) == 2)
+    assert applied == [{"mode": "work"}, {"mode": "home"}]
+
+    listener.cancel()
+    await asyncio.gather(listener, return_exceptions=True)
+    assert subscriber._routes == {}
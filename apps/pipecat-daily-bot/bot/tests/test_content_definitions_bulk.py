@@ -0,0 +1,89 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+import nia_content_definitions as defs
+
+
+class _FakeMesh(ThreadingHTTPServer):
+    """Definition endpoints of Mesh: GET /api/definition/<name>, POST (upsert) /api/definition."""
+
+    def __init__(self, stored):
+        super().__init__(("127.0.0.1", 0), _MeshHandler)
+        self.stored = stored
+        self.requests = []
+        self.lock = threading.Lock()
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}/api"
+
+
+class _MeshHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *_args):
+        pass
+
+    def _reply(self, status, payload):
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        name = self.path.split("?")[0].rsplit("/", 1)[-1]
+        with self.server.lock:
+            self.server.requests.append(("GET", name))
+            stored = self.server.stored.get(name)
+        if stored is None:
+            self._reply(404, {"success": False})
+        else:
+            # Mesh wraps the definition in its content model
+            self._reply(200, {"success": True, "data": {"_id": "x", "content": stored}})
+
+    def do_POST(self):
+        definition = json.loads(self.rfile.read(int(self.headers["Content-Length"])))["definition"]
+        with self.server.lock:
+            self.server.requests.append(("POST", definition["name"]))
+            self.server.stored[definition["name"]] = definition
+        self._reply(200, {"success": True, "data": definition})
+
+
+@pytest.fixture
+def mesh():
+    defs.clear_ensured_cache()
+    changed = {**defs.NOTES_DEFINITION, "description": "stale"}
+    server = _FakeMesh({"HtmlGeneration": defs.HTMLGENERATION_DEFINITION, "Notes": changed})
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    defs.clear_ensured_cache()
+
+
+def test_bulk_registration_only_writes_what_changed(mesh):
+    results = defs.ensure_content_definitions(defs.ALL_DEFINITIONS, mesh.url, "tenant-1")
+
+    assert results == {"HtmlGeneration": True, "AppletStorage": True, "Notes": True}
+    assert sorted(r for r in mesh.requests if r[0] == "POST") == [("POST", "AppletStorage"), ("POST", "Notes")]
+    assert mesh.stored["Notes"] == defs.NOTES_DEFINITION
+
+    # Warm start in the same process: nothing to check
+    mesh.requests.clear()
+    assert defs.register_all_definitions(mesh.url, "tenant-1") == results
+    assert mesh.requests == []
+
+    # force goes back to Mesh, which now holds everything current
+    defs.ensure_content_definitions(defs.ALL_DEFINITIONS, mesh.url, "tenant-1", force=True)
+    assert sorted(mesh.requests) == [("GET", "AppletStorage"), ("GET", "HtmlGeneration"), ("GET", "Notes")]
+
+
+def test_failed_registration_is_not_cached():
+    defs.clear_ensured_cache()
+    assert defs.register_content_definition(defs.NOTES_DEFINITION, "http://127.0.0.1:9/api", "t") is False
+    assert defs.mesh_helpers._ensured.get(("http://127.0.0.1:9/api", "t"), {}) == {}
@@ -0,0 +1,79 @@
+from core.conversation_window import SUMMARY_HEADER, ConversationWindow, estimate_tokens
+
+
+def _turns(count, words=40):
+    messages = []
+    for i in range(count):
+        role = "user" if i % 2 == 0 else "assistant"
+        messages.append({"role": role, "content": f"turn {i} " + "word " * words})
+    return messages
+
+
+def test_sync_ingests_only_new_messages():
+    window = ConversationWindow("sys", token_budget=100_000, summary_chars=0)
+    upstream = [{"role": "system", "content": "flow prompt"}, *_turns(3)]
+    window.sync(upstream)
+    first = window.snapshot()
+    assert [m["role"] for m in first] == ["system", "user", "assistant", "user"]
+    assert first[0]["content"] == "sys"
+
+    upstream.append({"role": "assistant", "content": "reply"})
+    window.sync(upstream)
+    second = window.snapshot()
+    # Earlier messages are shared, not copied
+    assert second[1] is first[1]
+    assert second[-1]["content"] == "reply"
+    assert window.snapshot() is second
+    assert window.resyncs == 0
+
+
+def test_rewritten_upstream_triggers_resync():
+    window = ConversationWindow("sys", token_budget=100_000)
+    window.sync(_turns(4))
+    window.sync([{"role": "user", "content": "fresh start"}])
+    assert window.resyncs == 1
+    assert [m["content"] for m in window.snapshot()[1:]] == ["fresh start"]
+
+
+def test_budget_evicts_into_rolling_summary():
+    budget = 400
+    window = ConversationWindow("sys", token_budget=budget, max_messages=1000, summary_chars=300)
+    upstream = []
+    sizes = []
+    for turn in _turns(500):
+        upstream.append(turn)
+        window.sync(upstream)
+        sizes.append(window.token_count)
+
+    snapshot = window.snapshot()
+    assert snapshot[1]["role"] == "system"
+    assert snapshot[1]["content"].startswith(SUMMARY_HEADER)
+    assert len(window.summary) <= 300
+    assert sum(estimate_tokens(m) for m in snapshot[2:]) <= budget
+    assert snapshot[-1]["content"].startswith("turn 499 ")
+    # Prompt size is flat once the window is full
+    assert max(sizes[100:]) - min(sizes[100:]) < 100
+    assert window.evicted > 400
+
+
+def test_local_messages_are_replaced_by_next_sync():
+    window = ConversationWindow("sys", token_budget=100_000)
+    upstream = _turns(1)
+    window.sync(upstream)
+    window.add_local({"role": "assistant", "content": "streamed"})
+    assert window.snapshot()[-1]["content"] == "streamed"
+
+    upstream.append({"role": "assistant", "content": "streamed"})
+    window.sync(upstream)
+    assert [m["content"] for m in window.snapshot()].count("streamed") == 1
+
+
+def test_orphaned_tool_results_are_dropped():
+    window = ConversationWindow("sys", token_budget=100_000, max_messages=2, summary_chars=0)
+    window.sync([
+        {"role": "user", "content": "search"},
+        {"role": "assistant", "content": None, "tool_calls": [{"id": "1"}]},
+        {"role": "tool", "tool_call_id": "1", "content": "result"},
+        {"role": "assistant", "content": "done"},
+    ])
+    assert [m["role"] for m in window.snapshot()] == ["system", "assistant"]
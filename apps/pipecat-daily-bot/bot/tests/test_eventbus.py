@@ -1,7 +1,12 @@
+import asyncio
+import contextvars
 import importlib
 
+import pytest
 from loguru import logger
 
+import eventbus.bus as bus
+
 
 def test_eventbus_publish_logs(monkeypatch):
     monkeypatch.setenv("BOT_EVENT_BUS", "log")
@@ -17,6 +22,8 @@ def test_eventbus_publish_logs(monkeypatch):
         ev1 = eb.emit_call_state("room", "starting")
         ev2 = eb.emit_participant_join("room", "p1")
         ev3 = eb.emit_participant_left("room", "p1", "left")
+        # Logging happens on a background writer; wait for it before inspecting
+        assert eb.flush_log()
     finally:
         logger.remove(token)
     combined = "\n".join(str(r) for r in records)
@@ -29,6 +36,66 @@ def test_eventbus_publish_logs(monkeypatch):
         assert ev["version"] == "1"
 
 
+def test_dispatch_index_tracks_subscription_changes():
+    calls = []
+    unsub_topic = bus.subscribe("t.one", lambda t, d: calls.append(("topic", t)))
+    unsub_wild = bus.subscribe("*", lambda t, d: calls.append(("wild", t)))
+    bus.publish("t.one", {})
+    assert calls == [("topic", "t.one"), ("wild", "t.one")]
+    unsub_wild()
+    bus.publish("t.one", {})
+    assert calls[-1] == ("topic", "t.one") and len(calls) == 3
+    unsub_topic()
+    bus.publish("t.one", {})
+    assert len(calls) == 3
+
+
+def test_log_writer_uses_publish_time_message_and_context(monkeypatch):
+    monkeypatch.setattr(bus, "EVENT_BUS_BACKEND", "log")
+    request_id = contextvars.ContextVar("request_id", default=None)
+    logged = []
+    monkeypatch.setattr(
+        bus.logger, "info", lambda message: logged.append((request_id.get(), message))
+    )
+
+    token = request_id.set("req-1")
+    try:
+        payload = {"items": ["a"]}
+        bus.publish("t.snapshot", payload)
+    finally:
+        request_id.reset(token)
+    payload["late"] = "b"
+    assert bus.flush_log()
+
+    ((bound, message),) = [entry for entry in logged if "t.snapshot" in entry[1]]
+    assert bound == "req-1"
+    assert "['a']" in message and "late" not in message
+
+
+def test_log_sampling(monkeypatch):
+    exact, prefixes = bus._parse_sample_rates("a.b=0,c.*=3")
+    monkeypatch.setattr(bus, "_sample_exact", exact)
+    monkeypatch.setattr(bus, "_sample_prefixes", prefixes)
+    monkeypatch.setattr(bus, "_sample_counters", {})
+    assert not bus._should_log("a.b", {})
+    assert [bus._should_log("c.x", {}) for _ in range(6)] == [True, False, False] * 2
+    assert bus._should_log("other", {})
+    assert not bus._should_log(bus.BOT_TRANSCRIPT, {"isFinal": False})
+
+
+@pytest.mark.asyncio
+async def test_full_stream_drops_oldest_and_counts_it(monkeypatch):
+    monkeypatch.setattr(bus, "_drop_counts", {})
+    stream = await bus.register_stream(maxsize=2)
+    try:
+        for i in range(3):
+            bus.publish("s.tick", {"i": i})
+        assert [stream.get_nowait()["data"]["i"] for _ in range(2)] == [1, 2]
+        assert bus.bus_stats()["drops"] == {"s.tick": 1}
+    finally:
+        bus.unregister_stream(stream)
+
+
 # TODO: These tests hang, fix and refactor
 # def test_sse_stream_envelopes(monkeypatch):
 #     class FakeProc:
@@ -0,0 +1,34 @@
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from actions import html_actions
+from actions.html_actions import HTML_GENERATION_METADATA_FIELDS
+
+
+@pytest.mark.asyncio
+async def test_listing_requests_metadata_projection():
+    request = AsyncMock(return_value={"success": True, "data": [{"_id": "a1", "title": "Snake", "createdBy": "u1"}]})
+    shared = AsyncMock(return_value={"success": True, "resources": [{"_id": "a2", "title": "Tetris", "_sharing": {"role": "viewer"}}]})
+    with patch.object(html_actions.mesh_client, "request", request), patch.object(
+        html_actions.sharing_tools, "get_user_shared_resources", shared
+    ):
+        listing = await html_actions.list_html_generations("t1", "u1")
+
+    params = request.await_args.kwargs["params"]
+    assert params["fields"].split(",") == list(HTML_GENERATION_METADATA_FIELDS)
+    assert "htmlContent" not in params["fields"]
+    assert shared.await_args.kwargs["fields"] == HTML_GENERATION_METADATA_FIELDS
+    assert [(g["_id"], g["accessLevel"]) for g in listing] == [("a1", "owner"), ("a2", "viewer")]
+
+
+@pytest.mark.asyncio
+async def test_get_by_id_loads_body_unless_projected():
+    request = AsyncMock(return_value={"success": True, "data": [{"_id": "a1", "createdBy": "u1"}]})
+    with patch.object(html_actions.mesh_client, "request", request):
+        await html_actions.get_html_generation_by_id("t1", "a1")
+        assert "fields" not in request.await_args.kwargs["params"]
+
+        applet = await html_actions.get_html_generation_by_id("t1", "a1", fields=("createdBy",))
+        assert request.await_args.kwargs["params"]["fields"] == "createdBy"
+        assert applet["createdBy"] == "u1"
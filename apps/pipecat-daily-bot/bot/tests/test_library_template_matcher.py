@@ -0,0 +1,23 @@
+from nia_library_templates import LIBRARY_TEMPLATE_INDEX, LIBRARY_TEMPLATES, match_templates
+
+from tools.html.crud import _auto_select_library_template
+
+
+def test_auto_select_uses_indexed_matches():
+    assert _auto_select_library_template("Quick poll", "Lunch options for the team", "tool") == ("tool", "quick_poll_v1")
+    assert _auto_select_library_template("Space invaders", "retro shooter", "game") == ("game", "space_invaders_lite")
+    # Plurals fold onto template words; the content type filters the shortlist
+    assert _auto_select_library_template("Checkers", "", "game") == ("game", "checkers_challenge")
+    assert _auto_select_library_template("Checkers", "", "tool") == (None, None)
+    # Whole tokens only: "function" no longer matches the "fun" tag
+    assert _auto_select_library_template("Function plotter", "graph a function", "tool") == (None, None)
+
+
+def test_match_templates_ranks_shortlist():
+    shortlist = match_templates("party pack emoji poll", library_type="tool", limit=2)
+    assert [(t["id"], score) for t, score in shortlist] == [("party_pack_poll", 8), ("party_pack_score", 4)]
+    assert match_templates("checkers_challenge")[0][0]["id"] == "checkers_challenge"
+
+    # Every posting points at a real template
+    positions = {position for postings in LIBRARY_TEMPLATE_INDEX.values() for position, _ in postings}
+    assert positions == set(range(len(LIBRARY_TEMPLATES)))
@@ -0,0 +1,130 @@
+import asyncio
+import json
+import time
+from contextlib import asynccontextmanager
+
+import aiohttp
+import pytest
+from aiohttp import web
+
+from services.llm_hedging import FirstTokenStats, HedgedLLM, LLMEndpoint, LLMStreamError
+
+TIMEOUT = aiohttp.ClientTimeout(total=10)
+
+
+@asynccontextmanager
+async def fake_llm(delay: float, tokens=("Hello", " there"), status: int = 200):
+    """OpenAI-compatible streaming server with an injected first-token delay."""
+    stats = {"requests": 0, "completed": 0}
+
+    async def completions(request: web.Request) -> web.StreamResponse:
+        stats["requests"] += 1
+        await request.json()
+        if status != 200:
+            return web.Response(status=status, text="upstream unavailable")
+        resp = web.StreamResponse(headers={"Content-Type": "text/event-stream"})
+        await resp.prepare(request)
+        await asyncio.sleep(delay)
+        for token in tokens:
+            chunk = {"choices": [{"delta": {"content": token}}]}
+            await resp.write(f"data: {json.dumps(chunk)}\n\n".encode())
+        await resp.write(b"data: [DONE]\n\n")
+        stats["completed"] += 1
+        return resp
+
+    app = web.Application()
+    app.router.add_post("/v1/chat/completions", completions)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    try:
+        yield f"http://127.0.0.1:{port}/v1", stats
+    finally:
+        await runner.cleanup()
+
+
+def _endpoint(name, url):
+    return LLMEndpoint(name, url, "key", f"{name}-model")
+
+
+async def _collect(llm, session):
+    return "".join([chunk async for chunk in llm.stream(session, [], timeout=TIMEOUT)])
+
+
+@pytest.mark.asyncio
+async def test_backup_wins_when_primary_first_token_is_late():
+    async with fake_llm(2.0, ("slow",)) as (primary_url, primary), fake_llm(0.02, ("fast",)) as (backup_url, backup):
+        llm = HedgedLLM(_endpoint("primary", primary_url), _endpoint("backup", backup_url), initial_delay=0.1, min_delay=0.05)
+        async with aiohttp.ClientSession() as session:
+            started = time.monotonic()
+            assert await _collect(llm, session) == "fast"
+            assert time.monotonic() - started < 1.0
+        assert (llm.hedges, llm.backup_wins) == (1, 1)
+        assert primary["completed"] == 0
+
+
+@pytest.mark.asyncio
+async def test_fast_primary_never_fires_backup():
+    async with fake_llm(0.0) as (primary_url, _), fake_llm(0.0) as (backup_url, backup):
+        llm = HedgedLLM(_endpoint("primary", primary_url), _endpoint("backup", backup_url), initial_delay=0.5)
+        async with aiohttp.ClientSession() as session:
+            assert await _collect(llm, session) == "Hello there"
+        assert backup["requests"] == 0
+        assert llm.summary()["first_token_p50_ms"] is not None
+
+
+@pytest.mark.asyncio
+async def test_primary_error_falls_back_immediately():
+    async with fake_llm(0.0, status=503) as (primary_url, _), fake_llm(0.0) as (backup_url, _):
+        llm = HedgedLLM(_endpoint("primary", primary_url), _endpoint("backup", backup_url), initial_delay=5.0)
+        async with aiohttp.ClientSession() as session:
+            started = time.monotonic()
+            assert await _collect(llm, session) == "Hello there"
+            assert time.monotonic() - started < 1.0
+
+
+@pytest.mark.asyncio
+async def test_error_without_backup_is_raised():
+    async with fake_llm(0.0, status=500) as (url, _):
+        llm = HedgedLLM(_endpoint("primary", url))
+        async with aiohttp.ClientSession() as session:
+            with pytest.raises(LLMStreamError):
+                await _collect(llm, session)
+
+
+def test_hedge_delay_tracks_percentile_within_bounds():
+    llm = HedgedLLM(_endpoint("primary", "http://x"), percentile=0.9, min_delay=0.2, max_delay=1.0, initial_delay=0.7)
+    assert llm.hedge_delay() == 0.7
+    for ms in range(100, 1100, 100):
+        llm.stats["primary"].record(ms / 1000)
+    assert llm.hedge_delay() == pytest.approx(0.9)
+    stats = FirstTokenStats()
+    for _ in range(20):
+        stats.record(5.0)
+    assert stats.percentile(0.99) == 5.0
+
+
+@pytest.mark.asyncio
+async def test_router_adopts_matching_speculation():
+    from processors.non_blocking_router import NonBlockingToolRouter
+
+    async with fake_llm(0.0, ("Sure", " thing")) as (url, stats):
+        router = NonBlockingToolRouter(system_prompt="sys", fast_api_url=url, fast_api_key="k")
+        router._speculative = True
+        router._speculation_stable_secs = 0.01
+        router.on_interim_transcript("tell me a joke")
+        router.on_interim_transcript("Tell me a joke!")  # same normalized text keeps the timer
+        await asyncio.sleep(0.05)
+        assert router._speculation is not None
+
+        assert router._take_speculation("something else", False) is None
+        assert router.speculation_misses == 1
+
+        router.on_interim_transcript("tell me a joke")
+        await asyncio.sleep(0.05)
+        speculation = router._take_speculation("Tell me a joke.", False)
+        assert speculation is not None
+        assert "".join([c async for c in speculation.chunks()]) == "Sure thing"
+        await router.cleanup()
@@ -0,0 +1,98 @@
+import asyncio
+from pathlib import Path
+
+import aiohttp
+import pytest
+from pipecat.audio.vad.silero import SileroVADAnalyzer
+from pipecat.audio.vad.vad_analyzer import VADParams
+from pipecat.frames.frames import TranscriptionFrame, TTSAudioRawFrame
+from pipecat.pipeline.pipeline import Pipeline
+from pipecat.pipeline.runner import PipelineRunner
+from pipecat.pipeline.task import PipelineTask
+from pipecat.processors.frame_processor import FrameProcessor
+from pipecat.transports.base_transport import TransportParams
+
+from tests.integration.clips import read_wav_clip
+from tests.integration.loopback import (
+    BOT_AUDIO,
+    LLM_TOOL_CALL,
+    LLM_TOOL_RESULT,
+    TRANSCRIPTION,
+    USER_STARTED_SPEAKING,
+    USER_STOPPED_SPEAKING,
+    FakeLLMServer,
+    LoopbackTimeline,
+    LoopbackTransport,
+)
+
+_HELLO = Path(__file__).parent / "integration" / "resources" / "hello_how_are_you.wav"
+
+
+class _Replier(FrameProcessor):
+    """Answers every transcript with 300ms of audio, standing in for LLM + TTS."""
+
+    async def process_frame(self, frame, direction):
+        await super().process_frame(frame, direction)
+        if isinstance(frame, TranscriptionFrame):
+            await self.push_frame(TTSAudioRawFrame(b"\x00" * 14400, 24000, 1))
+        else:
+            await self.push_frame(frame, direction)
+
+
+@pytest.mark.asyncio
+async def test_clip_round_trip_is_timestamped():
+    params = TransportParams(
+        audio_in_enabled=True,
+        audio_out_enabled=True,
+        audio_out_sample_rate=24000,
+        vad_analyzer=SileroVADAnalyzer(params=VADParams(stop_secs=0.3)),
+    )
+    transport = LoopbackTransport(params, stt_delay_secs=0.05)
+    timeline = transport.timeline
+    task = PipelineTask(Pipeline([transport.input(), _Replier(), transport.output()]))
+    run = asyncio.create_task(PipelineRunner(handle_sigint=False).run(task))
+    try:
+        await transport.wait_until_ready()
+        clip = read_wav_clip(_HELLO, transport.input().sample_rate)
+        ended = await transport.say(clip, "Hello, how are you?")
+        first = await timeline.wait_for(BOT_AUDIO, ended, timeout=10)
+        spoken_until = await timeline.wait_for_bot_silence(ended, quiet_secs=0.1, timeout=10)
+        vad_stop = await timeline.wait_for(USER_STOPPED_SPEAKING, ended, timeout=10)
+    finally:
+        await task.cancel()
+        await asyncio.gather(run, return_exceptions=True)
+
+    assert timeline.first(USER_STARTED_SPEAKING).at < ended < vad_stop.at
+    assert timeline.first(TRANSCRIPTION, ended).at - ended == pytest.approx(0.05, abs=0.05)
+    # Output plays at real-time pace: 300ms of audio takes ~300ms to write out
+    assert spoken_until - first.at == pytest.approx(0.3, abs=0.05)
+    assert timeline.bot_speech_end(first.at) == spoken_until
+
+
+async def _stream(session, url, messages):
+    async with session.post(f"{url}/chat/completions", json={"messages": messages, "stream": True}) as resp:
+        return await resp.text()
+
+
+@pytest.mark.asyncio
+async def test_fake_llm_scripts_tool_round_trip():
+    timeline = LoopbackTimeline()
+    server = FakeLLMServer(timeline)
+    server.script.first_token_secs = 0
+    url = await server.start()
+    try:
+        async with aiohttp.ClientSession() as session:
+            call = await _stream(session, url, [{"role": "user", "content": "Open the notepad please."}])
+            result = await _stream(
+                session,
+                url,
+                [{"role": "assistant", "tool_calls": []}, {"role": "tool", "tool_call_id": "call_loopback_1", "content": "{}"}],
+            )
+    finally:
+        await server.stop()
+
+    assert '"name": "loopback_probe"' in call and '"finish_reason": "tool_calls"' in call
+    assert '"content": " notepad"' in result and "tool_calls" not in result
+    assert timeline.first(LLM_TOOL_CALL).detail == "call_loopback_1"
+    assert timeline.first(LLM_TOOL_RESULT).detail == "call_loopback_1"
+    assert len(server.requests) == 2
@@ -0,0 +1,168 @@
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from actions import notes_actions
+from actions.notes_actions import (
+    NoteEdit,
+    NotePatchError,
+    NoteVersionConflict,
+    apply_note_edits,
+    note_version,
+)
+
+
+def test_position_and_anchor_edits():
+    body = "# Groceries\n- milk\n- eggs"
+    assert apply_note_edits("", [NoteEdit("insert", "- bread")]) == "- bread"
+    assert apply_note_edits(body, [NoteEdit("insert", "- bread")]).endswith("- eggs\n- bread")
+    assert apply_note_edits(body, [NoteEdit("insert", "Intro", position="start", separator="\n\n")]).startswith("Intro\n\n# Groceries")
+    assert apply_note_edits(body, [NoteEdit("insert", "- butter", anchor="- milk", position="after")]) == (
+        "# Groceries\n- milk\n- butter\n- eggs"
+    )
+    assert apply_note_edits(body, [NoteEdit("insert", "- jam", anchor="- eggs", position="before")]) == (
+        "# Groceries\n- milk\n- jam\n- eggs"
+    )
+    assert apply_note_edits(body, [NoteEdit("remove", anchor="\n- milk")]) == "# Groceries\n- eggs"
+    assert apply_note_edits("a a a", [NoteEdit("replace", "b", anchor="a", count=2)]) == "b b a"
+
+
+def test_missing_anchor_is_an_error():
+    with pytest.raises(NotePatchError):
+        apply_note_edits("- milk", [NoteEdit("remove", anchor="- eggs")])
+    with pytest.raises(NotePatchError):
+        apply_note_edits("- milk", [NoteEdit("replace", "x")])
+
+
+@pytest.fixture
+def mesh_request():
+    request = AsyncMock()
+    with patch("services.mesh.request", request), \
+         patch.object(notes_actions.sharing_actions, "check_resource_write_permission", AsyncMock(return_value=True)), \
+         patch.object(notes_actions.asyncio, "sleep", AsyncMock()) as sleep:
+        request.sleep = sleep
+        notes_actions._note_versions.clear()
+        yield request
+    notes_actions._note_versions.clear()
+
+
+@pytest.mark.asyncio
+async def test_patch_sends_only_edits_and_returns_mesh_note(mesh_request):
+    saved = {"_id": "n1", "mode": "work", "content": "- milk\n- eggs", "updatedAt": "2026-10-18T21:00:00Z"}
+    mesh_request.return_value = {"success": True, "data": saved, "version": "v2"}
+
+    result = await notes_actions.patch_note_content(
+        "t1", "n1", [NoteEdit("insert", "- eggs")], "u1", expected_version="v1"
+    )
+
+    assert result == saved
+    mesh_request.assert_awaited_once_with(
+        "PATCH",
+        "/content/Notes/n1/edits",
+        params={"tenant": "t1"},
+        json_body={
+            "field": "content",
+            "edits": [{"op": "insert", "text": "- eggs", "position": "end", "separator": "\n", "count": -1}],
+            "expectedVersion": "v1",
+        },
+    )
+    assert notes_actions.known_note_version("t1", "n1") == "v2"
+
+
+@pytest.mark.asyncio
+async def test_conflicts_and_rejected_edits_are_not_retried(mesh_request):
+    notes_actions._note_versions[("t1", "n1")] = "v1"
+    mesh_request.return_value = {"success": False, "error": "precondition failed", "status": 412}
+    with pytest.raises(NoteVersionConflict):
+        await notes_actions.patch_note_content("t1", "n1", [NoteEdit("insert", "x")], "u1", expected_version="v1")
+    assert notes_actions.known_note_version("t1", "n1") is None
+
+    mesh_request.return_value = {"success": False, "error": "'- eggs' not found", "status": 422}
+    with pytest.raises(NotePatchError):
+        await notes_actions.patch_note_content("t1", "n1", [NoteEdit("remove", anchor="- eggs")], "u1")
+
+    assert mesh_request.await_count == 2
+    mesh_request.sleep.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_transient_failures_are_retried_with_backoff(mesh_request):
+    saved = {"_id": "n1", "content": "- milk"}
+    mesh_request.side_effect = [
+        {"success": False, "error": "bad gateway", "status": 502},
+        {"success": False, "error": "Mesh request error: timeout", "status": None},
+        {"success": True, "data": saved},
+    ]
+    assert await notes_actions.patch_note_content("t1", "n1", [NoteEdit("insert", "- milk")], "u1") == saved
+    assert [call.args[0] for call in mesh_request.sleep.await_args_list] == [1.0, 2.0]
+    assert notes_actions.known_note_version("t1", "n1") == note_version("- milk")
+
+    mesh_request.side_effect = None
+    mesh_request.return_value = {"success": False, "error": "unavailable", "status": 503}
+    assert await notes_actions.patch_note_content("t1", "n1", [NoteEdit("insert", "x")], "u1") is None
+    assert mesh_request.await_count == 6
+
+
+@pytest.mark.asyncio
+async def test_append_to_note_uses_patch(mesh_request):
+    mesh_request.return_value = {"success": True, "data": {"_id": "n1", "content": "- milk"}}
+    assert await notes_actions.append_to_note("t1", "n1", "milk", "u1") is True
+    body = mesh_request.await_args.kwargs["json_body"]
+    assert body["edits"][0]["text"] == "- milk"
+    assert "expectedVersion" not in body
+
+    mesh_request.return_value = {"success": False, "error": "Content not found", "status": 404}
+    assert await notes_actions.append_to_note("t1", "missing", "milk", "u1") is False
+
+
+@pytest.mark.asyncio
+async def test_content_tools_make_only_anchor_edits_conditional(mesh_request):
+    from tools.notes import content as content_tools
+
+    params = MagicMock(forwarder=None)
+    get_note = AsyncMock(return_value={"_id": "n1", "content": "- milk"})
+    patch_note = AsyncMock(return_value={"_id": "n1", "content": "- milk\n- eggs"})
+    with patch.object(content_tools, "_resolve_target_note", AsyncMock(return_value=(("t1", "u1", "n1"), None))), \
+         patch.object(notes_actions, "get_note_by_id", get_note), \
+         patch.object(notes_actions, "patch_note_content", patch_note):
+        # Appends apply to whatever the note holds, even with a stale version known
+        notes_actions._note_versions[("t1", "n1")] = "stale"
+        assert (await content_tools._patch_note(params, [NoteEdit("insert", "- eggs")], MagicMock()))["success"] is True
+        assert patch_note.await_args.kwargs["expected_version"] is None
+        get_note.assert_not_awaited()
+
+        remove = [NoteEdit("remove", anchor="- milk")]
+        await content_tools._patch_note(params, remove, MagicMock())
+        assert patch_note.await_args.kwargs["expected_version"] == "stale"
+
+        notes_actions._note_versions.clear()
+        await content_tools._patch_note(params, remove, MagicMock())
+        assert patch_note.await_args.kwargs["expected_version"] == note_version("- milk")
+        get_note.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_content_tools_reread_once_on_conflict(mesh_request):
+    from tools.notes import content as content_tools
+
+    params = MagicMock(forwarder=None)
+    get_note = AsyncMock(return_value={"_id": "n1", "content": "- milk\n- bread"})
+    saved = {"_id": "n1", "content": "- bread"}
+    patch_note = AsyncMock(side_effect=[NoteVersionConflict("Note n1 changed"), saved])
+    edits = [NoteEdit("remove", anchor="- milk\n"), NoteEdit("remove", anchor="- eggs")]
+    notes_actions._note_versions[("t1", "n1")] = "stale"
+    with patch.object(content_tools, "_resolve_target_note", AsyncMock(return_value=(("t1", "u1", "n1"), None))), \
+         patch.object(notes_actions, "get_note_by_id", get_note), \
+         patch.object(notes_actions, "patch_note_content", patch_note):
+        result = await content_tools._patch_note(params, edits, MagicMock())
+        assert result == {"success": True, "note": saved, "user_message": "I've updated the note."}
+        retry = patch_note.await_args_list[1]
+        assert retry.args[2] == [edits[0]]
+        assert retry.kwargs["expected_version"] == note_version("- milk\n- bread")
+
+        # A second conflict is reported rather than retried again
+        patch_note.side_effect = NoteVersionConflict("Note n1 changed")
+        patch_note.reset_mock()
+        result = await content_tools._patch_note(params, edits, MagicMock())
+        assert result["success"] is False
+        assert patch_note.await_count == 2
@@ -0,0 +1,139 @@
+from unittest.mock import AsyncMock
+
+import pytest
+from pipecat.frames.frames import TTSAudioRawFrame, TTSStartedFrame, TTSStoppedFrame
+
+from services import phrase_audio_cache as pac
+from services.phrase_audio_cache import CachedPhrase, PhraseAudioCache, phrase_key
+
+PCM = b"\x01\x00" * 2400  # 100ms of 24kHz mono
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache(monkeypatch):
+    monkeypatch.delenv("BOT_PHRASE_CACHE_DIR", raising=False)
+    monkeypatch.setenv("BOT_PHRASE_CACHE_ENABLED", "1")
+    pac.reset_phrase_cache()
+    yield
+    pac.reset_phrase_cache()
+
+
+def test_key_normalizes_whitespace_and_speed():
+    assert phrase_key("pocket", None, None, "  One   sec. ") == ("pocket", "", 1.0, "One sec.")
+
+
+def test_lru_eviction_and_stats():
+    cache = PhraseAudioCache(max_entries=2)
+    for text in ("a", "b", "c"):
+        cache.put(phrase_key("p", "v", 1.0, text), CachedPhrase(PCM, 24000))
+    assert cache.get(phrase_key("p", "v", 1.0, "a")) is None
+    assert cache.get(phrase_key("p", "v", 1.0, "c")) is not None
+    cache.record_first_audio(True, 1.0)
+    cache.record_first_audio(False, 180.0)
+    stats = cache.stats()
+    assert stats["hits"] == 1 and stats["misses"] == 1 and stats["entries"] == 2
+    assert stats["first_audio_ms_p50"] == {"hit": 1.0, "miss": 180.0}
+
+
+def test_disk_round_trip(tmp_path):
+    key = phrase_key("kokoro", "af_alloy", 1.0, "On it.")
+    PhraseAudioCache(cache_dir=str(tmp_path)).put(key, CachedPhrase(PCM, 22050))
+    loaded = PhraseAudioCache(cache_dir=str(tmp_path)).get(key)
+    assert loaded == CachedPhrase(PCM, 22050, 1)
+
+
+def test_frames_are_20ms_chunks():
+    frames = CachedPhrase(PCM, 24000).frames()
+    assert len(frames) == 5
+    assert all(len(f.audio) == 960 and f.sample_rate == 24000 for f in frames)
+
+
+class _FakeService:
+    def __init__(self, fail=()):
+        self.rendered = []
+        self._fail = set(fail)
+
+    def phrase_cache_key(self, text):
+        return phrase_key("fake", "v", 1.0, text)
+
+    async def render_phrase(self, text):
+        self.rendered.append(text)
+        if text in self._fail:
+            raise RuntimeError("tts down")
+        return CachedPhrase(PCM, 24000)
+
+
+@pytest.mark.asyncio
+async def test_warm_renders_segments_once_and_skips_failures():
+    svc = _FakeService(fail={"Hang on."})
+    count = await pac.warm_phrase_cache([svc, object()], ["One moment...", "Hang on.", "One moment..."])
+    assert svc.rendered == ["One moment...", "One moment.", "Hang on."]
+    assert count == 2
+    svc.rendered.clear()
+    assert await pac.warm_phrase_cache([svc], ["One moment..."]) == 0
+    assert svc.rendered == []
+
+
+@pytest.mark.asyncio
+async def test_pocket_serves_cached_phrase_without_http():
+    from providers.pocket_tts import PocketTTSService
+
+    svc = PocketTTSService(base_url="http://127.0.0.1:1")
+    pac.get_phrase_cache().put(svc.phrase_cache_key("On it."), CachedPhrase(PCM, 24000), persist=False)
+    frames = [f async for f in svc.run_tts(" On it. ", "ctx")]
+    assert isinstance(frames[0], TTSStartedFrame)
+    assert isinstance(frames[-1], TTSStoppedFrame)
+    assert b"".join(f.audio for f in frames if isinstance(f, TTSAudioRawFrame)) == PCM
+    assert pac.get_phrase_cache().stats()["hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_pocket_services_share_one_pool_closed_by_the_last_cleanup():
+    from providers import pocket_tts
+
+    first = pocket_tts.PocketTTSService(base_url="http://127.0.0.1:1")
+    second = pocket_tts.PocketTTSService(base_url="http://127.0.0.1:1/")
+    await first.warm_connection()
+    await second.warm_connection()
+    session, key = first._session, first._session_key
+    assert second._session is session
+
+    await first.cleanup()
+    assert not session.closed
+    await second.cleanup()
+    assert session.closed
+    assert key not in pocket_tts._shared_sessions
+
+
+@pytest.mark.asyncio
+async def test_kokoro_serves_cache_only_when_no_live_audio_is_streaming(monkeypatch):
+    from providers.kokoro import KokoroTTSService
+
+    class _Socket:
+        def __init__(self):
+            self.sent = []
+
+        async def send(self, message):
+            self.sent.append(message)
+
+    svc = KokoroTTSService(api_key="k", base_url="ws://127.0.0.1:1", voice_id="af_alloy")
+    socket = _Socket()
+
+    async def _connected():
+        svc._websocket = socket
+
+    monkeypatch.setattr(svc, "_ensure_connected", _connected)
+    monkeypatch.setattr(svc, "start_ttfb_metrics", AsyncMock())
+    monkeypatch.setattr(svc, "start_tts_usage_metrics", AsyncMock())
+    pac.get_phrase_cache().put(svc.phrase_cache_key("On it."), CachedPhrase(PCM, 22050), persist=False)
+
+    frames = [f async for f in svc.run_tts("On it.")]
+    assert isinstance(frames[0], TTSStartedFrame) and isinstance(frames[-1], TTSStoppedFrame)
+    assert b"".join(f.audio for f in frames if isinstance(f, TTSAudioRawFrame)) == PCM
+
+    # While a live sentence is still streaming, the phrase goes over the socket
+    # so its audio follows the earlier audio in order
+    [f async for f in svc.run_tts("Let me check that.")]
+    frames = [f async for f in svc.run_tts("On it.")]
+    assert len(socket.sent) == 2
+    assert not any(isinstance(f, TTSAudioRawFrame) for f in frames)
@@ -0,0 +1,54 @@
+import time
+
+import pytest
+
+fakeredis = pytest.importorskip("fakeredis", reason="fakeredis required for redis identity tests")
+
+from services.redis import RedisClient
+
+ROOM = "https://example.daily.co/room"
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setenv("USE_REDIS", "true")
+    c = RedisClient()
+    c._redis = fakeredis.aioredis.FakeRedis(decode_responses=True)
+    return c
+
+
+@pytest.mark.asyncio
+async def test_room_lookup_is_one_pipelined_round_trip(client):
+    await client.write_identity(ROOM, "p1", {"name": "Ada"})
+    await client.write_identity(ROOM, "p2", {"name": "Grace"})
+    await client.write_identity("https://example.daily.co/other", "p3", {"name": "Linus"})
+
+    calls = []
+    original = client._redis.execute_command
+
+    async def counting(*args, **kwargs):
+        calls.append(args[0])
+        return await original(*args, **kwargs)
+
+    client._redis.execute_command = counting
+    identities = await client.scan_identities(ROOM)
+
+    assert sorted(i["name"] for i in identities) == ["Ada", "Grace"]
+    assert all(i["room_url"] == ROOM for i in identities)
+    assert calls == []  # no standalone commands: served by a single pipeline
+    assert (await client.read_identity(ROOM, "p1"))["name"] == "Ada"
+
+
+@pytest.mark.asyncio
+async def test_expired_entries_are_hidden_and_cleaned(client):
+    await client.write_identity(ROOM, "p1", {"name": "Ada"})
+    await client.write_identity(ROOM, "gone", {"name": "Old"})
+    _, expiry_key = client._identity_index_keys(ROOM)
+    await client._redis.zadd(expiry_key, {"gone": time.time() - 1})
+
+    assert [i["name"] for i in await client.scan_identities(ROOM)] == ["Ada"]
+    assert await client.cleanup_expired_identities(ROOM) == 1
+    assert await client.cleanup_expired_identities(ROOM) == 0
+    index_key, _ = client._identity_index_keys(ROOM)
+    assert await client._redis.hkeys(index_key) == ["p1"]
+    assert 0 < await client._redis.ttl(index_key) <= 86400
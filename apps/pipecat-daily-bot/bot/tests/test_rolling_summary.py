@@ -0,0 +1,73 @@
+import asyncio
+
+import pytest
+
+from core.utils import append_text
+from session import lifecycle
+from session.lifecycle import RollingSummary
+
+
+def _turn(i):
+    return {"role": "user" if i % 2 == 0 else "assistant", "content": f"message {i}"}
+
+
+@pytest.fixture
+def summarizer_calls(monkeypatch):
+    calls = []
+
+    async def fake_summary(messages, previous_summary=None):
+        calls.append((len(messages), previous_summary))
+        return f"summary of {messages[-1]['content']}"
+
+    monkeypatch.setattr(lifecycle, "generate_conversation_summary", fake_summary)
+    return calls
+
+
+@pytest.mark.asyncio
+async def test_only_new_messages_are_summarized(summarizer_calls):
+    messages = [{"role": "system", "content": "sys"}]
+    rolling = RollingSummary(lambda: messages, every=4, poll_secs=60)
+
+    for i in range(10):
+        messages.append(_turn(i))
+        await rolling.update()
+    assert summarizer_calls == [(4, None), (4, "summary of message 3")]
+
+    # Teardown folds in just the remainder, however long the meeting was
+    assert await rolling.finish() == "summary of message 9"
+    assert summarizer_calls[-1] == (2, "summary of message 7")
+    assert rolling.summarized == 10
+
+
+@pytest.mark.asyncio
+async def test_rewritten_context_only_takes_the_tail(summarizer_calls):
+    messages = [_turn(i) for i in range(6)]
+    rolling = RollingSummary(lambda: messages, every=3, poll_secs=60)
+    await rolling.update()
+    assert rolling.summarized == 6
+
+    messages[:] = [dict(m) for m in messages[:2]]  # e.g. a flow reset copies/trims messages
+    messages.append(_turn(99))
+    await rolling.finish()
+    # Position is lost; the final delta stays bounded by the update size
+    assert summarizer_calls[-1] == (3, "summary of message 5")
+
+
+@pytest.mark.asyncio
+async def test_background_task_polls(summarizer_calls):
+    messages = [_turn(i) for i in range(3)]
+    rolling = RollingSummary(lambda: messages, every=3, poll_secs=0.01)
+    rolling.start()
+    await asyncio.sleep(0.05)
+    await rolling.stop()
+    assert summarizer_calls == [(3, None)]
+
+
+@pytest.mark.asyncio
+async def test_append_text_keeps_entries_whole(tmp_path):
+    path = str(tmp_path / "memory" / "activity-log.md")
+    entries = [f"[entry {i}] " + "x" * 2000 + "\n" for i in range(20)]
+    await asyncio.gather(*(append_text(path, entry) for entry in entries))
+    with open(path, encoding="utf-8") as f:
+        lines = f.read().splitlines(keepends=True)
+    assert sorted(lines) == sorted(entries)
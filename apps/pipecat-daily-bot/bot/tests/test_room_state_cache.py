@@ -0,0 +1,105 @@
+import asyncio
+import json
+
+import pytest
+
+fakeredis = pytest.importorskip("fakeredis", reason="fakeredis required for room state cache tests")
+
+from room import state
+from services.redis import RedisClient
+
+ROOM = "https://example.daily.co/cache-room"
+
+
+@pytest.fixture
+async def redis_server(monkeypatch):
+    monkeypatch.setenv("USE_REDIS", "true")
+    server = fakeredis.FakeServer()
+    client = RedisClient()
+    client._redis = fakeredis.aioredis.FakeRedis(server=server, decode_responses=True)
+    monkeypatch.setattr(state, "_redis", client)
+    yield server
+    listener = state._listener
+    if listener is not None:
+        listener.stop()
+        await asyncio.gather(listener.task, return_exceptions=True)
+    state._cache.clear()
+
+
+async def _wait_until_live():
+    await state.get_active_note_id(ROOM)  # starts the listener
+    for _ in range(100):
+        if state._listener is not None and state._listener.live:
+            return
+        await asyncio.sleep(0.01)
+    raise AssertionError("invalidation listener never subscribed")
+
+
+def _count_gets(monkeypatch):
+    calls = []
+    client = state._redis._redis
+    original = client.get
+
+    async def counting(key):
+        calls.append(key)
+        return await original(key)
+
+    monkeypatch.setattr(client, "get", counting)
+    return calls
+
+
+@pytest.mark.asyncio
+async def test_hot_reads_are_served_from_memory(redis_server, monkeypatch):
+    await _wait_until_live()
+    await state.set_active_note_id(ROOM, "note-1", owner="p1")
+    gets = _count_gets(monkeypatch)
+
+    for _ in range(5):
+        assert await state.get_active_note_id(ROOM) == "note-1"
+        assert await state.get_active_note_owner(ROOM) == "p1"
+    assert gets == []
+
+    await state.set_desktop_mode(ROOM, "work")
+    assert await state.get_desktop_mode(ROOM) == "work"
+    assert gets == []
+
+
+@pytest.mark.asyncio
+async def test_write_from_another_process_invalidates(redis_server):
+    await _wait_until_live()
+    await state.set_active_applet_id(ROOM, "applet-1", owner="p1")
+    assert await state.get_active_applet_id(ROOM) == "applet-1"
+
+    other = fakeredis.aioredis.FakeRedis(server=redis_server, decode_responses=True)
+    key = f"room:{ROOM}:active_applet"
+    await other.set(key, json.dumps({"applet_id": "applet-2", "owner": "p2", "version": 2}))
+    await other.publish(state.INVALIDATION_CHANNEL, json.dumps({"keys": [key], "origin": "other-process"}))
+
+    for _ in range(100):
+        if await state.get_active_applet_id(ROOM) == "applet-2":
+            break
+        await asyncio.sleep(0.01)
+    assert await state.get_active_applet_owner(ROOM) == "p2"
+
+
+@pytest.mark.asyncio
+async def test_compare_and_set_detects_concurrent_writer(redis_server):
+    await state.set_active_note_id(ROOM, "note-1")
+    payload, version = await state.get_room_state(ROOM, "active_note")
+    assert payload["note_id"] == "note-1"
+
+    await state.set_active_note_id(ROOM, "note-2")  # a competing write bumps the version
+    assert await state.compare_and_set_room_state(ROOM, "active_note", version, {"note_id": "mine"}) is None
+
+    _, latest = await state.get_room_state(ROOM, "active_note")
+    assert await state.compare_and_set_room_state(ROOM, "active_note", latest, None) == latest + 1
+    assert await state.get_active_note_id(ROOM) is None
+    assert (await state.get_room_state(ROOM, "active_note"))[1] == latest + 1
+
+
+@pytest.mark.asyncio
+async def test_legacy_plain_desktop_mode_is_read(redis_server):
+    await state._redis._redis.set(f"room:{ROOM}:desktop_mode", "creative")
+    assert await state.get_desktop_mode(ROOM) == "creative"
+    await state.clear_room_state(ROOM)
+    assert await state.get_desktop_mode(ROOM) == "home"
@@ -0,0 +1,63 @@
+import asyncio
+import contextvars
+
+import pytest
+
+from core.config import BOT_VOICE_SPEED
+from core.session_context import (
+    SessionContext,
+    bind_session,
+    current_session_id,
+    current_user_id,
+    update_session,
+    use_session,
+)
+
+
+def _launch(session: SessionContext, coro):
+    ctx = contextvars.copy_context()
+    ctx.run(bind_session, session)
+    return asyncio.create_task(coro, context=ctx)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_sessions_see_their_own_identity(monkeypatch):
+    monkeypatch.setenv("BOT_SESSION_USER_ID", "env-user")
+    monkeypatch.delenv("BOT_SESSION_ID", raising=False)
+    seen = {}
+
+    async def session_body(speed):
+        update_session(voice_speed=speed)
+        await asyncio.sleep(0)
+
+        async def tool_call():
+            # Tasks spawned by the pipeline inherit the session context
+            await asyncio.sleep(0)
+            return current_session_id(), current_user_id(), BOT_VOICE_SPEED()
+
+        seen[current_session_id()] = await asyncio.create_task(tool_call())
+
+    await asyncio.gather(
+        _launch(SessionContext(session_id="s1", user_id="alice"), session_body(0.9)),
+        _launch(SessionContext(session_id="s2"), session_body(1.1)),
+    )
+
+    assert seen["s1"] == ("s1", "alice", 0.9)
+    assert seen["s2"] == ("s2", "env-user", 1.1)
+    # Nothing leaked into the launching context
+    assert current_session_id() is None
+
+
+def test_env_is_process_default(monkeypatch):
+    monkeypatch.setenv("BOT_SESSION_ID", "pod-session")
+    monkeypatch.setenv("BOT_VOICE_SPEED", "0.8")
+    assert current_session_id() == "pod-session"
+    with use_session(SessionContext(session_id="bound")):
+        assert current_session_id() == "bound"
+        assert BOT_VOICE_SPEED() == 0.8
+    assert current_session_id() == "pod-session"
+
+
+def test_update_session_rejects_unknown_fields():
+    with pytest.raises(TypeError):
+        update_session(not_a_field="x")
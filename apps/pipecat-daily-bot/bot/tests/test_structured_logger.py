@@ -0,0 +1,167 @@
+import json
+import logging
+import threading
+import time
+
+import pytest
+
+import loguru
+from loguru import StructuredLogger
+
+
+class _Collect(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+@pytest.fixture
+def base():
+    log = logging.getLogger(f"test-structured-{time.monotonic_ns()}")
+    log.propagate = False
+    log.setLevel(logging.INFO)
+    collect = _Collect()
+    log.addHandler(collect)
+    log.collected = collect.records
+    return log
+
+
+class _GatedStream:
+    """Stream whose writes block until the test opens the gate."""
+
+    def __init__(self):
+        self.gate = threading.Event()
+        self.lines = []
+
+    def write(self, text):
+        self.gate.wait(5)
+        self.lines.append(text)
+
+    def flush(self):
+        pass
+
+
+def test_rate_limit_is_per_call_site(base, monkeypatch):
+    sampler = loguru._RateLimiter(2)
+    monkeypatch.setattr(loguru, "_sampler", sampler)
+    log = StructuredLogger(base, {"roomUrl": "r1"})
+
+    for i in range(5):
+        log.info("frame %d", i)
+    log.info("other site")
+    for _ in range(3):
+        log.warning("never sampled")
+
+    messages = [r.getMessage() for r in base.collected]
+    assert messages == ["frame 0", "frame 1", "other site"] + ["never sampled"] * 3
+    assert sampler.total_suppressed == 3
+
+
+def test_only_emitted_records_look_up_their_caller(base, monkeypatch):
+    monkeypatch.setattr(loguru, "_sampler", loguru._RateLimiter(2))
+    calls = []
+    find_caller = base.findCaller
+
+    def counting_find_caller(*args, **kwargs):
+        calls.append(1)
+        return find_caller(*args, **kwargs)
+
+    monkeypatch.setattr(base, "findCaller", counting_find_caller)
+    log = StructuredLogger(base)
+
+    for _ in range(10):
+        log.info("hot loop")
+
+    assert len(base.collected) == 2 and len(calls) == 2
+
+
+def test_suppressed_count_rides_on_next_admitted_record(base, monkeypatch):
+    monkeypatch.setattr(loguru, "_sampler", loguru._RateLimiter(1, window_secs=0.05))
+    log = StructuredLogger(base)
+
+    for _ in range(2):
+        for _ in range(4):
+            log.info("tick")
+        time.sleep(0.06)
+
+    assert [getattr(r, "context", {}).get("suppressed") for r in base.collected] == [None, 3]
+
+
+def test_disabled_level_skips_sampling_and_context(base, monkeypatch):
+    sampler = loguru._RateLimiter(1)
+    monkeypatch.setattr(loguru, "_sampler", sampler)
+    log = StructuredLogger(base, {"roomUrl": "r1"})
+
+    log.debug("hidden %s", object())
+    assert base.collected == [] and sampler._sites == {}
+
+    log.info("shown %s", "lazily", sessionId="s1")
+    (record,) = base.collected
+    assert record.args == ("lazily",) and record.getMessage() == "shown lazily"
+    assert record.context == {"roomUrl": "r1", "sessionId": "s1"}
+
+
+def test_queued_handler_keeps_io_off_the_caller(monkeypatch):
+    monkeypatch.setenv("BOT_LOG_QUEUE_SIZE", "2")
+    monkeypatch.setattr(loguru, "_sampler", None)
+    base = logging.getLogger(f"test-queued-{time.monotonic_ns()}")
+    base.propagate = False
+    base.setLevel(logging.INFO)
+    stream = _GatedStream()
+    listener = loguru._install_handlers(base, stream, queued=True)
+    log = StructuredLogger(base, {"tag": "bench"})
+    try:
+        started = time.monotonic()
+        for i in range(10):
+            log.info("line %d", i)
+        # Writes are blocked, yet logging returned and overflow was dropped
+        assert time.monotonic() - started < 1.0
+        assert base.handlers[0].dropped >= 7
+    finally:
+        stream.gate.set()
+        listener.stop()
+
+    payloads = [json.loads(line) for line in stream.lines]
+    assert payloads[0]["message"] == "[bench] line 0" and payloads[0]["tag"] == "[bench]"
+    assert len(payloads) == 10 - base.handlers[0].dropped
+
+
+def test_wrapper_stacklevel_attributes_records_to_its_callers(base, monkeypatch):
+    sampler = loguru._RateLimiter(1)
+    monkeypatch.setattr(loguru, "_sampler", sampler)
+    log = StructuredLogger(base)
+
+    def log_event(name):
+        log.info("event %s", name, stacklevel=2)
+
+    log_event("a")
+    log_event("b")  # a different call site of the wrapper
+
+    assert [r.getMessage() for r in base.collected] == ["event a", "event b"]
+    assert [r.funcName for r in base.collected] == [
+        "test_wrapper_stacklevel_attributes_records_to_its_callers"
+    ] * 2
+    assert sampler.total_suppressed == 0
+
+
+def test_queued_record_renders_arguments_at_call_time(monkeypatch):
+    monkeypatch.setattr(loguru, "_sampler", None)
+    base = logging.getLogger(f"test-queued-args-{time.monotonic_ns()}")
+    base.propagate = False
+    base.setLevel(logging.INFO)
+    stream = _GatedStream()
+    listener = loguru._install_handlers(base, stream, queued=True)
+    log = StructuredLogger(base, {"tag": "roster"})
+    participants = ["alice"]
+    try:
+        log.info("participants %s", participants)
+        participants.append("bob")
+    finally:
+        stream.gate.set()
+        listener.stop()
+
+    (line,) = stream.lines
+    assert json.loads(line)["message"] == "[roster] participants ['alice']"
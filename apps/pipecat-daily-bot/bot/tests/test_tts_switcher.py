@@ -0,0 +1,58 @@
+import asyncio
+
+import pytest
+from pipecat.processors.frame_processor import FrameProcessor
+
+from pipeline.tts_switcher import ModeServiceSwitcher, ModeVoice
+
+
+@pytest.mark.asyncio
+async def test_modes_share_service_and_apply_voice_on_prepare():
+    shared, other = FrameProcessor(), FrameProcessor()
+    applied, warmed = [], []
+
+    async def applier(svc, voice):
+        applied.append((svc, voice.voice_id))
+
+    async def on_prepared(svc):
+        warmed.append(svc)
+
+    switcher = ModeServiceSwitcher(
+        [shared, other],
+        mode_map={"home": 0, "work": 0, "pocket": 1},
+        mode_voices={
+            "home": ModeVoice.from_config("af_alloy", {}),
+            "work": ModeVoice.from_config("am_adam", {"speed": 1.1}),
+        },
+        voice_applier=applier,
+        on_prepared=on_prepared,
+    )
+    assert len(switcher.services) == 2
+
+    assert await switcher.prepare_mode("work") is shared
+    assert await switcher.prepare_mode("pocket") is other
+    assert await switcher.prepare_mode("missing") is None
+    await asyncio.sleep(0)
+
+    assert applied == [(shared, "am_adam")]
+    assert warmed == [shared, other]
+
+
+@pytest.mark.asyncio
+async def test_pocket_services_share_http_session():
+    from providers.pocket_tts import PocketTTSService
+
+    a = PocketTTSService(base_url="http://127.0.0.1:1")
+    b = PocketTTSService(base_url="http://127.0.0.1:1/")
+    await a.warm_connection()
+    await b.warm_connection()
+    assert a._session is b._session
+
+    a.set_voice_url("https://voices.example/v.wav")
+    assert a.phrase_cache_key("Hi.") != b.phrase_cache_key("Hi.")
+
+    session = b._session
+    await a.cleanup()
+    assert not session.closed
+    await b.cleanup()
+    assert session.closed
@@ -0,0 +1,55 @@
+import os
+
+from core.workspace_context import WorkspaceContextCache
+
+
+def _workspace(tmp_path):
+    (tmp_path / "memory").mkdir()
+    (tmp_path / "SOUL.md").write_text("I am Pearl.\n")
+    (tmp_path / "USER.md").write_text("Likes jazz.\n")
+    log = tmp_path / "memory" / "activity-log.md"
+    log.write_text("".join(f"[{i:05d}] event {i}\nnoise line\n" for i in range(5000)))
+    return log
+
+
+def test_sections_render_in_order_with_log_tail(tmp_path):
+    _workspace(tmp_path)
+    ctx = WorkspaceContextCache(str(tmp_path), recheck_secs=0).get()
+    assert ctx.index("## Core Identity\nI am Pearl.") < ctx.index("## User Context\nLikes jazz.")
+    activity = ctx.split("## Recent Cross-Session Activity\n", 1)[1]
+    entries = [line for line in activity.splitlines() if line.startswith("[")]
+    assert entries == [f"[{i:05d}] event {i}" for i in range(4990, 5000)]
+    assert "## Your Identity Across Channels" in ctx
+
+
+def test_unchanged_files_are_not_reread(tmp_path):
+    log = _workspace(tmp_path)
+    cache = WorkspaceContextCache(str(tmp_path), recheck_secs=0)
+    first = cache.get()
+    reads = cache.reads
+    assert cache.get() is first
+    assert cache.reads == reads
+
+    with open(log, "a") as f:
+        f.write("[99999] new session\n")
+    os.utime(log, ns=(0, os.stat(log).st_mtime_ns + 1_000_000))
+    updated = cache.get()
+    assert cache.reads == reads + 1
+    assert updated.rstrip().endswith("check your tools first.")
+    assert "[99999] new session" in updated
+
+
+def test_recheck_window_skips_stat(tmp_path, monkeypatch):
+    _workspace(tmp_path)
+    cache = WorkspaceContextCache(str(tmp_path), recheck_secs=60)
+    first = cache.get()
+    monkeypatch.setattr("core.workspace_context._signature", lambda path: 1 / 0)
+    assert cache.get() is first
+
+
+def test_long_memory_files_are_tail_read(tmp_path):
+    _workspace(tmp_path)
+    (tmp_path / "MEMORY.md").write_text("".join(f"memory {i}\n" for i in range(200)))
+    ctx = WorkspaceContextCache(str(tmp_path), recheck_secs=0).get()
+    memory = ctx.split("## Long-Term Memory (recent entries)\n", 1)[1].split("\n\n")[0]
+    assert memory.splitlines() == [f"memory {i}" for i in range(150, 200)]
@@ -1,12 +1,12 @@
 """CRUD operations for HTML tools."""
 from __future__ import annotations
 
-import os
 from typing import Any
 from pipecat.frames.frames import FunctionCallResultProperties
 from pipecat.services.llm_service import FunctionCallParams
 
 from actions import html_actions, notes_actions, sharing_actions
+from core.session_context import current_user_id
 from tools.decorators import bot_tool
 from tools.logging_utils import bind_context_logger, bind_tool_logger
 from tools.sharing import utils as sharing_tools
@@ -16,51 +16,28 @@ from .prompts import DEFAULT_HTML_TOOL_PROMPTS
 from .utils import _get_room_state, _create_or_request_html_generation
 
 try:
-    from nia_library_templates import LIBRARY_TEMPLATES  # type: ignore
+    from nia_library_templates import match_templates  # type: ignore
 except Exception:
-    LIBRARY_TEMPLATES = []
+    match_templates = None
 
 
 def _auto_select_library_template(title: str, description: str, content_type: str) -> tuple[str | None, str | None]:
     """Heuristic to pick a library template when the request matches known templates.
 
-    Matches against template id, name tokens, and tags in the title/description. Returns
-    (library_type, library_template_id) or (None, None) when no confident match is found.
+    Scores templates through the codegen-built token index (exact id, name words and
+    tags in the title/description). Returns (library_type, library_template_id) or
+    (None, None) when no template shares a token with the request.
     """
 
-    if not LIBRARY_TEMPLATES:
+    if match_templates is None:
         return None, None
 
-    text = f"{title} {description}".lower()
-    best_match: tuple[str, str] | None = None
-    best_score = 0
-
-    for tmpl in LIBRARY_TEMPLATES:
-        if tmpl.get("library_type") != content_type:
-            continue
-
-        tid = str(tmpl.get("id", "")).lower()
-        name = str(tmpl.get("name", "")).lower()
-        tags = " ".join(tmpl.get("tags", [])).lower()
-
-        score = 0
-        if tid and tid in text:
-            score += 3
-        for token in name.split():
-            if token and token in text:
-                score += 2
-        for token in tags.split():
-            if token and token in text:
-                score += 1
-
-        if score > best_score:
-            best_score = score
-            best_match = (tmpl.get("library_type"), tmpl.get("id"))
-
-    if best_match and best_score > 0:
-        return best_match
+    shortlist = match_templates(f"{title} {description}", library_type=content_type, limit=1)
+    if not shortlist:
+        return None, None
 
-    return None, None
+    template, _score = shortlist[0]
+    return template.get("library_type"), template.get("id")
 
 
 async def _resolve_applet_by_id_or_title(
@@ -78,7 +55,9 @@ async def _resolve_applet_by_id_or_title(
     """
 
     if applet_id:
-        applet = await html_actions.get_html_generation_by_id(tenant_id, applet_id)
+        applet = await html_actions.get_html_generation_by_id(
+            tenant_id, applet_id, fields=html_actions.HTML_GENERATION_METADATA_FIELDS
+        )
         if applet:
             return applet, applet.get("_id"), None
 
@@ -159,7 +138,7 @@ async def create_app_from_description_handler(params: FunctionCallParams):
     # Get user_id from context
     user_id = context.user_id() if context and hasattr(context, 'user_id') else None
     if not user_id:
-        user_id = os.environ.get('BOT_SESSION_USER_ID')
+        user_id = current_user_id()
         if user_id:
             log.info("Using BOT_SESSION_USER_ID from environment", userId=user_id)
 
@@ -342,7 +321,7 @@ async def create_html_content_handler(params: FunctionCallParams):
     # Get user_id from context
     user_id = context.user_id() if context and hasattr(context, 'user_id') else None
     if not user_id:
-        user_id = os.environ.get('BOT_SESSION_USER_ID')
+        user_id = current_user_id()
         if user_id:
             log.info("Using BOT_SESSION_USER_ID from environment", userId=user_id)
 
@@ -476,7 +455,7 @@ async def create_app_from_note_handler(params: FunctionCallParams):
     # Get user_id from context
     user_id = context.user_id() if context and hasattr(context, 'user_id') else None
     if not user_id:
-        user_id = os.environ.get('BOT_SESSION_USER_ID')
+        user_id = current_user_id()
         if user_id:
             log.info("Using BOT_SESSION_USER_ID from environment", userId=user_id)
 
@@ -768,7 +747,9 @@ async def bot_update_html_applet(
     # Update HTML generation via actions layer
     try:
         # SECURITY CHECK: First fetch the applet to verify it exists and check permissions
-        applet = await html_actions.get_html_generation_by_id(tenant_id, applet_id)
+        applet = await html_actions.get_html_generation_by_id(
+            tenant_id, applet_id, fields=html_actions.HTML_GENERATION_METADATA_FIELDS
+        )
         
         if not applet:
             return {
@@ -922,7 +903,9 @@ async def bot_rollback_app(
     
     try:
         # SECURITY CHECK: First fetch the applet to verify it exists and check permissions
-        applet = await html_actions.get_html_generation_by_id(tenant_id, applet_id)
+        applet = await html_actions.get_html_generation_by_id(
+            tenant_id, applet_id, fields=html_actions.HTML_GENERATION_METADATA_FIELDS
+        )
         
         if not applet:
             return {
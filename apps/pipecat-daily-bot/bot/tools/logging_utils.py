@@ -5,6 +5,13 @@ import os
 import json
 from typing import Any
 
+from core.session_context import (
+    current_session_id,
+    current_user_email,
+    current_user_id,
+    current_user_name,
+)
+
 try:
     from session.context import HandlerContext
 except Exception:  # pragma: no cover
@@ -105,13 +112,13 @@ def _bind_logger(**context: Any) -> StructuredLogger:
 
 
 def _env_context() -> dict[str, str | None]:
-    """Return session/user context from environment for fallback binding."""
+    """Return session/user context (session-bound, else environment) for fallback binding."""
     return {
         "room_url": os.getenv("BOT_ROOM_URL"),
-        "session_id": os.getenv("BOT_SESSION_ID"),
-        "user_id": os.getenv("BOT_SESSION_USER_ID"),
-        "user_name": os.getenv("BOT_SESSION_USER_NAME"),
-        "user_email": os.getenv("BOT_SESSION_USER_EMAIL"),
+        "session_id": current_session_id(),
+        "user_id": current_user_id(),
+        "user_name": current_user_name(),
+        "user_email": current_user_email(),
     }
 
 
@@ -178,7 +185,7 @@ def bind_tool_logger(params: Any, *, tag: str | None = None) -> StructuredLogger
     session_id = (
         getattr(params, "session_id", None)
         or getattr(params, "sessionId", None)
-        or os.getenv("BOT_SESSION_ID")
+        or current_session_id()
     )
 
     env_ctx = _env_context()
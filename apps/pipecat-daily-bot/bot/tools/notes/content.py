@@ -1,4 +1,9 @@
-"""Content manipulation tools for notes."""
+"""Content manipulation tools for notes.
+
+These tools send position/anchor-based edits (``notes_actions.NoteEdit``)
+instead of rebuilding the note here. Mesh applies them to the current body;
+anchor-based edits are conditional on the version the bot last read.
+"""
 from __future__ import annotations
 
 from typing import Any
@@ -7,13 +12,155 @@ from pipecat.frames.frames import FunctionCallResultProperties
 from pipecat.services.llm_service import FunctionCallParams
 
 from actions import notes_actions
+from actions.notes_actions import NoteEdit, NotePatchError, NoteVersionConflict
 from tools.decorators import bot_tool
 from tools.sharing import utils as sharing_tools
 from tools.logging_utils import bind_tool_logger
 
-from .crud import bot_replace_note
 from .prompts import DEFAULT_NOTE_TOOL_PROMPTS
-from .utils import _get_room_state, _extract_note_content
+from .utils import _get_room_state, _emit_refresh_event, _extract_note_content
+
+
+async def _resolve_target_note(params: FunctionCallParams, log: Any) -> tuple[tuple[str, str, str] | None, dict[str, Any] | None]:
+    """Resolve (tenant_id, user_id, note_id) for a content edit.
+
+    Uses the ``note_id`` argument, then the room's active note, then a fuzzy
+    title match. Returns the target or a tool error result.
+    """
+    room_url = params.room_url
+    arguments = params.arguments
+    note_id = arguments.get("note_id")
+    title = arguments.get("title")
+
+    user_id, error_msg = await sharing_tools._resolve_user_id(params, room_url)
+    if not user_id:
+        log.warning(f"[notes] Could not identify user for permission check: {error_msg}")
+        return None, {
+            "success": False,
+            "error": error_msg or "Could not identify user",
+            "user_message": error_msg or "I couldn't identify which user is making this request. Please try again."
+        }
+
+    # Get tenant context
+    tenant_id = _get_room_state().get_room_tenant_id(room_url)
+    if not tenant_id:
+        return None, {
+            "success": False,
+            "error": "No tenant context",
+            "user_message": "I'm having trouble accessing the workspace context."
+        }
+
+    # Accept note_id parameter or fall back to active note
+    if not note_id:
+        note_id = await _get_room_state().get_active_note_id(room_url)
+    if not note_id and title:
+        notes = await notes_actions.fuzzy_search_notes(tenant_id, title, user_id)
+        if not notes or len(notes) == 0:
+            log.warning(f"[notes] No note found with title: {title} and tenant_id: {tenant_id}")
+            return None, {
+                "success": False,
+                "error": f"Note with title '{title}' not found",
+                "user_message": f"I couldn't find a note matching '{title}'."
+            }
+        if len(notes) > 1:
+            log.warning(f"[notes] Multiple notes found with title: {title}, prompting user to choose.")
+            # compile a message of the found titles, modes, and IDs
+            found_notes_details = ", ".join([f"title: '{n.get('title')}' mode: '{n.get('mode')}' (note_id: {n.get('_id')})" for n in notes])
+            found_notes_info = "; ".join([f"Title: '{n.get('title')}', Mode: '{n.get('mode')}'" for n in notes])
+            return None, {
+                "success": False,
+                "error": f"Found multiple notes: {found_notes_details}. Use the associated note_id as the 'note_id' param when you retry the operation.",
+                "user_message": f"I found multiple notes matching '{title}': {found_notes_info} Please help me choose the correct one."
+            }
+        # One note found, proceed
+        note_id = notes[0].get("_id") or notes[0].get("page_id")
+    if not note_id:
+        log.error("[notes] Cannot edit: no note_id or title provided, and no active note")
+        return None, {
+            "success": False,
+            "error": "No note_id or title provided, and no active note",
+            "user_message": "Please open a note first, or specify which note to add to."
+        }
+    return (tenant_id, user_id, note_id), None
+
+
+def _note_not_found() -> dict[str, Any]:
+    return {
+        "success": False,
+        "error": "Note not found",
+        "user_message": "The note you're trying to update doesn't exist."
+    }
+
+
+async def _patch_note(params: FunctionCallParams, edits: list[NoteEdit], log: Any) -> dict[str, Any]:
+    """Resolve the target note, apply ``edits`` and emit the refresh event."""
+    target, error = await _resolve_target_note(params, log)
+    if error:
+        return error
+    tenant_id, user_id, note_id = target
+
+    # Start/end inserts apply to whatever the note holds now. Anchor edits are
+    # conditional on the version the bot last read; read it if it never was.
+    expected_version = None
+    if any(edit.anchored for edit in edits):
+        expected_version = notes_actions.known_note_version(tenant_id, note_id)
+        if expected_version is None:
+            current = await notes_actions.get_note_by_id(tenant_id, note_id)
+            if not current:
+                return _note_not_found()
+            expected_version = notes_actions.note_version(_extract_note_content(current))
+
+    # Permission check happens in notes_actions.patch_note_content
+    try:
+        try:
+            note = await notes_actions.patch_note_content(
+                tenant_id, note_id, edits, user_id, expected_version=expected_version
+            )
+        except NoteVersionConflict as e:
+            # Edited elsewhere since the last read: re-read once and keep the
+            # edits whose anchors are still there
+            log.info(f"[notes] Note {note_id} changed before the edit, re-reading: {e}")
+            current = await notes_actions.get_note_by_id(tenant_id, note_id)
+            if not current:
+                return _note_not_found()
+            content = _extract_note_content(current)
+            edits = [edit for edit in edits if not edit.anchored or edit.anchor in content]
+            if not edits:
+                raise NotePatchError("The text to edit is no longer in the note")
+            note = await notes_actions.patch_note_content(
+                tenant_id, note_id, edits, user_id,
+                expected_version=notes_actions.note_version(content),
+            )
+    except NoteVersionConflict as e:
+        log.info(f"[notes] Note {note_id} changed again before the edit: {e}")
+        return {
+            "success": False,
+            "error": f"{e}. Read the note again before retrying the edit.",
+            "user_message": "The note is being changed right now, so I didn't apply that edit."
+        }
+    except NotePatchError as e:
+        log.info(f"[notes] Edit does not apply to note {note_id}: {e}")
+        return {
+            "success": False,
+            "error": str(e),
+            "user_message": "I couldn't find that text in the note."
+        }
+    if not note:
+        return {
+            "success": False,
+            "error": "Note not found or update failed",
+            "user_message": "I couldn't update the note. It may have been deleted, or the server isn't responding."
+        }
+
+    # Emit refresh event via Daily app-message
+    if params.forwarder:
+        await _emit_refresh_event(params.forwarder, note_id, "update", note.get("mode"))
+    return {
+        "success": True,
+        "note": note,
+        "user_message": "I've updated the note."
+    }
+
 
 # ============================================================================
 # Tool Handlers
@@ -49,110 +196,17 @@ from .utils import _get_room_state, _extract_note_content
 async def replace_note_content_handler(params: FunctionCallParams):
     """Handle bot_replace_note_content tool call."""
     log = bind_tool_logger(params, tag="[notes_tools]")
-
-    async def replace_note_content(
-        params: FunctionCallParams | None = None,
-    ) -> dict[str, Any]:
-        """Remove specific content or sections from the note.
-        
-        Args:
-            room_url: Daily room URL for tenant context
-            pattern: Text pattern to replace
-            replace: The text to replace 'pattern' with
-            forwarder: Optional message forwarder for events
-            params: Function call params (for permission checks)
-            note_id: Optional note ID to remove from (if not provided, uses active note)
-            
-        Returns:
-            Dict with success status and optional error message
-        """
-        room_url = params.room_url
-        arguments = params.arguments
-        forwarder = params.forwarder
-        pattern = arguments.get("pattern")
-        replace = arguments.get("replace")
-        note_id = arguments.get("note_id")
-        title = arguments.get("title")
-        try:
-            user_id, error_msg = await sharing_tools._resolve_user_id(params, room_url)
-            if not user_id:
-                log.warning(f"[notes] Could not identify user for permission check: {error_msg}")
-                return {
-                    "success": False,
-                    "error": error_msg or "Could not identify user",
-                    "user_message": error_msg or "I couldn't identify which user is making this request. Please try again."
-                }
-            
-            # Get tenant context
-            tenant_id = _get_room_state().get_room_tenant_id(room_url)
-            if not tenant_id:
-                return {
-                    "success": False,
-                    "error": "No tenant context",
-                    "user_message": "I'm having trouble accessing the workspace context."
-                }
-
-            note = None
-            if note_id:
-                note = await notes_actions.get_note_by_id(tenant_id, note_id)
-            # Accept note_id parameter or fall back to active note
-            else:
-                note_id = await _get_room_state().get_active_note_id(room_url)
-                if note_id:
-                    note = await notes_actions.get_note_by_id(tenant_id, note_id)
-                elif title:
-                    notes = await notes_actions.fuzzy_search_notes(tenant_id, title, user_id)
-                    if not notes or len(notes) == 0:
-                        log.warning(f"[notes] No note found with title: {title} and tenant_id: {tenant_id}")
-                        return {
-                            "success": False, 
-                            "error": f"Note with title '{title}' not found",
-                            "user_message": f"I couldn't find a note matching '{title}'."
-                        }
-                    if len(notes) > 1:
-                        log.warning(f"[notes] Multiple notes found with title: {title}, prompting user to choose.")
-                        # compile a message of the found titles, modes, and IDs
-                        found_notes_details = ", ".join([f"title: '{n.get('title')}' mode: '{n.get('mode')}' (note_id: {n.get('_id')})" for n in notes])
-                        found_notes_info = "; ".join([f"Title: '{n.get('title')}', Mode: '{n.get('mode')}'" for n in notes])
-                        return {
-                            "success": False, 
-                            "error": f"Found multiple notes: {found_notes_details}. Use the associated note_id as the 'note_id' param when you retry the operation.",
-                            "user_message": f"I found multiple notes matching '{title}': {found_notes_info} Please help me choose the correct one."
-                        }
-                    # One note found, proceed
-                    note = notes[0]
-                else:
-                    log.error("[notes] Cannot append: no note_id or title provided, and no active note")
-                    return {
-                        "success": False, 
-                        "error": "No note_id or title provided, and no active note",
-                        "user_message": "Please open a note first, or specify which note to add to."
-                    }
-            
-            if not note:
-                return {
-                    "success": False,
-                    "error": "Note not found",
-                    "user_message": "The note you're trying to update doesn't exist."
-                }
-
-            # SECURITY CHECK: inside bot_replace_note
-            
-            existing_content = _extract_note_content(note)
-            # Replace pattern in content
-            new_content = existing_content.replace(pattern, replace)
-            # Update note with modified content and permission check, passing note_id explicitly
-            return await bot_replace_note(room_url, new_content, forwarder=forwarder, note_id=note_id, params=params)
-            
-        except Exception as e:
-            log.error(f"[notes] Error removing note content: {e}")
-            return {
-                "success": False,
-                "error": str(e),
-                "user_message": "Failed to remove content from note."
-            }
-
-    result = await replace_note_content(params)
+    arguments = params.arguments
+    edit = NoteEdit("replace", text=arguments.get("replace") or "", anchor=arguments.get("pattern"))
+    try:
+        result = await _patch_note(params, [edit], log)
+    except Exception as e:
+        log.error(f"[notes] Error replacing note content: {e}")
+        result = {
+            "success": False,
+            "error": str(e),
+            "user_message": "Failed to replace content in note."
+        }
     await params.result_callback(result, properties=FunctionCallResultProperties(run_llm=True))
 
 
@@ -187,104 +241,19 @@ async def replace_note_content_handler(params: FunctionCallParams):
 async def add_note_content_handler(params: FunctionCallParams):
     """Handle bot_add_note_content tool call."""
     log = bind_tool_logger(params, tag="[notes_tools]")
-
-    async def add_note_content(
-        params: FunctionCallParams | None = None
-    ) -> dict[str, Any]:
-        """Add new content to the note without replacing existing content.
-        """
-
-        room_url = params.room_url
-        arguments = params.arguments
-        forwarder = params.forwarder
-        content = arguments.get("content")
-        position = arguments.get("position", "end")
-        note_id = arguments.get("note_id")
-        title = arguments.get("title")
-        try:
-            user_id, error_msg = await sharing_tools._resolve_user_id(params, room_url)
-            if not user_id:
-                log.warning(f"[notes] Could not identify user for permission check: {error_msg}")
-                return {
-                    "success": False,
-                    "error": error_msg or "Could not identify user",
-                    "user_message": error_msg or "I couldn't identify which user is making this request. Please try again."
-                }
-            
-            # Get tenant context
-            tenant_id = _get_room_state().get_room_tenant_id(room_url)
-            if not tenant_id:
-                return {
-                    "success": False,
-                    "error": "No tenant context",
-                    "user_message": "I'm having trouble accessing the workspace context."
-                }
-
-            note = None
-            if note_id:
-                note = await notes_actions.get_note_by_id(tenant_id, note_id)
-            # Accept note_id parameter or fall back to active note
-            else:
-                note_id = await _get_room_state().get_active_note_id(room_url)
-                if note_id:
-                    note = await notes_actions.get_note_by_id(tenant_id, note_id)
-                elif title:
-                    notes = await notes_actions.fuzzy_search_notes(tenant_id, title, user_id)
-                    if not notes or len(notes) == 0:
-                        log.warning(f"[notes] No note found with title: {title} and tenant_id: {tenant_id}")
-                        return {
-                            "success": False, 
-                            "error": f"Note with title '{title}' not found",
-                            "user_message": f"I couldn't find a note matching '{title}'."
-                        }
-                    if len(notes) > 1:
-                        log.warning(f"[notes] Multiple notes found with title: {title}, prompting user to choose.")
-                        # compile a message of the found titles, modes, and IDs
-                        found_notes_details = ", ".join([f"title: '{n.get('title')}' mode: '{n.get('mode')}' (note_id: {n.get('_id')})" for n in notes])
-                        found_notes_info = "; ".join([f"Title: '{n.get('title')}', Mode: '{n.get('mode')}'" for n in notes])
-                        return {
-                            "success": False, 
-                            "error": f"Found multiple notes: {found_notes_details}. Use the associated note_id as the 'note_id' param when you retry the operation.",
-                            "user_message": f"I found multiple notes matching '{title}': {found_notes_info} Please help me choose the correct one."
-                        }
-                    # One note found, proceed
-                    note = notes[0]
-                else:
-                    log.error("[notes] Cannot append: no note_id or title provided, and no active note")
-                    return {
-                        "success": False, 
-                        "error": "No note_id or title provided, and no active note",
-                        "user_message": "Please open a note first, or specify which note to add to."
-                    }
-            
-            if not note:
-                return {
-                    "success": False,
-                    "error": "Note not found",
-                    "user_message": "The note you're trying to update doesn't exist."
-                }
-
-            # SECURITY CHECK: inside bot_replace_note
-
-            existing_content = _extract_note_content(note)
-            # Add content based on position
-            if position == "start":
-                new_content = content + "\n\n" + existing_content
-            else:  # 'end' or 'cursor' (default to end)
-                new_content = existing_content + "\n\n" + content
-            
-            # Update note with combined content and permission check, passing note_id explicitly
-            return await bot_replace_note(room_url, new_content, forwarder=forwarder, note_id=note_id, params=params)
-            
-        except Exception as e:
-            log.error(f"[notes] Error adding note content: {e}")
-            return {
-                "success": False,
-                "error": str(e),
-                "user_message": "Failed to add content to note."
-            }
-
-    result = await add_note_content(params)
+    arguments = params.arguments
+    # There is no cursor position to anchor to; 'cursor' appends like 'end'
+    position = "start" if arguments.get("position") == "start" else "end"
+    edit = NoteEdit("insert", text=arguments.get("content") or "", position=position, separator="\n\n")
+    try:
+        result = await _patch_note(params, [edit], log)
+    except Exception as e:
+        log.error(f"[notes] Error adding note content: {e}")
+        result = {
+            "success": False,
+            "error": str(e),
+            "user_message": "Failed to add content to note."
+        }
     await params.result_callback(result, properties=FunctionCallResultProperties(run_llm=True))
 
 
@@ -313,106 +282,15 @@ async def add_note_content_handler(params: FunctionCallParams):
 )
 async def remove_note_content_handler(params: FunctionCallParams):
     """Handle bot_remove_note_content tool call."""
-    async def remove_note_content(
-        params: FunctionCallParams | None = None,
-    ) -> dict[str, Any]:
-        """Remove specific content or sections from the note.
-        
-        Args:
-            room_url: Daily room URL for tenant context
-            pattern: Text pattern to remove
-            forwarder: Optional message forwarder for events
-            params: Function call params (for permission checks)
-            note_id: Optional note ID to remove from (if not provided, uses active note)
-            
-        Returns:
-            Dict with success status and optional error message
-        """
-        room_url = params.room_url
-        arguments = params.arguments
-        forwarder = params.forwarder
-        pattern = arguments.get("pattern")
-        note_id = arguments.get("note_id")
-        title = arguments.get("title")
-        try:
-            user_id, error_msg = await sharing_tools._resolve_user_id(params, room_url)
-            if not user_id:
-                logger.warning(f"[notes] Could not identify user for permission check: {error_msg}")
-                return {
-                    "success": False,
-                    "error": error_msg or "Could not identify user",
-                    "user_message": error_msg or "I couldn't identify which user is making this request. Please try again."
-                }
-            
-            # Get tenant context
-            tenant_id = _get_room_state().get_room_tenant_id(room_url)
-            if not tenant_id:
-                return {
-                    "success": False,
-                    "error": "No tenant context",
-                    "user_message": "I'm having trouble accessing the workspace context."
-                }
-
-            note = None
-            if note_id:
-                note = await notes_actions.get_note_by_id(tenant_id, note_id)
-            # Accept note_id parameter or fall back to active note
-            else:
-                note_id = await _get_room_state().get_active_note_id(room_url)
-                if note_id:
-                    note = await notes_actions.get_note_by_id(tenant_id, note_id)
-                elif title:
-                    notes = await notes_actions.fuzzy_search_notes(tenant_id, title, user_id)
-                    if not notes or len(notes) == 0:
-                        logger.warning(f"[notes] No note found with title: {title} and tenant_id: {tenant_id}")
-                        return {
-                            "success": False, 
-                            "error": f"Note with title '{title}' not found",
-                            "user_message": f"I couldn't find a note matching '{title}'."
-                        }
-                    if len(notes) > 1:
-                        logger.warning(f"[notes] Multiple notes found with title: {title}, prompting user to choose.")
-                        # compile a message of the found titles, modes, and IDs
-                        found_notes_details = ", ".join([f"title: '{n.get('title')}' mode: '{n.get('mode')}' (note_id: {n.get('_id')})" for n in notes])
-                        found_notes_info = "; ".join([f"Title: '{n.get('title')}', Mode: '{n.get('mode')}'" for n in notes])
-                        return {
-                            "success": False, 
-                            "error": f"Found multiple notes: {found_notes_details}. Use the associated note_id as the 'note_id' param when you retry the operation.",
-                            "user_message": f"I found multiple notes matching '{title}': {found_notes_info} Please help me choose the correct one."
-                        }
-                    # One note found, proceed
-                    note = notes[0]
-                else:
-                    logger.error("[notes] Cannot append: no note_id or title provided, and no active note")
-                    return {
-                        "success": False, 
-                        "error": "No note_id or title provided, and no active note",
-                        "user_message": "Please open a note first, or specify which note to add to."
-                    }
-            
-            if not note:
-                return {
-                    "success": False,
-                    "error": "Note not found",
-                    "user_message": "The note you're trying to update doesn't exist."
-                }
-
-            # SECURITY CHECK: inside bot_replace_note
-
-            existing_content = _extract_note_content(note)
-            # Remove pattern from content
-            new_content = existing_content.replace(pattern, "")
-            
-            # Update note with modified content and permission check, passing note_id explicitly
-            return await bot_replace_note(room_url, new_content, forwarder=forwarder, note_id=note_id, params=params)
-            
-        except Exception as e:
-            logger.error(f"[notes] Error removing note content: {e}")
-            return {
-                "success": False,
-                "error": str(e),
-                "user_message": "Failed to remove content from note."
-            }
-
-    result = await remove_note_content(params)
+    log = bind_tool_logger(params, tag="[notes_tools]")
+    edit = NoteEdit("remove", anchor=params.arguments.get("pattern"))
+    try:
+        result = await _patch_note(params, [edit], log)
+    except Exception as e:
+        log.error(f"[notes] Error removing note content: {e}")
+        result = {
+            "success": False,
+            "error": str(e),
+            "user_message": "Failed to remove content from note."
+        }
     await params.result_callback(result, properties=FunctionCallResultProperties(run_llm=True))
@@ -2,7 +2,6 @@
 from __future__ import annotations
 
 import asyncio
-import os
 from typing import Any
 
 from pipecat.frames.frames import FunctionCallResultProperties
@@ -10,6 +9,7 @@ from pipecat.services.llm_service import FunctionCallParams
 
 from actions import notes_actions, sharing_actions
 from core.transport import get_session_user_id_from_participant
+from core.session_context import current_user_id
 from services.app_message_forwarder import AppMessageForwarder
 from tools.decorators import bot_tool
 from tools.sharing import utils as sharing_tools
@@ -507,7 +507,7 @@ async def bot_create_note(
                 }
         
         # Get session user ID - try BOT_SESSION_USER_ID environment variable first (most reliable for voice sessions)
-        session_user_id = os.environ.get('BOT_SESSION_USER_ID')
+        session_user_id = current_user_id()
         if session_user_id:
             logger.info(f"[notes] Using BOT_SESSION_USER_ID from environment: {session_user_id}")
         else:
@@ -4,13 +4,14 @@ Tools for managing the onboarding process.
 """
 
 import json
-import os
 
 from pipecat.frames.frames import FunctionCallResultProperties
 from pipecat.services.llm_service import FunctionCallParams
 
 from actions import profile_actions
+from core.session_context import current_user_id
 from room.state import get_desktop_mode
+from services.config_subscriber import publish_config
 from services.redis import RedisClient
 from tools.decorators import bot_tool
 from tools.logging_utils import bind_tool_logger
@@ -59,7 +60,7 @@ async def bot_onboarding_complete(
         # Get user_id from context
         user_id = context.user_id() if context and hasattr(context, 'user_id') else None
         if not user_id:
-            user_id = os.environ.get('BOT_SESSION_USER_ID')
+            user_id = current_user_id()
         
         if user_id:
             log.bind(userId=user_id).info("Marking onboarding as complete")
@@ -96,9 +97,7 @@ async def bot_onboarding_complete(
             # Publish config update to Redis to trigger config_listener
             redis_client = RedisClient()
             client = await redis_client._get_redis()
-            channel = f"bot:config:room:{room_url}"
-            
-            await client.publish(channel, json.dumps({
+            await publish_config(client, room_url, json.dumps({
                 "mode": current_mode,
                 "source": "onboarding_complete"
             }))
@@ -3,12 +3,12 @@
 Tools for managing user profiles (preferences, settings, metadata).
 """
 
-import os
 
 from pipecat.frames.frames import FunctionCallResultProperties
 from pipecat.services.llm_service import FunctionCallParams
 
 from actions import profile_actions
+from core.session_context import current_user_id
 from tools.decorators import bot_tool
 from tools.logging_utils import bind_tool_logger
 
@@ -81,7 +81,7 @@ async def bot_update_user_profile(params: FunctionCallParams):
         # Get user_id from context (not from LLM arguments)
         user_id = context.user_id() if context and hasattr(context, 'user_id') else None
         if not user_id:
-            user_id = os.environ.get('BOT_SESSION_USER_ID')
+            user_id = current_user_id()
             if user_id:
                 log.bind(userId=user_id).info("Using BOT_SESSION_USER_ID from environment")
         
@@ -276,7 +276,9 @@ async def bot_set_user_access_level(
             if resource_type == 'note':
                 resource = await notes_actions.get_note_by_id(tenant_id, resource_id)
             else:
-                resource = await html_actions.get_html_generation_by_id(tenant_id, resource_id)
+                resource = await html_actions.get_html_generation_by_id(
+                    tenant_id, resource_id, fields=html_actions.HTML_GENERATION_METADATA_FIELDS
+                )
             
             if not resource:
                 return {
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import os
 import json
-from typing import Any, Literal, TYPE_CHECKING
+from typing import Any, Literal, Sequence, TYPE_CHECKING
 from difflib import SequenceMatcher
 import re
 
@@ -238,13 +238,14 @@ async def _share_resource_with_single_user(
 async def get_user_shared_resources(
     tenant_id: str,
     user_id: str,
-    content_type: Literal['Notes', 'HtmlGeneration'] | None = None
+    content_type: Literal['Notes', 'HtmlGeneration'] | None = None,
+    fields: Sequence[str] | None = None,
 ) -> dict[str, Any]:
     """Fetch shared resources accessible to a user within the call's tenant context.
 
     Wraps the actions-layer helper so bot flows can discover whether a note or
     applet has already been shared with a participant before attempting
-    additional sharing.
+    additional sharing. ``fields`` limits the loaded resources to a projection.
     """
     try:
         if not tenant_id:
@@ -264,7 +265,9 @@ async def get_user_shared_resources(
         logger.debug(f"[sharing] Found {len(shared_resources)} shared resources for user {user_id} in tenant {tenant_id}: indexed {len(resource_index)} items")
         raw_resources = []
     
-        resources = await sharing_actions.get_resources_by_id(tenant_id, list(resource_index.keys()), content_type=content_type)
+        resources = await sharing_actions.get_resources_by_id(
+            tenant_id, list(resource_index.keys()), content_type=content_type, fields=fields
+        )
         for resource in resources:
             if resource:
                 # Inject sharing metadata so consumers know context
@@ -15,6 +15,7 @@ from dataclasses import dataclass
 from typing import Any, Awaitable, Callable, Dict
 
 from actions import functional_prompt_actions
+from core.session_context import current_user_email, current_user_name
 from pipecat.adapters.schemas.tools_schema import ToolsSchema
 from pipecat.frames.frames import FunctionCallResultProperties, LLMMessagesAppendFrame
 from tools.discovery import get_discovery
@@ -313,8 +314,8 @@ async def prepare_toolbox(
     context = HandlerContext(
         get_tenant_id=get_tenant_id or (lambda: None),
         get_user_id=get_user_id or (lambda: None),
-        get_user_email=lambda: os.environ.get('BOT_SESSION_USER_EMAIL'),
-        get_user_name=lambda: os.environ.get('BOT_SESSION_USER_NAME')
+        get_user_email=current_user_email,
+        get_user_name=current_user_name
     )
     
     # Collect handlers from discovered tools (use filtered set if available)
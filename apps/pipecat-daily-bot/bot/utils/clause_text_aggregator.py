@@ -6,8 +6,13 @@ can start synthesizing a clause while the LLM is still generating the rest.
 
 Trade-off: slightly more TTS HTTP requests, but each is smaller and the first
 one fires sooner.
+
+Each streamed token is scanned once for boundary characters; pending text is
+kept as a list of fragments with a running length, so buffering is O(1)
+amortized per token instead of re-concatenating the whole clause per character.
 """
 
+import re
 from typing import AsyncIterator, Optional
 
 from pipecat.utils.text.base_text_aggregator import Aggregation, AggregationType, BaseTextAggregator
@@ -16,47 +21,73 @@ from pipecat.utils.text.base_text_aggregator import Aggregation, AggregationType
 CLAUSE_BREAKS = set(",;:—–")
 SENTENCE_ENDINGS = set(".!?")
 MIN_CLAUSE_LENGTH = 40  # Larger chunks = fewer HTTP requests = fewer inter-segment gaps (crackling fix)
+MIN_SENTENCE_LENGTH = 3
+
+_BOUNDARY_PATTERN = re.compile("[" + re.escape("".join(CLAUSE_BREAKS | SENTENCE_ENDINGS)) + "]")
 
 
 class ClauseTextAggregator(BaseTextAggregator):
     """Aggregates text and yields at clause boundaries for faster TTS onset."""
 
     def __init__(self, min_clause_length: int = MIN_CLAUSE_LENGTH):
-        self._text = ""
         self._min_length = min_clause_length
+        self._reset_buffer()
+
+    def _reset_buffer(self) -> None:
+        self._parts: list[str] = []
+        self._length = 0
+        # Leading whitespace in the buffer; None while the buffer is all whitespace
+        self._leading: int | None = None
+
+    def _append(self, fragment: str) -> None:
+        if not fragment:
+            return
+        if self._leading is None:
+            stripped = fragment.lstrip()
+            if stripped:
+                self._leading = self._length + len(fragment) - len(stripped)
+        self._parts.append(fragment)
+        self._length += len(fragment)
+
+    def _stripped_length_with(self, fragment: str) -> int:
+        """Length of ``(buffer + fragment).strip()`` when fragment ends in a boundary."""
+        if self._leading is None:
+            return len(fragment.lstrip())
+        return self._length - self._leading + len(fragment)
+
+    def _take(self) -> str:
+        result = "".join(self._parts).strip()
+        self._reset_buffer()
+        return result
 
     @property
     def text(self) -> Aggregation:
-        return Aggregation(text=self._text.strip(), type=AggregationType.SENTENCE)
+        return Aggregation(text="".join(self._parts).strip(), type=AggregationType.SENTENCE)
 
     async def aggregate(self, text: str) -> AsyncIterator[Aggregation]:
-        for char in text:
-            self._text += char
-
-            # Check for sentence endings (always yield)
-            if char in SENTENCE_ENDINGS and len(self._text.strip()) >= 3:
-                result = self._text.strip()
-                self._text = ""
-                if result:
-                    yield Aggregation(text=result, type=AggregationType.SENTENCE)
+        start = 0
+        for match in _BOUNDARY_PATTERN.finditer(text):
+            end = match.end()
+            char = match.group()
+            # Sentence endings always yield; clause breaks only once long enough
+            threshold = MIN_SENTENCE_LENGTH if char in SENTENCE_ENDINGS else self._min_length
+            if self._stripped_length_with(text[start:end]) < threshold:
                 continue
-
-            # Check for clause breaks (yield if we have enough text)
-            if char in CLAUSE_BREAKS and len(self._text.strip()) >= self._min_length:
-                result = self._text.strip()
-                self._text = ""
-                if result:
-                    yield Aggregation(text=result, type=AggregationType.SENTENCE)
+            self._append(text[start:end])
+            start = end
+            result = self._take()
+            if result:
+                yield Aggregation(text=result, type=AggregationType.SENTENCE)
+        self._append(text[start:])
 
     async def flush(self) -> Optional[Aggregation]:
-        if self._text.strip():
-            result = self._text.strip()
-            self._text = ""
+        result = self._take()
+        if result:
             return Aggregation(text=result, type=AggregationType.SENTENCE)
         return None
 
     async def handle_interruption(self):
-        self._text = ""
+        self._reset_buffer()
 
     async def reset(self):
-        self._text = ""
+        self._reset_buffer()
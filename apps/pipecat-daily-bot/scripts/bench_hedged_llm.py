@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""First-token latency benchmark for hedged voice LLM requests.
+
+Starts two local OpenAI-compatible streaming servers with injected latency:
+the primary is usually fast but has a slow tail (``--tail-rate`` of requests
+wait ``--tail-ms``), the backup is steadily mediocre. Runs the same request
+sequence without and with hedging and reports first-token p50/p99.
+
+Usage:
+    python scripts/bench_hedged_llm.py [--requests N] [--tail-rate 0.1] [--tail-ms 3000]
+"""
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+from pathlib import Path
+
+import aiohttp
+from aiohttp import web
+
+# Add bot directory to path for imports
+bot_dir = Path(__file__).parent.parent / "bot"
+sys.path.insert(0, str(bot_dir))
+
+from services.llm_hedging import HedgedLLM, LLMEndpoint
+
+
+async def _start_server(latency) -> tuple[web.AppRunner, str]:
+    async def completions(request: web.Request) -> web.StreamResponse:
+        await request.json()
+        resp = web.StreamResponse(headers={"Content-Type": "text/event-stream"})
+        await resp.prepare(request)
+        await asyncio.sleep(latency())
+        try:
+            for token in ("Sure", ",", " here", " you", " go", "."):
+                chunk = {"choices": [{"delta": {"content": token}}]}
+                await resp.write(f"data: {json.dumps(chunk)}\n\n".encode())
+            await resp.write(b"data: [DONE]\n\n")
+        except ConnectionResetError:
+            pass  # hedging cancelled this request
+        return resp
+
+    app = web.Application()
+    app.router.add_post("/v1/chat/completions", completions)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    return runner, f"http://127.0.0.1:{port}/v1"
+
+
+async def _run(llm: HedgedLLM, session: aiohttp.ClientSession, requests: int) -> dict:
+    timeout = aiohttp.ClientTimeout(total=30)
+    messages = [{"role": "user", "content": "hi"}]
+    for _ in range(requests):
+        async for _chunk in llm.stream(session, messages, timeout=timeout):
+            pass
+    return llm.summary()
+
+
+async def main(args: argparse.Namespace) -> None:
+    rng = random.Random(args.seed)
+
+    def primary_latency() -> float:
+        if rng.random() < args.tail_rate:
+            return args.tail_ms / 1000.0
+        return rng.uniform(0.08, 0.25)
+
+    def backup_latency() -> float:
+        return rng.uniform(0.3, 0.5)
+
+    primary_runner, primary_url = await _start_server(primary_latency)
+    backup_runner, backup_url = await _start_server(backup_latency)
+    primary = LLMEndpoint("primary", primary_url, "key", "primary-model")
+    backup = LLMEndpoint("backup", backup_url, "key", "backup-model")
+    try:
+        async with aiohttp.ClientSession() as session:
+            plain = await _run(HedgedLLM(primary), session, args.requests)
+            hedged = await _run(
+                HedgedLLM(primary, backup, percentile=args.percentile, min_delay=0.2, max_delay=2.0, initial_delay=0.6),
+                session,
+                args.requests,
+            )
+    finally:
+        await primary_runner.cleanup()
+        await backup_runner.cleanup()
+
+    print(f"requests={args.requests} tail_rate={args.tail_rate} tail_ms={args.tail_ms}")
+    for label, summary in (("single", plain), ("hedged", hedged)):
+        print(
+            f"{label:>7}: first-token p50={summary['first_token_p50_ms']}ms "
+            f"p99={summary['first_token_p99_ms']}ms hedges={summary['hedges']} "
+            f"backup_wins={summary['backup_wins']} deadline={summary['hedge_delay_ms']}ms"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=100)
+    parser.add_argument("--tail-rate", type=float, default=0.1)
+    parser.add_argument("--tail-ms", type=int, default=3000)
+    parser.add_argument("--percentile", type=float, default=0.9)
+    parser.add_argument("--seed", type=int, default=7)
+    started = time.monotonic()
+    asyncio.run(main(parser.parse_args()))
+    print(f"elapsed {time.monotonic() - started:.1f}s")
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""Per-call event-loop overhead of the bot's StructuredLogger.
+
+Logs from inside a running event loop to a stream whose writes take
+``--write-us`` (a backpressured stderr pipe) and reports the time each call
+keeps the loop busy, for:
+
+  legacy     the previous path: merge context, Logger.log, synchronous JSON write
+  sync       current StructuredLogger with the synchronous handler (BOT_LOG_ASYNC=false)
+  queued     current StructuredLogger with the queue + listener thread (default)
+  disabled   a DEBUG call while the logger is at INFO
+  repeated   one call site logging far above the per-site rate limit
+
+Usage:
+    python scripts/bench_log_overhead.py [--calls N] [--write-us 20]
+"""
+import argparse
+import asyncio
+import logging
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Add bot directory to path for imports
+bot_dir = Path(__file__).parent.parent / "bot"
+sys.path.insert(0, str(bot_dir))
+
+import loguru
+from loguru import StructuredLogger
+
+
+class _SlowStream:
+    def __init__(self, write_us: float):
+        self._write_secs = write_us / 1e6
+
+    def write(self, _text: str) -> None:
+        # Blocking I/O releases the GIL, like a write to a full pipe
+        time.sleep(self._write_secs)
+
+    def flush(self) -> None:
+        pass
+
+
+def _legacy_log(log: StructuredLogger, level: int, message: str, *args, **kwargs) -> None:
+    context = {**log._context}
+    for key, value in kwargs.items():
+        if value is not None:
+            context[key] = value
+    log._base.log(level, message, *args, extra={"context": context} if context else None)
+
+
+def _logger(name: str, stream: _SlowStream, *, queued: bool):
+    base = logging.getLogger(f"bench-{name}")
+    base.propagate = False
+    base.handlers.clear()
+    base.setLevel(logging.INFO)
+    listener = loguru._install_handlers(base, stream, queued=queued)
+    return StructuredLogger(base, {"roomUrl": "https://example.daily.co/bench", "sessionId": "s1"}), listener
+
+
+async def _measure(calls: int, emit) -> list[float]:
+    samples = []
+    for i in range(calls):
+        started = time.perf_counter()
+        emit(i)
+        samples.append(time.perf_counter() - started)
+        if i % 100 == 0:
+            await asyncio.sleep(0)  # let other tasks run, as the bot would
+    return samples
+
+
+async def main(args: argparse.Namespace) -> None:
+    stream = _SlowStream(args.write_us)
+    legacy, _ = _logger("legacy", stream, queued=False)
+    sync, _ = _logger("sync", stream, queued=False)
+    queued, listener = _logger("queued", stream, queued=True)
+
+    loguru._sampler = None
+    runs = {
+        "legacy": await _measure(args.calls, lambda i: _legacy_log(legacy, logging.INFO, "frame %d", i, userId="u1")),
+        "sync": await _measure(args.calls, lambda i: sync.info("frame %d", i, userId="u1")),
+    }
+    # Queued and later runs use distinct call sites, so the rate limit only bites "repeated"
+    runs["queued"] = await _measure(args.calls, lambda i: queued.info("frame %d", i, userId="u1"))
+    listener.queue.join()
+    runs["disabled"] = await _measure(args.calls, lambda i: queued.debug("frame %d", i, userId="u1"))
+    loguru._sampler = loguru._RateLimiter(args.rate_limit)
+    runs["repeated"] = await _measure(args.calls, lambda i: queued.info("frame %d", i, userId="u1"))
+    listener.stop()
+
+    print(f"calls={args.calls} write={args.write_us}us rate_limit={args.rate_limit}/s per site")
+    for name, samples in runs.items():
+        us = sorted(s * 1e6 for s in samples)
+        p99 = us[int(0.99 * (len(us) - 1))]
+        print(f"{name:>9}: mean={statistics.fmean(us):.2f}us p50={statistics.median(us):.2f}us p99={p99:.2f}us")
+    print(f"queued handler dropped={queued._base.handlers[0].dropped}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=5000)
+    parser.add_argument("--write-us", type=float, default=20.0)
+    parser.add_argument("--rate-limit", type=int, default=50)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""Per-token CPU benchmark for the LLM→TTS text path.
+
+Streams a long markdown-heavy reply token by token through
+ClauseTextAggregator and the TTS text filters (the Kokoro configuration with
+non-speakable stripping, plus the plain markdown filter) and reports CPU time
+per token and per emitted chunk.
+
+Usage:
+    python scripts/bench_text_pipeline.py [--tokens N] [--repeat R]
+"""
+import argparse
+import asyncio
+import re
+import sys
+import time
+from pathlib import Path
+
+# Add bot directory to path for imports
+bot_dir = Path(__file__).parent.parent / "bot"
+sys.path.insert(0, str(bot_dir))
+
+from filters.tts_text_filter import MarkdownStripFilter
+from utils.clause_text_aggregator import ClauseTextAggregator
+
+_PARAGRAPH = (
+    "## Summary\n"
+    "Sure — here's what I found in **your notes**, with a few *highlights*: "
+    "the launch moved to Tuesday; the budget is ≥ $40k & still pending. "
+    "See [the plan](https://example.com/plan) or `npm run build` for details… "
+    "- First item ✅ → done\n"
+    "- Second item 🚀 needs review, ideally by Friday, if that works for everyone!\n"
+    "> Quoted text stays readable. Does that answer it? "
+)
+
+
+def _tokens(count: int) -> list[str]:
+    """Split a repeated reply into word-ish tokens the way LLMs stream them."""
+    pieces = re.findall(r"\s*\S+|\s+", _PARAGRAPH)
+    out: list[str] = []
+    while len(out) < count:
+        out.extend(pieces)
+    return out[:count]
+
+
+async def _run(tokens: list[str], strip_nonspeakable: bool) -> tuple[float, int]:
+    aggregator = ClauseTextAggregator()
+    text_filter = MarkdownStripFilter(strip_nonspeakable=strip_nonspeakable)
+    chunks = 0
+    start = time.process_time()
+    for token in tokens:
+        async for aggregation in aggregator.aggregate(token):
+            await text_filter.filter(aggregation.text)
+            chunks += 1
+    tail = await aggregator.flush()
+    if tail:
+        await text_filter.filter(tail.text)
+        chunks += 1
+    return time.process_time() - start, chunks
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tokens", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    tokens = _tokens(args.tokens)
+    for label, strip in (("markdown", False), ("kokoro", True)):
+        best, chunks = min(asyncio.run(_run(tokens, strip)) for _ in range(args.repeat))
+        print(
+            f"{label:>9}: {len(tokens)} tokens, {chunks} chunks, "
+            f"{best * 1e6 / len(tokens):.2f} µs/token, {best * 1e6 / max(chunks, 1):.1f} µs/chunk"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""End-to-end voice latency benchmark over the offline loopback transport.
+
+Builds the real bot pipeline with ``build_pipeline`` but swaps Daily for the
+loopback transport, the LLM for a local OpenAI-compatible fake and PocketTTS
+for a local fake, then plays the recorded fixtures in
+``bot/tests/integration/resources`` through Silero VAD in real time. Each
+round runs three turns and reports:
+
+  response      user audio end -> first bot audio (and from VAD stop)
+  tool          tool call sent -> tool result back at the LLM, and user audio
+                end -> first bot audio for a turn that calls a tool
+  interruption  barge-in audio start -> bot audio cut off (and from VAD start)
+
+No network, Daily room or API keys are needed.
+
+Usage:
+    python scripts/bench_voice_loopback.py [--rounds N] [--llm-first-token-ms 250]
+        [--tts-first-audio-ms 120] [--stt-delay-ms 150] [--tool-ms 50]
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Add bot directory to path for imports
+bot_dir = Path(__file__).parent.parent / "bot"
+sys.path.insert(0, str(bot_dir))
+
+from loguru import logger
+
+from tests.integration.clips import read_wav_clip
+from tests.integration.loopback import (
+    BOT_AUDIO,
+    LLM_TOOL_CALL,
+    LLM_TOOL_RESULT,
+    USER_AUDIO_START,
+    USER_STARTED_SPEAKING,
+    USER_STOPPED_SPEAKING,
+    FakeLLMScript,
+    FakeLLMServer,
+    FakePocketTTSServer,
+    LoopbackTimeline,
+    loopback_factory,
+)
+
+_RESOURCES = bot_dir / "tests" / "integration" / "resources"
+_ROOM_URL = "https://loopback.daily.co/bench"
+_TURN_TIMEOUT_SECS = 30.0
+_QUIET_SECS = 0.8
+
+
+def _llm_service(pipeline):
+    from pipecat.services.llm_service import LLMService
+
+    for processor in pipeline.processors:
+        if isinstance(processor, LLMService):
+            return processor
+    raise RuntimeError("pipeline has no LLM service")
+
+
+async def _rounds(args: argparse.Namespace, timeline: LoopbackTimeline, transport) -> dict:
+    sample_rate = transport.input().sample_rate
+    hello = read_wav_clip(_RESOURCES / "hello_how_are_you.wav", sample_rate)
+    notepad = read_wav_clip(_RESOURCES / "open_notepad.wav", sample_rate)
+    results = {name: [] for name in ("response", "response_vad", "tool_rtt", "tool_turn", "interrupt", "interrupt_vad")}
+
+    for _ in range(args.rounds):
+        ended = await transport.say(hello, "Hello, how are you?")
+        first = await timeline.wait_for(BOT_AUDIO, ended, _TURN_TIMEOUT_SECS)
+        results["response"].append(first.at - ended)
+        vad_stop = timeline.first(USER_STOPPED_SPEAKING, ended - 1.0)
+        if vad_stop is not None and vad_stop.at <= first.at:
+            results["response_vad"].append(first.at - vad_stop.at)
+        await timeline.wait_for_bot_silence(ended, _QUIET_SECS, _TURN_TIMEOUT_SECS)
+
+        ended = await transport.say(notepad, "Open the notepad please.")
+        call = await timeline.wait_for(LLM_TOOL_CALL, ended, _TURN_TIMEOUT_SECS)
+        result = await timeline.wait_for(LLM_TOOL_RESULT, call.at, _TURN_TIMEOUT_SECS)
+        first = await timeline.wait_for(BOT_AUDIO, ended, _TURN_TIMEOUT_SECS)
+        results["tool_rtt"].append(result.at - call.at)
+        results["tool_turn"].append(first.at - ended)
+        await timeline.wait_for_bot_silence(ended, _QUIET_SECS, _TURN_TIMEOUT_SECS)
+
+        ended = await transport.say(hello, "Hello, how are you?")
+        first = await timeline.wait_for(BOT_AUDIO, ended, _TURN_TIMEOUT_SECS)
+        await asyncio.sleep(args.barge_in_ms / 1000)
+        barge_in = asyncio.create_task(transport.say(hello, "Sorry, one second."))
+        onset = await timeline.wait_for(USER_AUDIO_START, first.at, _TURN_TIMEOUT_SECS)
+        await barge_in
+        vad_start = await timeline.wait_for(USER_STARTED_SPEAKING, onset.at, _TURN_TIMEOUT_SECS)
+        cut_off = timeline.bot_speech_end(first.at)
+        if cut_off is not None and cut_off > onset.at:
+            results["interrupt"].append(cut_off - onset.at)
+            results["interrupt_vad"].append(cut_off - vad_start.at)
+        else:
+            logger.warning("Bot finished its reply before the barge-in; lengthen the reply or lower --barge-in-ms")
+        await timeline.wait_for_bot_silence(onset.at, _QUIET_SECS, _TURN_TIMEOUT_SECS)
+    return results
+
+
+async def main(args: argparse.Namespace) -> None:
+    from pipecat.pipeline.runner import PipelineRunner
+
+    from pipeline.builder import build_pipeline
+
+    timeline = LoopbackTimeline()
+    llm_server = FakeLLMServer(
+        timeline,
+        FakeLLMScript(first_token_secs=args.llm_first_token_ms / 1000, token_secs=args.llm_token_ms / 1000),
+    )
+    tts_server = FakePocketTTSServer(first_audio_secs=args.tts_first_audio_ms / 1000)
+    os.environ.update(
+        {
+            "OPENAI_API_KEY": "loopback",
+            "OPENAI_BASE_URL": await llm_server.start(),
+            "BOT_MODEL_SELECTION": "gpt-4o-mini",
+            "BOT_TTS_PROVIDER": "pocket",
+            "POCKET_TTS_URL": await tts_server.start(),
+            "USE_REDIS": "false",
+        }
+    )
+    for key in ("BOT_LLM_MODE", "OPENCLAW_API_URL", "BOT_NON_BLOCKING_TOOLS"):
+        os.environ.pop(key, None)
+
+    pipeline, task, _agg, transport, *_rest, tts = await build_pipeline(
+        _ROOM_URL,
+        "pearl",
+        "loopback",
+        transport_factory=loopback_factory(timeline=timeline, stt_delay_secs=args.stt_delay_ms / 1000),
+    )
+
+    async def loopback_probe(params):
+        await asyncio.sleep(args.tool_ms / 1000)
+        await params.result_callback({"success": True})
+
+    _llm_service(pipeline).register_function("loopback_probe", loopback_probe)
+
+    runner = PipelineRunner(handle_sigint=False)
+    run = asyncio.create_task(runner.run(task))
+    try:
+        await transport.wait_until_ready()
+        # Filler phrases render in the background; keep that TTS load out of the numbers
+        warm = getattr(tts, "phrase_warm_task", None)
+        if warm is not None:
+            await warm
+        await asyncio.sleep(0.5)  # let the VAD settle on silence
+        results = await _rounds(args, timeline, transport)
+    finally:
+        await task.cancel()
+        await asyncio.gather(run, return_exceptions=True)
+        await llm_server.stop()
+        await tts_server.stop()
+
+    print(
+        f"rounds={args.rounds} llm_first_token={args.llm_first_token_ms}ms "
+        f"tts_first_audio={args.tts_first_audio_ms}ms stt_delay={args.stt_delay_ms}ms tool={args.tool_ms}ms"
+    )
+    for name, samples in results.items():
+        if not samples:
+            print(f"{name:>14}: no samples")
+            continue
+        ms = sorted(s * 1000 for s in samples)
+        p95 = ms[min(len(ms) - 1, int(round(0.95 * (len(ms) - 1))))]
+        print(f"{name:>14}: p50={statistics.median(ms):.0f}ms p95={p95:.0f}ms max={ms[-1]:.0f}ms n={len(ms)}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--llm-first-token-ms", type=int, default=250)
+    parser.add_argument("--llm-token-ms", type=int, default=10)
+    parser.add_argument("--tts-first-audio-ms", type=int, default=120)
+    parser.add_argument("--stt-delay-ms", type=int, default=150)
+    parser.add_argument("--tool-ms", type=int, default=50)
+    parser.add_argument("--barge-in-ms", type=int, default=1000)
+    parser.add_argument("--log-level", default="WARNING")
+    parsed = parser.parse_args()
+    # Bot modules reset the shared logger level from this on import
+    os.environ["PYTHON_DEBUG_LEVEL"] = parsed.log_level
+    started = time.monotonic()
+    asyncio.run(main(parsed))
+    print(f"elapsed {time.monotonic() - started:.1f}s")
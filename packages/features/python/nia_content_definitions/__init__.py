@@ -9,7 +9,9 @@ from .definitions import (
 from .mesh_helpers import (
     register_content_definition,
     ensure_content_definitions,
-    register_all_definitions
+    register_all_definitions,
+    definition_hash,
+    clear_ensured_cache
 )
 
 __all__ = [
@@ -19,5 +21,7 @@ __all__ = [
     'ALL_DEFINITIONS',
     'register_content_definition',
     'ensure_content_definitions',
-    'register_all_definitions'
+    'register_all_definitions',
+    'definition_hash',
+    'clear_ensured_cache'
 ]
@@ -1,101 +1,183 @@
 """Helper functions for registering content definitions with Mesh API."""
+import hashlib
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any, Optional, Tuple
+
 import requests
-from typing import Dict, List, Any, Optional
+from requests.adapters import HTTPAdapter
 
 
-def register_content_definition(
+# Process-level record of definitions already ensured, keyed by
+# (mesh_url, tenant) -> {definition name: definition hash}
+_ensured: Dict[Tuple[str, str], Dict[str, str]] = {}
+_ensured_lock = threading.Lock()
+
+
+def definition_hash(definition: Dict[str, Any]) -> str:
+    """Stable content hash of a definition (key order does not matter)."""
+    canonical = json.dumps(definition, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def clear_ensured_cache() -> None:
+    """Forget which definitions were ensured, forcing the next call to check Mesh."""
+    with _ensured_lock:
+        _ensured.clear()
+
+
+def _headers(mesh_secret: Optional[str]) -> Dict[str, str]:
+    headers = {"Accept": "application/json"}
+    if mesh_secret:
+        headers["x-mesh-secret"] = mesh_secret
+    return headers
+
+
+def _sync_definition(
+    session: requests.Session,
     definition: Dict[str, Any],
     mesh_url: str,
     tenant: str,
-    mesh_secret: Optional[str] = None,
+    headers: Dict[str, str],
 ) -> bool:
-    """Register a single content definition with Mesh.
-    
-    Args:
-        definition: Content definition dictionary
-        mesh_url: Base URL for Mesh API (e.g., http://localhost:5002/api - includes /api)
-        tenant: Tenant ID
-        mesh_secret: Optional mesh shared secret for authentication
-        
-    Returns:
-        True if registration succeeded, False otherwise
-    """
+    """Create or update one definition unless Mesh already has identical content."""
     try:
-        # Check if definition already exists
-        headers = {"Accept": "application/json"}
-        if mesh_secret:
-            headers["x-mesh-secret"] = mesh_secret
-            
         type_name = definition.get("name")
         if not type_name:
             print(f"❌ Definition missing 'name' field")
             return False
-            
+
         # GET to check if exists
         get_url = f"{mesh_url}/definition/{type_name}"
-        get_response = requests.get(
+        get_response = session.get(
             get_url,
             params={"tenant": tenant},
             headers=headers,
             timeout=10
         )
-        
-        # If it exists (200), we're done
+
         if get_response.status_code == 200:
-            return True
-            
-        # If it doesn't exist (404), create it
-        if get_response.status_code == 404:
-            post_url = f"{mesh_url}/definition"
-            post_response = requests.post(
-                post_url,
-                params={"tenant": tenant},
-                headers=headers,
-                json={"definition": definition},
-                timeout=10
-            )
-            
-            if post_response.status_code in (200, 201):
+            existing = (get_response.json() or {}).get("data") or {}
+            if isinstance(existing, dict) and "content" in existing and "dataModel" not in existing:
+                existing = existing["content"] or {}
+            # Mesh may add bookkeeping fields; compare only what we define
+            current = {key: existing.get(key) for key in definition}
+            if definition_hash(current) == definition_hash(definition):
                 return True
-            else:
-                print(f"❌ Failed to register {type_name}: {post_response.status_code} {post_response.reason} for url: {post_url}?tenant={tenant}")
-                return False
-        else:
+        elif get_response.status_code != 404:
             print(f"❌ Unexpected status {get_response.status_code} checking for {type_name}")
             return False
-            
+
+        # Missing or changed: POST creates, or replaces an existing definition
+        post_url = f"{mesh_url}/definition"
+        post_response = session.post(
+            post_url,
+            params={"tenant": tenant},
+            headers=headers,
+            json={"definition": definition},
+            timeout=10
+        )
+
+        if post_response.status_code in (200, 201):
+            return True
+        print(f"❌ Failed to register {type_name}: {post_response.status_code} {post_response.reason} for url: {post_url}?tenant={tenant}")
+        return False
+
     except Exception as e:
         print(f"❌ Exception registering definition: {e}")
         return False
 
 
+def register_content_definition(
+    definition: Dict[str, Any],
+    mesh_url: str,
+    tenant: str,
+    mesh_secret: Optional[str] = None,
+    force: bool = False,
+) -> bool:
+    """Register a single content definition with Mesh.
+
+    Args:
+        definition: Content definition dictionary
+        mesh_url: Base URL for Mesh API (e.g., http://localhost:5002/api - includes /api)
+        tenant: Tenant ID
+        mesh_secret: Optional mesh shared secret for authentication
+        force: Check Mesh even if this process already ensured the definition
+
+    Returns:
+        True if registration succeeded, False otherwise
+    """
+    results = ensure_content_definitions(
+        definitions=[definition],
+        mesh_url=mesh_url,
+        tenant=tenant,
+        mesh_secret=mesh_secret,
+        force=force,
+    )
+    return results.get(definition.get("name", "unknown"), False)
+
+
 def ensure_content_definitions(
     definitions: List[Dict[str, Any]],
     mesh_url: str,
     tenant: str,
     mesh_secret: Optional[str] = None,
+    force: bool = False,
+    max_workers: int = 8,
 ) -> Dict[str, bool]:
     """Ensure multiple content definitions are registered with Mesh.
-    
+
+    Definitions this process already ensured for the same Mesh URL and tenant,
+    with the same content hash, are skipped without any request. The rest are
+    checked concurrently over one keep-alive session; each is created or
+    updated only when Mesh is missing it or holds different content.
+
     Args:
         definitions: List of content definition dictionaries
         mesh_url: Base URL for Mesh API (e.g., http://localhost:5002/api - includes /api)
         tenant: Tenant ID
         mesh_secret: Optional mesh shared secret for authentication
-        
+        force: Check Mesh even for definitions already ensured by this process
+        max_workers: Maximum concurrent Mesh requests
+
     Returns:
         Dictionary mapping definition names to success status
     """
-    results = {}
+    key = (mesh_url, tenant)
+    hashes = {definition.get("name", "unknown"): definition_hash(definition) for definition in definitions}
+    with _ensured_lock:
+        known = dict(_ensured.get(key, {}))
+
+    results: Dict[str, bool] = {}
+    pending: List[Dict[str, Any]] = []
     for definition in definitions:
         name = definition.get("name", "unknown")
-        success = register_content_definition(
-            definition=definition,
-            mesh_url=mesh_url,
-            tenant=tenant,
-            mesh_secret=mesh_secret
-        )
-        results[name] = success
+        if not force and known.get(name) == hashes[name]:
+            results[name] = True
+        else:
+            pending.append(definition)
+    if not pending:
+        return results
+
+    headers = _headers(mesh_secret)
+    workers = max(1, min(max_workers, len(pending)))
+    with requests.Session() as session:
+        session.mount("http://", HTTPAdapter(pool_maxsize=workers))
+        session.mount("https://", HTTPAdapter(pool_maxsize=workers))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            outcomes = list(executor.map(
+                lambda definition: _sync_definition(session, definition, mesh_url, tenant, headers),
+                pending,
+            ))
+
+    with _ensured_lock:
+        ensured = _ensured.setdefault(key, {})
+        for definition, success in zip(pending, outcomes, strict=True):
+            name = definition.get("name", "unknown")
+            results[name] = success
+            if success:
+                ensured[name] = hashes[name]
     return results
 
 
@@ -105,17 +187,17 @@ def register_all_definitions(
     mesh_secret: Optional[str] = None,
 ) -> Dict[str, bool]:
     """Register all definitions from this package with Mesh.
-    
+
     Args:
         mesh_url: Base URL for Mesh API (e.g., http://localhost:5002/api - includes /api)
         tenant: Tenant ID
         mesh_secret: Optional mesh shared secret for authentication
-        
+
     Returns:
         Dictionary mapping definition names to success status
     """
     from .definitions import ALL_DEFINITIONS
-    
+
     return ensure_content_definitions(
         definitions=ALL_DEFINITIONS,
         mesh_url=mesh_url,
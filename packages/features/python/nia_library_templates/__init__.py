@@ -7,15 +7,19 @@ This module provides template information for bot tool prompts.
 from .templates import (
     LIBRARY_TEMPLATES,
     LIBRARY_TYPES,
+    LIBRARY_TEMPLATE_INDEX,
     get_template_by_id,
     get_templates_by_type,
+    match_templates,
     build_prompt_guidance,
 )
 
 __all__ = [
     'LIBRARY_TEMPLATES',
     'LIBRARY_TYPES',
+    'LIBRARY_TEMPLATE_INDEX',
     'get_template_by_id',
     'get_templates_by_type',
+    'match_templates',
     'build_prompt_guidance',
 ]
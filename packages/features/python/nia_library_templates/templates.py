@@ -3,6 +3,7 @@
 """
 Library template metadata for Nia Universal HTML generation.
 """
+import re
 from typing import Optional
 
 # All available library types
@@ -61,6 +62,50 @@ LIBRARY_TEMPLATES: list[dict] = [
     }
 ]
 
+# Inverted index: token -> [(position in LIBRARY_TEMPLATES, weight)].
+# Weights: exact id 3, name word 2, tag 1.
+LIBRARY_TEMPLATE_INDEX: dict[str, list[tuple[int, int]]] = {
+    "arcade": [(4, 1)],
+    "board": [(5, 1), (6, 1)],
+    "challenge": [(5, 2)],
+    "checker": [(5, 2)],
+    "checkers_challenge": [(5, 3)],
+    "chess": [(6, 3)],
+    "chess_persistent": [(6, 3)],
+    "classic": [(5, 3)],
+    "counter": [(0, 3)],
+    "counter_widget_v1": [(0, 3)],
+    "emoji": [(2, 3)],
+    "fun": [(2, 1)],
+    "game": [(3, 1), (4, 1), (5, 1), (6, 1)],
+    "invader": [(4, 2)],
+    "keeper": [(3, 2)],
+    "lite": [(4, 2)],
+    "multiplayer": [(6, 2)],
+    "option": [(1, 2)],
+    "pack": [(2, 2), (3, 2)],
+    "party": [(2, 2), (3, 2)],
+    "party_pack_poll": [(2, 3)],
+    "party_pack_score": [(3, 3)],
+    "persisted": [(0, 1), (1, 1), (2, 1), (3, 1), (4, 1), (6, 1)],
+    "poll": [(1, 3), (2, 1)],
+    "quick": [(1, 2)],
+    "quick_poll_v1": [(1, 3)],
+    "score": [(3, 3)],
+    "shooter": [(4, 1)],
+    "single": [(6, 2)],
+    "space": [(4, 2)],
+    "space_invaders_lite": [(4, 3)],
+    "starter": [(0, 2)],
+    "strategy": [(5, 1)],
+    "team": [(3, 1)],
+    "two": [(1, 2)],
+    "vote": [(1, 1), (2, 2)],
+    "widget": [(0, 3)],
+}
+
+_TOKEN_RE = re.compile(r"[a-z0-9_]+")
+
 
 def get_template_by_id(template_id: str) -> Optional[dict]:
     """Get a template by its ID."""
@@ -75,6 +120,48 @@ def get_templates_by_type(library_type: str) -> list[dict]:
     return [t for t in LIBRARY_TEMPLATES if t["library_type"] == library_type]
 
 
+def _normalize_token(token: str) -> str:
+    """Lowercase and fold simple plurals; must match normalizeToken in codegen."""
+    token = token.lower()
+    if len(token) > 3 and token.endswith("s") and not token.endswith("ss"):
+        return token[:-1]
+    return token
+
+
+def _request_tokens(text: str) -> set[str]:
+    tokens: set[str] = set()
+    for raw in _TOKEN_RE.findall(text.lower()):
+        tokens.add(raw)  # template ids are indexed whole
+        for part in raw.split("_"):
+            if part:
+                tokens.add(_normalize_token(part))
+    return tokens
+
+
+def match_templates(
+    text: str,
+    library_type: Optional[str] = None,
+    limit: int = 3,
+) -> list[tuple[dict, int]]:
+    """
+    Rank templates against free text (e.g. a request title and description).
+
+    Looks up each distinct request token in LIBRARY_TEMPLATE_INDEX, so the cost
+    grows with the request, not the library. Returns up to limit
+    (template, score) pairs, best first; ties keep library order.
+    """
+    scores: dict[int, int] = {}
+    for token in _request_tokens(text):
+        for position, weight in LIBRARY_TEMPLATE_INDEX.get(token, ()):
+            scores[position] = scores.get(position, 0) + weight
+    ranked = sorted(
+        (-score, position)
+        for position, score in scores.items()
+        if library_type is None or LIBRARY_TEMPLATES[position]["library_type"] == library_type
+    )
+    return [(LIBRARY_TEMPLATES[position], -neg_score) for neg_score, position in ranked[:limit]]
+
+
 def build_prompt_guidance() -> str:
     """
     Build a prompt-friendly string of all available library templates
@@ -100,7 +100,9 @@ ${json.contentDefinitions.map(def => `    ${def.name.toUpperCase()}_DEFINITION,`
 from .mesh_helpers import (
     register_content_definition,
     ensure_content_definitions,
-    register_all_definitions
+    register_all_definitions,
+    definition_hash,
+    clear_ensured_cache
 )
 
 __all__ = [
@@ -108,7 +110,9 @@ ${json.contentDefinitions.map(def => `    '${def.name.toUpperCase()}_DEFINITION'
     'ALL_DEFINITIONS',
     'register_content_definition',
     'ensure_content_definitions',
-    'register_all_definitions'
+    'register_all_definitions',
+    'definition_hash',
+    'clear_ensured_cache'
 ]
 `;
   const pyInitPath = join(pyPkgRoot, '__init__.py');
@@ -176,6 +180,7 @@ function generateLibraryTemplates() {
 
   const templates = templatesJson.templates;
   const libraryTypes = Array.from(new Set(templates.map(t => t.libraryType)));
+  const templateIndex = buildTemplateIndex(templates);
 
   // Generate README.md (required by pyproject.toml)
   const readme = `# nia-library-templates
@@ -193,6 +198,7 @@ from nia_library_templates import (
     LIBRARY_TYPES,
     get_template_by_id,
     get_templates_by_type,
+    match_templates,
     build_prompt_guidance,
 )
 
@@ -206,6 +212,9 @@ game_templates = get_templates_by_type("game")
 # Get a specific template by ID
 template = get_template_by_id("counter_widget_v1")
 
+# Rank templates against a request (best first, with scores)
+shortlist = match_templates("a quick poll for the team", library_type="tool")
+
 # Generate prompt guidance for bot tools
 guidance = build_prompt_guidance()
 \`\`\`
@@ -223,16 +232,20 @@ This module provides template information for bot tool prompts.
 from .templates import (
     LIBRARY_TEMPLATES,
     LIBRARY_TYPES,
+    LIBRARY_TEMPLATE_INDEX,
     get_template_by_id,
     get_templates_by_type,
+    match_templates,
     build_prompt_guidance,
 )
 
 __all__ = [
     'LIBRARY_TEMPLATES',
     'LIBRARY_TYPES',
+    'LIBRARY_TEMPLATE_INDEX',
     'get_template_by_id',
     'get_templates_by_type',
+    'match_templates',
     'build_prompt_guidance',
 ]
 `;
@@ -255,11 +268,20 @@ __all__ = [
     })
     .join(',\n');
 
+  const pyTemplateIndex = Object.keys(templateIndex)
+    .sort()
+    .map(token => {
+      const postings = templateIndex[token].map(([position, weight]) => `(${position}, ${weight})`).join(', ');
+      return `    "${token}": [${postings}],`;
+    })
+    .join('\n');
+
   const pyTemplates = `# Auto-generated from descriptors/library-templates.json
 # Do not edit this file directly - run codegen instead
 """
 Library template metadata for Nia Universal HTML generation.
 """
+import re
 from typing import Optional
 
 # All available library types
@@ -270,6 +292,14 @@ LIBRARY_TEMPLATES: list[dict] = [
 ${pyTemplatesList}
 ]
 
+# Inverted index: token -> [(position in LIBRARY_TEMPLATES, weight)].
+# Weights: exact id ${TEMPLATE_TOKEN_WEIGHTS.id}, name word ${TEMPLATE_TOKEN_WEIGHTS.name}, tag ${TEMPLATE_TOKEN_WEIGHTS.tag}.
+LIBRARY_TEMPLATE_INDEX: dict[str, list[tuple[int, int]]] = {
+${pyTemplateIndex}
+}
+
+_TOKEN_RE = re.compile(r"[a-z0-9_]+")
+
 
 def get_template_by_id(template_id: str) -> Optional[dict]:
     """Get a template by its ID."""
@@ -284,6 +314,48 @@ def get_templates_by_type(library_type: str) -> list[dict]:
     return [t for t in LIBRARY_TEMPLATES if t["library_type"] == library_type]
 
 
+def _normalize_token(token: str) -> str:
+    """Lowercase and fold simple plurals; must match normalizeToken in codegen."""
+    token = token.lower()
+    if len(token) > 3 and token.endswith("s") and not token.endswith("ss"):
+        return token[:-1]
+    return token
+
+
+def _request_tokens(text: str) -> set[str]:
+    tokens: set[str] = set()
+    for raw in _TOKEN_RE.findall(text.lower()):
+        tokens.add(raw)  # template ids are indexed whole
+        for part in raw.split("_"):
+            if part:
+                tokens.add(_normalize_token(part))
+    return tokens
+
+
+def match_templates(
+    text: str,
+    library_type: Optional[str] = None,
+    limit: int = 3,
+) -> list[tuple[dict, int]]:
+    """
+    Rank templates against free text (e.g. a request title and description).
+
+    Looks up each distinct request token in LIBRARY_TEMPLATE_INDEX, so the cost
+    grows with the request, not the library. Returns up to limit
+    (template, score) pairs, best first; ties keep library order.
+    """
+    scores: dict[int, int] = {}
+    for token in _request_tokens(text):
+        for position, weight in LIBRARY_TEMPLATE_INDEX.get(token, ()):
+            scores[position] = scores.get(position, 0) + weight
+    ranked = sorted(
+        (-score, position)
+        for position, score in scores.items()
+        if library_type is None or LIBRARY_TEMPLATES[position]["library_type"] == library_type
+    )
+    return [(LIBRARY_TEMPLATES[position], -neg_score) for neg_score, position in ranked[:limit]]
+
+
 def build_prompt_guidance() -> str:
     """
     Build a prompt-friendly string of all available library templates
@@ -325,4 +397,43 @@ def build_prompt_guidance() -> str:
   }
 }
 
+// Matcher weights: an exact template id beats name words, which beat tags
+const TEMPLATE_TOKEN_WEIGHTS = { id: 3, name: 2, tag: 1 };
+const TEMPLATE_STOPWORDS = new Set(['a', 'an', 'and', 'for', 'in', 'of', 'on', 'the', 'to', 'with']);
+
+/** Lowercase and fold simple plurals; must match _normalize_token in templates.py. */
+function normalizeToken(token: string): string {
+  const lower = token.toLowerCase();
+  if (lower.length > 3 && lower.endsWith('s') && !lower.endsWith('ss')) {
+    return lower.slice(0, -1);
+  }
+  return lower;
+}
+
+function wordTokens(text: string): string[] {
+  return (text.toLowerCase().match(/[a-z0-9]+/g) || [])
+    .filter(token => token.length > 1 && !TEMPLATE_STOPWORDS.has(token))
+    .map(normalizeToken);
+}
+
+/**
+ * Inverted index from request tokens to [template position, summed weight],
+ * so matching a request costs one lookup per request token.
+ */
+function buildTemplateIndex(templates: LibraryTemplateInfo[]): Record<string, Array<[number, number]>> {
+  const index: Record<string, Map<number, number>> = {};
+  const add = (token: string, position: number, weight: number) => {
+    const postings = (index[token] ??= new Map());
+    postings.set(position, (postings.get(position) ?? 0) + weight);
+  };
+  templates.forEach((t, position) => {
+    add(t.id.toLowerCase(), position, TEMPLATE_TOKEN_WEIGHTS.id);
+    wordTokens(t.name).forEach(token => add(token, position, TEMPLATE_TOKEN_WEIGHTS.name));
+    (t.tags || []).flatMap(wordTokens).forEach(token => add(token, position, TEMPLATE_TOKEN_WEIGHTS.tag));
+  });
+  return Object.fromEntries(
+    Object.entries(index).map(([token, postings]) => [token, Array.from(postings.entries())]),
+  );
+}
+
 run();
@@ -164,7 +164,8 @@ export class Prism {
     );
 
     // Apply business logic to the results
-    return this.applyBusinessLogic(result);
+    const processed = this.applyBusinessLogic(result);
+    return query.select?.length ? this.applySelect(processed, query.select) : processed;
   }
   
   /**
@@ -602,6 +603,24 @@ export class Prism {
     return processedResult
   }
   
+  /**
+   * Project result items down to the selected top-level fields.
+   * `_id` is always kept so callers can follow up with a full fetch.
+   */
+  private applySelect(result: PrismContentResult, select: string[]): PrismContentResult {
+    const fields = ['_id', ...select.filter((field) => field !== '_id')];
+    return {
+      ...result,
+      items: result.items.map((item: any) => {
+        const projected: Record<string, any> = {};
+        for (const field of fields) {
+          if (item && field in item) projected[field] = item[field];
+        }
+        return projected;
+      }),
+    };
+  }
+
   /**
    * Convert order by object to GraphQL format
    */
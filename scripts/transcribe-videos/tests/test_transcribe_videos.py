@@ -1,18 +1,22 @@
 from __future__ import annotations
 
+import asyncio
 import json
 from pathlib import Path
 
 import pytest
 
 from transcribe_videos.config import PathConfig
+from transcribe_videos.fake_backend import FakeDeepgramClient
 from transcribe_videos.formatters import (
     extract_utterances,
     format_srt,
     format_text_transcript,
     summarize,
 )
+from transcribe_videos.ledger import JobLedger, JobState
 from transcribe_videos.runner import (
+    ByteBudget,
     TranscriptFormat,
     TranscribeRunner,
     TranscriptionJob,
@@ -135,3 +139,153 @@ def test_runner_skip_logic(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> N
     outputs_expected["json"].write_text("{}", encoding="utf-8")
     outputs_expected["text"].write_text("hi", encoding="utf-8")
     assert runner._should_skip(job, outputs_expected)
+
+
+class _RecordingMedia:
+    def __init__(self) -> None:
+        self.uploads: list[tuple[type, bytes]] = []
+
+    def transcribe_file(self, *, request, **_kw):
+        self.uploads.append((type(request), b"".join(request)))
+        return SAMPLE_PAYLOAD
+
+
+def _recording_client(monkeypatch: pytest.MonkeyPatch) -> _RecordingMedia:
+    media = _RecordingMedia()
+
+    class _StubClient:
+        def __init__(self, *_args, **_kwargs):
+            self.listen = type("Listen", (), {"v1": type("V1", (), {"media": media})()})()
+
+    monkeypatch.setattr("transcribe_videos.runner.DeepgramClient", _StubClient)
+    return media
+
+
+def test_runner_streams_upload_in_chunks(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    media = _recording_client(monkeypatch)
+    monkeypatch.setattr("transcribe_videos.runner.UPLOAD_CHUNK_BYTES", 4)
+    source = tmp_path / "clip.mp4"
+    source.write_bytes(b"0123456789")
+    job = TranscriptionJob(source, Path("."), tmp_path / "out")
+
+    runner = TranscribeRunner(api_key="test", formats=[TranscriptFormat.TEXT])
+    (result,) = asyncio.run(runner.run([job]))
+
+    assert result.status == "success"
+    ((request_type, body),) = media.uploads
+    assert request_type is not bytes  # a generator, never the whole file
+    assert body == b"0123456789"
+
+
+def test_runner_uploads_extracted_audio(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    media = _recording_client(monkeypatch)
+    extracted: list[Path] = []
+
+    def _fake_ffmpeg(command, **_kwargs):
+        target = Path(command[-1])
+        target.write_bytes(b"opus")
+        extracted.append(target)
+        return type("Completed", (), {"returncode": 0, "stderr": ""})()
+
+    monkeypatch.setattr("transcribe_videos.runner.shutil.which", lambda _name: "/usr/bin/ffmpeg")
+    monkeypatch.setattr("transcribe_videos.runner.subprocess.run", _fake_ffmpeg)
+    source = tmp_path / "clip.mp4"
+    source.write_bytes(b"video" * 100)
+    job = TranscriptionJob(source, Path("."), tmp_path / "out")
+
+    runner = TranscribeRunner(api_key="test", formats=[TranscriptFormat.SRT], extract_audio=True)
+    (result,) = asyncio.run(runner.run([job]))
+
+    assert result.status == "success"
+    assert [body for _, body in media.uploads] == [b"opus"]
+    assert extracted[0].suffix == ".ogg" and not extracted[0].exists()
+
+
+def test_byte_budget_bounds_inflight_size() -> None:
+    async def scenario() -> list[int]:
+        budget = ByteBudget(1000)
+        peaks: list[int] = []
+
+        async def upload(size: int) -> None:
+            async with budget.reserve(size):
+                peaks.append(budget.in_flight)
+                await asyncio.sleep(0.01)
+
+        await asyncio.gather(upload(600), upload(600), upload(300), upload(5000))
+        return peaks
+
+    peaks = asyncio.run(scenario())
+    assert max(peaks) == 5000  # oversized upload ran, but alone
+    assert sorted(peaks)[:3] == [600, 600, 900]
+
+
+def _ledger_run(paths: PathConfig, client: FakeDeepgramClient, **kwargs) -> dict[str, TranscriptionResult]:
+    runner = TranscribeRunner(
+        api_key="test",
+        formats=[TranscriptFormat.TEXT],
+        ledger=JobLedger(paths.output_dir / "ledger.jsonl"),
+        client=client,
+        **kwargs,
+    )
+    results = asyncio.run(runner.run(discover_jobs(paths)))
+    return {result.job.source_path.name: result for result in results}
+
+
+def _distinct_recordings(paths: PathConfig) -> None:
+    for name in ("a.mp4", "b.mp4"):
+        (paths.input_dir / name).write_bytes(f"fake-{name}".encode())
+
+
+def test_ledger_skips_reruns_and_reuses_moved_recordings(tmp_paths: PathConfig) -> None:
+    _distinct_recordings(tmp_paths)
+    (tmp_paths.input_dir / "copy-of-a.mp4").write_bytes(b"fake-a.mp4")
+    first_client = FakeDeepgramClient()
+    first = _ledger_run(tmp_paths, first_client)
+    assert {r.status for r in first.values()} == {"success"}
+    assert len(first_client.calls) == 2  # identical copies transcribed once
+    assert first["a.mp4"].content_hash == first["copy-of-a.mp4"].content_hash
+
+    moved = tmp_paths.input_dir / "day2" / "renamed.mp4"
+    moved.parent.mkdir()
+    (tmp_paths.input_dir / "b.mp4").rename(moved)
+    second_client = FakeDeepgramClient()
+    second = _ledger_run(tmp_paths, second_client)
+
+    assert second_client.calls == []
+    assert second["a.mp4"].status == "skipped"
+    assert second["renamed.mp4"].status == "success"
+    assert second["renamed.mp4"].message.startswith("Reused transcript of")
+    assert (tmp_paths.output_dir / "day2" / "renamed.transcript.md").exists()
+
+
+def test_ledger_records_failures_and_resumes(tmp_paths: PathConfig) -> None:
+    _distinct_recordings(tmp_paths)
+    failed = _ledger_run(tmp_paths, FakeDeepgramClient(fail_first=1), max_retries=1)
+    assert sorted(r.status for r in failed.values()) == ["failed", "success"]
+
+    ledger = JobLedger(tmp_paths.output_dir / "ledger.jsonl")
+    (failed_entry,) = [e for e in ledger if e.state is JobState.FAILED]
+    assert failed_entry.attempts == 1 and "Fake transcription" in failed_entry.error
+
+    # A torn trailing line from a crash is ignored
+    with (tmp_paths.output_dir / "ledger.jsonl").open("a", encoding="utf-8") as handle:
+        handle.write('{"content_hash": "abc", "sta')
+    client = FakeDeepgramClient()
+    resumed = _ledger_run(tmp_paths, client)
+
+    assert len(client.calls) == 1
+    entry = JobLedger(tmp_paths.output_dir / "ledger.jsonl").get(failed_entry.content_hash)
+    assert entry.state is JobState.SUCCEEDED and entry.attempts == 2
+    assert set(entry.outputs) == {"json", "text"}
+    assert sorted(r.status for r in resumed.values()) == ["skipped", "success"]
+
+
+def test_ledger_retranscribes_when_outputs_change(tmp_paths: PathConfig) -> None:
+    _distinct_recordings(tmp_paths)
+    _ledger_run(tmp_paths, FakeDeepgramClient())
+    (tmp_paths.output_dir / "b.deepgram.json").write_text("{}", encoding="utf-8")
+    client = FakeDeepgramClient()
+    results = _ledger_run(tmp_paths, client)
+
+    assert len(client.calls) == 1
+    assert results["b.mp4"].status == "success" and results["a.mp4"].status == "skipped"
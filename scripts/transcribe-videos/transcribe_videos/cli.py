@@ -7,6 +7,8 @@ from pathlib import Path
 from typing import Sequence
 
 from .config import PathConfig, ensure_output_dir, load_api_key, resolve_paths
+from .fake_backend import FakeDeepgramClient
+from .ledger import JobLedger
 from .runner import TranscriptFormat, TranscribeRunner, TranscriptionResult, discover_jobs, write_manifest
 
 LOG_FORMAT = "%(asctime)s %(levelname)s %(name)s - %(message)s"
@@ -44,6 +46,17 @@ def build_parser() -> argparse.ArgumentParser:
         default=3,
         help="Number of times to retry a failed Deepgram upload before giving up (default: 3).",
     )
+    parser.add_argument(
+        "--max-inflight-mb",
+        type=int,
+        default=2048,
+        help="Upper bound on the combined size of uploads in flight, in MB (default: 2048).",
+    )
+    parser.add_argument(
+        "--extract-audio",
+        action="store_true",
+        help="Upload only the audio track, extracted locally with ffmpeg as mono Opus.",
+    )
     parser.add_argument(
         "--overwrite",
         action="store_true",
@@ -64,6 +77,15 @@ def build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Request Deepgram v2 summaries in the response.",
     )
+    parser.add_argument(
+        "--ledger",
+        help="Job ledger path used to skip and resume work (default: <output-dir>/ledger.jsonl).",
+    )
+    parser.add_argument(
+        "--fake-backend",
+        action="store_true",
+        help="Use an offline fake transcription backend instead of Deepgram (for testing).",
+    )
     parser.add_argument(
         "--manifest",
         help="Custom manifest path (default: <output-dir>/manifest.jsonl).",
@@ -89,18 +111,26 @@ def main(argv: Sequence[str] | None = None) -> int:
     if not paths.input_dir.exists():
         parser.error(f"Input directory {paths.input_dir} does not exist.")
 
-    api_key = load_api_key(paths.env_path)
+    api_key = "fake" if args.fake_backend else load_api_key(paths.env_path)
+    ledger_path = Path(args.ledger).expanduser().resolve() if args.ledger else paths.output_dir / "ledger.jsonl"
     formats = TranscriptFormat.from_csv(args.formats)
-    runner = TranscribeRunner(
-        api_key=api_key,
-        formats=formats,
-        overwrite=args.overwrite,
-        dry_run=args.dry_run,
-        max_concurrency=args.max_concurrency,
-        language=args.language,
-        summaries=args.summaries,
-        max_retries=args.max_retries,
-    )
+    try:
+        runner = TranscribeRunner(
+            api_key=api_key,
+            formats=formats,
+            overwrite=args.overwrite,
+            dry_run=args.dry_run,
+            max_concurrency=args.max_concurrency,
+            language=args.language,
+            summaries=args.summaries,
+            max_retries=args.max_retries,
+            extract_audio=args.extract_audio,
+            max_inflight_bytes=args.max_inflight_mb * 1024 * 1024,
+            ledger=JobLedger(ledger_path),
+            client=FakeDeepgramClient() if args.fake_backend else None,
+        )
+    except RuntimeError as exc:
+        parser.error(str(exc))
 
     jobs = discover_jobs(paths)
     logging.info("Discovered %s recording(s).", len(jobs))
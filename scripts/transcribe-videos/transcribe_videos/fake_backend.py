@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import hashlib
+import threading
+from typing import Iterable, List, Union
+
+
+class _FakeMedia:
+    def __init__(self, backend: "FakeDeepgramClient") -> None:
+        self._backend = backend
+
+    def transcribe_file(self, *, request: Union[bytes, Iterable[bytes]], **options) -> dict:
+        return self._backend.transcribe(request, options)
+
+
+class _FakeV1:
+    def __init__(self, backend: "FakeDeepgramClient") -> None:
+        self.media = _FakeMedia(backend)
+
+
+class _FakeListen:
+    def __init__(self, backend: "FakeDeepgramClient") -> None:
+        self.v1 = _FakeV1(backend)
+
+
+class FakeDeepgramClient:
+    """Offline stand-in for ``DeepgramClient`` exposing ``listen.v1.media.transcribe_file``.
+
+    Consumes the uploaded stream and returns a deterministic payload derived
+    from its bytes. ``fail_first`` makes the first N calls raise, to exercise
+    retries and failed-job bookkeeping.
+    """
+
+    def __init__(self, *_args, fail_first: int = 0, **_kwargs) -> None:
+        self.listen = _FakeListen(self)
+        self.fail_first = fail_first
+        self.calls: List[dict] = []
+        self._lock = threading.Lock()
+
+    def transcribe(self, request: Union[bytes, Iterable[bytes]], options: dict) -> dict:
+        body = request if isinstance(request, bytes) else b"".join(request)
+        with self._lock:
+            self.calls.append({"bytes": len(body), **options})
+            if len(self.calls) <= self.fail_first:
+                raise RuntimeError("Fake transcription backend failure.")
+        digest = hashlib.sha256(body).hexdigest()[:12]
+        duration = round(len(body) / 16000, 3)
+        return {
+            "metadata": {"duration": duration, "sha256": digest},
+            "results": {
+                "utterances": [
+                    {
+                        "speaker": 0,
+                        "start": 0.0,
+                        "end": duration,
+                        "confidence": 1.0,
+                        "transcript": f"fake transcript {digest}",
+                    }
+                ]
+            },
+        }
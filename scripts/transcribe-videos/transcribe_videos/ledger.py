@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from enum import Enum
+from pathlib import Path
+from typing import Dict, Iterator, Optional
+
+from .config import ensure_output_dir
+
+HASH_CHUNK_BYTES = 4 * 1024 * 1024
+
+
+class JobState(str, Enum):
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+
+def sha256_file(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        while chunk := handle.read(HASH_CHUNK_BYTES):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+@dataclass
+class LedgerEntry:
+    """Latest known state of one recording, identified by its content hash."""
+
+    content_hash: str
+    source: str
+    size: int
+    mtime_ns: int
+    state: JobState
+    attempts: int = 0
+    outputs: Dict[str, Dict[str, str]] = field(default_factory=dict)  # format -> {path, sha256}
+    error: Optional[str] = None
+    updated_at: str = field(default_factory=_now)
+
+    def to_json(self) -> str:
+        record = asdict(self)
+        record["state"] = self.state.value
+        return json.dumps(record)
+
+    @classmethod
+    def from_json(cls, line: str) -> "LedgerEntry":
+        record = json.loads(line)
+        record["state"] = JobState(record["state"])
+        return cls(**record)
+
+    def verified_outputs(self) -> Dict[str, Path]:
+        """Recorded outputs whose files still exist with the recorded checksum."""
+        verified: Dict[str, Path] = {}
+        for name, output in self.outputs.items():
+            path = Path(output["path"])
+            if path.exists() and sha256_file(path) == output["sha256"]:
+                verified[name] = path
+        return verified
+
+
+class JobLedger:
+    """Append-only JSONL record of transcription jobs keyed by content hash.
+
+    Every state change is appended and fsynced as it happens, so an interrupted
+    batch resumes from the last finished job. Loading replays the file (the last
+    line per hash wins) and rewrites it compacted. Content hashes are cached per
+    (path, size, mtime) so unchanged recordings are not re-read on every run.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._entries: Dict[str, LedgerEntry] = {}
+        self._hash_by_file: Dict[tuple[str, int, int], str] = {}
+        if path.exists():
+            self._load()
+
+    def _load(self) -> None:
+        with self.path.open("r", encoding="utf-8") as ledger_file:
+            for line in ledger_file:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    entry = LedgerEntry.from_json(line)
+                except (ValueError, TypeError, KeyError):
+                    continue  # torn final line from an interrupted write
+                self._remember(entry)
+        self._compact()
+
+    def _compact(self) -> None:
+        tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+        with tmp_path.open("w", encoding="utf-8") as ledger_file:
+            for entry in self._entries.values():
+                ledger_file.write(entry.to_json() + "\n")
+            ledger_file.flush()
+            os.fsync(ledger_file.fileno())
+        os.replace(tmp_path, self.path)
+
+    def _remember(self, entry: LedgerEntry) -> None:
+        self._entries[entry.content_hash] = entry
+        self._hash_by_file[(entry.source, entry.size, entry.mtime_ns)] = entry.content_hash
+
+    def _append(self, entry: LedgerEntry) -> None:
+        entry.updated_at = _now()
+        self._remember(entry)
+        ensure_output_dir(self.path.parent)
+        with self.path.open("a", encoding="utf-8") as ledger_file:
+            ledger_file.write(entry.to_json() + "\n")
+            ledger_file.flush()
+            os.fsync(ledger_file.fileno())
+
+    def __iter__(self) -> Iterator[LedgerEntry]:
+        return iter(list(self._entries.values()))
+
+    def get(self, content_hash: str) -> Optional[LedgerEntry]:
+        return self._entries.get(content_hash)
+
+    def content_hash(self, source_path: Path) -> str:
+        stat = source_path.stat()
+        cached = self._hash_by_file.get((str(source_path), stat.st_size, stat.st_mtime_ns))
+        if cached is not None:
+            return cached
+        content_hash = sha256_file(source_path)
+        self._hash_by_file[(str(source_path), stat.st_size, stat.st_mtime_ns)] = content_hash
+        return content_hash
+
+    def _entry_for(self, content_hash: str, source_path: Path, state: JobState) -> LedgerEntry:
+        stat = source_path.stat()
+        previous = self._entries.get(content_hash)
+        return LedgerEntry(
+            content_hash=content_hash,
+            source=str(source_path),
+            size=stat.st_size,
+            mtime_ns=stat.st_mtime_ns,
+            state=state,
+            attempts=previous.attempts if previous else 0,
+            outputs=dict(previous.outputs) if previous else {},
+        )
+
+    def mark_running(self, content_hash: str, source_path: Path) -> LedgerEntry:
+        entry = self._entry_for(content_hash, source_path, JobState.RUNNING)
+        entry.attempts += 1
+        self._append(entry)
+        return entry
+
+    def mark_failed(self, content_hash: str, source_path: Path, error: str) -> LedgerEntry:
+        entry = self._entry_for(content_hash, source_path, JobState.FAILED)
+        entry.error = error
+        self._append(entry)
+        return entry
+
+    def mark_succeeded(self, content_hash: str, source_path: Path, outputs: Dict[str, Path]) -> LedgerEntry:
+        entry = self._entry_for(content_hash, source_path, JobState.SUCCEEDED)
+        entry.outputs = {name: {"path": str(path), "sha256": sha256_file(path)} for name, path in outputs.items()}
+        self._append(entry)
+        return entry
@@ -1,14 +1,18 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import json
 import logging
 import random
+import shutil
+import subprocess
+import tempfile
 import time
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
-from typing import Iterable, List, Sequence
+from typing import Any, AsyncIterator, Iterable, Iterator, List, Sequence
 
 from datetime import date, datetime
 
@@ -17,9 +21,14 @@ from tqdm import tqdm
 
 from .config import PathConfig, ensure_output_dir
 from .formatters import TranscriptSummary, extract_utterances, format_srt, format_text_transcript, summarize
+from .ledger import JobLedger, JobState, LedgerEntry, sha256_file
 
 LOGGER = logging.getLogger(__name__)
 
+UPLOAD_CHUNK_BYTES = 1024 * 1024
+# Speech-quality mono Opus: roughly 15 MB per hour of recording.
+AUDIO_EXTRACT_ARGS = ("-vn", "-ac", "1", "-ar", "16000", "-c:a", "libopus", "-b:a", "32k", "-f", "ogg")
+
 
 def _json_default(value):
     if isinstance(value, (datetime, date)):
@@ -75,6 +84,7 @@ class TranscriptionResult:
     outputs: dict[str, str] = field(default_factory=dict)
     summary: TranscriptSummary | None = None
     error: str | None = None
+    content_hash: str | None = None
 
     def manifest_entry(self) -> dict:
         entry = {
@@ -88,9 +98,52 @@ class TranscriptionResult:
         }
         if self.error:
             entry["error"] = self.error
+        if self.content_hash:
+            entry["contentHash"] = self.content_hash
         return entry
 
 
+def iter_file_chunks(path: Path, chunk_size: int = UPLOAD_CHUNK_BYTES) -> Iterator[bytes]:
+    """Yield a file in fixed-size chunks so uploads never hold it in memory."""
+    with path.open("rb") as source_file:
+        while chunk := source_file.read(chunk_size):
+            yield chunk
+
+
+def extract_audio(ffmpeg: str, source_path: Path, target_path: Path) -> Path:
+    """Write the audio track of a recording to target_path as mono Opus."""
+    command = [ffmpeg, "-nostdin", "-loglevel", "error", "-y", "-i", str(source_path), *AUDIO_EXTRACT_ARGS, str(target_path)]
+    completed = subprocess.run(command, capture_output=True, text=True, check=False)
+    if completed.returncode != 0:
+        raise RuntimeError(f"ffmpeg failed for {source_path}: {completed.stderr.strip()}")
+    return target_path
+
+
+class ByteBudget:
+    """Admit uploads while their combined size stays under a byte limit.
+
+    A single upload larger than the limit is still admitted once nothing else
+    is in flight, so oversized recordings run alone instead of blocking forever.
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max(1, max_bytes)
+        self.in_flight = 0
+        self._condition = asyncio.Condition()
+
+    @contextlib.asynccontextmanager
+    async def reserve(self, size: int) -> AsyncIterator[None]:
+        async with self._condition:
+            await self._condition.wait_for(lambda: self.in_flight == 0 or self.in_flight + size <= self.max_bytes)
+            self.in_flight += size
+        try:
+            yield
+        finally:
+            async with self._condition:
+                self.in_flight -= size
+                self._condition.notify_all()
+
+
 def discover_jobs(paths: PathConfig) -> List[TranscriptionJob]:
     """Enumerate mp4 files and produce jobs that mirror the input directory structure."""
     jobs: List[TranscriptionJob] = []
@@ -123,8 +176,14 @@ class TranscribeRunner:
         language: str = "en",
         summaries: bool = False,
         max_retries: int = 3,
+        extract_audio: bool = False,
+        max_inflight_bytes: int = 2 * 1024**3,
+        ledger: JobLedger | None = None,
+        client: Any = None,
     ) -> None:
-        self.client = DeepgramClient(api_key=api_key)
+        self.client = client if client is not None else DeepgramClient(api_key=api_key)
+        self.ledger = ledger
+        self._claims: dict[str, asyncio.Event] = {}
         self.formats = list(dict.fromkeys(formats))  # preserve order, remove duplicates
         self.overwrite = overwrite
         self.dry_run = dry_run
@@ -132,6 +191,13 @@ class TranscribeRunner:
         self.language = language
         self.summaries = summaries
         self.max_retries = max(1, max_retries)
+        self.ffmpeg: str | None = None
+        if extract_audio:
+            self.ffmpeg = shutil.which("ffmpeg")
+            if self.ffmpeg is None:
+                raise RuntimeError("Audio extraction requires ffmpeg on PATH.")
+        self.max_inflight_bytes = max_inflight_bytes
+        self._budget = ByteBudget(max_inflight_bytes)
 
     async def run(self, jobs: Sequence[TranscriptionJob]) -> List[TranscriptionResult]:
         if not jobs:
@@ -139,6 +205,8 @@ class TranscribeRunner:
             return []
 
         semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._budget = ByteBudget(self.max_inflight_bytes)  # bound to this event loop
+        self._claims = {}
         results: List[TranscriptionResult] = []
         progress = tqdm(total=len(jobs), desc="Transcribing", unit="file")
         try:
@@ -173,19 +241,55 @@ class TranscribeRunner:
         self,
         job: TranscriptionJob,
         semaphore: asyncio.Semaphore,
+    ) -> TranscriptionResult:
+        if self.ledger is None:
+            return await self._run_job(job, semaphore, None)
+
+        content_hash = await asyncio.to_thread(self.ledger.content_hash, job.source_path)
+        # Identical recordings in one batch: the first transcribes, the rest reuse it
+        claim = self._claims.get(content_hash)
+        if claim is not None:
+            await claim.wait()
+        else:
+            self._claims[content_hash] = asyncio.Event()
+        try:
+            result = await self._run_job(job, semaphore, content_hash)
+        finally:
+            if claim is None:
+                self._claims[content_hash].set()
+        result.content_hash = content_hash
+        return result
+
+    async def _run_job(
+        self,
+        job: TranscriptionJob,
+        semaphore: asyncio.Semaphore,
+        content_hash: str | None,
     ) -> TranscriptionResult:
         outputs = self._expected_outputs(job)
-        if self._should_skip(job, outputs):
+        entry = self.ledger.get(content_hash) if self.ledger and content_hash else None
+        if not self.overwrite and entry is not None and entry.state is JobState.SUCCEEDED:
+            reused = await asyncio.to_thread(self._reuse_outputs, job, entry, outputs)
+            if reused is not None:
+                return reused
+        elif entry is None and self._should_skip(job, outputs):
+            if self.ledger and content_hash:
+                # Outputs from before the ledger existed: adopt them
+                self.ledger.mark_succeeded(content_hash, job.source_path, self._required_outputs(outputs))
             return TranscriptionResult(job=job, status="skipped", message="Already transcribed.")
 
         if self.dry_run:
             return TranscriptionResult(job=job, status="skipped", message="Dry run (no API call).")
 
         async with semaphore:
+            if self.ledger and content_hash:
+                self.ledger.mark_running(content_hash, job.source_path)
             try:
-                payload = await asyncio.to_thread(self._transcribe_with_retry, job)
+                payload = await self._transcribe_job(job)
             except Exception as exc:  # pragma: no cover - surfaced to CLI
                 LOGGER.exception("Failed to transcribe %s", job.source_path)
+                if self.ledger and content_hash:
+                    self.ledger.mark_failed(content_hash, job.source_path, str(exc))
                 return TranscriptionResult(
                     job=job,
                     status="failed",
@@ -197,6 +301,8 @@ class TranscribeRunner:
         utterances = extract_utterances(payload)
         summary = summarize(payload, utterances)
         written = self._write_outputs(outputs, payload, utterances)
+        if self.ledger and content_hash:
+            self.ledger.mark_succeeded(content_hash, job.source_path, written)
         return TranscriptionResult(
             job=job,
             status="success",
@@ -205,11 +311,65 @@ class TranscribeRunner:
             message=f"Wrote {len(written)} files.",
         )
 
-    def _transcribe_with_retry(self, job: TranscriptionJob) -> dict:
+    def _required_outputs(self, outputs: dict[str, Path]) -> dict[str, Path]:
+        required = {"json": outputs["json"]}
+        if TranscriptFormat.TEXT in self.formats:
+            required["text"] = outputs["text"]
+        if TranscriptFormat.SRT in self.formats:
+            required["srt"] = outputs["srt"]
+        return required
+
+    def _reuse_outputs(
+        self,
+        job: TranscriptionJob,
+        entry: LedgerEntry,
+        outputs: dict[str, Path],
+    ) -> TranscriptionResult | None:
+        """Serve a job from a previous transcription of the same content.
+
+        Returns None when the recorded transcript is gone or was modified, so
+        the job is transcribed again.
+        """
+        # Same content renders byte-identical outputs wherever they are written
+        required = self._required_outputs(outputs)
+        if all(
+            name in entry.outputs and path.exists() and sha256_file(path) == entry.outputs[name]["sha256"]
+            for name, path in required.items()
+        ):
+            return TranscriptionResult(job=job, status="skipped", message="Already transcribed.")
+        verified = entry.verified_outputs()
+        if "json" not in verified:
+            return None
+
+        # Moved, renamed or duplicated recording: re-render from the stored payload
+        payload = json.loads(verified["json"].read_text(encoding="utf-8"))
+        ensure_output_dir(outputs["json"].parent)
+        utterances = extract_utterances(payload)
+        written = self._write_outputs(outputs, payload, utterances)
+        self.ledger.mark_succeeded(entry.content_hash, job.source_path, written)
+        return TranscriptionResult(
+            job=job,
+            status="success",
+            outputs={key: str(path) for key, path in written.items()},
+            summary=summarize(payload, utterances),
+            message=f"Reused transcript of {entry.source}.",
+        )
+
+    async def _transcribe_job(self, job: TranscriptionJob) -> dict:
+        with tempfile.TemporaryDirectory(prefix="transcribe-") as scratch:
+            upload_path = job.source_path
+            if self.ffmpeg:
+                upload_path = await asyncio.to_thread(
+                    extract_audio, self.ffmpeg, job.source_path, Path(scratch) / f"{job.stem}.ogg"
+                )
+            async with self._budget.reserve(upload_path.stat().st_size):
+                return await asyncio.to_thread(self._transcribe_with_retry, job, upload_path)
+
+    def _transcribe_with_retry(self, job: TranscriptionJob, upload_path: Path) -> dict:
         delay = 2.0
         for attempt in range(1, self.max_retries + 1):
             try:
-                return self._transcribe_sync(job)
+                return self._transcribe_sync(upload_path)
             except Exception as exc:
                 if attempt >= self.max_retries:
                     raise
@@ -223,11 +383,9 @@ class TranscribeRunner:
                 time.sleep(delay + random.uniform(0, 0.5))
                 delay = min(delay * 2, 30.0)
 
-    def _transcribe_sync(self, job: TranscriptionJob) -> dict:
-        with job.source_path.open("rb") as source_file:
-            buffer = source_file.read()
+    def _transcribe_sync(self, upload_path: Path) -> dict:
         response = self.client.listen.v1.media.transcribe_file(
-            request=buffer,
+            request=iter_file_chunks(upload_path),
             model="nova-3",
             language=self.language,
             smart_format=True,